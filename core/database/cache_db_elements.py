@@ -0,0 +1,534 @@
+"""
+- Creation Date: 10/18/2026 02:25 PM EDT
+- Last Updated: 10/19/2026 04:45 AM EDT
+- Author: Joseph Armstrong (armstrongjoseph08@gmail.com)
+- File Name: ./core/database/cache_db_elements.py
+- Purpose: In-memory caches for data that rarely changes (or only changes
+-   in small pieces), so windows don't have to reload that data
+-   every time they open or refresh.
+"""
+
+###############################################################################
+
+import logging
+import sqlite3
+import threading
+
+from core.database.query_db_elements import SqliteQueryData
+from core.database.seed_db_elements import REFERENCE_TABLES, reseed_tables
+
+
+class ReferenceDataCache:
+    """
+    Caches the ISO nations, ISO 3166-2 subdivisions (states),
+    and time zones used by this application,
+    along with the strings shown for them in combo boxes.
+
+    The cache is loaded once, and is only reloaded if the seed pack version
+    of `iso_nations`, `iso_3166_2`, or `iso_timezones` changes.
+
+    Everything returned by this cache is a tuple or a dictionary
+    that is shared between windows, and must not be modified.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.seed_version = None
+        self.is_loaded = False
+
+        # Nations
+        self.nation_codes_arr = ()
+        self.show_nations_arr = ()
+        self.show_nation_dict = {}
+        self.nation_code_dict = {}
+
+        # States (ISO 3166-2 subdivisions), keyed by nation.
+        self.state_codes_dict = {}
+        self.show_states_dict = {}
+        self.show_state_dict = {}
+        self.state_code_dict = {}
+
+        # Time zones
+        self.timezones_arr = ()
+        self.nation_timezones_dict = {}
+
+    def get_seed_version(self, cur: sqlite3.Cursor) -> tuple:
+        """
+        Returns the seed pack version of every reference table,
+        or `None` if the seed version of those tables isn't known.
+        """
+        try:
+            cur.execute(
+                "SELECT table_name, seed_version FROM app_seed_versions " +
+                f"WHERE table_name IN ({','.join(['?'] * 3)}) " +
+                "ORDER BY table_name",
+                REFERENCE_TABLES
+            )
+        except sqlite3.OperationalError:
+            return None
+
+        return tuple(cur.fetchall())
+
+    def refresh(self, con: sqlite3.Connection) -> None:
+        """
+        Reloads this cache from the database `con` is connected to.
+        """
+        cur = con.cursor()
+
+        try:
+            nations_arr = cur.execute(
+                "SELECT nation_iso_alpha_2, nation_name " +
+                "FROM iso_nations ORDER BY rowid"
+            ).fetchall()
+            states_arr = cur.execute(
+                "SELECT nation_iso_alpha_2, subdivision_iso_3166_2_code, " +
+                "subdivision_name FROM iso_3166_2 ORDER BY rowid"
+            ).fetchall()
+            timezones_arr = cur.execute(
+                "SELECT timezone_name, nation_iso_alpha_2 " +
+                "FROM iso_timezones ORDER BY rowid"
+            ).fetchall()
+        except sqlite3.OperationalError as e:
+            logging.warning(
+                "A SQLite3 Operational Error has been raised. " +
+                f"Reason: {e}"
+            )
+            reseed_tables(con, list(REFERENCE_TABLES))
+            return self.refresh(con)
+
+        # Nations
+        self.nation_codes_arr = tuple([x[0] for x in nations_arr])
+        self.show_nations_arr = tuple(
+            [f"({iso_2}) {name}" for iso_2, name in nations_arr]
+        )
+        self.show_nation_dict = dict(
+            zip(self.nation_codes_arr, self.show_nations_arr)
+        )
+        self.nation_code_dict = dict(
+            zip(self.show_nations_arr, self.nation_codes_arr)
+        )
+
+        # States
+        state_codes_dict = {}
+        show_states_dict = {}
+        for iso_2, state_code, state_name in states_arr:
+            state_codes_dict.setdefault(iso_2, []).append(state_code)
+            show_states_dict.setdefault(iso_2, []).append(
+                f"({state_code}) {state_name}"
+            )
+
+        self.state_codes_dict = {
+            k: tuple(v) for k, v in state_codes_dict.items()
+        }
+        self.show_states_dict = {
+            k: tuple(v) for k, v in show_states_dict.items()
+        }
+        self.show_state_dict = {}
+        self.state_code_dict = {}
+        for iso_2, state_codes in self.state_codes_dict.items():
+            self.show_state_dict.update(
+                zip(state_codes, self.show_states_dict[iso_2])
+            )
+            self.state_code_dict.update(
+                zip(self.show_states_dict[iso_2], state_codes)
+            )
+
+        # Time zones
+        nation_timezones_dict = {}
+        for timezone_name, iso_2 in timezones_arr:
+            nation_timezones_dict.setdefault(iso_2, []).append(timezone_name)
+
+        self.timezones_arr = tuple([x[0] for x in timezones_arr])
+        self.nation_timezones_dict = {
+            k: tuple(v) for k, v in nation_timezones_dict.items()
+        }
+
+        self.seed_version = self.get_seed_version(cur)
+        self.is_loaded = True
+
+    def ensure_loaded(self, con: sqlite3.Connection):
+        """
+        Loads this cache if it hasn't been loaded yet,
+        or if the reference tables have been re-seeded since it was loaded.
+
+        Returns
+        ----------
+        This cache.
+        """
+        with self.lock:
+            if self.is_loaded is False or \
+                    self.get_seed_version(con.cursor()) != self.seed_version:
+                self.refresh(con)
+
+        return self
+
+    def invalidate(self) -> None:
+        """
+        Forces this cache to reload the next time it is used.
+        """
+        with self.lock:
+            self.is_loaded = False
+
+    def get_show_nation(self, nation_code: str) -> str:
+        """
+        Returns the string shown for a nation (ex. `"(US) United States"`).
+        """
+        return self.show_nation_dict[nation_code]
+
+    def get_nation_code(self, show_nation: str) -> str:
+        """
+        Returns the ISO 3166-1 alpha-2 code of a shown nation.
+        """
+        return self.nation_code_dict[show_nation]
+
+    def get_state_codes(self, nation_code: str) -> tuple:
+        """
+        Returns the ISO 3166-2 code of every state in a nation.
+        """
+        return self.state_codes_dict.get(nation_code, ())
+
+    def get_show_states(self, nation_code: str) -> tuple:
+        """
+        Returns the string shown for every state in a nation.
+        """
+        return self.show_states_dict.get(nation_code, ())
+
+    def get_show_state(self, state_code: str) -> str:
+        """
+        Returns the string shown for a state (ex. `"(US-MI) Michigan"`).
+        """
+        return self.show_state_dict[state_code]
+
+    def get_state_code(self, show_state: str) -> str:
+        """
+        Returns the ISO 3166-2 code of a shown state.
+        """
+        return self.state_code_dict[show_state]
+
+    def get_timezones(self, nation_code: str = None) -> tuple:
+        """
+        Returns every time zone in a nation,
+        or every time zone if `nation_code` is not set.
+        """
+        if nation_code is None:
+            return self.timezones_arr
+
+        return self.nation_timezones_dict.get(nation_code, ())
+
+
+# Shared by every window in this application.
+reference_data_cache = ReferenceDataCache()
+
+
+def get_reference_data(con: sqlite3.Connection) -> ReferenceDataCache:
+    """
+    Returns the shared `ReferenceDataCache()` for this application,
+    loading it first if needed.
+    """
+    return reference_data_cache.ensure_loaded(con)
+
+
+class ScheduleIndex:
+    """
+    A pre-sorted, pre-indexed view of every game in a league
+    (and optionally, a season), so the main window can filter games
+    by team and/or week without scanning or sorting every game.
+    """
+
+    def __init__(self, rows_arr: list, columns: list, key_count: int) -> None:
+        """
+        Parameters
+        ----------
+        `rows_arr` (list, mandatory):
+            Every game in this league/season, as tuples of `columns`.
+
+        `columns` (list, mandatory):
+            The columns in each row.
+
+        `key_count` (int, mandatory):
+            The number of columns at the start of each row
+            that are not shown to the user.
+        """
+        week_idx = columns.index("week")
+        away_idx = columns.index("away_team_abv")
+        home_idx = columns.index("home_team_abv")
+        sort_idx = columns.index("nflverse_game_id")
+
+        rows_arr = sorted(rows_arr, key=lambda x: x[sort_idx])
+
+        # Every game, in the order shown to the user.
+        self.rows_arr = [row[key_count:] for row in rows_arr]
+        self.game_ids_arr = [row[0] for row in rows_arr]
+
+        # `{week: [row index, ...]}` and `{team: [row index, ...]}`.
+        # Each list of row indexes is already sorted.
+        self.week_rows_dict = {}
+        self.team_rows_dict = {}
+
+        for i, row in enumerate(rows_arr):
+            self.week_rows_dict.setdefault(row[week_idx], []).append(i)
+            self.team_rows_dict.setdefault(row[away_idx], []).append(i)
+            if row[home_idx] != row[away_idx]:
+                self.team_rows_dict.setdefault(row[home_idx], []).append(i)
+
+        self.weeks_arr = sorted(self.week_rows_dict.keys())
+        self.teams_arr = sorted(self.team_rows_dict.keys())
+
+        self.week_col = week_idx - key_count
+
+    def get_rows(self, team_abv: str = None, week: int = None) -> list:
+        """
+        Returns every game played by a team and/or in a week,
+        sorted by `nflverse_game_id`.
+        """
+        if team_abv is None and week is None:
+            return list(self.rows_arr)
+        elif team_abv is None:
+            row_idx_arr = self.week_rows_dict.get(week, [])
+        elif week is None:
+            row_idx_arr = self.team_rows_dict.get(team_abv, [])
+        else:
+            # A team plays at most a few games per week,
+            # so only the team's games need to be checked.
+            row_idx_arr = [
+                i for i in self.team_rows_dict.get(team_abv, [])
+                if self.rows_arr[i][self.week_col] == week
+            ]
+
+        return [self.rows_arr[i] for i in row_idx_arr]
+
+
+class ScheduleCache:
+    """
+    Caches the games shown in the main window, keyed by league and season.
+
+    Every change to `fb_schedule` is recorded in `fb_schedule_changes`
+    (see `SqliteSampleFiles.schedule_change_tracking_sql_file()`),
+    so after a game is created, edited, or deleted,
+    only the games that changed are reloaded.
+
+    Every method that reads from the database takes an optional `con`,
+    so that background loads can read with their own connection
+    (see `core.database.worker_db_elements.DataService()`)
+    instead of the connection this cache was created with.
+    """
+
+    # Columns cached for each game.
+    # `SqliteQueryData.schedule_table_columns` is what is actually shown.
+    key_columns = ["game_id", "league_id", "season"]
+    cached_columns = key_columns + SqliteQueryData.schedule_table_columns
+
+    def __init__(self, con: sqlite3.Connection) -> None:
+        self.con = con
+        self.lock = threading.RLock()
+
+        # `{(league_id, season): {game_id: row}}`.
+        # `season` is `None` for partitions that hold every season.
+        self.partitions_dict = {}
+        # `{(league_id, season): ScheduleIndex()}`.
+        # Indexes are rebuilt the next time they're used
+        # after a game in that partition changes.
+        self.indexes_dict = {}
+        self.last_change_id = self.get_last_change_id()
+
+    def get_connection(
+        self,
+        con: sqlite3.Connection = None
+    ) -> sqlite3.Connection:
+        """
+        Returns `con`, or the connection this cache was created with
+        if `con` is not set.
+        """
+        if con is None:
+            return self.con
+        return con
+
+    def get_last_change_id(self, con: sqlite3.Connection = None) -> int:
+        """
+        Returns the ID of the latest change to `fb_schedule`.
+
+        `fb_schedule_changes` is emptied every time the app closes,
+        but `change_id` keeps counting up from the last ID handed out,
+        so that ID is read from `sqlite_sequence` instead of the table.
+        """
+        con = self.get_connection(con)
+        try:
+            change_id = con.execute(
+                "SELECT COALESCE(MAX(change_id), 0) FROM fb_schedule_changes"
+            ).fetchone()[0]
+        except sqlite3.OperationalError:
+            return 0
+
+        try:
+            row = con.execute(
+                "SELECT seq FROM sqlite_sequence " +
+                "WHERE name = 'fb_schedule_changes'"
+            ).fetchone()
+        except sqlite3.OperationalError:
+            # `sqlite_sequence` doesn't exist until
+            # a change has been recorded.
+            row = None
+
+        if row is not None and row[0] is not None:
+            change_id = max(change_id, row[0])
+        return change_id
+
+    def invalidate(self, con: sqlite3.Connection = None) -> None:
+        """
+        Empties this cache.
+        """
+        with self.lock:
+            self.partitions_dict = {}
+            self.indexes_dict = {}
+            self.last_change_id = self.get_last_change_id(con)
+
+    def load_partition(
+        self,
+        league_id: str,
+        season: int,
+        con: sqlite3.Connection = None
+    ) -> dict:
+        """
+        Loads every game in a league (and optionally, a season)
+        into this cache.
+        """
+        rows_arr = SqliteQueryData.query_schedule_rows(
+            self.get_connection(con).cursor(),
+            league_id=league_id,
+            season=season,
+            columns=self.cached_columns
+        )
+        partition_dict = {row[0]: row for row in rows_arr}
+        self.partitions_dict[(league_id, season)] = partition_dict
+        return partition_dict
+
+    def apply_changes(self, con: sqlite3.Connection = None) -> int:
+        """
+        Applies every change to `fb_schedule` made since the last time
+        this cache was updated.
+
+        Returns
+        ----------
+        The number of changed games.
+        """
+        con = self.get_connection(con)
+
+        with self.lock:
+            try:
+                changes_arr = con.execute(
+                    "SELECT change_id, game_id FROM fb_schedule_changes " +
+                    "WHERE change_id > ? ORDER BY change_id",
+                    (self.last_change_id,)
+                ).fetchall()
+            except sqlite3.OperationalError:
+                # No change tracking, so nothing can be cached.
+                self.partitions_dict = {}
+                self.indexes_dict = {}
+                return 0
+
+            if len(changes_arr) == 0:
+                return 0
+
+            if changes_arr[0][0] != self.last_change_id + 1:
+                # Some changes were cleared before this cache saw them.
+                self.invalidate(con)
+                return len(changes_arr)
+
+            self.last_change_id = changes_arr[-1][0]
+            game_ids_arr = list(set([x[1] for x in changes_arr]))
+
+            if len(self.partitions_dict) == 0:
+                return len(game_ids_arr)
+
+            for key, partition_dict in self.partitions_dict.items():
+                for game_id in game_ids_arr:
+                    if partition_dict.pop(game_id, None) is not None:
+                        self.indexes_dict.pop(key, None)
+
+            # Deleted games won't be returned here.
+            rows_arr = SqliteQueryData.query_schedule_rows(
+                con.cursor(),
+                game_id=game_ids_arr,
+                columns=self.cached_columns
+            )
+            for row in rows_arr:
+                _, league_id, season = row[:3]
+                for key in [(league_id, season), (league_id, None)]:
+                    if key in self.partitions_dict:
+                        self.partitions_dict[key][row[0]] = row
+                        self.indexes_dict.pop(key, None)
+
+            return len(game_ids_arr)
+
+    def get_index(
+        self,
+        league_id: str,
+        season: int,
+        con: sqlite3.Connection = None
+    ) -> ScheduleIndex:
+        """
+        Returns the `ScheduleIndex()` for every game in a league
+        (and optionally, a season), after applying any changes made
+        since this cache was last used.
+        """
+        with self.lock:
+            self.apply_changes(con)
+            key = (league_id, season)
+
+            schedule_index = self.indexes_dict.get(key)
+            if schedule_index is not None:
+                return schedule_index
+
+            partition_dict = self.partitions_dict.get(key)
+            if partition_dict is None:
+                partition_dict = self.load_partition(league_id, season, con)
+
+            schedule_index = ScheduleIndex(
+                rows_arr=list(partition_dict.values()),
+                columns=self.cached_columns,
+                key_count=len(self.key_columns)
+            )
+            self.indexes_dict[key] = schedule_index
+            return schedule_index
+
+    def get_rows(
+        self,
+        league_id: str,
+        season: int = None,
+        team_abv: str = None,
+        week: int = None,
+        con: sqlite3.Connection = None
+    ) -> list:
+        """
+        Returns the rows shown in the main window's schedule table,
+        sorted by `nflverse_game_id`.
+        The columns in each row are listed in
+        `SqliteQueryData.schedule_table_columns`.
+        """
+        return self.get_index(league_id, season, con).get_rows(
+            team_abv=team_abv, week=week
+        )
+
+    def get_weeks(
+        self,
+        league_id: str,
+        season: int = None,
+        con: sqlite3.Connection = None
+    ) -> list:
+        """
+        Returns a sorted list of every week with a game
+        in a league (and optionally, a season).
+        """
+        return list(self.get_index(league_id, season, con).weeks_arr)
+
+    def get_teams(
+        self,
+        league_id: str,
+        season: int = None,
+        con: sqlite3.Connection = None
+    ) -> list:
+        """
+        Returns a sorted list of every team with a game
+        in a league (and optionally, a season).
+        """
+        return list(self.get_index(league_id, season, con).teams_arr)
@@ -1,6 +1,6 @@
 """
 - Creation Date: 08/16/2023 07:28 PM EST
-- Last Updated: 06/04/2024 01:15 PM EDT
+- Last Updated: 10/19/2026 03:35 AM EDT
 - Author: Joseph Armstrong (armstrongjoseph08@gmail.com)
 - File Name: ./core/database/create_sdv_pbp_db.py
 - Purpose: Creates a database that can be used for this application.
@@ -8,9 +8,11 @@
 ###############################################################################
 
 import logging
-from os import makedirs
-from os.path import expanduser
+import sqlite3
+from os import makedirs, remove
+from os.path import exists, expanduser
 from sqlite3 import connect as sqlite_connect
+from time import perf_counter
 
 # import zoneinfo
 
@@ -10091,7 +10093,7 @@ class SqliteSampleFiles:
         );
 
 
-    INSERT_INTO fb_weekly_rosters (
+    INSERT INTO fb_weekly_rosters (
         "season",
         "game_id",
         "league_id",
@@ -11151,10 +11153,737 @@ class SqliteSampleFiles:
         """
         return sql_script.replace("        ", "")
 
+    def pbp_plays_sql_file() -> str:
+        """
+        Returns a SQLite3 script that generates a SQLite3 table that
+        stores every play in a game as its own row,
+        with the fields most commonly used by stats and exports
+        stored in typed columns.
+
+        Every other field in a play is stored in `play_details_json`,
+        so that a play can be rebuilt without losing anything
+        (see `core.database.pbp_db_elements`).
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        ----------
+        A SQLite3 script that generates a SQLite3 table that
+        stores every play in a game as its own row.
+        """
+
+        sql_script = """
+        CREATE TABLE IF NOT EXISTS "fb_pbp_plays" (
+            "game_id"                   INTEGER NOT NULL,
+            -- Starts at 1, and increases by 1 for every play in a game.
+            "play_num"                  INTEGER NOT NULL,
+            "play_type"                 TEXT NOT NULL,
+            "play_desc"                 TEXT,
+            "drive_num"                 INTEGER,
+            "half_num"                  INTEGER,
+            "quarter_num"               INTEGER,
+            "quarter_time_left"         INTEGER,
+            "half_time_left"            INTEGER,
+            "game_time_left"            INTEGER,
+            "quarter_time_left_str"     TEXT,
+            "pos_team"                  TEXT,
+            "def_team"                  TEXT,
+            "down"                      INTEGER,
+            "distance"                  INTEGER,
+            "is_goal_to_go"             INTEGER,
+            "yardline_start"            INTEGER,
+            "yardline_end"              INTEGER,
+            "starting_hash"             TEXT,
+            "home_score"                INTEGER,
+            "away_score"                INTEGER,
+            "home_score_post"           INTEGER,
+            "away_score_post"           INTEGER,
+            "posteam_score"             INTEGER,
+            "defteam_score"             INTEGER,
+            "posteam_post"              INTEGER,
+            "defteam_post"              INTEGER,
+            "is_scoring_play"           INTEGER,
+            "is_touchdown"              INTEGER,
+            "is_safety"                 INTEGER,
+            "is_turnover"               INTEGER,
+            "is_no_play"                INTEGER,
+            "is_first_down"             INTEGER,
+            "is_completed_pass"         INTEGER,
+            "is_intercepted"            INTEGER,
+            "is_sack_play"              INTEGER,
+            "is_fumble"                 INTEGER,
+            "is_touchback"              INTEGER,
+            "is_fg_made"                INTEGER,
+            "fg_attempt_distance"       INTEGER,
+            -- Every field in this play that isn't stored
+            -- in a column above, or in a child table.
+            "play_details_json"         TEXT NOT NULL DEFAULT '{}',
+            PRIMARY KEY("game_id", "play_num"),
+            FOREIGN KEY(game_id) REFERENCES  fb_schedule(game_id)
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_pbp_plays_play_type
+        ON "fb_pbp_plays" ("play_type");
+        """
+        return sql_script.replace("        ", "")
+
+    def pbp_play_players_sql_file() -> str:
+        """
+        Returns a SQLite3 script that generates a SQLite3 table that
+        stores every player that had a role in a play
+        (passer, receiver, rusher, kicker, punter, returner, blocker),
+        and every player that participated in a play.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        ----------
+        A SQLite3 script that generates a SQLite3 table that
+        stores the players in every play.
+        """
+
+        sql_script = """
+        CREATE TABLE IF NOT EXISTS "fb_pbp_play_players" (
+            "game_id"                   INTEGER NOT NULL,
+            "play_num"                  INTEGER NOT NULL,
+            -- The key this player was stored under in the play,
+            -- (`"passer"`, `"rusher"`, `"returner"`, etc.),
+            -- or `"participating_players"` for player participation data.
+            "player_role"               TEXT NOT NULL,
+            -- The order of this player within `"participating_players"`.
+            "player_order"              INTEGER NOT NULL DEFAULT 0,
+            "player_id"                 INTEGER,
+            "team_id"                   TEXT,
+            "player_num"                INTEGER,
+            "player_full_name"          TEXT,
+            "player_football_name"      TEXT,
+            "player_position"           TEXT,
+            FOREIGN KEY(game_id, play_num)
+                REFERENCES fb_pbp_plays(game_id, play_num)
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_pbp_play_players_game_id
+        ON "fb_pbp_play_players" ("game_id", "play_num");
+
+        CREATE INDEX IF NOT EXISTS idx_pbp_play_players_player_id
+        ON "fb_pbp_play_players" ("player_id");
+        """
+        return sql_script.replace("        ", "")
+
+    def pbp_play_tacklers_sql_file() -> str:
+        """
+        Returns a SQLite3 script that generates a SQLite3 table that
+        stores every tackler in a play.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        ----------
+        A SQLite3 script that generates a SQLite3 table that
+        stores every tackler in a play.
+        """
+
+        sql_script = """
+        CREATE TABLE IF NOT EXISTS "fb_pbp_play_tacklers" (
+            "game_id"                   INTEGER NOT NULL,
+            "play_num"                  INTEGER NOT NULL,
+            -- The order of this tackler within `"tacklers"`.
+            "tackler_order"             INTEGER NOT NULL DEFAULT 0,
+            "player_id"                 INTEGER,
+            "team_id"                   TEXT,
+            "player_num"                INTEGER,
+            "player_full_name"          TEXT,
+            "player_football_name"      TEXT,
+            "is_tfl"                    INTEGER,
+            "is_sack"                   INTEGER,
+            "is_sack_fumble"            INTEGER,
+            FOREIGN KEY(game_id, play_num)
+                REFERENCES fb_pbp_plays(game_id, play_num)
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_pbp_play_tacklers_game_id
+        ON "fb_pbp_play_tacklers" ("game_id", "play_num");
+
+        CREATE INDEX IF NOT EXISTS idx_pbp_play_tacklers_player_id
+        ON "fb_pbp_play_tacklers" ("player_id");
+        """
+        return sql_script.replace("        ", "")
+
+    def pbp_play_penalties_sql_file() -> str:
+        """
+        Returns a SQLite3 script that generates a SQLite3 table that
+        stores every penalty in a play.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        ----------
+        A SQLite3 script that generates a SQLite3 table that
+        stores every penalty in a play.
+        """
+
+        sql_script = """
+        CREATE TABLE IF NOT EXISTS "fb_pbp_play_penalties" (
+            "game_id"                   INTEGER NOT NULL,
+            "play_num"                  INTEGER NOT NULL,
+            -- The order of this penalty within `"penalties"`.
+            "penalty_order"             INTEGER NOT NULL DEFAULT 0,
+            "penalty_num"               INTEGER,
+            -- IDs for penalties follow this guide (p 226-229)
+            -- http://www.myiafoa.org/mechanics/mofo19/mofo.pdf
+            "penalty_id"                TEXT,
+            "penalty_name"              TEXT,
+            "is_offensive_penalty"      INTEGER,
+            "is_penalty_accepted"       INTEGER,
+            "is_personal_foul"          INTEGER,
+            "is_player_ejected"         INTEGER,
+            "is_team_penalty"           INTEGER,
+            "player_id"                 INTEGER,
+            "team_id"                   TEXT,
+            "player_num"                INTEGER,
+            "player_full_name"          TEXT,
+            "player_football_name"      TEXT,
+            FOREIGN KEY(game_id, play_num)
+                REFERENCES fb_pbp_plays(game_id, play_num)
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_pbp_play_penalties_game_id
+        ON "fb_pbp_play_penalties" ("game_id", "play_num");
+        """
+        return sql_script.replace("        ", "")
+
+    def pbp_journal_sql_file() -> str:
+        """
+        Returns a SQLite3 script that generates a SQLite3 table that
+        records every play added to, replaced in, or removed from a game
+        while that game is being charted, before those plays are
+        compacted into `fb_pbp_plays`
+        (see `core.database.journal_db_elements.PlayJournal()`).
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        ----------
+        A SQLite3 script that generates a SQLite3 table that
+        records every change to the plays in a game.
+        """
+
+        sql_script = """
+        CREATE TABLE IF NOT EXISTS "fb_pbp_journal" (
+            -- Increases by 1 every time a play is recorded.
+            "journal_id"    INTEGER PRIMARY KEY AUTOINCREMENT,
+            "game_id"       INTEGER NOT NULL,
+            -- Can be one of the following values:
+            --   - "append": `play_json` was added to the end of the game.
+            --   - "replace": `play_json` replaced play #`play_num`.
+            --   - "delete": play #`play_num` was removed from the game.
+            "journal_action"    TEXT NOT NULL,
+            "play_num"      INTEGER NOT NULL,
+            "play_json"     TEXT,
+            "recorded_at"   TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY(game_id) REFERENCES  fb_schedule(game_id)
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_pbp_journal_game_id
+        ON "fb_pbp_journal" ("game_id", "journal_id");
+        """
+        return sql_script.replace("        ", "")
+
+    def pbp_drives_sql_file() -> str:
+        """
+        Returns a SQLite3 script that generates a SQLite3 table that
+        stores every drive in a game as its own row
+        (see `core.pbp_engine.drives.DriveBuilder()`).
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        ----------
+        A SQLite3 script that generates a SQLite3 table that
+        stores every drive in a game as its own row.
+        """
+
+        sql_script = """
+        CREATE TABLE IF NOT EXISTS "fb_pbp_drives" (
+            "game_id"                   INTEGER NOT NULL,
+            "drive_num"                 INTEGER NOT NULL,
+            "pos_team"                  TEXT,
+            "def_team"                  TEXT,
+            -- The first and last `fb_pbp_plays.play_num` in this drive.
+            "first_play_num"            INTEGER NOT NULL,
+            "last_play_num"             INTEGER NOT NULL,
+            "start_quarter_num"         INTEGER,
+            "end_quarter_num"           INTEGER,
+            "start_half_num"            INTEGER,
+            "start_quarter_time_left"   INTEGER,
+            "end_quarter_time_left"     INTEGER,
+            "start_game_time_left"      INTEGER,
+            "end_game_time_left"        INTEGER,
+            "time_of_possession"        INTEGER NOT NULL DEFAULT 0,
+            "start_yardline"            INTEGER,
+            "end_yardline"              INTEGER,
+            "yards"                     INTEGER NOT NULL DEFAULT 0,
+            "play_count"                INTEGER NOT NULL DEFAULT 0,
+            "first_downs"               INTEGER NOT NULL DEFAULT 0,
+            "is_red_zone"               INTEGER NOT NULL DEFAULT 0,
+            "start_transition"          TEXT,
+            -- `NULL` until this drive is over.
+            "drive_result"              TEXT,
+            "points"                    INTEGER NOT NULL DEFAULT 0,
+            "is_finished"               INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (game_id, drive_num),
+            FOREIGN KEY(game_id) REFERENCES  fb_schedule(game_id)
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_pbp_drives_pos_team
+        ON "fb_pbp_drives" ("pos_team", "game_id");
+
+        CREATE INDEX IF NOT EXISTS idx_pbp_drives_drive_result
+        ON "fb_pbp_drives" ("drive_result");
+        """
+        return sql_script.replace("        ", "")
+
+    def game_stats_sql_file() -> str:
+        """
+        Returns a SQLite3 script that generates the SQLite3 tables that
+        store the box score of every game
+        (see `core.pbp_engine.box_score.BoxScore()`),
+        with one row per stat.
+
+        Parameters
+        ----------
+        None
 
-def create_app_sqlite3_db(custom_dir: str = None):
-    """ """
-    # print(SqliteSampleFiles.leagues_sql_file())
+        Returns
+        ----------
+        A SQLite3 script that generates the SQLite3 tables that
+        store the box score of every game.
+        """
+
+        sql_script = """
+        CREATE TABLE IF NOT EXISTS "fb_player_game_stats" (
+            "game_id"           INTEGER NOT NULL,
+            "team_id"           TEXT NOT NULL,
+            "player_id"         INTEGER NOT NULL,
+            -- A section of a game file's `"stats"`
+            -- (such as "passing" or "defense"),
+            -- or "games" for the number of games played.
+            "stat_category"     TEXT NOT NULL,
+            "stat_name"         TEXT NOT NULL,
+            "stat_value"        REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (
+                game_id, team_id, player_id, stat_category, stat_name
+            ),
+            FOREIGN KEY(game_id) REFERENCES  fb_schedule(game_id)
+        );
+
+        CREATE TABLE IF NOT EXISTS "fb_team_game_stats" (
+            "game_id"           INTEGER NOT NULL,
+            "team_id"           TEXT NOT NULL,
+            "stat_category"     TEXT NOT NULL,
+            "stat_name"         TEXT NOT NULL,
+            "stat_value"        REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (game_id, team_id, stat_category, stat_name),
+            FOREIGN KEY(game_id) REFERENCES  fb_schedule(game_id)
+        );
+        """
+        return sql_script.replace("        ", "")
+
+    def season_stats_sql_file() -> str:
+        """
+        Returns a SQLite3 script that generates the SQLite3 tables that
+        store the season totals of every player and team,
+        with one row per stat.
+        These are kept up to date as each game's box score changes
+        (see `core.database.stats_db_elements`),
+        and as games are moved to another league/season.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        ----------
+        A SQLite3 script that generates the SQLite3 tables that
+        store the season totals of every player and team.
+        """
+
+        sql_script = """
+        CREATE TABLE IF NOT EXISTS "fb_player_season_stats" (
+            "league_id"         TEXT NOT NULL,
+            "season"            INTEGER NOT NULL,
+            "team_id"           TEXT NOT NULL,
+            "player_id"         INTEGER NOT NULL,
+            "stat_category"     TEXT NOT NULL,
+            "stat_name"         TEXT NOT NULL,
+            "stat_value"        REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (
+                league_id, season, player_id, team_id,
+                stat_category, stat_name
+            )
+        );
+
+        -- Season leaderboards.
+        CREATE INDEX IF NOT EXISTS idx_player_season_stats_leaders
+        ON "fb_player_season_stats" (
+            "league_id", "season", "stat_category", "stat_name", "stat_value"
+        );
+
+        -- Career totals.
+        CREATE INDEX IF NOT EXISTS idx_player_season_stats_player_id
+        ON "fb_player_season_stats" ("player_id");
+
+        CREATE TABLE IF NOT EXISTS "fb_team_season_stats" (
+            "league_id"         TEXT NOT NULL,
+            "season"            INTEGER NOT NULL,
+            "team_id"           TEXT NOT NULL,
+            "stat_category"     TEXT NOT NULL,
+            "stat_name"         TEXT NOT NULL,
+            "stat_value"        REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (
+                league_id, season, team_id, stat_category, stat_name
+            )
+        );
+
+        -- Box scores are added to the season totals of the league/season
+        -- the game is in when it's saved,
+        -- so if a game is moved to another league/season,
+        -- its box score is moved to that league/season's totals.
+        CREATE TRIGGER IF NOT EXISTS trg_schedule_move_season_stats
+        AFTER UPDATE OF "league_id", "season" ON "fb_schedule"
+        WHEN OLD."league_id" IS NOT NEW."league_id"
+        OR OLD."season" IS NOT NEW."season"
+        BEGIN
+            INSERT INTO "fb_player_season_stats"(
+                "league_id", "season", "team_id", "player_id",
+                "stat_category", "stat_name", "stat_value"
+            )
+            SELECT
+                OLD."league_id", OLD."season", "team_id", "player_id",
+                "stat_category", "stat_name", -"stat_value"
+            FROM "fb_player_game_stats"
+            WHERE "game_id" = OLD."game_id"
+            AND OLD."league_id" IS NOT NULL
+            AND OLD."season" IS NOT NULL
+            ON CONFLICT(
+                league_id, season, player_id, team_id,
+                stat_category, stat_name
+            )
+            DO UPDATE SET "stat_value" = "stat_value" + excluded."stat_value";
+
+            INSERT INTO "fb_player_season_stats"(
+                "league_id", "season", "team_id", "player_id",
+                "stat_category", "stat_name", "stat_value"
+            )
+            SELECT
+                NEW."league_id", NEW."season", "team_id", "player_id",
+                "stat_category", "stat_name", "stat_value"
+            FROM "fb_player_game_stats"
+            WHERE "game_id" = OLD."game_id"
+            AND NEW."league_id" IS NOT NULL
+            AND NEW."season" IS NOT NULL
+            ON CONFLICT(
+                league_id, season, player_id, team_id,
+                stat_category, stat_name
+            )
+            DO UPDATE SET "stat_value" = "stat_value" + excluded."stat_value";
+
+            INSERT INTO "fb_team_season_stats"(
+                "league_id", "season", "team_id",
+                "stat_category", "stat_name", "stat_value"
+            )
+            SELECT
+                OLD."league_id", OLD."season", "team_id",
+                "stat_category", "stat_name", -"stat_value"
+            FROM "fb_team_game_stats"
+            WHERE "game_id" = OLD."game_id"
+            AND OLD."league_id" IS NOT NULL
+            AND OLD."season" IS NOT NULL
+            ON CONFLICT(
+                league_id, season, team_id, stat_category, stat_name
+            )
+            DO UPDATE SET "stat_value" = "stat_value" + excluded."stat_value";
+
+            INSERT INTO "fb_team_season_stats"(
+                "league_id", "season", "team_id",
+                "stat_category", "stat_name", "stat_value"
+            )
+            SELECT
+                NEW."league_id", NEW."season", "team_id",
+                "stat_category", "stat_name", "stat_value"
+            FROM "fb_team_game_stats"
+            WHERE "game_id" = OLD."game_id"
+            AND NEW."league_id" IS NOT NULL
+            AND NEW."season" IS NOT NULL
+            ON CONFLICT(
+                league_id, season, team_id, stat_category, stat_name
+            )
+            DO UPDATE SET "stat_value" = "stat_value" + excluded."stat_value";
+
+            -- Shared sacks are fractions, which can leave behind
+            -- tiny rounding errors instead of an exact 0.
+            DELETE FROM "fb_player_season_stats"
+            WHERE (
+                ("league_id" = OLD."league_id" AND "season" = OLD."season")
+                OR ("league_id" = NEW."league_id" AND "season" = NEW."season")
+            )
+            AND ROUND("stat_value", 6) = 0;
+
+            DELETE FROM "fb_team_season_stats"
+            WHERE (
+                ("league_id" = OLD."league_id" AND "season" = OLD."season")
+                OR ("league_id" = NEW."league_id" AND "season" = NEW."season")
+            )
+            AND ROUND("stat_value", 6) = 0;
+        END;
+        """
+        return sql_script.replace("        ", "")
+
+    def app_indexes_sql_file() -> str:
+        """
+        Returns a SQLite3 script that creates the indexes used by
+        the filtered loaders in `core.database.load_db_elements`.
+        Every index is created with `IF NOT EXISTS`,
+        so this script can safely be re-run against an existing database.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        ----------
+        A SQLite3 script that creates the indexes used by
+        the filtered loaders in `core.database.load_db_elements`.
+        """
+
+        sql_script = """
+        -- Main window/schedule browser lookups.
+        CREATE INDEX IF NOT EXISTS idx_schedule_league_season_week
+        ON "fb_schedule" ("league_id", "season", "week");
+
+        CREATE INDEX IF NOT EXISTS idx_schedule_away_team
+        ON "fb_schedule" ("league_id", "season", "away_team_abv");
+
+        CREATE INDEX IF NOT EXISTS idx_schedule_home_team
+        ON "fb_schedule" ("league_id", "season", "home_team_abv");
+
+        CREATE INDEX IF NOT EXISTS idx_schedule_nflverse_game_id
+        ON "fb_schedule" ("nflverse_game_id");
+
+        -- Roster lookups by league, rather than by season.
+        CREATE INDEX IF NOT EXISTS idx_rosters_league_team
+        ON "fb_rosters" ("league_id", "season", "team_id");
+
+        -- Weekly rosters/depth charts are always loaded for a given week,
+        -- or for a given game.
+        CREATE INDEX IF NOT EXISTS idx_weekly_rosters_league_week
+        ON "fb_weekly_rosters" ("league_id", "season", "week", "team_id");
+
+        CREATE INDEX IF NOT EXISTS idx_weekly_rosters_game_id
+        ON "fb_weekly_rosters" ("game_id");
+
+        CREATE INDEX IF NOT EXISTS idx_depth_charts_league_week
+        ON "fb_depth_charts" ("league_id", "season", "week", "team_abv");
+
+        CREATE INDEX IF NOT EXISTS idx_depth_charts_game_id
+        ON "fb_depth_charts" ("game_id");
+
+        CREATE INDEX IF NOT EXISTS idx_game_refs_game_id
+        ON "fb_game_refs" ("game_id");
+
+        CREATE INDEX IF NOT EXISTS idx_pbp_game_id
+        ON "fb_pbp" ("game_id");
+        """
+        return sql_script.replace("        ", "")
+
+    def schedule_change_tracking_sql_file() -> str:
+        """
+        Returns a SQLite3 script that records every game
+        inserted into, updated in, or deleted from `fb_schedule`,
+        so that cached schedules only have to reload the games that changed
+        (see `core.database.cache_db_elements.ScheduleCache()`).
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        ----------
+        A SQLite3 script that creates the `fb_schedule_changes` table,
+        and the triggers that populate it.
+        """
+
+        sql_script = """
+        CREATE TABLE IF NOT EXISTS "fb_schedule_changes" (
+            -- Increases by 1 every time a game is changed.
+            "change_id"     INTEGER PRIMARY KEY AUTOINCREMENT,
+            "game_id"       INTEGER NOT NULL
+        );
+
+        CREATE TRIGGER IF NOT EXISTS trg_schedule_after_insert
+        AFTER INSERT ON "fb_schedule"
+        BEGIN
+            INSERT INTO "fb_schedule_changes"("game_id")
+            VALUES (NEW."game_id");
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_schedule_after_update
+        AFTER UPDATE ON "fb_schedule"
+        BEGIN
+            INSERT INTO "fb_schedule_changes"("game_id")
+            VALUES (NEW."game_id");
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_schedule_after_delete
+        AFTER DELETE ON "fb_schedule"
+        BEGIN
+            INSERT INTO "fb_schedule_changes"("game_id")
+            VALUES (OLD."game_id");
+        END;
+        """
+        return sql_script.replace("        ", "")
+
+
+def split_sql_script(sql_script: str) -> list:
+    """
+    Splits a SQLite3 script into individual statements,
+    so that a script can be run within an existing transaction
+    (`sqlite3.Cursor.executescript()` always commits first).
+
+    Parameters
+    ----------
+    `sql_script` (str, mandatory):
+        The SQLite3 script to split.
+
+    Returns
+    ----------
+    A list of every statement in `sql_script`.
+    """
+    statements_arr = []
+    statement = ""
+
+    for line in sql_script.splitlines(keepends=True):
+        statement += line
+        # `sqlite3.complete_statement()` re-reads the whole statement,
+        # so only check statements that could actually be complete.
+        if line.rstrip().endswith(";") is False:
+            continue
+        elif sqlite3.complete_statement(statement):
+            statements_arr.append(statement.strip())
+            statement = ""
+
+    if statement.strip() != "":
+        statements_arr.append(statement.strip())
+
+    return statements_arr
+
+
+def build_app_sqlite3_db(sql_file: str) -> dict:
+    """
+    Builds a database for this application from the SQL scripts in
+    `SqliteSampleFiles()`.
+
+    The entire database is built in a single transaction
+    with journaling turned off, in a temporary file
+    that is only renamed to `sql_file` once the build succeeds.
+    If the build fails, `sql_file` is left untouched.
+
+    This is only used to build the seed pack
+    (see `core.database.seed_db_elements.build_seed_pack()`).
+    New databases are copied from the seed pack instead.
+
+    Parameters
+    ----------
+    `sql_file` (str, mandatory):
+        The path to the new database.
+
+    Returns
+    ----------
+    A dictionary where each key is a table name (or `"indexes"`),
+    and each value is how long (in seconds) that step took.
+    """
+    from core.database.seed_db_elements import (
+        SEED_TABLES, replace_database_file
+    )
+
+    temp_file = f"{sql_file}.tmp"
+    if exists(temp_file):
+        remove(temp_file)
+
+    timings_dict = {}
+    con = sqlite_connect(temp_file, isolation_level=None)
+
+    try:
+        # Nothing is lost if the app crashes during a build,
+        # because `sql_file` is only replaced once the build succeeds.
+        con.execute("PRAGMA journal_mode = OFF;")
+        con.execute("PRAGMA synchronous = OFF;")
+        con.execute("BEGIN")
+
+        build_steps = list(SEED_TABLES.items())
+        build_steps.append(("indexes", ("app_indexes_sql_file",)))
+
+        for table_name, script_names in build_steps:
+            start_time = perf_counter()
+            for script_name in script_names:
+                sql_script = getattr(SqliteSampleFiles, script_name)()
+                for statement in split_sql_script(sql_script):
+                    con.execute(statement)
+            timings_dict[table_name] = perf_counter() - start_time
+
+        con.execute("COMMIT")
+        con.execute("PRAGMA journal_mode = DELETE;")
+    except Exception as e:
+        con.close()
+        remove(temp_file)
+        raise e
+
+    con.close()
+    replace_database_file(temp_file, sql_file)
+
+    for table_name, seconds in timings_dict.items():
+        logging.info("Built `%s` in %.4f seconds.", table_name, seconds)
+
+    return timings_dict
+
+
+def create_app_sqlite3_db(
+    custom_dir: str = None,
+    from_seed_pack: bool = True
+):
+    """
+    Creates the database for this application by copying the seed pack.
+    If the database already exists,
+    any tables missing from it are re-seeded instead.
+    If the database is corrupted, it is moved to
+    `sdv_pbp_py.sqlite.corrupt`, and a new database is created.
+
+    Parameters
+    ----------
+    `custom_dir` (str, optional):
+        If set, the database is created in this directory
+        instead of the user's home directory.
+
+    `from_seed_pack` (bool, optional):
+        If set to `False`, new databases are built from the SQL scripts
+        in `SqliteSampleFiles()` (see `build_app_sqlite3_db()`)
+        instead of being copied from the seed pack.
+    """
+    from core.database.seed_db_elements import (
+        copy_seed_database, replace_database_file, sync_seed_tables
+    )
 
     sql_file = ""
     if custom_dir is not None:
@@ -11182,53 +11911,31 @@ def create_app_sqlite3_db(custom_dir: str = None):
 
     del custom_dir
 
-    con = sqlite_connect(sql_file)
-    cur = con.cursor()
-
-    cur.executescript(SqliteSampleFiles.iso_nations())
-    con.commit()
-
-    cur.executescript(SqliteSampleFiles.iso_timezones())
-    con.commit()
-
-    cur.executescript(SqliteSampleFiles.iso_3166_2_states())
-    con.commit()
-
-    cur.executescript(SqliteSampleFiles.iso_3166_2_data())
-    con.commit()
-
-    cur.executescript(SqliteSampleFiles.leagues_sql_file())
-    con.commit()
-
-    cur.executescript(SqliteSampleFiles.seasons_sql_file())
-    con.commit()
-
-    cur.executescript(SqliteSampleFiles.teams_sql_file())
-    con.commit()
-
-    cur.executescript(SqliteSampleFiles.rosters_sql_file())
-    con.commit()
-
-    cur.executescript(SqliteSampleFiles.stadiums_sql_file())
-    con.commit()
-
-    cur.executescript(SqliteSampleFiles.weekly_rosters_sql_file())
-    con.commit()
-
-    cur.executescript(SqliteSampleFiles.depth_chart_sql_file())
-    con.commit()
-
-    cur.executescript(SqliteSampleFiles.schedule_sql_file())
-    con.commit()
-
-    # cur.executescript(SqliteSampleFiles.game_betting_sql_file())
-    # con.commit()
-
-    cur.executescript(SqliteSampleFiles.game_refs_sql_file())
-    con.commit()
+    if exists(sql_file) is True:
+        con = None
+        try:
+            con = sqlite_connect(sql_file)
+            sync_seed_tables(con)
+            con.close()
+            return
+        except sqlite3.OperationalError as e:
+            # Locked, read-only, etc. The database itself is fine.
+            raise e
+        except sqlite3.DatabaseError as e:
+            if con is not None:
+                con.close()
+            logging.error(
+                "`%s` is corrupted, and will be replaced. Reason: %s",
+                sql_file, e
+            )
+            # The `-wal` and `-shm` files of the corrupted database
+            # are moved with it, so they aren't applied to the new one.
+            replace_database_file(sql_file, f"{sql_file}.corrupt")
 
-    cur.executescript(SqliteSampleFiles.game_pbp_sql_file())
-    con.commit()
+    if from_seed_pack is True:
+        copy_seed_database(sql_file)
+    else:
+        build_app_sqlite3_db(sql_file)
 
 
 if __name__ == "__main__":
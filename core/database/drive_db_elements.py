@@ -0,0 +1,244 @@
+"""
+- Creation Date: 10/18/2026 06:55 PM EDT
+- Last Updated: 10/19/2026 02:30 AM EDT
+- Author: Joseph Armstrong (armstrongjoseph08@gmail.com)
+- File Name: ./core/database/drive_db_elements.py
+- Purpose: Saves, and loads, the drives in a game,
+-   stored one row per drive in `fb_pbp_drives`
+-   (see `core.pbp_engine.drives.DriveBuilder()`).
+-   Drives are rebuilt from the typed columns in `fb_pbp_plays`,
+-   so `play_details_json` never has to be read.
+"""
+
+###############################################################################
+
+import sqlite3
+from contextlib import nullcontext
+
+from core.database.query_db_elements import build_where_clause
+from core.pbp_engine.drives import DriveBuilder, get_drive_template
+
+# Every field in a drive, in the order they're stored in `fb_pbp_drives`.
+PBP_DRIVE_COLUMNS = tuple(get_drive_template().keys())
+
+# Every column in `fb_pbp_plays` that `DriveBuilder()` reads.
+DRIVE_PLAY_COLUMNS = (
+    "drive_num",
+    "play_type",
+    "pos_team",
+    "def_team",
+    "half_num",
+    "quarter_num",
+    "quarter_time_left",
+    "half_time_left",
+    "game_time_left",
+    "down",
+    "yardline_start",
+    "yardline_end",
+    "posteam_score",
+    "defteam_score",
+    "posteam_post",
+    "defteam_post",
+    "is_touchdown",
+    "is_safety",
+    "is_turnover",
+    "is_intercepted",
+    "is_fg_made",
+    "is_first_down",
+    "is_no_play",
+)
+
+# `DRIVE_PLAY_COLUMNS` that are stored as integers,
+# but are booleans in a play.
+DRIVE_PLAY_FLAGS = tuple(
+    x for x in DRIVE_PLAY_COLUMNS if x.startswith("is_")
+)
+
+
+def to_drive_row(game_id: int, drive_dict: dict) -> tuple:
+    """
+    Returns a drive as a row in `fb_pbp_drives`.
+    """
+    return (game_id,) + tuple(
+        drive_dict[x] for x in PBP_DRIVE_COLUMNS
+    )
+
+
+def to_drive_play(row: tuple) -> dict:
+    """
+    Returns a row of `DRIVE_PLAY_COLUMNS` as a play
+    that `DriveBuilder()` can read.
+    """
+    play_dict = dict(zip(DRIVE_PLAY_COLUMNS, row))
+    for key in DRIVE_PLAY_FLAGS:
+        if play_dict[key] is not None:
+            play_dict[key] = bool(play_dict[key])
+    return play_dict
+
+
+def save_game_drives(
+    con: sqlite3.Connection,
+    game_id: int,
+    drives_arr: list
+) -> None:
+    """
+    Replaces every drive stored for a game with the drives in `drives_arr`.
+    This does not commit, so that it can be part of a larger transaction.
+    """
+    con.execute("DELETE FROM fb_pbp_drives WHERE game_id = ?", (game_id,))
+    upsert_game_drives(con, game_id, drives_arr)
+
+
+def upsert_game_drives(
+    con: sqlite3.Connection,
+    game_id: int,
+    drives_arr: list
+) -> None:
+    """
+    Adds, or replaces, the drives in `drives_arr`,
+    without touching any other drive in that game.
+    This does not commit, so that it can be part of a larger transaction.
+    """
+    con.executemany(
+        "INSERT OR REPLACE INTO fb_pbp_drives VALUES " +
+        f"({','.join(['?'] * (len(PBP_DRIVE_COLUMNS) + 1))})",
+        [to_drive_row(game_id, x) for x in drives_arr]
+    )
+
+
+def load_game_drives(con: sqlite3.Connection, game_id: int) -> list:
+    """
+    Returns every drive stored for a game, in order,
+    in the same format as `core.pbp_engine.drives.get_drive_template()`.
+    """
+    columns_str = ",".join([f"\"{x}\"" for x in PBP_DRIVE_COLUMNS])
+    drives_arr = []
+
+    for row in con.execute(
+        f"SELECT {columns_str} FROM fb_pbp_drives " +
+        "WHERE game_id = ? ORDER BY drive_num",
+        (game_id,)
+    ):
+        drive_dict = dict(zip(PBP_DRIVE_COLUMNS, row))
+        drive_dict["is_red_zone"] = bool(drive_dict["is_red_zone"])
+        drive_dict["is_finished"] = bool(drive_dict["is_finished"])
+        drives_arr.append(drive_dict)
+
+    return drives_arr
+
+
+def is_game_finished(con: sqlite3.Connection, game_id: int) -> bool:
+    """
+    Returns `True` if `fb_schedule` says this game is over.
+    """
+    row = con.execute(
+        "SELECT game_is_finished FROM fb_schedule WHERE game_id = ?",
+        (game_id,)
+    ).fetchone()
+    return row is not None and bool(row[0])
+
+
+def build_game_drives(con: sqlite3.Connection, game_id: int) -> list:
+    """
+    Groups the plays stored in `fb_pbp_plays` for a game into drives.
+    The last drive is only closed if this game is over.
+    """
+    columns_str = ",".join([f"\"{x}\"" for x in DRIVE_PLAY_COLUMNS])
+    plays_arr = [
+        to_drive_play(row) for row in con.execute(
+            f"SELECT {columns_str} FROM fb_pbp_plays " +
+            "WHERE game_id = ? ORDER BY play_num",
+            (game_id,)
+        )
+    ]
+    return DriveBuilder.build_drives(
+        plays_arr, is_game_finished(con, game_id)
+    )
+
+
+def rebuild_drives(
+    con: sqlite3.Connection,
+    league_id: str = None,
+    season: int = None,
+    week: int = None,
+    commit: bool = True
+) -> int:
+    """
+    Rebuilds the drives for every game in a league/season/week
+    (or every game with PBP data, if no filters are set)
+    from `fb_pbp_plays`, in a single transaction.
+
+    Every play is read with one query, and is only looked at once.
+
+    Parameters
+    ----------
+    `con` (sqlite3.Connection, mandatory):
+        A connection to the database for this application.
+
+    `league_id`, `season`, `week` (optional):
+        Filters passed into `build_where_clause()`.
+
+    `commit` (bool, optional):
+        If set to `False`, the drives are saved without committing,
+        so that they can be part of a larger transaction.
+
+    Returns
+    ----------
+    The number of drives that were saved.
+    """
+    where_clause, params = build_where_clause(
+        {
+            "league_id": league_id,
+            "season": season,
+            "week": week,
+        }
+    )
+    columns_str = ",".join([f"p.\"{x}\"" for x in DRIVE_PLAY_COLUMNS])
+    cursor = con.execute(
+        "SELECT p.game_id, s.game_is_finished, p.play_num, " +
+        f"{columns_str} " +
+        "FROM fb_pbp_plays p " +
+        "LEFT JOIN fb_schedule s USING (game_id) " +
+        f"{where_clause} ORDER BY p.game_id, p.play_num",
+        params
+    )
+
+    drive_rows_arr = []
+    game_ids_arr = []
+    builder = None
+    game_id = None
+    game_is_finished = False
+
+    for row in cursor:
+        if row[0] != game_id:
+            if builder is not None:
+                if game_is_finished:
+                    builder.finish()
+                drive_rows_arr += [
+                    to_drive_row(game_id, x) for x in builder.get_drives()
+                ]
+            game_id = row[0]
+            game_is_finished = bool(row[1])
+            game_ids_arr.append((game_id,))
+            builder = DriveBuilder()
+
+        builder.add_play(row[2], to_drive_play(row[3:]))
+
+    if builder is not None:
+        if game_is_finished:
+            builder.finish()
+        drive_rows_arr += [
+            to_drive_row(game_id, x) for x in builder.get_drives()
+        ]
+
+    with con if commit is True else nullcontext():
+        con.executemany(
+            "DELETE FROM fb_pbp_drives WHERE game_id = ?", game_ids_arr
+        )
+        con.executemany(
+            "INSERT INTO fb_pbp_drives VALUES " +
+            f"({','.join(['?'] * (len(PBP_DRIVE_COLUMNS) + 1))})",
+            drive_rows_arr
+        )
+
+    return len(drive_rows_arr)
@@ -0,0 +1,404 @@
+"""
+- Creation Date: 10/18/2026 04:35 PM EDT
+- Last Updated: 10/18/2026 10:25 PM EDT
+- Author: Joseph Armstrong (armstrongjoseph08@gmail.com)
+- File Name: ./core/database/journal_db_elements.py
+- Purpose: An append-only journal of the plays recorded
+-   while a game is being charted.
+-   Recording a play is a single insert into `fb_pbp_journal`,
+-   no matter how many plays are already in that game.
+-   Every so often, the journal is compacted into the game file
+-   stored in `fb_pbp` and `fb_pbp_plays`
+-   (see `core.database.pbp_db_elements`).
+"""
+
+###############################################################################
+
+import logging
+import sqlite3
+
+from core.database.drive_db_elements import (
+    build_game_drives,
+    save_game_drives,
+    upsert_game_drives,
+)
+from core.database.pbp_db_elements import (
+    insert_game_plays,
+    load_game_pbp,
+    load_game_plays,
+    replace_game_play,
+)
+from core.database.stats_db_elements import save_game_stats
+from core.pbp_engine.box_score import BoxScore
+from core.pbp_engine.drives import DriveBuilder
+from core.pbp_engine.game_codec import from_json, to_json
+
+JOURNAL_ACTIONS = ("append", "replace", "delete")
+
+
+def load_journal_entries(con: sqlite3.Connection, game_id: int) -> list:
+    """
+    Returns every entry in the journal for a game, in the order
+    they were recorded, as
+    `[journal_id, journal_action, play_num, play_json]`.
+    """
+    return con.execute(
+        "SELECT journal_id, journal_action, play_num, play_json " +
+        "FROM fb_pbp_journal WHERE game_id = ? ORDER BY journal_id",
+        (game_id,)
+    ).fetchall()
+
+
+def replay_journal_entries(plays_arr: list, entries_arr: list) -> list:
+    """
+    Applies journal entries (see `load_journal_entries()`)
+    to a list of plays, in order.
+
+    Parameters
+    ----------
+    `plays_arr` (list, mandatory):
+        The plays in a game, before these entries were recorded.
+        This list is changed in place.
+
+    `entries_arr` (list, mandatory):
+        The journal entries to apply.
+
+    Returns
+    ----------
+    `plays_arr`, with every entry applied.
+    """
+    for journal_id, journal_action, play_num, play_json in entries_arr:
+        if journal_action == "append":
+            plays_arr.append(from_json(play_json))
+        elif journal_action == "replace" and \
+                1 <= play_num <= len(plays_arr):
+            plays_arr[play_num - 1] = from_json(play_json)
+        elif journal_action == "delete" and \
+                1 <= play_num <= len(plays_arr):
+            plays_arr.pop(play_num - 1)
+        else:
+            logging.warning(
+                f"Skipping journal entry #{journal_id} " +
+                f"(`{journal_action}` play #{play_num}), " +
+                f"because the game only has {len(plays_arr)} play(s)."
+            )
+
+    return plays_arr
+
+
+def compact_play_journal(con: sqlite3.Connection, game_id: int) -> int:
+    """
+    Applies every entry in the journal for a game to the plays stored
+    in `fb_pbp_plays`, and removes those entries from the journal,
+    in a single transaction.
+
+    Only the plays that were added or replaced are rewritten,
+    unless a play was removed, in which case every play after it
+    has to be renumbered, and every play in the game is rewritten.
+
+    Returns
+    ----------
+    The number of journal entries that were compacted.
+    """
+    entries_arr = load_journal_entries(con, game_id)
+    if len(entries_arr) == 0:
+        return 0
+
+    with con:
+        if con.execute(
+            "SELECT 1 FROM fb_pbp WHERE game_id = ?", (game_id,)
+        ).fetchone() is None:
+            from core.pbp_engine.game import get_initial_game_file
+
+            game_dict = get_initial_game_file()
+            game_dict["game_info"]["game_id"] = game_id
+            con.execute(
+                "INSERT INTO fb_pbp(game_id, game_json_str) VALUES (?, ?)",
+                (game_id, to_json(game_dict))
+            )
+
+        if any(x[1] == "delete" for x in entries_arr):
+            plays_arr = replay_journal_entries(
+                load_game_plays(con, game_id), entries_arr
+            )
+            insert_game_plays(con, game_id, plays_arr)
+        else:
+            play_count = con.execute(
+                "SELECT COUNT(*) FROM fb_pbp_plays WHERE game_id = ?",
+                (game_id,)
+            ).fetchone()[0]
+
+            # Only the last version of each play has to be written.
+            changed_plays_dict = {}
+            for _, journal_action, play_num, play_json in entries_arr:
+                if journal_action == "append":
+                    play_count += 1
+                    changed_plays_dict[play_count] = play_json
+                elif 1 <= play_num <= play_count:
+                    changed_plays_dict[play_num] = play_json
+
+            for play_num, play_json in changed_plays_dict.items():
+                replace_game_play(
+                    con, game_id, play_num, from_json(play_json)
+                )
+            save_game_drives(con, game_id, build_game_drives(con, game_id))
+            save_game_stats(
+                con,
+                game_id,
+                BoxScore.from_plays(load_game_plays(con, game_id)).get_stats()
+            )
+
+        con.execute(
+            "DELETE FROM fb_pbp_journal " +
+            "WHERE game_id = ? AND journal_id <= ?",
+            (game_id, entries_arr[-1][0])
+        )
+
+    return len(entries_arr)
+
+
+def recover_play_journals(con: sqlite3.Connection) -> list:
+    """
+    Compacts the journal of every game that still has entries in it.
+    Journals are compacted when a game is closed,
+    so any entries left over are from a session that crashed.
+
+    Returns
+    ----------
+    A list of the games that were recovered.
+    """
+    game_ids_arr = [
+        x[0] for x in con.execute(
+            "SELECT DISTINCT game_id FROM fb_pbp_journal"
+        ).fetchall()
+    ]
+
+    for game_id in game_ids_arr:
+        entries = compact_play_journal(con, game_id)
+        logging.info(
+            f"Recovered {entries} journaled play(s) for game #{game_id}."
+        )
+
+    return game_ids_arr
+
+
+class PlayJournal:
+    """
+    Records the plays in a game as they are charted.
+
+    Every call to `append_play()`, `replace_play()`, or `delete_play()`
+    is a single insert into `fb_pbp_journal` (and a commit),
+    so recording a play takes the same amount of time
+    on the first play of a game as it does on the 180th.
+    Appending a play also updates the current drive in `fb_pbp_drives`
+    (see `core.pbp_engine.drives.DriveBuilder()`) in that same commit.
+    The journal is compacted into `fb_pbp_plays`
+    every `compact_every` entries, and when `close()` is called.
+    """
+
+    def __init__(
+        self,
+        con: sqlite3.Connection,
+        game_id: int,
+        compact_every: int = 50
+    ) -> None:
+        self.con = con
+        self.game_id = game_id
+        self.compact_every = compact_every
+
+        self.play_count = con.execute(
+            "SELECT COUNT(*) FROM fb_pbp_plays WHERE game_id = ?",
+            (game_id,)
+        ).fetchone()[0]
+        self.pending_entries = 0
+        # Created the first time a play is recorded,
+        # and recreated whenever a play is replaced or removed.
+        self.drive_builder = None
+        # Created the first time the box score is needed,
+        # and then kept up to date one journal entry at a time.
+        self.box_score = None
+
+        # Entries left over from a session that crashed.
+        for _, journal_action, _, _ in load_journal_entries(con, game_id):
+            self.pending_entries += 1
+            if journal_action == "append":
+                self.play_count += 1
+            elif journal_action == "delete":
+                self.play_count -= 1
+
+    def record(
+        self,
+        journal_action: str,
+        play_num: int,
+        play_dict: dict = None
+    ) -> None:
+        """
+        Records a single journal entry, and compacts the journal
+        if it has reached `self.compact_every` entries.
+        """
+        if journal_action not in JOURNAL_ACTIONS:
+            raise ValueError(
+                f"`{journal_action}` is not a valid journal action."
+            )
+
+        play_json = None
+        if play_dict is not None:
+            play_json = to_json(play_dict)
+
+        with self.con:
+            self.con.execute(
+                "INSERT INTO fb_pbp_journal" +
+                "(game_id, journal_action, play_num, play_json) " +
+                "VALUES (?, ?, ?, ?)",
+                (self.game_id, journal_action, play_num, play_json)
+            )
+            self.pending_entries += 1
+            self.update_drives(journal_action, play_num, play_dict)
+        self.update_box_score(journal_action, play_num, play_dict)
+
+        if self.pending_entries >= self.compact_every:
+            self.compact()
+
+    def update_drives(
+        self,
+        journal_action: str,
+        play_num: int,
+        play_dict: dict = None
+    ) -> None:
+        """
+        Updates the drives stored for this game with a journal entry
+        that was just recorded. This does not commit.
+
+        Appending a play only rewrites the drive it ended (if any),
+        and the current drive. Every drive in the game is rebuilt
+        after a play is replaced or removed,
+        or on the first play recorded by this journal.
+        """
+        if journal_action == "append" and self.drive_builder is not None:
+            upsert_game_drives(
+                self.con,
+                self.game_id,
+                self.drive_builder.add_play(play_num, play_dict)
+            )
+            return
+
+        self.drive_builder = DriveBuilder()
+        for num, replayed_dict in enumerate(self.get_plays(), start=1):
+            self.drive_builder.add_play(num, replayed_dict)
+        save_game_drives(
+            self.con, self.game_id, self.drive_builder.get_drives()
+        )
+
+    def update_box_score(
+        self,
+        journal_action: str,
+        play_num: int,
+        play_dict: dict = None
+    ) -> None:
+        """
+        Adds, replaces, or removes a play in this game's box score,
+        if the box score has already been built.
+        """
+        if self.box_score is None:
+            return
+        elif journal_action == "append":
+            self.box_score.append_play(play_dict)
+        elif journal_action == "replace":
+            self.box_score.replace_play(play_num, play_dict)
+        else:
+            self.box_score.delete_play(play_num)
+
+    def get_box_score(self) -> BoxScore:
+        """
+        Returns the box score for this game
+        (see `core.pbp_engine.box_score.BoxScore()`).
+        """
+        if self.box_score is None:
+            self.box_score = BoxScore.from_plays(self.get_plays())
+        return self.box_score
+
+    def check_play_num(self, play_num: int) -> None:
+        """
+        Raises an `IndexError` if `play_num` is not a play in this game.
+        """
+        if play_num < 1 or play_num > self.play_count:
+            raise IndexError(
+                f"Play #{play_num} does not exist. " +
+                f"This game has {self.play_count} play(s)."
+            )
+
+    def append_play(self, play_dict: dict) -> int:
+        """
+        Adds a play to the end of this game.
+
+        Returns
+        ----------
+        The play number of the new play.
+        """
+        self.record("append", self.play_count + 1, play_dict)
+        self.play_count += 1
+        return self.play_count
+
+    def replace_play(self, play_num: int, play_dict: dict) -> None:
+        """
+        Replaces an existing play in this game.
+        """
+        self.check_play_num(play_num)
+        self.record("replace", play_num, play_dict)
+
+    def delete_play(self, play_num: int) -> None:
+        """
+        Removes a play from this game.
+        Every play after it moves up by one.
+        """
+        self.check_play_num(play_num)
+        self.record("delete", play_num)
+        self.play_count -= 1
+
+    def get_plays(self) -> list:
+        """
+        Returns every play in this game, including plays
+        that haven't been compacted yet.
+        """
+        plays_arr = load_game_plays(self.con, self.game_id)
+        if self.pending_entries == 0:
+            return plays_arr
+
+        return replay_journal_entries(
+            plays_arr, load_journal_entries(self.con, self.game_id)
+        )
+
+    def get_game_file(self) -> dict:
+        """
+        Returns the full game file for this game,
+        including plays that haven't been compacted yet.
+        """
+        game_dict = load_game_pbp(self.con, self.game_id)
+        if game_dict is None:
+            from core.pbp_engine.game import get_initial_game_file
+
+            game_dict = get_initial_game_file()
+            game_dict["game_info"]["game_id"] = self.game_id
+
+        game_dict["plays"] = self.get_plays()
+        game_dict["stats"] = self.get_box_score().get_stats()
+        return game_dict
+
+    def compact(self) -> int:
+        """
+        Compacts this journal into `fb_pbp_plays`
+        (see `compact_play_journal()`).
+
+        Returns
+        ----------
+        The number of journal entries that were compacted.
+        """
+        entries = compact_play_journal(self.con, self.game_id)
+        self.pending_entries = 0
+        return entries
+
+    def close(self) -> None:
+        """
+        Compacts this journal. Call this once a game is done being charted.
+        """
+        self.compact()
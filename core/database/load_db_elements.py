@@ -1,6 +1,6 @@
 """
 - Creation Date: 02/03/2024 02:54 PM EST
-- Last Updated: 06/04/2024 02:15 PM EDT
+- Last Updated: 10/19/2026 01:55 AM EDT
 - Author: Joseph Armstrong (armstrongjoseph08@gmail.com)
 - File Name: ./core/database/create_sdv_pbp_db.py
 - Purpose: Loads in data used by this application,
@@ -15,9 +15,11 @@ from os.path import expanduser
 
 import polars as pl
 
-from core.database.create_db_elements import (
-    SqliteSampleFiles, create_app_sqlite3_db
+from core.database.pbp_db_elements import (
+    PBP_PLAY_COLUMNS, build_plays_where_clause
 )
+from core.database.query_db_elements import build_where_clause
+from core.database.seed_db_elements import reseed_tables
 
 # class verify_db_integrity:
 #     """ """
@@ -56,8 +58,7 @@ class SqliteLoadData:
             logging.warning(
                 f"A SQLite3 Operational Error has been raised. Reason {e}"
             )
-            cur.executescript(SqliteSampleFiles.iso_nations())
-            con.commit()
+            reseed_tables(con, ["iso_nations"])
 
             df = pl.read_database(
                 query="SELECT * FROM iso_nations",
@@ -107,10 +108,7 @@ class SqliteLoadData:
             )
         except sqlite3.OperationalError:
             logging.warning("A SQLite3 Operational Error has been raised. ")
-            cur.executescript(SqliteSampleFiles.iso_3166_2_states())
-            con.commit()
-            cur.executescript(SqliteSampleFiles.iso_3166_2_data())
-            con.commit()
+            reseed_tables(con, ["iso_3166_2"])
             df = pl.read_database(
                 query="SELECT * FROM iso_3166_2",
                 connection=cur,
@@ -153,8 +151,7 @@ class SqliteLoadData:
             logging.warning(
                 "A SQLite3 Operational Error has been raised. "
             )
-            cur.executescript(SqliteSampleFiles.iso_timezones())
-            con.commit()
+            reseed_tables(con, ["iso_timezones"])
             df = pl.read_database(
                 query="SELECT * FROM iso_timezones",
                 connection=cur,
@@ -176,13 +173,22 @@ class SqliteLoadData:
 
     def load_leagues(
             con: sqlite3.Connection,
-            cur: sqlite3.Cursor
+            cur: sqlite3.Cursor,
+            league_id: str = None
     ) -> pl.DataFrame:
         """ """
+        where_clause, params = build_where_clause(
+            {
+                "league_id": league_id,
+            }
+        )
+        query = f"SELECT * FROM fb_leagues {where_clause}"
+
         try:
             df = pl.read_database(
-                query="SELECT * FROM fb_leagues",
+                query=query,
                 connection=cur,
+                execute_options={"parameters": params},
                 schema_overrides={
                     "league_id": pl.String,
                     "league_long_name": pl.String,
@@ -254,11 +260,11 @@ class SqliteLoadData:
                 "A SQLite3 Operational Error has been raised. " +
                 f"Reason: {e}"
             )
-            cur.executescript(SqliteSampleFiles.leagues_sql_file())
-            con.commit()
+            reseed_tables(con, ["fb_leagues"])
             df = pl.read_database(
-                query="SELECT * FROM fb_leagues",
+                query=query,
                 connection=cur,
+                execute_options={"parameters": params},
                 schema_overrides={
                     "league_id": pl.String,
                     "league_long_name": pl.String,
@@ -329,7 +335,7 @@ class SqliteLoadData:
             logging.critical(f"An unhandled exception has occurred: {e}")
             raise e
 
-        if len(df) < 1:
+        if len(df) < 1 and len(params) == 0:
             logging.error(
                 "[sqlite3].[dbo].[fb_leagues] has no data. "
                 + "Recreating database table."
@@ -338,13 +344,24 @@ class SqliteLoadData:
 
     def load_seasons(
             con: sqlite3.Connection,
-            cur: sqlite3.Cursor
+            cur: sqlite3.Cursor,
+            league_id: str = None,
+            season: int = None
     ) -> pl.DataFrame:
         """ """
+        where_clause, params = build_where_clause(
+            {
+                "league_id": league_id,
+                "season": season,
+            }
+        )
+        query = f"SELECT * FROM fb_seasons {where_clause}"
+
         try:
             df = pl.read_database(
-                query="SELECT * FROM fb_seasons",
+                query=query,
                 connection=cur,
+                execute_options={"parameters": params},
                 schema_overrides={
                     "season": pl.UInt16,
                     "league_id": pl.String,
@@ -409,11 +426,11 @@ class SqliteLoadData:
                 "A SQLite3 Operational Error has been raised. " +
                 f"Reason: {e}"
             )
-            cur.executescript(SqliteSampleFiles.seasons_sql_file())
-            con.commit()
+            reseed_tables(con, ["fb_seasons"])
             df = pl.read_database(
-                query="SELECT * FROM fb_seasons",
+                query=query,
                 connection=cur,
+                execute_options={"parameters": params},
                 schema_overrides={
                     "season": pl.UInt16,
                     "league_id": pl.String,
@@ -495,7 +512,7 @@ class SqliteLoadData:
             logging.critical(f"An unhandled exception has occurred: {e}")
             raise e
 
-        if len(df) < 1:
+        if len(df) < 1 and len(params) == 0:
             logging.error(
                 "[sqlite3].[dbo].[fb_seasons] has no data. "
                 + "Recreating database table."
@@ -504,13 +521,26 @@ class SqliteLoadData:
 
     def load_fb_teams(
             con: sqlite3.Connection,
-            cur: sqlite3.Cursor
+            cur: sqlite3.Cursor,
+            league_id: str = None,
+            season: int = None,
+            team_id: str = None
     ) -> pl.DataFrame:
         """ """
+        where_clause, params = build_where_clause(
+            {
+                "league_id": league_id,
+                "season": season,
+                "team_id": team_id,
+            }
+        )
+        query = f"SELECT * FROM fb_teams {where_clause}"
+
         try:
             df = pl.read_database(
-                query="SELECT * FROM fb_teams",
+                query=query,
                 connection=cur,
+                execute_options={"parameters": params},
                 infer_schema_length=100,
                 schema_overrides={
                     "season": pl.UInt16,
@@ -547,11 +577,11 @@ class SqliteLoadData:
                 "A SQLite3 Operational Error has been raised. " +
                 f"Reason: {e}"
             )
-            cur.executescript(SqliteSampleFiles.teams_sql_file())
-            con.commit()
+            reseed_tables(con, ["fb_teams"])
             df = pl.read_database(
-                query="SELECT * FROM fb_teams",
+                query=query,
                 connection=cur,
+                execute_options={"parameters": params},
                 infer_schema_length=100,
                 schema_overrides={
                     "season": pl.UInt16,
@@ -587,7 +617,7 @@ class SqliteLoadData:
             logging.critical(f"An unhandled exception has occurred: {e}")
             raise e
 
-        if len(df) < 1:
+        if len(df) < 1 and len(params) == 0:
             logging.error(
                 "[sqlite3].[dbo].[fb_teams] has no data. " +
                 "Recreating database table."
@@ -596,13 +626,28 @@ class SqliteLoadData:
 
     def load_fb_rosters(
             con: sqlite3.Connection,
-            cur: sqlite3.Cursor
+            cur: sqlite3.Cursor,
+            league_id: str = None,
+            season: int = None,
+            team_id: str = None,
+            player_id: int = None
     ) -> pl.DataFrame:
         """ """
+        where_clause, params = build_where_clause(
+            {
+                "league_id": league_id,
+                "season": season,
+                "team_id": team_id,
+                "player_id": player_id,
+            }
+        )
+        query = f"SELECT * FROM fb_rosters {where_clause}"
+
         try:
             df = pl.read_database(
-                query="SELECT * FROM fb_rosters",
+                query=query,
                 connection=cur,
+                execute_options={"parameters": params},
                 infer_schema_length=1000,
                 schema_overrides={
                     "season": pl.String,
@@ -652,11 +697,11 @@ class SqliteLoadData:
                 "A SQLite3 Operational Error has been raised. " +
                 f"Reason: {e}"
             )
-            cur.executescript(SqliteSampleFiles.rosters_sql_file())
-            con.commit()
+            reseed_tables(con, ["fb_rosters"])
             df = pl.read_database(
-                query="SELECT * FROM fb_rosters",
+                query=query,
                 connection=cur,
+                execute_options={"parameters": params},
                 infer_schema_length=1000,
                 schema_overrides={
                     "season": pl.String,
@@ -705,7 +750,7 @@ class SqliteLoadData:
             logging.critical(f"An unhandled exception has occurred: {e}")
             raise e
 
-        if len(df) < 1:
+        if len(df) < 1 and len(params) == 0:
             logging.error(
                 "[sqlite3].[dbo].[fb_rosters] has no data. "
                 + "Recreating database table."
@@ -714,13 +759,24 @@ class SqliteLoadData:
 
     def load_fb_stadiums(
             con: sqlite3.Connection,
-            cur: sqlite3.Cursor
+            cur: sqlite3.Cursor,
+            stadium_id: int = None,
+            team_id: str = None
     ) -> pl.DataFrame:
         """ """
+        where_clause, params = build_where_clause(
+            {
+                "stadium_id": stadium_id,
+                "team_id": team_id,
+            }
+        )
+        query = f"SELECT * FROM fb_stadiums {where_clause}"
+
         try:
             df = pl.read_database(
-                query="SELECT * FROM fb_stadiums",
+                query=query,
                 connection=cur,
+                execute_options={"parameters": params},
                 schema_overrides={
                     "stadium_id": pl.UInt64,
                     "team_id": pl.String,
@@ -745,11 +801,11 @@ class SqliteLoadData:
                 "A SQLite3 Operational Error has been raised. " +
                 f"Reason: {e}"
             )
-            cur.executescript(SqliteSampleFiles.stadiums_sql_file())
-            con.commit()
+            reseed_tables(con, ["fb_stadiums"])
             df = pl.read_database(
-                query="SELECT * FROM fb_stadiums",
+                query=query,
                 connection=cur,
+                execute_options={"parameters": params},
                 schema_overrides={
                     "stadium_id": pl.UInt64,
                     "team_id": pl.String,
@@ -774,7 +830,7 @@ class SqliteLoadData:
             raise e
 
         # print(df)
-        if len(df) < 1:
+        if len(df) < 1 and len(params) == 0:
             logging.error(
                 "[sqlite3].[dbo].[fb_stadiums] has no data. "
                 + "Recreating database table."
@@ -782,13 +838,31 @@ class SqliteLoadData:
         return df
 
     def load_fb_weekly_rosters(
-        con: sqlite3.Connection, cur: sqlite3.Cursor
+            con: sqlite3.Connection,
+            cur: sqlite3.Cursor,
+            league_id: str = None,
+            season: int = None,
+            team_id: str = None,
+            week: int = None,
+            game_id: int = None
     ) -> pl.DataFrame:
         """ """
+        where_clause, params = build_where_clause(
+            {
+                "league_id": league_id,
+                "season": season,
+                "team_id": team_id,
+                "week": week,
+                "game_id": game_id,
+            }
+        )
+        query = f"SELECT * FROM fb_weekly_rosters {where_clause}"
+
         try:
             df = pl.read_database(
-                query="SELECT * FROM fb_weekly_rosters",
+                query=query,
                 connection=cur,
+                execute_options={"parameters": params},
                 schema_overrides={
                     "season": pl.String,
                     "game_id": pl.Int64,
@@ -837,11 +911,11 @@ class SqliteLoadData:
                 "A SQLite3 Operational Error has been raised. " +
                 f"Reason: {e}"
             )
-            cur.executescript(SqliteSampleFiles.weekly_rosters_sql_file())
-            con.commit()
+            reseed_tables(con, ["fb_weekly_rosters"])
             df = pl.read_database(
-                query="SELECT * FROM fb_weekly_rosters",
+                query=query,
                 connection=cur,
+                execute_options={"parameters": params},
                 schema_overrides={
                     "season": pl.String,
                     "game_id": pl.Int64,
@@ -890,7 +964,7 @@ class SqliteLoadData:
             raise e
 
         # print(df)
-        if len(df) < 1:
+        if len(df) < 1 and len(params) == 0:
             logging.error(
                 "[sqlite3].[dbo].[fb_weekly_rosters] has no data. "
                 + "Recreating database table."
@@ -898,13 +972,31 @@ class SqliteLoadData:
         return df
 
     def load_fb_depth_charts(
-        con: sqlite3.Connection, cur: sqlite3.Cursor
+            con: sqlite3.Connection,
+            cur: sqlite3.Cursor,
+            league_id: str = None,
+            season: int = None,
+            team_abv: str = None,
+            week: int = None,
+            game_id: int = None
     ) -> pl.DataFrame:
         """ """
+        where_clause, params = build_where_clause(
+            {
+                "league_id": league_id,
+                "season": season,
+                "team_abv": team_abv,
+                "week": week,
+                "game_id": game_id,
+            }
+        )
+        query = f"SELECT * FROM fb_depth_charts {where_clause}"
+
         try:
             df = pl.read_database(
-                query="SELECT * FROM fb_depth_charts",
+                query=query,
                 connection=cur,
+                execute_options={"parameters": params},
                 schema_overrides={
                     "season": pl.Int16,
                     "league_id": pl.String,
@@ -940,11 +1032,11 @@ class SqliteLoadData:
                 "A SQLite3 Operational Error has been raised. " +
                 f"Reason: {e}"
             )
-            cur.executescript(SqliteSampleFiles.depth_chart_sql_file())
-            con.commit()
+            reseed_tables(con, ["fb_depth_charts"])
             df = pl.read_database(
-                query="SELECT * FROM fb_depth_charts",
+                query=query,
                 connection=cur,
+                execute_options={"parameters": params},
                 schema_overrides={
                     "season": pl.Int16,
                     "league_id": pl.String,
@@ -980,7 +1072,7 @@ class SqliteLoadData:
             raise e
 
         # print(df)
-        if len(df) < 1:
+        if len(df) < 1 and len(params) == 0:
             logging.error(
                 "[sqlite3].[dbo].[fb_weekly_rosters] has no data. "
                 + "Recreating database table."
@@ -989,13 +1081,32 @@ class SqliteLoadData:
 
     def load_fb_schedule(
             con: sqlite3.Connection,
-            cur: sqlite3.Cursor
+            cur: sqlite3.Cursor,
+            league_id: str = None,
+            season: int = None,
+            week: int = None,
+            team_abv: str = None,
+            game_id: int = None,
+            nflverse_game_id: str = None
     ) -> pl.DataFrame:
         """ """
+        where_clause, params = build_where_clause(
+            {
+                "league_id": league_id,
+                "season": season,
+                "week": week,
+                ("away_team_abv", "home_team_abv"): team_abv,
+                "game_id": game_id,
+                "nflverse_game_id": nflverse_game_id,
+            }
+        )
+        query = f"SELECT * FROM fb_schedule {where_clause}"
+
         try:
             df = pl.read_database(
-                query="SELECT * FROM fb_schedule",
+                query=query,
                 connection=cur,
+                execute_options={"parameters": params},
                 infer_schema_length=1000,
                 schema_overrides={
                     "game_is_in_progress": pl.Binary,
@@ -1047,11 +1158,11 @@ class SqliteLoadData:
                 "A SQLite3 Operational Error has been raised. " +
                 f"Reason: {e}"
             )
-            cur.executescript(SqliteSampleFiles.schedule_sql_file())
-            con.commit()
+            reseed_tables(con, ["fb_schedule"])
             df = pl.read_database(
-                query="SELECT * FROM fb_schedule",
+                query=query,
                 connection=cur,
+                execute_options={"parameters": params},
                 infer_schema_length=1000,
                 schema_overrides={
                     "game_is_in_progress": pl.Binary,
@@ -1104,7 +1215,7 @@ class SqliteLoadData:
             raise e
 
         # print(df)
-        if len(df) < 1:
+        if len(df) < 1 and len(params) == 0:
             logging.error(
                 "[sqlite3].[dbo].[fb_weekly_rosters] has no data. "
                 + "Recreating database table."
@@ -1113,13 +1224,22 @@ class SqliteLoadData:
 
     def load_fb_game_refs(
             con: sqlite3.Connection,
-            cur: sqlite3.Cursor
+            cur: sqlite3.Cursor,
+            game_id: int = None
     ) -> pl.DataFrame:
         """ """
+        where_clause, params = build_where_clause(
+            {
+                "game_id": game_id,
+            }
+        )
+        query = f"SELECT * FROM fb_game_refs {where_clause}"
+
         try:
             df = pl.read_database(
-                query="SELECT * FROM fb_game_refs",
+                query=query,
                 connection=cur,
+                execute_options={"parameters": params},
                 schema_overrides={
                     "game_id": pl.UInt64,
                     "ref_num": pl.UInt16,
@@ -1135,11 +1255,11 @@ class SqliteLoadData:
                 "A SQLite3 Operational Error has been raised. " +
                 f"Reason: {e}"
             )
-            cur.executescript(SqliteSampleFiles.game_refs_sql_file())
-            con.commit()
+            reseed_tables(con, ["fb_game_refs"])
             df = pl.read_database(
-                query="SELECT * FROM fb_game_refs",
+                query=query,
                 connection=cur,
+                execute_options={"parameters": params},
                 schema_overrides={
                     "game_id": pl.UInt64,
                     "ref_num": pl.UInt16,
@@ -1155,7 +1275,7 @@ class SqliteLoadData:
             raise e
 
         # print(df)
-        if len(df) < 1:
+        if len(df) < 1 and len(params) == 0:
             logging.error(
                 "[sqlite3].[dbo].[fb_weekly_rosters] has no data. "
                 + "Recreating database table."
@@ -1164,13 +1284,22 @@ class SqliteLoadData:
 
     def load_fb_pbp(
             con: sqlite3.Connection,
-            cur: sqlite3.Cursor
+            cur: sqlite3.Cursor,
+            game_id: int = None
     ) -> pl.DataFrame:
         """ """
+        where_clause, params = build_where_clause(
+            {
+                "game_id": game_id,
+            }
+        )
+        query = f"SELECT * FROM fb_pbp {where_clause}"
+
         try:
             df = pl.read_database(
-                query="SELECT * FROM fb_pbp",
+                query=query,
                 connection=cur,
+                execute_options={"parameters": params},
                 schema_overrides={
                     "game_id": pl.UInt64,
                     "game_json_str": pl.String
@@ -1181,11 +1310,11 @@ class SqliteLoadData:
                 "A SQLite3 Operational Error has been raised. " +
                 f"Reason: {e}"
             )
-            cur.executescript(SqliteSampleFiles.game_pbp_sql_file())
-            con.commit()
+            reseed_tables(con, ["fb_pbp"])
             df = pl.read_database(
-                query="SELECT * FROM fb_pbp",
+                query=query,
                 connection=cur,
+                execute_options={"parameters": params},
                 schema_overrides={
                     "game_id": pl.UInt64,
                     "game_json_str": pl.String
@@ -1197,13 +1326,513 @@ class SqliteLoadData:
             raise e
 
         # print(df)
-        if len(df) < 1:
+        if len(df) < 1 and len(params) == 0:
             logging.error(
                 "[sqlite3].[dbo].[fb_pbp] has no data. " +
                 "Recreating database table."
             )
         return df
 
+    def load_fb_pbp_plays(
+            con: sqlite3.Connection,
+            cur: sqlite3.Cursor,
+            game_id: int = None,
+            league_id: str = None,
+            season: int = None,
+            week: int = None,
+            include_details: bool = False
+    ) -> pl.DataFrame:
+        """
+        Loads every play in a game, or in every game
+        in a league/season/week, with one row per play.
+
+        Parameters
+        ----------
+        `con` (sqlite3.Connection, mandatory):
+            A connection to the database for this application.
+
+        `cur` (sqlite3.Cursor, mandatory):
+            A cursor for `con`.
+
+        `game_id`, `league_id`, `season`, `week` (optional):
+            Only plays in games that match these filters are loaded.
+
+        `include_details` (bool, optional):
+            If set to `True`, the `play_details_json` column
+            (every field in a play without its own column) is also loaded.
+
+        Returns
+        ----------
+        A `polars` DataFrame of plays,
+        ordered by `game_id`, and then by `play_num`.
+        """
+        columns_arr = ["game_id", "league_id", "season", "week", "play_num"]
+        columns_arr += list(PBP_PLAY_COLUMNS)
+        if include_details is True:
+            columns_arr.append("play_details_json")
+
+        where_clause, params = build_plays_where_clause(
+            game_id=game_id,
+            league_id=league_id,
+            season=season,
+            week=week
+        )
+        query = (
+            f"SELECT {', '.join(columns_arr)} FROM fb_pbp_plays " +
+            f"INNER JOIN fb_schedule USING (game_id) {where_clause} " +
+            "ORDER BY game_id, play_num"
+        )
+        schema_overrides = {
+            "game_id": pl.UInt64,
+            "league_id": pl.String,
+            "season": pl.UInt16,
+            "week": pl.UInt8,
+            "play_num": pl.UInt16,
+            "play_type": pl.String,
+            "play_desc": pl.String,
+            "drive_num": pl.UInt16,
+            "half_num": pl.UInt8,
+            "quarter_num": pl.UInt8,
+            "quarter_time_left": pl.Int16,
+            "half_time_left": pl.Int16,
+            "game_time_left": pl.Int16,
+            "quarter_time_left_str": pl.String,
+            "pos_team": pl.String,
+            "def_team": pl.String,
+            "down": pl.UInt8,
+            "distance": pl.Int16,
+            "yardline_start": pl.Int16,
+            "yardline_end": pl.Int16,
+            "starting_hash": pl.String,
+            "home_score": pl.Int16,
+            "away_score": pl.Int16,
+            "home_score_post": pl.Int16,
+            "away_score_post": pl.Int16,
+            "posteam_score": pl.Int16,
+            "defteam_score": pl.Int16,
+            "posteam_post": pl.Int16,
+            "defteam_post": pl.Int16,
+            "fg_attempt_distance": pl.Int16,
+            "play_details_json": pl.String,
+        }
+        for column in PBP_PLAY_COLUMNS:
+            if column.startswith("is_"):
+                schema_overrides[column] = pl.Boolean
+
+        try:
+            df = pl.read_database(
+                query=query,
+                connection=cur,
+                execute_options={"parameters": params},
+                schema_overrides=schema_overrides,
+            )
+        except sqlite3.OperationalError as e:
+            logging.warning(
+                "A SQLite3 Operational Error has been raised. " +
+                f"Reason: {e}"
+            )
+            reseed_tables(con, ["fb_pbp_plays"])
+            df = pl.read_database(
+                query=query,
+                connection=cur,
+                execute_options={"parameters": params},
+                schema_overrides=schema_overrides,
+            )
+
+        except Exception as e:
+            logging.critical(f"An unhandled exception has occurred: {e}")
+            raise e
+
+        return df
+
+    def load_fb_pbp_play_players(
+            con: sqlite3.Connection,
+            cur: sqlite3.Cursor,
+            game_id: int = None,
+            league_id: str = None,
+            season: int = None,
+            week: int = None
+    ) -> pl.DataFrame:
+        """
+        Loads every player that had a role in, or participated in,
+        a play in a game, or in every game in a league/season/week.
+        """
+        where_clause, params = build_plays_where_clause(
+            game_id=game_id,
+            league_id=league_id,
+            season=season,
+            week=week
+        )
+        query = (
+            "SELECT fb_pbp_play_players.* FROM fb_pbp_play_players " +
+            f"INNER JOIN fb_schedule USING (game_id) {where_clause} " +
+            "ORDER BY game_id, play_num, player_role, player_order"
+        )
+        schema_overrides = {
+            "game_id": pl.UInt64,
+            "play_num": pl.UInt16,
+            "player_role": pl.String,
+            "player_order": pl.UInt8,
+            "player_id": pl.UInt64,
+            "team_id": pl.String,
+            "player_num": pl.UInt8,
+            "player_full_name": pl.String,
+            "player_football_name": pl.String,
+            "player_position": pl.String,
+        }
+
+        try:
+            df = pl.read_database(
+                query=query,
+                connection=cur,
+                execute_options={"parameters": params},
+                schema_overrides=schema_overrides,
+            )
+        except sqlite3.OperationalError as e:
+            logging.warning(
+                "A SQLite3 Operational Error has been raised. " +
+                f"Reason: {e}"
+            )
+            reseed_tables(con, ["fb_pbp_play_players"])
+            df = pl.read_database(
+                query=query,
+                connection=cur,
+                execute_options={"parameters": params},
+                schema_overrides=schema_overrides,
+            )
+
+        except Exception as e:
+            logging.critical(f"An unhandled exception has occurred: {e}")
+            raise e
+
+        return df
+
+    def load_fb_pbp_play_tacklers(
+            con: sqlite3.Connection,
+            cur: sqlite3.Cursor,
+            game_id: int = None,
+            league_id: str = None,
+            season: int = None,
+            week: int = None
+    ) -> pl.DataFrame:
+        """
+        Loads every tackler in a play in a game,
+        or in every game in a league/season/week.
+        """
+        where_clause, params = build_plays_where_clause(
+            game_id=game_id,
+            league_id=league_id,
+            season=season,
+            week=week
+        )
+        query = (
+            "SELECT fb_pbp_play_tacklers.* FROM fb_pbp_play_tacklers " +
+            f"INNER JOIN fb_schedule USING (game_id) {where_clause} " +
+            "ORDER BY game_id, play_num, tackler_order"
+        )
+        schema_overrides = {
+            "game_id": pl.UInt64,
+            "play_num": pl.UInt16,
+            "tackler_order": pl.UInt8,
+            "player_id": pl.UInt64,
+            "team_id": pl.String,
+            "player_num": pl.UInt8,
+            "player_full_name": pl.String,
+            "player_football_name": pl.String,
+            "is_tfl": pl.Boolean,
+            "is_sack": pl.Boolean,
+            "is_sack_fumble": pl.Boolean,
+        }
+
+        try:
+            df = pl.read_database(
+                query=query,
+                connection=cur,
+                execute_options={"parameters": params},
+                schema_overrides=schema_overrides,
+            )
+        except sqlite3.OperationalError as e:
+            logging.warning(
+                "A SQLite3 Operational Error has been raised. " +
+                f"Reason: {e}"
+            )
+            reseed_tables(con, ["fb_pbp_play_tacklers"])
+            df = pl.read_database(
+                query=query,
+                connection=cur,
+                execute_options={"parameters": params},
+                schema_overrides=schema_overrides,
+            )
+
+        except Exception as e:
+            logging.critical(f"An unhandled exception has occurred: {e}")
+            raise e
+
+        return df
+
+    def load_fb_pbp_play_penalties(
+            con: sqlite3.Connection,
+            cur: sqlite3.Cursor,
+            game_id: int = None,
+            league_id: str = None,
+            season: int = None,
+            week: int = None
+    ) -> pl.DataFrame:
+        """
+        Loads every penalty in a play in a game,
+        or in every game in a league/season/week.
+        """
+        where_clause, params = build_plays_where_clause(
+            game_id=game_id,
+            league_id=league_id,
+            season=season,
+            week=week
+        )
+        query = (
+            "SELECT fb_pbp_play_penalties.* FROM fb_pbp_play_penalties " +
+            f"INNER JOIN fb_schedule USING (game_id) {where_clause} " +
+            "ORDER BY game_id, play_num, penalty_order"
+        )
+        schema_overrides = {
+            "game_id": pl.UInt64,
+            "play_num": pl.UInt16,
+            "penalty_order": pl.UInt8,
+            "penalty_num": pl.UInt16,
+            "penalty_id": pl.String,
+            "penalty_name": pl.String,
+            "is_offensive_penalty": pl.Boolean,
+            "is_penalty_accepted": pl.Boolean,
+            "is_personal_foul": pl.Boolean,
+            "is_player_ejected": pl.Boolean,
+            "is_team_penalty": pl.Boolean,
+            "player_id": pl.UInt64,
+            "team_id": pl.String,
+            "player_num": pl.UInt8,
+            "player_full_name": pl.String,
+            "player_football_name": pl.String,
+        }
+
+        try:
+            df = pl.read_database(
+                query=query,
+                connection=cur,
+                execute_options={"parameters": params},
+                schema_overrides=schema_overrides,
+            )
+        except sqlite3.OperationalError as e:
+            logging.warning(
+                "A SQLite3 Operational Error has been raised. " +
+                f"Reason: {e}"
+            )
+            reseed_tables(con, ["fb_pbp_play_penalties"])
+            df = pl.read_database(
+                query=query,
+                connection=cur,
+                execute_options={"parameters": params},
+                schema_overrides=schema_overrides,
+            )
+
+        except Exception as e:
+            logging.critical(f"An unhandled exception has occurred: {e}")
+            raise e
+
+        return df
+
+    def load_fb_pbp_drives(
+            con: sqlite3.Connection,
+            cur: sqlite3.Cursor,
+            game_id: int = None,
+            league_id: str = None,
+            season: int = None,
+            week: int = None
+    ) -> pl.DataFrame:
+        """
+        Loads every drive in a game,
+        or in every game in a league/season/week,
+        with one row per drive.
+        """
+        where_clause, params = build_plays_where_clause(
+            game_id=game_id,
+            league_id=league_id,
+            season=season,
+            week=week
+        )
+        query = (
+            "SELECT fb_pbp_drives.* FROM fb_pbp_drives " +
+            f"INNER JOIN fb_schedule USING (game_id) {where_clause} " +
+            "ORDER BY game_id, drive_num"
+        )
+        schema_overrides = {
+            "game_id": pl.UInt64,
+            "drive_num": pl.UInt16,
+            "pos_team": pl.String,
+            "def_team": pl.String,
+            "first_play_num": pl.UInt16,
+            "last_play_num": pl.UInt16,
+            "start_quarter_num": pl.UInt8,
+            "end_quarter_num": pl.UInt8,
+            "start_half_num": pl.UInt8,
+            "start_quarter_time_left": pl.Int16,
+            "end_quarter_time_left": pl.Int16,
+            "start_game_time_left": pl.Int16,
+            "end_game_time_left": pl.Int16,
+            "time_of_possession": pl.Int16,
+            "start_yardline": pl.Int16,
+            "end_yardline": pl.Int16,
+            "yards": pl.Int16,
+            "play_count": pl.UInt16,
+            "first_downs": pl.UInt8,
+            "is_red_zone": pl.Boolean,
+            "start_transition": pl.String,
+            "drive_result": pl.String,
+            "points": pl.Int16,
+            "is_finished": pl.Boolean,
+        }
+
+        try:
+            df = pl.read_database(
+                query=query,
+                connection=cur,
+                execute_options={"parameters": params},
+                schema_overrides=schema_overrides,
+            )
+        except sqlite3.OperationalError as e:
+            logging.warning(
+                "A SQLite3 Operational Error has been raised. " +
+                f"Reason: {e}"
+            )
+            reseed_tables(con, ["fb_pbp_drives"])
+            df = pl.read_database(
+                query=query,
+                connection=cur,
+                execute_options={"parameters": params},
+                schema_overrides=schema_overrides,
+            )
+
+        except Exception as e:
+            logging.critical(f"An unhandled exception has occurred: {e}")
+            raise e
+
+        return df
+
+    def load_fb_player_season_stats(
+            con: sqlite3.Connection,
+            cur: sqlite3.Cursor,
+            league_id: str = None,
+            season: int = None,
+            team_id: str = None,
+            player_id: int = None
+    ) -> pl.DataFrame:
+        """
+        Loads the season totals of every player in a league/season,
+        with one row per stat.
+        """
+        where_clause, params = build_where_clause(
+            {
+                "league_id": league_id,
+                "season": season,
+                "team_id": team_id,
+                "player_id": player_id,
+            }
+        )
+        query = (
+            f"SELECT * FROM fb_player_season_stats {where_clause} " +
+            "ORDER BY league_id, season, team_id, player_id, " +
+            "stat_category, stat_name"
+        )
+        schema_overrides = {
+            "league_id": pl.String,
+            "season": pl.UInt16,
+            "team_id": pl.String,
+            "player_id": pl.UInt64,
+            "stat_category": pl.String,
+            "stat_name": pl.String,
+            "stat_value": pl.Float64,
+        }
+
+        try:
+            df = pl.read_database(
+                query=query,
+                connection=cur,
+                execute_options={"parameters": params},
+                schema_overrides=schema_overrides,
+            )
+        except sqlite3.OperationalError as e:
+            logging.warning(
+                "A SQLite3 Operational Error has been raised. " +
+                f"Reason: {e}"
+            )
+            reseed_tables(con, ["fb_player_season_stats"])
+            df = pl.read_database(
+                query=query,
+                connection=cur,
+                execute_options={"parameters": params},
+                schema_overrides=schema_overrides,
+            )
+
+        except Exception as e:
+            logging.critical(f"An unhandled exception has occurred: {e}")
+            raise e
+
+        return df
+
+    def load_fb_team_season_stats(
+            con: sqlite3.Connection,
+            cur: sqlite3.Cursor,
+            league_id: str = None,
+            season: int = None,
+            team_id: str = None
+    ) -> pl.DataFrame:
+        """
+        Loads the season totals of every team in a league/season,
+        with one row per stat.
+        """
+        where_clause, params = build_where_clause(
+            {
+                "league_id": league_id,
+                "season": season,
+                "team_id": team_id,
+            }
+        )
+        query = (
+            f"SELECT * FROM fb_team_season_stats {where_clause} " +
+            "ORDER BY league_id, season, team_id, stat_category, stat_name"
+        )
+        schema_overrides = {
+            "league_id": pl.String,
+            "season": pl.UInt16,
+            "team_id": pl.String,
+            "stat_category": pl.String,
+            "stat_name": pl.String,
+            "stat_value": pl.Float64,
+        }
+
+        try:
+            df = pl.read_database(
+                query=query,
+                connection=cur,
+                execute_options={"parameters": params},
+                schema_overrides=schema_overrides,
+            )
+        except sqlite3.OperationalError as e:
+            logging.warning(
+                "A SQLite3 Operational Error has been raised. " +
+                f"Reason: {e}"
+            )
+            reseed_tables(con, ["fb_team_season_stats"])
+            df = pl.read_database(
+                query=query,
+                connection=cur,
+                execute_options={"parameters": params},
+                schema_overrides=schema_overrides,
+            )
+
+        except Exception as e:
+            logging.critical(f"An unhandled exception has occurred: {e}")
+            raise e
+
+        return df
+
 
 def test_sqlite3_load(custom_dir: str = None):
     home_dir = expanduser("~")
@@ -1217,6 +1846,8 @@ def test_sqlite3_load(custom_dir: str = None):
         con = sqlite3.connect(f"{sql_dir}/.sdv_pbp_fb/sdv_pbp_py.sqlite")
         cur = con.cursor()
     except sqlite3.OperationalError as e:
+        from core.database.create_db_elements import create_app_sqlite3_db
+
         create_app_sqlite3_db(custom_dir)
         logging.warning(
             "A SQLite3 Operational Error has been raised. " + f"Reason: {e}"
@@ -1235,6 +1866,7 @@ def test_sqlite3_load(custom_dir: str = None):
     print(SqliteLoadData.load_fb_schedule(con, cur))
     print(SqliteLoadData.load_fb_game_refs(con, cur))
     print(SqliteLoadData.load_fb_pbp(con, cur))
+    print(SqliteLoadData.load_fb_pbp_plays(con, cur))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,609 @@
+"""
+- Creation Date: 10/18/2026 04:00 PM EDT
+- Last Updated: 10/19/2026 01:55 AM EDT
+- Author: Joseph Armstrong (armstrongjoseph08@gmail.com)
+- File Name: ./core/database/pbp_db_elements.py
+- Purpose: Saves, and rebuilds, play-by-play (PBP) data
+-   stored one row per play in `fb_pbp_plays`,
+-   with the players, tacklers, and penalties in each play
+-   stored in their own tables.
+-   The rest of a game file (everything but `"plays"`)
+-   is still stored in `fb_pbp.game_json_str`.
+"""
+
+###############################################################################
+
+import json
+import logging
+import sqlite3
+
+from core.database.drive_db_elements import (
+    is_game_finished,
+    load_game_drives,
+    save_game_drives,
+)
+from core.database.query_db_elements import build_where_clause
+from core.database.stats_db_elements import save_game_stats
+from core.pbp_engine.box_score import BoxScore
+from core.pbp_engine.drives import DriveBuilder
+from core.pbp_engine.game_codec import from_json, to_json
+
+# Every field in a play that has its own column in `fb_pbp_plays`,
+# in the order those columns are stored.
+PBP_PLAY_COLUMNS = (
+    "play_type",
+    "play_desc",
+    "drive_num",
+    "half_num",
+    "quarter_num",
+    "quarter_time_left",
+    "half_time_left",
+    "game_time_left",
+    "quarter_time_left_str",
+    "pos_team",
+    "def_team",
+    "down",
+    "distance",
+    "is_goal_to_go",
+    "yardline_start",
+    "yardline_end",
+    "starting_hash",
+    "home_score",
+    "away_score",
+    "home_score_post",
+    "away_score_post",
+    "posteam_score",
+    "defteam_score",
+    "posteam_post",
+    "defteam_post",
+    "is_scoring_play",
+    "is_touchdown",
+    "is_safety",
+    "is_turnover",
+    "is_no_play",
+    "is_first_down",
+    "is_completed_pass",
+    "is_intercepted",
+    "is_sack_play",
+    "is_fumble",
+    "is_touchback",
+    "is_fg_made",
+    "fg_attempt_distance",
+)
+
+# Keys in a play that hold a single player,
+# and are stored in `fb_pbp_play_players`.
+PBP_PLAYER_ROLES = (
+    "passer",
+    "receiver",
+    "rusher",
+    "kicker",
+    "punter",
+    "returner",
+    "blocker",
+    "own_kickoff_recovery_player",
+)
+
+# The fields that identify a player within a play.
+PBP_PLAYER_COLUMNS = (
+    "player_id",
+    "team_id",
+    "player_num",
+    "player_full_name",
+    "player_football_name",
+)
+
+PBP_TACKLER_COLUMNS = PBP_PLAYER_COLUMNS + (
+    "is_tfl",
+    "is_sack",
+    "is_sack_fumble",
+)
+
+PBP_PENALTY_COLUMNS = (
+    "penalty_num",
+    "penalty_id",
+    "penalty_name",
+    "is_offensive_penalty",
+    "is_penalty_accepted",
+    "is_personal_foul",
+    "is_player_ejected",
+    "is_team_penalty",
+)
+
+# Every table a play is stored in.
+PBP_PLAY_TABLES = (
+    "fb_pbp_play_players",
+    "fb_pbp_play_tacklers",
+    "fb_pbp_play_penalties",
+    "fb_pbp_plays",
+)
+
+# Lists the typed columns a play did not have,
+# so that those fields aren't added to the play when it is rebuilt.
+ABSENT_COLUMNS_KEY = "_absent_columns"
+
+
+def to_nullable_bool(value) -> bool:
+    """
+    Converts a SQLite3 `INTEGER` back into a `bool`,
+    unless that value is `NULL`.
+    """
+    if value is None:
+        return None
+    return bool(value)
+
+
+def split_play(game_id: int, play_num: int, play_dict: dict) -> tuple:
+    """
+    Splits a play (see `core.pbp_engine.plays.Plays()`)
+    into rows for `fb_pbp_plays`, `fb_pbp_play_players`,
+    `fb_pbp_play_tacklers`, and `fb_pbp_play_penalties`.
+
+    Players, tacklers, and penalties are only moved into their own table
+    if they have exactly the fields those tables store.
+    Anything else is kept in `play_details_json` as-is,
+    so no part of a play is ever lost.
+
+    Parameters
+    ----------
+    `game_id` (int, mandatory):
+        The game this play is in.
+
+    `play_num` (int, mandatory):
+        Where this play is within the game, starting at 1.
+
+    `play_dict` (dict, mandatory):
+        The play to split.
+
+    Returns
+    ----------
+    A tuple containing the row for `fb_pbp_plays`,
+    and lists of rows for `fb_pbp_play_players`,
+    `fb_pbp_play_tacklers`, and `fb_pbp_play_penalties`.
+    """
+    details_dict = {}
+    players_arr = []
+    tacklers_arr = []
+    penalties_arr = []
+
+    player_keys = set(PBP_PLAYER_COLUMNS)
+    participant_keys = player_keys | {"player_position"}
+    tackler_keys = set(PBP_TACKLER_COLUMNS)
+    penalty_keys = set(PBP_PENALTY_COLUMNS) | {"player"}
+
+    for key, value in play_dict.items():
+        if key in PBP_PLAY_COLUMNS:
+            continue
+        elif key in PBP_PLAYER_ROLES and isinstance(value, dict) and \
+                set(value) == player_keys and \
+                any(x is not None for x in value.values()):
+            players_arr.append(
+                (game_id, play_num, key, 0) +
+                tuple(value[x] for x in PBP_PLAYER_COLUMNS) +
+                (None,)
+            )
+            details_dict[key] = {}
+        elif key == "participating_players" and \
+                isinstance(value, list) and \
+                all(set(x) == participant_keys for x in value):
+            for i, player in enumerate(value):
+                players_arr.append(
+                    (game_id, play_num, key, i) +
+                    tuple(player[x] for x in PBP_PLAYER_COLUMNS) +
+                    (player["player_position"],)
+                )
+            details_dict[key] = []
+        elif key == "tacklers" and isinstance(value, list) and \
+                all(set(x) == tackler_keys for x in value):
+            for i, tackler in enumerate(value):
+                tacklers_arr.append(
+                    (game_id, play_num, i) +
+                    tuple(tackler[x] for x in PBP_TACKLER_COLUMNS)
+                )
+            details_dict[key] = []
+        elif key == "penalties" and isinstance(value, list) and \
+                all(
+                    set(x) == penalty_keys and
+                    isinstance(x["player"], dict) and
+                    set(x["player"]) == player_keys
+                    for x in value
+                ):
+            for i, penalty in enumerate(value):
+                penalties_arr.append(
+                    (game_id, play_num, i) +
+                    tuple(penalty[x] for x in PBP_PENALTY_COLUMNS) +
+                    tuple(penalty["player"][x] for x in PBP_PLAYER_COLUMNS)
+                )
+            details_dict[key] = []
+        else:
+            details_dict[key] = value
+
+    absent_columns = [x for x in PBP_PLAY_COLUMNS if x not in play_dict]
+    if len(absent_columns) > 0:
+        details_dict[ABSENT_COLUMNS_KEY] = absent_columns
+
+    play_row = (
+        (game_id, play_num) +
+        tuple(play_dict.get(x) for x in PBP_PLAY_COLUMNS) +
+        (to_json(details_dict),)
+    )
+    return play_row, players_arr, tacklers_arr, penalties_arr
+
+
+def rebuild_play(
+    play_row: tuple,
+    players_arr: list,
+    tacklers_arr: list,
+    penalties_arr: list
+) -> dict:
+    """
+    Rebuilds a play from the rows created by `split_play()`.
+
+    Parameters
+    ----------
+    `play_row` (tuple, mandatory):
+        A row from `fb_pbp_plays`, in the same order as `split_play()`.
+
+    `players_arr`, `tacklers_arr`, `penalties_arr` (list, mandatory):
+        The rows in `fb_pbp_play_players`, `fb_pbp_play_tacklers`,
+        and `fb_pbp_play_penalties` for this play,
+        in the same order as `split_play()`.
+
+    Returns
+    ----------
+    The play, as a dictionary.
+    """
+    details_dict = from_json(play_row[-1])
+    absent_columns = details_dict.pop(ABSENT_COLUMNS_KEY, [])
+    play_dict = {}
+
+    for column, value in zip(PBP_PLAY_COLUMNS, play_row[2:-1]):
+        if column in absent_columns:
+            continue
+        elif column.startswith("is_"):
+            value = to_nullable_bool(value)
+        play_dict[column] = value
+
+    play_dict.update(details_dict)
+
+    for row in players_arr:
+        player_dict = dict(zip(PBP_PLAYER_COLUMNS, row[4:9]))
+        if row[2] == "participating_players":
+            player_dict["player_position"] = row[9]
+            play_dict[row[2]].append(player_dict)
+        else:
+            play_dict[row[2]] = player_dict
+
+    for row in tacklers_arr:
+        tackler_dict = dict(zip(PBP_TACKLER_COLUMNS, row[3:]))
+        for flag in PBP_TACKLER_COLUMNS[5:]:
+            tackler_dict[flag] = to_nullable_bool(tackler_dict[flag])
+        play_dict["tacklers"].append(tackler_dict)
+
+    for row in penalties_arr:
+        penalty_len = len(PBP_PENALTY_COLUMNS)
+        penalty_dict = dict(zip(PBP_PENALTY_COLUMNS, row[3:3 + penalty_len]))
+        for flag in PBP_PENALTY_COLUMNS[3:]:
+            penalty_dict[flag] = to_nullable_bool(penalty_dict[flag])
+        penalty_dict["player"] = dict(
+            zip(PBP_PLAYER_COLUMNS, row[3 + penalty_len:])
+        )
+        play_dict["penalties"].append(penalty_dict)
+
+    return play_dict
+
+
+def insert_game_plays(
+    con: sqlite3.Connection,
+    game_id: int,
+    plays_arr: list
+) -> None:
+    """
+    Replaces every play stored for a game with the plays in `plays_arr`,
+    and rebuilds the drives and box score of that game.
+    This does not commit, so that it can be part of a larger transaction.
+    """
+    play_rows_arr = []
+    players_arr = []
+    tacklers_arr = []
+    penalties_arr = []
+
+    for play_num, play_dict in enumerate(plays_arr, start=1):
+        play_row, players, tacklers, penalties = split_play(
+            game_id, play_num, play_dict
+        )
+        play_rows_arr.append(play_row)
+        players_arr += players
+        tacklers_arr += tacklers
+        penalties_arr += penalties
+
+    delete_game_plays(con, game_id, commit=False)
+    insert_play_rows(
+        con, play_rows_arr, players_arr, tacklers_arr, penalties_arr
+    )
+    save_game_drives(
+        con,
+        game_id,
+        DriveBuilder.build_drives(
+            plays_arr, is_game_finished(con, game_id)
+        )
+    )
+    save_game_stats(
+        con, game_id, BoxScore.from_plays(plays_arr).get_stats()
+    )
+
+
+def insert_play_rows(
+    con: sqlite3.Connection,
+    play_rows_arr: list,
+    players_arr: list,
+    tacklers_arr: list,
+    penalties_arr: list
+) -> None:
+    """
+    Inserts rows created by `split_play()`. This does not commit.
+    """
+    con.executemany(
+        "INSERT INTO fb_pbp_plays VALUES " +
+        f"({','.join(['?'] * (len(PBP_PLAY_COLUMNS) + 3))})",
+        play_rows_arr
+    )
+    con.executemany(
+        "INSERT INTO fb_pbp_play_players VALUES " +
+        f"({','.join(['?'] * 10)})",
+        players_arr
+    )
+    con.executemany(
+        "INSERT INTO fb_pbp_play_tacklers VALUES " +
+        f"({','.join(['?'] * 11)})",
+        tacklers_arr
+    )
+    con.executemany(
+        "INSERT INTO fb_pbp_play_penalties VALUES " +
+        f"({','.join(['?'] * 16)})",
+        penalties_arr
+    )
+
+
+def replace_game_play(
+    con: sqlite3.Connection,
+    game_id: int,
+    play_num: int,
+    play_dict: dict
+) -> None:
+    """
+    Replaces (or adds) a single play in a game,
+    without touching any other play in that game.
+    This does not commit, so that it can be part of a larger transaction.
+    """
+    for table_name in PBP_PLAY_TABLES:
+        con.execute(
+            f"DELETE FROM {table_name} WHERE game_id = ? AND play_num = ?",
+            (game_id, play_num)
+        )
+
+    play_row, players_arr, tacklers_arr, penalties_arr = split_play(
+        game_id, play_num, play_dict
+    )
+    insert_play_rows(
+        con, [play_row], players_arr, tacklers_arr, penalties_arr
+    )
+
+
+def save_game_plays(
+    con: sqlite3.Connection,
+    game_id: int,
+    plays_arr: list
+) -> None:
+    """
+    Replaces every play stored for a game
+    with the plays in `plays_arr`, in a single transaction.
+
+    Parameters
+    ----------
+    `con` (sqlite3.Connection, mandatory):
+        A connection to the database for this application.
+
+    `game_id` (int, mandatory):
+        The game these plays are in.
+
+    `plays_arr` (list, mandatory):
+        Every play in this game, in order.
+    """
+    with con:
+        insert_game_plays(con, game_id, plays_arr)
+
+
+def delete_game_plays(
+    con: sqlite3.Connection,
+    game_id: int,
+    commit: bool = True
+) -> None:
+    """
+    Deletes every play, and drive, stored for a game,
+    and removes that game's box score from its season totals.
+    """
+    for table_name in PBP_PLAY_TABLES + ("fb_pbp_drives",):
+        con.execute(f"DELETE FROM {table_name} WHERE game_id = ?", (game_id,))
+    save_game_stats(con, game_id, None)
+
+    if commit is True:
+        con.commit()
+
+
+def load_game_plays(con: sqlite3.Connection, game_id: int) -> list:
+    """
+    Returns every play stored for a game, in order,
+    in the same format as `core.pbp_engine.plays.Plays()`.
+    """
+    play_rows_arr = con.execute(
+        "SELECT * FROM fb_pbp_plays WHERE game_id = ? ORDER BY play_num",
+        (game_id,)
+    ).fetchall()
+
+    child_rows_dict = {}
+    for table_name, order_column in (
+        ("fb_pbp_play_players", "player_order"),
+        ("fb_pbp_play_tacklers", "tackler_order"),
+        ("fb_pbp_play_penalties", "penalty_order"),
+    ):
+        rows_dict = {}
+        for row in con.execute(
+            f"SELECT * FROM {table_name} WHERE game_id = ? " +
+            f"ORDER BY play_num, {order_column}",
+            (game_id,)
+        ):
+            rows_dict.setdefault(row[1], []).append(row)
+        child_rows_dict[table_name] = rows_dict
+
+    return [
+        rebuild_play(
+            row,
+            child_rows_dict["fb_pbp_play_players"].get(row[1], []),
+            child_rows_dict["fb_pbp_play_tacklers"].get(row[1], []),
+            child_rows_dict["fb_pbp_play_penalties"].get(row[1], []),
+        )
+        for row in play_rows_arr
+    ]
+
+
+def save_game_pbp(con: sqlite3.Connection, game_dict: dict) -> None:
+    """
+    Saves a game file (see `core.pbp_engine.game.get_initial_game_file()`).
+    The plays in this game are stored in `fb_pbp_plays`
+    (see `split_play()`), the drives are rebuilt into `fb_pbp_drives`,
+    and everything else is stored in `fb_pbp.game_json_str`,
+    in a single transaction.
+    """
+    game_id = game_dict["game_info"]["game_id"]
+    header_dict = game_dict.copy()
+    header_dict["plays"] = []
+    header_dict["drives"] = []
+    # Always rebuilt from the plays (see `load_game_pbp()`).
+    header_dict["stats"] = BoxScore().get_stats()
+
+    with con:
+        con.execute("DELETE FROM fb_pbp WHERE game_id = ?", (game_id,))
+        con.execute(
+            "INSERT INTO fb_pbp(game_id, game_json_str) VALUES (?, ?)",
+            (game_id, to_json(header_dict))
+        )
+        insert_game_plays(con, game_id, game_dict["plays"])
+
+
+def load_game_pbp(con: sqlite3.Connection, game_id: int) -> dict:
+    """
+    Returns the full game file for a game,
+    or `None` if this game has no PBP data.
+    The `"stats"` section is built from the plays in this game
+    (see `core.pbp_engine.box_score.BoxScore()`).
+    """
+    row = con.execute(
+        "SELECT game_json_str FROM fb_pbp WHERE game_id = ?",
+        (game_id,)
+    ).fetchone()
+
+    if row is None:
+        return None
+
+    game_dict = from_json(row[0])
+    game_dict["plays"] = load_game_plays(con, game_id)
+    game_dict["drives"] = load_game_drives(con, game_id)
+    game_dict["stats"] = BoxScore.from_plays(game_dict["plays"]).get_stats()
+    return game_dict
+
+
+def migrate_game_json_plays(con: sqlite3.Connection) -> int:
+    """
+    Moves the plays in every `fb_pbp.game_json_str`
+    into `fb_pbp_plays` (and its child tables).
+    Games that have already been moved are skipped.
+
+    Returns
+    ----------
+    The number of games that were moved.
+    """
+    games_arr = con.execute(
+        "SELECT game_id, game_json_str FROM fb_pbp"
+    ).fetchall()
+    migrated = 0
+
+    for game_id, game_json_str in games_arr:
+        try:
+            game_dict = from_json(game_json_str)
+        except json.JSONDecodeError as e:
+            logging.warning(
+                f"Could not read the PBP data for game #{game_id}. " +
+                f"Reason: {e}"
+            )
+            continue
+
+        if len(game_dict.get("plays", [])) == 0:
+            continue
+
+        save_game_pbp(con, game_dict)
+        migrated += 1
+
+    return migrated
+
+
+def migrate_play_team_ids(con: sqlite3.Connection) -> None:
+    """
+    Re-creates `fb_pbp_play_players`, `fb_pbp_play_tacklers`,
+    and `fb_pbp_play_penalties`, so that `team_id` is stored as `TEXT`
+    (like `fb_rosters.team_id`), instead of `INTEGER`.
+    Every row in these tables is kept.
+    """
+    # Imported here, so that the table definitions are only loaded
+    # when a database is being upgraded.
+    from core.database.create_db_elements import SqliteSampleFiles
+
+    for table_name, sql_script in (
+        ("fb_pbp_play_players", SqliteSampleFiles.pbp_play_players_sql_file),
+        (
+            "fb_pbp_play_tacklers",
+            SqliteSampleFiles.pbp_play_tacklers_sql_file
+        ),
+        (
+            "fb_pbp_play_penalties",
+            SqliteSampleFiles.pbp_play_penalties_sql_file
+        ),
+    ):
+        columns_str = ", ".join(
+            f"\"{x[1]}\""
+            for x in con.execute(f"PRAGMA table_info(\"{table_name}\");")
+        )
+        # The indexes of the old table keep their names until it's
+        # dropped, so the script is run again afterwards
+        # to re-create them on the new table.
+        con.executescript(
+            f"ALTER TABLE \"{table_name}\" " +
+            f"RENAME TO \"{table_name}_old\";\n" +
+            sql_script() +
+            f"INSERT INTO \"{table_name}\" ({columns_str}) " +
+            f"SELECT {columns_str} FROM \"{table_name}_old\";\n" +
+            f"DROP TABLE \"{table_name}_old\";\n" +
+            sql_script()
+        )
+
+
+def build_plays_where_clause(
+    game_id: int = None,
+    league_id: str = None,
+    season: int = None,
+    week: int = None
+) -> tuple[str, list]:
+    """
+    Builds the `WHERE` clause used to load plays for a game,
+    or for every game in a league/season/week.
+    The table being loaded must be joined to `fb_schedule`
+    with `USING (game_id)`.
+    """
+    return build_where_clause(
+        {
+            "game_id": game_id,
+            "league_id": league_id,
+            "season": season,
+            "week": week,
+        }
+    )
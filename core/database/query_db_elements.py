@@ -0,0 +1,377 @@
+"""
+- Creation Date: 10/18/2026 12:10 PM EDT
+- Last Updated: 10/18/2026 08:05 PM EDT
+- Author: Joseph Armstrong (armstrongjoseph08@gmail.com)
+- File Name: ./core/database/query_db_elements.py
+- Purpose: Lightweight queries that return plain python lists,
+-   for windows that don't need a full `polars` DataFrame
+-   (and shouldn't have to wait for `polars` to be imported).
+"""
+
+###############################################################################
+
+import sqlite3
+
+
+def build_where_clause(filters: dict) -> tuple[str, list]:
+    """
+    Builds a parameterized SQLite3 `WHERE` clause from a set of filters,
+    so loaders only read the rows a view actually needs.
+
+    Parameters
+    ----------
+    `filters` (dict, mandatory):
+        A dictionary where each key is a column name, and each value is
+        the value that column must equal.
+        - If a value is `None`, that filter is skipped.
+        - If a value is a list, tuple, or set,
+            the column must match any value within it (`IN (...)`).
+        - If a key is a tuple of column names,
+            any of those columns can match the value (`... OR ...`).
+
+    Returns
+    ----------
+    A tuple containing the `WHERE` clause (or an empty string if there
+    are no filters to apply), and a list of parameters for that clause.
+    """
+    where_arr = []
+    params_arr = []
+
+    for column, value in filters.items():
+        if value is None:
+            continue
+
+        if isinstance(value, (list, tuple, set)):
+            value = list(value)
+            placeholders = ",".join(["?"] * len(value))
+        else:
+            value = [value]
+            placeholders = "?"
+
+        if isinstance(column, tuple):
+            where_arr.append(
+                "(" + " OR ".join(
+                    [f"\"{x}\" IN ({placeholders})" for x in column]
+                ) + ")"
+            )
+            params_arr += value * len(column)
+        else:
+            where_arr.append(f"\"{column}\" IN ({placeholders})")
+            params_arr += value
+
+    if len(where_arr) == 0:
+        return "", params_arr
+
+    return "WHERE " + " AND ".join(where_arr), params_arr
+
+
+class SqliteQueryData:
+    """
+    Houses queries that return plain python lists instead of
+    `polars` DataFrames.
+    """
+
+    # Columns shown in the main window's schedule table, in order.
+    schedule_table_columns = [
+        "nflverse_game_id",
+        "game_type",
+        "week",
+        "game_day",
+        "away_team_abv",
+        "home_team_abv",
+        "away_team_score",
+        "home_team_score",
+        "game_is_finished",
+    ]
+
+    # Maps the OT types a league can pick (see `fb_leagues`)
+    # to the OT rule they enable in a game file's `"settings"`.
+    ot_type_settings = {
+        "Sudden Death OT": "sudden_death_ot",
+        "Modified Sudden Death OT": "modified_sudden_death_ot",
+        "Super Modified Sudden Death OT": "super_modified_sudden_death_ot",
+        "Kansas OT": "kansas_ot",
+        "NCAA OT": "ncaa_ot",
+        "XFL OT": "xfl_ot_rule",
+        "Full Period OT": "full_period_ot",
+    }
+
+    # `fb_leagues` columns that don't share a name
+    # with the setting they hold.
+    league_settings_columns = {
+        "fg_adds_ez_length": "field_goal_adds_end_zone_length",
+        "kickoff_fc_always_goes_to_touchback":
+            "kickoff_fair_catch_always_goes_to_touchback",
+    }
+
+    def query_distinct_values(
+        cur: sqlite3.Cursor,
+        table_name: str,
+        column: str,
+        filters: dict = None
+    ) -> list:
+        """
+        Returns a sorted list of the distinct values in a column.
+
+        Parameters
+        ----------
+        `cur` (sqlite3.Cursor, mandatory):
+            A cursor for the database for this application.
+
+        `table_name` (str, mandatory):
+            The table to query. This is never user input.
+
+        `column` (str, mandatory):
+            The column to query. This is never user input.
+
+        `filters` (dict, optional):
+            Filters passed into `build_where_clause()`.
+
+        Returns
+        ----------
+        A sorted list of the distinct values in `column`.
+        """
+        if filters is None:
+            filters = {}
+
+        where_clause, params = build_where_clause(filters)
+        cur.execute(
+            f"SELECT DISTINCT \"{column}\" FROM \"{table_name}\" " +
+            f"{where_clause} ORDER BY \"{column}\"",
+            params
+        )
+        return [x[0] for x in cur.fetchall()]
+
+    def query_leagues(cur: sqlite3.Cursor) -> list:
+        """ """
+        return SqliteQueryData.query_distinct_values(
+            cur=cur,
+            table_name="fb_leagues",
+            column="league_id"
+        )
+
+    def query_seasons(cur: sqlite3.Cursor, league_id: str) -> list:
+        """ """
+        return SqliteQueryData.query_distinct_values(
+            cur=cur,
+            table_name="fb_seasons",
+            column="season",
+            filters={"league_id": league_id}
+        )
+
+    def query_teams(
+        cur: sqlite3.Cursor,
+        league_id: str,
+        season: int
+    ) -> list:
+        """ """
+        return SqliteQueryData.query_distinct_values(
+            cur=cur,
+            table_name="fb_teams",
+            column="team_id",
+            filters={"league_id": league_id, "season": season}
+        )
+
+    def query_schedule_rows(
+        cur: sqlite3.Cursor,
+        league_id: str = None,
+        season: int = None,
+        team_abv: str = None,
+        week: int = None,
+        game_id: int = None,
+        columns: list = None
+    ) -> list:
+        """
+        Returns games from `fb_schedule`, sorted by `nflverse_game_id`.
+
+        Parameters
+        ----------
+        `league_id`, `season`, `team_abv`, `week`, `game_id` (optional):
+            Filters passed into `build_where_clause()`.
+            `team_abv` matches either the away or home team.
+
+        `columns` (list, optional):
+            The columns to return for each game. Defaults to
+            `SqliteQueryData.schedule_table_columns`,
+            the columns shown in the main window's schedule table.
+            This is never user input.
+
+        Returns
+        ----------
+        A list of tuples, one per game.
+        """
+        if columns is None:
+            columns = SqliteQueryData.schedule_table_columns
+
+        where_clause, params = build_where_clause(
+            {
+                "league_id": league_id,
+                "season": season,
+                ("away_team_abv", "home_team_abv"): team_abv,
+                "week": week,
+                "game_id": game_id,
+            }
+        )
+        columns_str = ",".join([f"\"{x}\"" for x in columns])
+        cur.execute(
+            f"SELECT {columns_str} FROM fb_schedule {where_clause} " +
+            "ORDER BY \"nflverse_game_id\"",
+            params
+        )
+        return cur.fetchall()
+
+    def query_league_settings(
+        cur: sqlite3.Cursor,
+        league_id: str,
+        game_type: str = "REG"
+    ) -> dict:
+        """
+        Returns the game file `"settings"` for a league
+        (see `core.pbp_engine.game.get_initial_game_file()`),
+        so a `core.pbp_engine.game_state.GameStateEngine()`
+        can use that league's rules.
+
+        Parameters
+        ----------
+        `cur` (sqlite3.Cursor, mandatory):
+            A cursor for the database for this application.
+
+        `league_id` (str, mandatory):
+            The league to get the rules of.
+
+        `game_type` (str, optional):
+            The type of game (`"PRE"`, `"REG"`, `"POST"`, etc.).
+            Determines if OT is enabled, and which OT rules are used.
+
+        Returns
+        ----------
+        A dictionary of settings. Any setting that isn't stored
+        in `fb_leagues` keeps its default value.
+        If `league_id` doesn't exist, every setting is the default value.
+        """
+        from core.pbp_engine.game import get_initial_game_file
+
+        settings_dict = get_initial_game_file()["settings"]
+
+        cur.execute(
+            "SELECT * FROM fb_leagues WHERE league_id = ?", (league_id,)
+        )
+        row = cur.fetchone()
+        if row is None:
+            return settings_dict
+
+        league_dict = dict(zip([x[0] for x in cur.description], row))
+
+        for column, value in league_dict.items():
+            key = SqliteQueryData.league_settings_columns.get(column, column)
+            if key not in settings_dict or value is None:
+                continue
+            elif isinstance(settings_dict[key], bool):
+                settings_dict[key] = bool(value)
+            else:
+                settings_dict[key] = value
+
+        match game_type:
+            case "PRE":
+                season_type = "preseason"
+            case "REG" | None:
+                season_type = "reg_season"
+            case _:
+                season_type = "postseason"
+
+        for ot_rule in SqliteQueryData.ot_type_settings.values():
+            settings_dict[ot_rule] = False
+
+        settings_dict["overtime_enabled"] = bool(
+            league_dict[f"{season_type}_ot_enabled"]
+        )
+        ot_rule = SqliteQueryData.ot_type_settings.get(
+            league_dict[f"{season_type}_ot_type"]
+        )
+        if ot_rule is not None:
+            settings_dict[ot_rule] = True
+
+        return settings_dict
+
+    def query_stat_leaders(
+        cur: sqlite3.Cursor,
+        league_id: str,
+        season: int,
+        stat_category: str,
+        stat_name: str,
+        limit: int = 10
+    ) -> list:
+        """
+        Returns the league leaders in a stat for a season,
+        from `fb_player_season_stats`.
+
+        Parameters
+        ----------
+        `cur` (sqlite3.Cursor, mandatory):
+            A cursor for the database for this application.
+
+        `league_id`, `season` (mandatory):
+            The league and season to get the leaders of.
+
+        `stat_category`, `stat_name` (str, mandatory):
+            The stat to rank players by
+            (for example, `"passing"` and `"yards"`).
+
+        `limit` (int, optional):
+            The number of players to return.
+
+        Returns
+        ----------
+        A list of `(player_id, team_id, stat_value)` tuples,
+        sorted from the highest value to the lowest.
+        """
+        cur.execute(
+            "SELECT player_id, team_id, stat_value " +
+            "FROM fb_player_season_stats " +
+            "WHERE league_id = ? AND season = ? " +
+            "AND stat_category = ? AND stat_name = ? " +
+            "ORDER BY stat_value DESC, player_id LIMIT ?",
+            (league_id, season, stat_category, stat_name, limit)
+        )
+        return cur.fetchall()
+
+    def query_career_stats(
+        cur: sqlite3.Cursor,
+        player_id: int,
+        league_id: str = None
+    ) -> dict:
+        """
+        Returns the career totals of a player,
+        summed from every season in `fb_player_season_stats`.
+
+        Parameters
+        ----------
+        `cur` (sqlite3.Cursor, mandatory):
+            A cursor for the database for this application.
+
+        `player_id` (int, mandatory):
+            The player to get the career totals of.
+
+        `league_id` (str, optional):
+            If set, only seasons in this league are counted.
+
+        Returns
+        ----------
+        A dictionary where each key is a stat category,
+        and each value is a dictionary of `{stat_name: stat_value}`.
+        """
+        where_clause, params = build_where_clause(
+            {"player_id": player_id, "league_id": league_id}
+        )
+        cur.execute(
+            "SELECT stat_category, stat_name, SUM(stat_value) " +
+            f"FROM fb_player_season_stats {where_clause} " +
+            "GROUP BY stat_category, stat_name " +
+            "ORDER BY stat_category, stat_name",
+            params
+        )
+
+        career_dict = {}
+        for stat_category, stat_name, stat_value in cur.fetchall():
+            career_dict.setdefault(stat_category, {})[stat_name] = stat_value
+        return career_dict
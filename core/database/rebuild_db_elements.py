@@ -0,0 +1,793 @@
+"""
+- Creation Date: 10/18/2026 06:20 PM EDT
+- Last Updated: 10/19/2026 03:20 AM EDT
+- Author: Joseph Armstrong (armstrongjoseph08@gmail.com)
+- File Name: ./core/database/rebuild_db_elements.py
+- Purpose: Re-derives the down, distance, drive, score, and clock
+-   of every play stored in `fb_pbp_plays` for a league/season,
+-   in one `polars` DataFrame, with the same rules as
+-   `core.pbp_engine.game_state.GameStateEngine()`.
+-   Used after the rules of a league change,
+-   or after a bug in how these fields are derived is fixed.
+"""
+
+###############################################################################
+
+import logging
+import random
+import sqlite3
+import time
+from contextlib import nullcontext
+
+import polars as pl
+
+from core.database.drive_db_elements import rebuild_drives
+from core.database.load_db_elements import SqliteLoadData
+from core.database.query_db_elements import SqliteQueryData
+from core.database.stats_db_elements import rebuild_game_stats
+from core.pbp_engine.game import get_initial_game_file
+from core.pbp_engine.game_state import (
+    CONVERSION_PLAY_TYPES,
+    KICKOFF_PLAY_TYPES,
+    NEXT_CONVERSION,
+    NEXT_SCRIMMAGE,
+    SCRIMMAGE_PLAY_TYPES,
+    GameStateEngine,
+)
+
+# Columns in `fb_pbp_plays` that are rewritten by `rebuild_season_pbp()`.
+PBP_DERIVED_COLUMNS = (
+    "drive_num",
+    "half_num",
+    "half_time_left",
+    "game_time_left",
+    "quarter_time_left_str",
+    "down",
+    "distance",
+    "is_goal_to_go",
+    "home_score",
+    "away_score",
+    "home_score_post",
+    "away_score_post",
+    "posteam_score",
+    "defteam_score",
+    "posteam_post",
+    "defteam_post",
+    "is_scoring_play",
+    "is_first_down",
+)
+
+# Fields in `play_details_json` that are rewritten
+# by `rebuild_season_pbp()`, if a play has them.
+PBP_DERIVED_DETAILS = (
+    "is_third_down",
+    "is_third_down_converted",
+    "is_fourth_down",
+    "is_fourth_down_converted",
+)
+
+# Fields in `play_details_json` that are needed to derive
+# the columns in `PBP_DERIVED_COLUMNS`.
+PBP_DETAILS_FLAGS = (
+    "is_first_down_penalty",
+    "is_1pt_successful_conversion",
+    "is_2pt_successful_conversion",
+    "is_3pt_successful_conversion",
+    "is_defensive_2pc",
+    "is_own_kickoff_recovery",
+    "is_blocked",
+    "is_returned",
+    "is_rouge",
+)
+
+
+def add_details_flags(plays_df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Adds every flag in `PBP_DETAILS_FLAGS` that isn't already a column
+    in `plays_df`, by reading it out of `play_details_json`.
+    If `plays_df` doesn't have `play_details_json`,
+    missing flags are set to `False`.
+    """
+    missing_arr = [x for x in PBP_DETAILS_FLAGS if x not in plays_df.columns]
+    if len(missing_arr) == 0:
+        return plays_df
+    elif "play_details_json" not in plays_df.columns:
+        return plays_df.with_columns(
+            [pl.lit(False).alias(x) for x in missing_arr]
+        )
+
+    # Parses `play_details_json` once for every flag,
+    # instead of once per flag.
+    return plays_df.with_columns(
+        pl.col("play_details_json").str.json_decode(
+            pl.Struct({x: pl.Boolean for x in missing_arr})
+        ).alias("details_flags")
+    ).unnest("details_flags").with_columns(
+        [pl.col(x).fill_null(False) for x in missing_arr]
+    )
+
+
+def group_cum_sum(column, start: str = "series_start") -> pl.Expr:
+    """
+    Returns the running total of `column` (a column name, or expression)
+    within each group of rows, where `start` is `True`
+    on the first row of each group.
+    Groups are contiguous, so this is a running total over every row,
+    minus that total when the current group started,
+    which is much faster than a `.over()` window.
+    """
+    if isinstance(column, str):
+        column = pl.col(column)
+    column = column.cast(pl.Int32)
+    running_total = column.cum_sum()
+    return running_total - pl.when(pl.col(start)).then(
+        running_total - column
+    ).forward_fill()
+
+
+def group_first(column: str, start: str = "series_start") -> pl.Expr:
+    """
+    Returns the value of `column` on the first row of each group
+    (see `group_cum_sum()`).
+    """
+    return pl.when(pl.col(start)).then(pl.col(column)).forward_fill()
+
+
+def group_shift(column, start: str = "game_start") -> pl.Expr:
+    """
+    Returns the value of `column` (a column name, or expression)
+    on the row before, or `None` on the first row of each group
+    (see `group_cum_sum()`).
+    """
+    if isinstance(column, str):
+        column = pl.col(column)
+    return pl.when(pl.col(start)).then(None).otherwise(column.shift(1))
+
+
+def derive_series(series_df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Splits the scrimmage plays in a set of games into series
+    (every play between two first downs),
+    and derives the down and distance of every play in each series.
+
+    A series can only be split once the series before it is known,
+    so each pass over `series_df` finds the first play that reaches
+    the line to gain in every series, and starts a new series after it,
+    until no series has a play that reaches the line to gain
+    before the last play in that series.
+    The number of passes is the most first downs in any one drive,
+    not the number of plays.
+
+    Parameters
+    ----------
+    `series_df` (pl.DataFrame, mandatory):
+        Every scrimmage play, ordered by `game_id`, and then `play_num`,
+        with `series_start`, `gain`, `start_distance`,
+        `can_reach`, `is_first_down_penalty`, and `counted_down`
+        (`False` for plays that don't use up a down) columns.
+
+    Returns
+    ----------
+    `series_df`, with `down`, `distance`, and `is_first_down` columns.
+    """
+    while True:
+        series_df = series_df.with_columns(
+            (
+                pl.col("can_reach") & (
+                    (
+                        group_cum_sum("gain") >=
+                        group_first("start_distance")
+                    ) | pl.col("is_first_down_penalty")
+                )
+            ).alias("reached")
+        ).with_columns(
+            (
+                pl.col("reached") & (group_cum_sum("reached") == 1)
+            ).alias("is_first_down")
+        )
+
+        next_start = (
+            pl.col("series_start") |
+            pl.col("is_first_down").shift(1).fill_null(False)
+        )
+        if series_df.select(
+            (next_start != pl.col("series_start")).any()
+        ).item() is False:
+            break
+        series_df = series_df.with_columns(next_start.alias("series_start"))
+
+    return series_df.with_columns(
+        (
+            1 + group_cum_sum("counted_down") - pl.col("counted_down")
+        ).alias("down"),
+        (
+            group_first("start_distance") -
+            group_cum_sum("gain") + pl.col("gain")
+        ).alias("distance"),
+    ).drop("reached")
+
+
+def derive_pbp_columns(
+    plays_df: pl.DataFrame,
+    settings_dict: dict = None
+) -> pl.DataFrame:
+    """
+    Derives every column in `PBP_DERIVED_COLUMNS` and
+    `PBP_DERIVED_DETAILS` for a set of games, with running totals and
+    shifts within each game (see `group_cum_sum()`),
+    instead of going through every play one at a time.
+    Gives the same results as applying each play to a
+    `core.pbp_engine.game_state.GameStateEngine()`.
+
+    Parameters
+    ----------
+    `plays_df` (pl.DataFrame, mandatory):
+        Plays from `SqliteLoadData.load_fb_pbp_plays()`,
+        with a `home_team_abv` column added.
+        The charted fields (`play_type`, `pos_team`, `quarter_num`,
+        `quarter_time_left`, `yardline_start`, `yardline_end`,
+        and the play result flags) are never changed.
+
+    `settings_dict` (dict, optional):
+        The game file `"settings"` for these games
+        (see `SqliteQueryData.query_league_settings()`).
+
+    Returns
+    ----------
+    A `polars` DataFrame with `game_id`, `play_num`,
+    and every column in `PBP_DERIVED_COLUMNS` and `PBP_DERIVED_DETAILS`,
+    ordered by `game_id`, and then by `play_num`.
+    """
+    if settings_dict is None:
+        settings_dict = get_initial_game_file()["settings"]
+
+    field_length = settings_dict["field_length"]
+    downs = settings_dict["downs"]
+    quarters = settings_dict["quarters"]
+    quarter_seconds = settings_dict["quarter_seconds"]
+    half_quarters = max(quarters // 2, 1)
+
+    def flag(column: str) -> pl.Expr:
+        return pl.col(column).fill_null(False)
+
+    plays_df = add_details_flags(plays_df).sort(
+        ["game_id", "play_num"]
+    ).with_columns(
+        (pl.col("game_id") != pl.col("game_id").shift(1))
+        .fill_null(True).alias("game_start")
+    )
+
+    play_type = pl.col("play_type")
+    is_kickoff = play_type.is_in(KICKOFF_PLAY_TYPES)
+    is_scrimmage = play_type.is_in(SCRIMMAGE_PLAY_TYPES)
+    is_down_play = play_type.is_in(("pass", "rush"))
+    is_punt = play_type == "punt"
+    is_field_goal = play_type.is_in(("field_goal", "fair_catch_kick"))
+    is_conversion = play_type.is_in(CONVERSION_PLAY_TYPES)
+    yardline_start = pl.col("yardline_start").cast(pl.Int32)
+    yardline_end = pl.col("yardline_end").cast(pl.Int32).fill_null(
+        yardline_start
+    )
+    quarter_num = pl.col("quarter_num").cast(pl.Int32)
+    quarter_time_left = pl.max_horizontal(
+        pl.col("quarter_time_left").cast(pl.Int32).fill_null(0), 0
+    )
+    is_touchdown = flag("is_touchdown")
+    is_safety = flag("is_safety")
+    is_turnover = flag("is_turnover")
+    is_fg_made = flag("is_fg_made")
+
+    # Who scored, and how.
+    down_play_pos_td = is_down_play & ~is_turnover & (
+        is_touchdown | (yardline_end <= 0)
+    )
+    down_play_safety = is_down_play & ~is_turnover & ~down_play_pos_td & (
+        is_safety | (yardline_end >= field_length)
+    )
+    kick_flipped = is_turnover | flag("is_own_kickoff_recovery")
+    punt_flipped = is_turnover | (~flag("is_blocked") & ~flag("is_returned"))
+    field_goal_flipped = (
+        flag("is_blocked") | flag("is_returned") | is_turnover
+    )
+    pos_td = (
+        down_play_pos_td |
+        is_kickoff & is_touchdown & ~kick_flipped |
+        is_punt & is_touchdown & punt_flipped |
+        is_field_goal & ~is_fg_made & is_touchdown & ~field_goal_flipped
+    )
+    def_td = (
+        is_down_play & is_turnover & (
+            is_touchdown | (yardline_end >= field_length)
+        ) |
+        is_kickoff & is_touchdown & kick_flipped |
+        is_punt & is_touchdown & ~punt_flipped |
+        is_field_goal & ~is_fg_made & is_touchdown & field_goal_flipped
+    )
+    def_safety = (
+        down_play_safety |
+        (is_kickoff | is_punt) & ~is_touchdown & is_safety
+    )
+    conversion_scored = is_conversion & (
+        (play_type == "xp") & is_fg_made |
+        flag("is_1pt_successful_conversion") |
+        flag("is_2pt_successful_conversion") |
+        flag("is_3pt_successful_conversion")
+    )
+
+    fg_points = pl.lit(settings_dict["field_goal_points"])
+    if settings_dict.get("long_fg_bonus_point") is True:
+        fg_points = fg_points + (
+            pl.col("fg_attempt_distance").fill_null(0) >= 50
+        ).cast(pl.Int32)
+
+    pos_points = (
+        pl.when(pos_td).then(settings_dict["touchdown_points"])
+        .when(is_field_goal & is_fg_made).then(fg_points)
+        .when(is_punt & ~is_touchdown & ~is_safety & flag("is_rouge"))
+        .then(1)
+        .when(is_conversion & (play_type == "xp") & is_fg_made)
+        .then(settings_dict["pat_points"])
+        .when(is_conversion & flag("is_1pt_successful_conversion")).then(1)
+        .when(is_conversion & flag("is_2pt_successful_conversion")).then(2)
+        .when(is_conversion & flag("is_3pt_successful_conversion")).then(3)
+        .when(is_conversion & ~flag("is_defensive_2pc") & is_safety)
+        .then(settings_dict["pat_safety"])
+        .otherwise(0)
+    )
+    def_points = (
+        pl.when(def_td).then(settings_dict["touchdown_points"])
+        .when(def_safety).then(settings_dict["safety_points"])
+        .when(
+            is_conversion & ~conversion_scored & flag("is_defensive_2pc")
+        ).then(settings_dict["pat_defense"])
+        .otherwise(0)
+    )
+    is_home = (
+        (pl.col("pos_team") == pl.col("home_team_abv")) |
+        (pl.col("pos_team") == "home")
+    ).fill_null(False)
+
+    # A new drive starts on every kickoff,
+    # every change of possession, and at the start of every half.
+    # The try after a touchdown is part of the drive that scored it,
+    # even if the defense scored that touchdown.
+    previous_quarter = group_shift(quarter_num)
+    period_break = (quarter_num != previous_quarter) & (
+        (quarter_num == half_quarters + 1) | (quarter_num > quarters)
+    )
+    is_try = is_conversion & group_shift(pos_td | def_td).fill_null(False)
+    new_drive = (
+        is_kickoff |
+        group_shift("pos_team").is_null() |
+        (
+            (pl.col("pos_team") != group_shift("pos_team")) & ~is_try
+        ).fill_null(True) |
+        period_break.fill_null(False)
+    )
+
+    plays_df = plays_df.with_columns(
+        pos_points.cast(pl.Int32).alias("pos_points"),
+        def_points.cast(pl.Int32).alias("def_points"),
+        is_home.alias("is_home"),
+        new_drive.alias("new_drive"),
+        is_scrimmage.alias("is_scrimmage"),
+        (yardline_start - yardline_end).alias("gain"),
+        pl.min_horizontal(
+            yardline_start, settings_dict["first_down_yards"]
+        ).alias("start_distance"),
+        (
+            is_down_play & ~is_turnover &
+            ~down_play_pos_td & ~down_play_safety
+        ).alias("can_reach"),
+        down_play_pos_td.alias("down_play_pos_td"),
+        pl.int_range(pl.len()).alias("row_num"),
+    )
+
+    series_df = derive_series(
+        plays_df.with_columns(
+            (
+                pl.col("new_drive") |
+                ~group_shift("is_scrimmage")
+                .fill_null(False)
+            ).alias("series_start")
+        ).filter(pl.col("is_scrimmage")).select(
+            "row_num",
+            "series_start",
+            "gain",
+            "start_distance",
+            "can_reach",
+            flag("is_first_down_penalty").alias("is_first_down_penalty"),
+            (~flag("is_no_play")).alias("counted_down"),
+        )
+    ).select("row_num", "down", "distance", "is_first_down")
+
+    # There are only a few thousand distinct clock readings in a season,
+    # so each one is only formatted once.
+    ot_period = pl.col("quarter_num") - quarters
+    clock_df = plays_df.select(
+        quarter_num.alias("quarter_num"),
+        quarter_time_left.alias("quarter_time_left"),
+    ).unique().with_columns(
+        pl.format(
+            "{} {}:{}",
+            pl.when(ot_period > 1).then(pl.format("{} OT", ot_period))
+            .when(ot_period == 1).then(pl.lit("OT"))
+            .otherwise(pl.format("Q{}", pl.col("quarter_num"))),
+            (pl.col("quarter_time_left") // 60).cast(pl.String).str.zfill(2),
+            (pl.col("quarter_time_left") % 60).cast(pl.String).str.zfill(2),
+        ).alias("quarter_time_left_str")
+    )
+
+    plays_df = plays_df.drop(
+        [
+            x for x in (
+                "down", "distance", "is_first_down", "quarter_time_left_str"
+            ) if x in plays_df.columns
+        ]
+    ).with_columns(
+        quarter_num.alias("quarter_num"),
+        quarter_time_left.alias("quarter_time_left"),
+    ).join(
+        series_df, on="row_num", how="left"
+    ).join(
+        clock_df, on=["quarter_num", "quarter_time_left"], how="left"
+    ).sort("row_num")
+
+    home_points = pl.when(pl.col("is_home")).then(
+        pl.col("pos_points")
+    ).otherwise(pl.col("def_points"))
+    away_points = pl.when(pl.col("is_home")).then(
+        pl.col("def_points")
+    ).otherwise(pl.col("pos_points"))
+    down = pl.col("down").fill_null(0)
+    distance = pl.when(pl.col("is_scrimmage")).then(
+        pl.col("distance")
+    ).when(is_conversion).then(yardline_start).otherwise(0)
+    is_first_down = pl.col("is_first_down").fill_null(False)
+    is_converted = is_down_play & (is_first_down | pl.col("down_play_pos_td"))
+    is_third_down = is_scrimmage & (down == downs - 1)
+    is_fourth_down = is_scrimmage & (down == downs)
+
+    plays_df = plays_df.with_columns(
+        group_cum_sum("new_drive", "game_start").alias("drive_num"),
+        pl.when(quarter_num > quarters).then(3)
+        .when(quarter_num <= half_quarters).then(1)
+        .otherwise(2).alias("half_num"),
+        pl.when(quarter_num > quarters).then(quarter_time_left)
+        .when(quarter_num <= half_quarters).then(
+            quarter_time_left +
+            (half_quarters - quarter_num) * quarter_seconds
+        ).otherwise(
+            quarter_time_left + (quarters - quarter_num) * quarter_seconds
+        ).alias("half_time_left"),
+        pl.when(quarter_num > quarters).then(quarter_time_left).otherwise(
+            quarter_time_left + (quarters - quarter_num) * quarter_seconds
+        ).alias("game_time_left"),
+        down.alias("down"),
+        distance.alias("distance"),
+        (is_scrimmage & (yardline_start <= distance)).alias("is_goal_to_go"),
+        group_cum_sum(home_points, "game_start").alias("home_score_post"),
+        group_cum_sum(away_points, "game_start").alias("away_score_post"),
+        (pl.col("pos_points") + pl.col("def_points") > 0)
+        .alias("is_scoring_play"),
+        is_first_down.alias("is_first_down"),
+        is_third_down.alias("is_third_down"),
+        (is_third_down & is_converted).alias("is_third_down_converted"),
+        is_fourth_down.alias("is_fourth_down"),
+        (is_fourth_down & is_converted).alias("is_fourth_down_converted"),
+    ).with_columns(
+        (pl.col("home_score_post") - home_points).alias("home_score"),
+        (pl.col("away_score_post") - away_points).alias("away_score"),
+    ).with_columns(
+        pl.when(pl.col("is_home")).then(pl.col("home_score"))
+        .otherwise(pl.col("away_score")).alias("posteam_score"),
+        pl.when(pl.col("is_home")).then(pl.col("away_score"))
+        .otherwise(pl.col("home_score")).alias("defteam_score"),
+        pl.when(pl.col("is_home")).then(pl.col("home_score_post"))
+        .otherwise(pl.col("away_score_post")).alias("posteam_post"),
+        pl.when(pl.col("is_home")).then(pl.col("away_score_post"))
+        .otherwise(pl.col("home_score_post")).alias("defteam_post"),
+    )
+
+    return plays_df.select(
+        ["game_id", "play_num"] +
+        list(PBP_DERIVED_COLUMNS) +
+        list(PBP_DERIVED_DETAILS)
+    )
+
+
+def load_season_plays(
+    con: sqlite3.Connection,
+    league_id: str,
+    season: int,
+    week: int = None
+) -> pl.DataFrame:
+    """
+    Loads every play in a league/season (or week) from `fb_pbp_plays`,
+    with the `home_team_abv` of each game,
+    in the format `derive_pbp_columns()` expects.
+    """
+    cur = con.cursor()
+    plays_df = SqliteLoadData.load_fb_pbp_plays(
+        con,
+        cur,
+        league_id=league_id,
+        season=season,
+        week=week,
+        include_details=True
+    )
+    games_df = pl.DataFrame(
+        SqliteQueryData.query_schedule_rows(
+            cur,
+            league_id=league_id,
+            season=season,
+            week=week,
+            columns=["game_id", "home_team_abv"]
+        ),
+        schema={"game_id": pl.UInt64, "home_team_abv": pl.String},
+        orient="row",
+    )
+    return plays_df.join(games_df, on="game_id", how="left")
+
+
+def save_derived_columns(
+    con: sqlite3.Connection,
+    derived_df: pl.DataFrame,
+    commit: bool = True
+) -> int:
+    """
+    Writes the output of `derive_pbp_columns()` back into `fb_pbp_plays`,
+    in a single transaction.
+    Fields in `PBP_DERIVED_DETAILS` are only written to plays
+    that already have them in `play_details_json`.
+    If `commit` is set to `False`, the plays are saved without committing,
+    so that they can be part of a larger transaction.
+
+    Returns
+    ----------
+    The number of plays that were updated.
+    """
+    set_arr = [f"\"{x}\" = ?" for x in PBP_DERIVED_COLUMNS]
+    details_arr = [f"'$.{x}', json(?)" for x in PBP_DERIVED_DETAILS]
+    query = (
+        f"UPDATE fb_pbp_plays SET {', '.join(set_arr)}, " +
+        "play_details_json = json_replace(play_details_json, " +
+        f"{', '.join(details_arr)}) " +
+        "WHERE game_id = ? AND play_num = ?"
+    )
+    rows = derived_df.select(
+        list(PBP_DERIVED_COLUMNS) +
+        [
+            pl.when(pl.col(x)).then(pl.lit("true"))
+            .otherwise(pl.lit("false")).alias(x)
+            for x in PBP_DERIVED_DETAILS
+        ] +
+        ["game_id", "play_num"]
+    ).iter_rows()
+
+    with con if commit is True else nullcontext():
+        con.executemany(query, rows)
+
+    return derived_df.height
+
+
+def rebuild_season_pbp(
+    con: sqlite3.Connection,
+    league_id: str,
+    season: int,
+    week: int = None,
+    settings_dict: dict = None
+) -> int:
+    """
+    Re-derives the down, distance, drive, score, and clock
+    of every play in a league/season (or week),
+    and saves them back into `fb_pbp_plays`.
+    The drives and box score of every game in that league/season (or week)
+    are rebuilt from those plays in the same transaction.
+
+    Parameters
+    ----------
+    `con` (sqlite3.Connection, mandatory):
+        A connection to the database for this application.
+
+    `league_id` (str, mandatory), `season` (int, mandatory),
+    `week` (int, optional):
+        Only plays in games that match these filters are rebuilt.
+
+    `settings_dict` (dict, optional):
+        The rules to use. Defaults to the rules for
+        regular season games in this league
+        (see `SqliteQueryData.query_league_settings()`).
+
+    Returns
+    ----------
+    The number of plays that were rebuilt.
+    """
+    if settings_dict is None:
+        settings_dict = SqliteQueryData.query_league_settings(
+            con.cursor(), league_id
+        )
+
+    plays_df = load_season_plays(con, league_id, season, week)
+    if plays_df.height == 0:
+        return 0
+
+    derived_df = derive_pbp_columns(plays_df, settings_dict)
+    with con:
+        plays = save_derived_columns(con, derived_df, commit=False)
+        # Drives are built from `drive_num` (and the scores),
+        # which were just rewritten.
+        rebuild_drives(con, league_id, season, week, commit=False)
+        # So are the box scores, and the season totals built from them.
+        rebuild_game_stats(
+            con, derived_df["game_id"].unique().to_list(), commit=False
+        )
+    logging.info(
+        f"Rebuilt {plays} play(s) in the {season} {league_id} season."
+    )
+    return plays
+
+
+def simulate_game(rng: random.Random) -> list:
+    """
+    Charts a random game with `GameStateEngine()`.
+    Only used to create test data.
+    """
+    from core.pbp_engine.play_records import PLAY_TEMPLATES
+
+    engine = GameStateEngine(home_team_abv="HOM", away_team_abv="AWY")
+    plays_arr = []
+
+    while engine.state.is_game_over is False and len(plays_arr) < 400:
+        state = engine.state
+        seconds = 0
+
+        if state.next_play == NEXT_CONVERSION:
+            if rng.random() < 0.9:
+                play_dict = PLAY_TEMPLATES["xp"]()
+                play_dict["is_fg_made"] = rng.random() < 0.94
+            else:
+                play_dict = PLAY_TEMPLATES["conversion_attempt"]()
+                play_dict["is_2pt_successful_conversion"] = \
+                    rng.random() < 0.48
+        elif state.next_play != NEXT_SCRIMMAGE:
+            play_dict = PLAY_TEMPLATES["kickoff"]()
+            play_dict["play_type"] = state.next_play
+            seconds = rng.randint(0, 8)
+            if rng.random() < 0.6:
+                play_dict["is_touchback"] = True
+            else:
+                play_dict["yardline_end"] = rng.randint(55, 85)
+        elif state.down == 4 and state.yardline > 38:
+            play_dict = PLAY_TEMPLATES["punt"]()
+            play_dict["yardline_end"] = max(state.yardline - 45, 5)
+            seconds = rng.randint(5, 12)
+        elif state.down == 4:
+            play_dict = PLAY_TEMPLATES["field_goal"]()
+            play_dict["is_fg_made"] = rng.random() < 0.8
+            seconds = rng.randint(3, 6)
+        else:
+            play_dict = PLAY_TEMPLATES[rng.choice(("pass", "rush"))]()
+            seconds = rng.randint(5, 40)
+            roll = rng.random()
+            if roll < 0.02:
+                play_dict["is_turnover"] = True
+                play_dict["yardline_end"] = min(
+                    state.yardline + rng.randint(-10, 60),
+                    engine.settings["field_length"]
+                )
+            elif roll < 0.05:
+                play_dict["is_no_play"] = True
+                play_dict["yardline_end"] = min(
+                    state.yardline + 5, engine.settings["field_length"] - 1
+                )
+            elif play_dict["play_type"] == "pass" and rng.random() < 0.38:
+                # Incomplete passes don't move the ball.
+                play_dict["yardline_end"] = state.yardline
+            else:
+                if play_dict["play_type"] == "pass":
+                    play_dict["is_completed_pass"] = True
+                play_dict["yardline_end"] = min(
+                    state.yardline - rng.randint(-3, 15),
+                    engine.settings["field_length"]
+                )
+
+        engine.apply_play(play_dict, seconds)
+        plays_arr.append(play_dict)
+
+    return plays_arr
+
+
+def build_synthetic_plays(
+    game_count: int = 10000,
+    simulated_games: int = 100,
+    seed: int = 0
+) -> pl.DataFrame:
+    """
+    Builds a DataFrame of `game_count` games, in the format
+    `load_season_plays()` returns, by copying `simulated_games`
+    games charted with `simulate_game()`.
+    Only used to create test data.
+    """
+    rng = random.Random(seed)
+    columns_arr = ["play_type", "pos_team", "quarter_num",
+                   "quarter_time_left", "yardline_start", "yardline_end",
+                   "is_touchdown", "is_safety", "is_turnover", "is_no_play",
+                   "is_fg_made", "fg_attempt_distance"]
+    columns_arr += list(PBP_DETAILS_FLAGS)
+    columns_arr += list(PBP_DERIVED_COLUMNS)
+    columns_arr += list(PBP_DERIVED_DETAILS)
+
+    rows_arr = []
+    for game_num in range(simulated_games):
+        for play_num, play_dict in enumerate(simulate_game(rng), start=1):
+            rows_arr.append(
+                [game_num, play_num] +
+                [play_dict.get(x) for x in columns_arr]
+            )
+
+    games_df = pl.DataFrame(
+        rows_arr,
+        schema=["game_id", "play_num"] + columns_arr,
+        orient="row",
+        infer_schema_length=None,
+    ).with_columns(pl.lit("HOM").alias("home_team_abv"))
+
+    copies_df = pl.DataFrame(
+        {"copy_num": range(-(-game_count // simulated_games))}
+    )
+    return games_df.join(copies_df, how="cross").with_columns(
+        (pl.col("copy_num") * simulated_games + pl.col("game_id"))
+        .alias("game_id")
+    ).filter(pl.col("game_id") < game_count).drop("copy_num").sort(
+        ["game_id", "play_num"]
+    )
+
+
+def benchmark_pbp_rebuild(game_count: int = 10000) -> dict:
+    """
+    Times `derive_pbp_columns()` on `game_count` synthetic games,
+    and checks that it gives the same results as `GameStateEngine()`.
+    """
+    from core.pbp_engine.play_records import PLAY_TEMPLATES
+
+    expected_df = build_synthetic_plays(game_count)
+    plays_df = expected_df.drop(
+        list(PBP_DERIVED_COLUMNS) + list(PBP_DERIVED_DETAILS)
+    )
+
+    start_time = time.perf_counter()
+    derived_df = derive_pbp_columns(plays_df)
+    seconds = time.perf_counter() - start_time
+
+    # Fields a play template doesn't have are never set by the engine,
+    # so each field is only checked on the play types that have it.
+    template_keys_dict = {
+        play_type.value: template().keys()
+        for play_type, template in PLAY_TEMPLATES.items()
+    }
+    mismatches_dict = {}
+    for column in PBP_DERIVED_COLUMNS + PBP_DERIVED_DETAILS:
+        play_types_arr = [
+            play_type for play_type, keys in template_keys_dict.items()
+            if column in keys
+        ]
+        mismatches = (
+            derived_df[column].cast(pl.String).ne_missing(
+                expected_df[column].cast(pl.String)
+            ) & expected_df["play_type"].is_in(play_types_arr)
+        ).sum()
+        if mismatches > 0:
+            mismatches_dict[column] = mismatches
+
+    return {
+        "games": game_count,
+        "plays": derived_df.height,
+        "seconds": round(seconds, 3),
+        "plays_per_second": round(derived_df.height / seconds),
+        "mismatches": mismatches_dict,
+    }
+
+
+if __name__ == "__main__":
+    print(benchmark_pbp_rebuild())
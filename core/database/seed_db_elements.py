@@ -0,0 +1,401 @@
+"""
+- Creation Date: 10/18/2026 01:15 PM EDT
+- Last Updated: 10/19/2026 03:50 AM EDT
+- Author: Joseph Armstrong (armstrongjoseph08@gmail.com)
+- File Name: ./core/database/seed_db_elements.py
+- Purpose: Builds, and copies data from, the seed pack for this application.
+-   The seed pack is a compressed, prebuilt SQLite3 database
+-   (`./resources/seed_pack/`) that holds every table and row
+-   created by `core.database.create_db_elements.SqliteSampleFiles()`,
+-   so new databases and lost tables can be copied in
+-   instead of being rebuilt from SQL scripts.
+"""
+
+###############################################################################
+
+import gzip
+import hashlib
+import json
+import logging
+import shutil
+import sqlite3
+import tempfile
+from os import listdir, makedirs, remove, replace
+from os.path import abspath, dirname, exists, join
+
+SEED_PACK_DIR = abspath(
+    join(dirname(__file__), "..", "..", "resources", "seed_pack")
+)
+SEED_PACK_FILE = "sdv_pbp_seed.sqlite.gz"
+SEED_MANIFEST_FILE = "seed_manifest.json"
+
+# Files SQLite3 keeps next to a database while it is being written to.
+# A leftover `-wal` file is applied to whatever database
+# is at that path the next time it's opened.
+SQLITE3_SIDECAR_SUFFIXES = ("-wal", "-shm", "-journal")
+
+# Every table in the seed pack, in the order it is created,
+# and the `SqliteSampleFiles()` scripts that create it.
+SEED_TABLES = {
+    "iso_nations": ("iso_nations",),
+    "iso_timezones": ("iso_timezones",),
+    "iso_3166_2": ("iso_3166_2_states", "iso_3166_2_data"),
+    "fb_leagues": ("leagues_sql_file",),
+    "fb_seasons": ("seasons_sql_file",),
+    "fb_teams": ("teams_sql_file",),
+    "fb_rosters": ("rosters_sql_file",),
+    "fb_stadiums": ("stadiums_sql_file",),
+    "fb_weekly_rosters": ("weekly_rosters_sql_file",),
+    "fb_depth_charts": ("depth_chart_sql_file",),
+    "fb_schedule": (
+        "schedule_sql_file", "schedule_change_tracking_sql_file"
+    ),
+    "fb_schedule_changes": ("schedule_change_tracking_sql_file",),
+    "fb_game_refs": ("game_refs_sql_file",),
+    "fb_pbp": ("game_pbp_sql_file",),
+    "fb_pbp_plays": ("pbp_plays_sql_file",),
+    "fb_pbp_play_players": ("pbp_play_players_sql_file",),
+    "fb_pbp_play_tacklers": ("pbp_play_tacklers_sql_file",),
+    "fb_pbp_play_penalties": ("pbp_play_penalties_sql_file",),
+    "fb_pbp_journal": ("pbp_journal_sql_file",),
+    "fb_pbp_drives": ("pbp_drives_sql_file",),
+    "fb_player_game_stats": ("game_stats_sql_file",),
+    "fb_team_game_stats": ("game_stats_sql_file",),
+    "fb_player_season_stats": ("season_stats_sql_file",),
+    "fb_team_season_stats": ("season_stats_sql_file",),
+}
+
+# Tables that only hold reference data, and are never edited by the user.
+# These are the only tables that are re-seeded
+# when their version in the seed pack changes.
+# Every other table is only seeded when it is created (or lost).
+REFERENCE_TABLES = ("iso_nations", "iso_timezones", "iso_3166_2")
+
+
+def get_seed_versions() -> dict:
+    """
+    Returns the version of every table in `SEED_TABLES`,
+    based on the SQL scripts that create that table.
+
+    Returns
+    ----------
+    A dictionary where each key is a table name,
+    and each value is the version of that table.
+    """
+    from core.database.create_db_elements import SqliteSampleFiles
+
+    versions_dict = {}
+    for table_name, script_names in SEED_TABLES.items():
+        table_hash = hashlib.sha256()
+        for script_name in script_names:
+            table_hash.update(
+                getattr(SqliteSampleFiles, script_name)().encode("utf-8")
+            )
+        versions_dict[table_name] = table_hash.hexdigest()[:16]
+
+    return versions_dict
+
+
+def stamp_seed_versions(
+    con: sqlite3.Connection,
+    versions_dict: dict
+) -> None:
+    """
+    Records the seed pack version of one or more tables in a database.
+    """
+    con.execute(
+        """
+        CREATE TABLE IF NOT EXISTS "app_seed_versions" (
+            "table_name"    TEXT PRIMARY KEY,
+            "seed_version"  TEXT NOT NULL
+        );
+        """
+    )
+    con.executemany(
+        "INSERT OR REPLACE INTO app_seed_versions VALUES (?, ?)",
+        list(versions_dict.items())
+    )
+
+
+def build_seed_pack(output_dir: str = SEED_PACK_DIR) -> dict:
+    """
+    Builds the seed pack for this application
+    from `core.database.create_db_elements.SqliteSampleFiles()`.
+    Run this (`python -m core.database.seed_db_elements`)
+    whenever any of those scripts are changed.
+
+    Parameters
+    ----------
+    `output_dir` (str, optional):
+        The directory the seed pack is saved to.
+
+    Returns
+    ----------
+    The manifest for the new seed pack.
+    """
+    from core.database.create_db_elements import build_app_sqlite3_db
+
+    makedirs(output_dir, exist_ok=True)
+    versions_dict = get_seed_versions()
+    pack_hash = hashlib.sha256(
+        json.dumps(versions_dict, sort_keys=True).encode("utf-8")
+    )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_file = join(temp_dir, "sdv_pbp_seed.sqlite")
+        build_app_sqlite3_db(temp_file)
+
+        con = sqlite3.connect(temp_file)
+        stamp_seed_versions(con, versions_dict)
+        con.commit()
+        con.execute("PRAGMA journal_mode = DELETE;")
+        con.execute("VACUUM;")
+        con.close()
+
+        # `mtime=0` keeps the seed pack byte-for-byte identical
+        # between builds of the same data.
+        with open(temp_file, "rb") as f_in:
+            with gzip.GzipFile(
+                join(output_dir, SEED_PACK_FILE), "wb", mtime=0
+            ) as f_out:
+                shutil.copyfileobj(f_in, f_out)
+
+    manifest_dict = {
+        "seed_pack_version": pack_hash.hexdigest()[:16],
+        "seed_pack_file": SEED_PACK_FILE,
+        "tables": versions_dict,
+    }
+    with open(join(output_dir, SEED_MANIFEST_FILE), "w+") as f:
+        f.write(json.dumps(manifest_dict, indent=4))
+
+    return manifest_dict
+
+
+def load_seed_manifest() -> dict:
+    """
+    Returns the manifest of the seed pack shipped with this app,
+    or `None` if there is no seed pack.
+    """
+    try:
+        with open(join(SEED_PACK_DIR, SEED_MANIFEST_FILE), "r") as f:
+            return json.loads(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def get_seed_cache_dir(con: sqlite3.Connection = None) -> str:
+    """
+    Returns the directory uncompressed seed packs are cached in.
+    This is the `seed_cache/` folder next to the database `con`
+    is connected to, or a temporary folder if `con` is not set,
+    or is an in-memory database.
+    """
+    db_file = ""
+    if con is not None:
+        db_file = con.execute("PRAGMA database_list;").fetchone()[2]
+
+    if db_file == "":
+        return join(tempfile.gettempdir(), "sdv_pbp_fb_seed_cache")
+
+    return join(dirname(db_file), "seed_cache")
+
+
+def get_seed_template(cache_dir: str) -> str:
+    """
+    Returns the path to an uncompressed copy of the seed pack,
+    decompressing the seed pack into `cache_dir` if needed.
+    If there is no seed pack, one is built from
+    `core.database.create_db_elements.SqliteSampleFiles()` instead.
+    """
+    makedirs(cache_dir, exist_ok=True)
+    manifest_dict = load_seed_manifest()
+
+    if manifest_dict is None:
+        logging.warning(
+            "Could not find the seed pack in `%s`. " +
+            "Building a seed pack from SQL scripts instead.",
+            SEED_PACK_DIR
+        )
+        manifest_dict = build_seed_pack(cache_dir)
+        gz_file = join(cache_dir, SEED_PACK_FILE)
+    else:
+        gz_file = join(SEED_PACK_DIR, manifest_dict["seed_pack_file"])
+
+    template_file = join(
+        cache_dir,
+        f"sdv_pbp_seed_{manifest_dict['seed_pack_version']}.sqlite"
+    )
+
+    if exists(template_file) is False:
+        # Decompressed into a temp file first, so that a crash
+        # can never leave behind a half-written template.
+        temp_file = f"{template_file}.tmp"
+        with gzip.open(gz_file, "rb") as f_in:
+            with open(temp_file, "wb") as f_out:
+                shutil.copyfileobj(f_in, f_out)
+        replace(temp_file, template_file)
+        clear_seed_cache(cache_dir)
+
+    return template_file
+
+
+def replace_database_file(src_file: str, dst_file: str) -> None:
+    """
+    Moves the database at `src_file` to `dst_file`,
+    along with its `-wal`, `-shm`, and `-journal` files.
+    Any of those files left behind at `dst_file` are deleted first,
+    so they're never applied to the database moved there.
+    """
+    for suffix in SQLITE3_SIDECAR_SUFFIXES:
+        if exists(f"{dst_file}{suffix}"):
+            remove(f"{dst_file}{suffix}")
+
+    replace(src_file, dst_file)
+
+    for suffix in SQLITE3_SIDECAR_SUFFIXES:
+        if exists(f"{src_file}{suffix}"):
+            replace(f"{src_file}{suffix}", f"{dst_file}{suffix}")
+
+
+def copy_seed_database(sql_file: str) -> None:
+    """
+    Creates a new database at `sql_file`
+    by copying the seed pack for this application.
+    """
+    template_file = get_seed_template(
+        join(dirname(abspath(sql_file)), "seed_cache")
+    )
+    temp_file = f"{sql_file}.tmp"
+    shutil.copyfile(template_file, temp_file)
+    replace_database_file(temp_file, sql_file)
+
+
+def reseed_tables(con: sqlite3.Connection, table_names: list) -> None:
+    """
+    Drops, recreates, and re-seeds one or more tables from the seed pack.
+
+    Parameters
+    ----------
+    `con` (sqlite3.Connection, mandatory):
+        A connection to the database for this application.
+
+    `table_names` (list, mandatory):
+        The tables to re-seed. Each table must be in `SEED_TABLES`.
+    """
+    if len(table_names) == 0:
+        return
+
+    for table_name in table_names:
+        if table_name not in SEED_TABLES:
+            raise ValueError(
+                f"`{table_name}` is not a table in the seed pack."
+            )
+
+    template_file = get_seed_template(get_seed_cache_dir(con))
+    manifest_dict = load_seed_manifest()
+
+    # `ATTACH` cannot be used within a transaction.
+    con.commit()
+    con.execute("ATTACH DATABASE ? AS seed_pack", (template_file,))
+
+    try:
+        con.execute("BEGIN")
+        for table_name in table_names:
+            table_sql = con.execute(
+                "SELECT sql FROM seed_pack.sqlite_master " +
+                "WHERE type = 'table' AND name = ?",
+                (table_name,)
+            ).fetchone()[0]
+
+            con.execute(f"DROP TABLE IF EXISTS main.\"{table_name}\"")
+            con.execute(table_sql)
+            con.execute(
+                f"INSERT INTO main.\"{table_name}\" " +
+                f"SELECT * FROM seed_pack.\"{table_name}\""
+            )
+
+        # Triggers can write to other tables, which have to exist
+        # before the trigger is created,
+        # so indexes and triggers are only created once every table is.
+        for table_name in table_names:
+            sql_arr = con.execute(
+                "SELECT sql FROM seed_pack.sqlite_master " +
+                "WHERE tbl_name = ? AND type != 'table' " +
+                "AND sql IS NOT NULL ORDER BY rowid",
+                (table_name,)
+            ).fetchall()
+            for (sql_script,) in sql_arr:
+                con.execute(sql_script)
+
+        if manifest_dict is not None:
+            stamp_seed_versions(
+                con,
+                {x: manifest_dict["tables"][x] for x in table_names}
+            )
+        con.commit()
+    except sqlite3.Error as e:
+        con.rollback()
+        raise e
+    finally:
+        con.execute("DETACH DATABASE seed_pack")
+
+    logging.info("Re-seeded the following tables: %s", table_names)
+
+
+def sync_seed_tables(con: sqlite3.Connection) -> list:
+    """
+    Re-seeds any table that is missing from the database `con`
+    is connected to, and any table in `REFERENCE_TABLES`
+    whose version has changed in the seed pack.
+
+    Returns
+    ----------
+    A list of the tables that were re-seeded.
+    """
+    manifest_dict = load_seed_manifest()
+    if manifest_dict is None:
+        return []
+
+    existing_tables = [
+        x[0] for x in con.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'"
+        ).fetchall()
+    ]
+
+    db_versions_dict = {}
+    if "app_seed_versions" in existing_tables:
+        db_versions_dict = dict(
+            con.execute(
+                "SELECT table_name, seed_version FROM app_seed_versions"
+            ).fetchall()
+        )
+
+    table_names = []
+    for table_name, seed_version in manifest_dict["tables"].items():
+        if table_name not in existing_tables:
+            table_names.append(table_name)
+        elif table_name in REFERENCE_TABLES and \
+                db_versions_dict.get(table_name) != seed_version:
+            table_names.append(table_name)
+
+    reseed_tables(con, table_names)
+    return table_names
+
+
+def clear_seed_cache(cache_dir: str) -> None:
+    """
+    Removes every cached seed pack in `cache_dir`
+    that does not match the current seed pack.
+    """
+    manifest_dict = load_seed_manifest()
+    if manifest_dict is None or exists(cache_dir) is False:
+        return
+
+    current_file = f"sdv_pbp_seed_{manifest_dict['seed_pack_version']}.sqlite"
+    for file in listdir(cache_dir):
+        if file.startswith("sdv_pbp_seed_") and file != current_file:
+            remove(join(cache_dir, file))
+
+
+if __name__ == "__main__":
+    print(json.dumps(build_seed_pack(), indent=4))
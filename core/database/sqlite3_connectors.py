@@ -1,38 +1,424 @@
 """
 # Creation Date: 02/10/2024 12:39 AM EDT
-# Last Updated: 04/15/2024 10:25 AM EDT
+# Last Updated: 10/19/2026 04:55 AM EDT
 # Authors: Joseph Armstrong (armstrongjoseph08@gmail.com)
 # file: `./core/settings/sqlite3_connectors.py`
 # Purpose: Core code for the settings of this application.
 ###############################################################################
 """
+import atexit
 import logging
+import queue
 import sqlite3
-from os.path import expanduser
+import threading
+from contextlib import contextmanager
+from os.path import exists, expanduser
+from urllib.request import pathname2url
 
-from core.database.create_db_elements import create_app_sqlite3_db
+from core.database.seed_db_elements import sync_seed_tables
 
+# Stored in `PRAGMA user_version`. Bump this whenever
+# `SqliteConnectionManager().upgrade_schema()` has something new to apply
+# to existing databases.
+SQLITE3_SCHEMA_VERSION = 8
 
-def initialize_sqlite3_connectors(custom_dir: str = None):
+# PRAGMAs applied once to every connection handed out by
+# `SqliteConnectionManager()`.
+SQLITE3_PRAGMAS = {
+    # Lets readers keep reading while the app is writing a play/game.
+    "journal_mode": "WAL",
+    # Safe with WAL, and avoids an fsync on every commit.
+    "synchronous": "NORMAL",
+    "mmap_size": 268435456,  # 256 MiB
+    "cache_size": -32768,  # Negative values are in KiB, so this is 32 MiB.
+    "temp_store": "MEMORY",
+    # NOTE: `fb_schedule.stadium_id` and `fb_teams.stadium_id` default to
+    # `0`, which is not a valid `fb_stadiums.stadium_id`.
+    # Until that is sorted out, turning this on would prevent
+    # new games from being created.
+    "foreign_keys": "OFF",
+}
+
+
+def get_sqlite3_db_path(custom_dir: str = None) -> str:
     """
-    asdf
+    Returns the path to the SQLite3 database for this application.
     """
-    home_dir = expanduser("~")
-    sql_dir = ""
     if custom_dir is not None:
         sql_dir = custom_dir
     else:
-        sql_dir = home_dir
-
-    try:
-        con = sqlite3.connect(f"{sql_dir}/.sdv_pbp_fb/sdv_pbp_py.sqlite")
-        cur = con.cursor()
-    except sqlite3.OperationalError as e:
-        create_app_sqlite3_db(custom_dir)
-        logging.warning(
-            "A SQLite3 Operational Error has been raised. " + f"Reason: {e}"
-        )
-        con = sqlite3.connect(f"{sql_dir}/.sdv_pbp_fb/sdv_pbp_py.sqlite")
-        cur = con.cursor()
+        sql_dir = expanduser("~")
+
+    return f"{sql_dir}/.sdv_pbp_fb/sdv_pbp_py.sqlite"
+
+
+def open_read_only_connection(db_path: str) -> sqlite3.Connection:
+    """
+    Opens a read-only connection to an existing database,
+    without a `SqliteConnectionManager()`.
+    Used by worker processes, which can't share the connections
+    of this process, and should never upgrade or seed the database.
+    """
+    con = sqlite3.connect(f"file:{pathname2url(db_path)}?mode=ro", uri=True)
+    for pragma in ("mmap_size", "cache_size", "temp_store"):
+        con.execute(f"PRAGMA {pragma} = {SQLITE3_PRAGMAS[pragma]};")
+    con.execute("PRAGMA query_only = ON;")
+    return con
+
+
+class SqliteConnectionManager:
+    """
+    Hands out reusable SQLite3 connections for this application:
+    one writer connection, and a pool of up to `max_readers`
+    read-only connections for background loads.
+    """
+
+    def __init__(
+        self,
+        custom_dir: str = None,
+        max_readers: int = 4,
+        pragmas: dict = None
+    ) -> None:
+        self.custom_dir = custom_dir
+        self.db_path = get_sqlite3_db_path(custom_dir)
+        self.max_readers = max_readers
+        self.pragmas = SQLITE3_PRAGMAS.copy()
+
+        if pragmas is not None:
+            self.pragmas.update(pragmas)
+
+        # Serializes every write made by a `DataService()`
+        # (see `core.database.worker_db_elements`).
+        # A window with a `DataService()` sends its writes through
+        # `DataService().write()`, instead of writing on the GUI thread,
+        # so the writer connection is never used by two threads at once.
+        self.writer_lock = threading.RLock()
+        self.writer_con = None
+        self.reader_pool = queue.LifoQueue()
+        self.readers_opened = 0
+        self.readers_lock = threading.Lock()
+        self.is_closed = False
+
+        try:
+            self.writer_con = self.open_connection()
+            # Missing tables are re-seeded first,
+            # since the schema upgrades rely on them.
+            self.sync_seed_data()
+            self.upgrade_schema()
+        except sqlite3.OperationalError as e:
+            raise e
+        except sqlite3.DatabaseError as e:
+            # The database file is corrupted.
+            # `create_app_sqlite3_db()` moves it aside,
+            # and replaces it with a new database.
+            from core.database.create_db_elements import create_app_sqlite3_db
+
+            logging.error(
+                f"Could not read `{self.db_path}`. Reason: {e}"
+            )
+            if self.writer_con is not None:
+                self.writer_con.close()
+            create_app_sqlite3_db(self.custom_dir)
+            self.writer_con = self.open_connection()
+            self.sync_seed_data()
+            self.upgrade_schema()
+        self.recover_play_journals()
+
+    def upgrade_schema(self) -> None:
+        """
+        Applies anything added to the database schema since this database
+        was created, and records `SQLITE3_SCHEMA_VERSION`
+        in `PRAGMA user_version` so this only happens once.
+        """
+        con = self.writer_con
+        db_version = con.execute("PRAGMA user_version;").fetchone()[0]
+
+        if db_version >= SQLITE3_SCHEMA_VERSION:
+            return
+
+        # Imported here, so that the seed data doesn't have to be loaded
+        # every time the app starts up.
+        from core.database.create_db_elements import SqliteSampleFiles
+
+        # Each script is applied in order, to any database
+        # older than the version listed alongside that script.
+        upgrade_scripts = [
+            # Databases created before the filtered loaders existed
+            # won't have the indexes those loaders rely on.
+            (1, SqliteSampleFiles.app_indexes_sql_file),
+            # Lets the main window's schedule cache only reload
+            # the games that have changed.
+            (2, SqliteSampleFiles.schedule_change_tracking_sql_file),
+            # Stores every play in its own row,
+            # instead of within `fb_pbp.game_json_str`.
+            (3, SqliteSampleFiles.pbp_plays_sql_file),
+            (3, SqliteSampleFiles.pbp_play_players_sql_file),
+            (3, SqliteSampleFiles.pbp_play_tacklers_sql_file),
+            (3, SqliteSampleFiles.pbp_play_penalties_sql_file),
+            # Lets plays be recorded one at a time while charting a game.
+            (4, SqliteSampleFiles.pbp_journal_sql_file),
+            # Stores every drive in its own row.
+            (5, SqliteSampleFiles.pbp_drives_sql_file),
+            # Stores the box score of every game,
+            # and the season totals built from them.
+            (6, SqliteSampleFiles.game_stats_sql_file),
+            (6, SqliteSampleFiles.season_stats_sql_file),
+            # Moves a game's box score to another league/season's totals
+            # when that game is moved.
+            (8, SqliteSampleFiles.season_stats_sql_file),
+        ]
+
+        try:
+            for version, sql_script in upgrade_scripts:
+                if db_version < version:
+                    con.executescript(sql_script())
+
+            if db_version < 3:
+                from core.database.pbp_db_elements import (
+                    migrate_game_json_plays
+                )
+
+                migrate_game_json_plays(con)
+            else:
+                if db_version < 5:
+                    from core.database.drive_db_elements import (
+                        rebuild_drives
+                    )
+
+                    rebuild_drives(con)
+                if db_version < 7:
+                    from core.database.pbp_db_elements import (
+                        migrate_play_team_ids
+                    )
+
+                    # `team_id` was stored as `INTEGER` in these tables.
+                    migrate_play_team_ids(con)
+                if db_version < 6:
+                    from core.database.stats_db_elements import (
+                        rebuild_game_stats
+                    )
+
+                    rebuild_game_stats(con)
+                elif db_version < 8:
+                    from core.database.stats_db_elements import (
+                        rebuild_season_stats
+                    )
+
+                    # Games moved to another league/season before now
+                    # left their box score in the old season's totals.
+                    rebuild_season_stats(con)
+        except sqlite3.OperationalError as e:
+            logging.warning(
+                "Could not upgrade the schema for this database. " +
+                f"Reason: {e}"
+            )
+            return
+
+        con.execute(f"PRAGMA user_version = {SQLITE3_SCHEMA_VERSION};")
+        con.commit()
+
+    def sync_seed_data(self) -> None:
+        """
+        Re-seeds any table missing from this database,
+        and any reference table that has changed in the seed pack.
+        """
+        try:
+            table_names = sync_seed_tables(self.writer_con)
+        except (OSError, sqlite3.Error) as e:
+            logging.warning(
+                "Could not sync this database with the seed pack. " +
+                f"Reason: {e}"
+            )
+            return
+
+        if len(table_names) > 0:
+            logging.info(
+                "Re-seeded %s table(s) from the seed pack.", len(table_names)
+            )
+
+    def recover_play_journals(self) -> None:
+        """
+        Compacts any play journals left over from a session that crashed,
+        so no charted plays are lost.
+        """
+        from core.database.journal_db_elements import recover_play_journals
+
+        try:
+            game_ids_arr = recover_play_journals(self.writer_con)
+        except sqlite3.Error as e:
+            logging.warning(
+                "Could not recover the play journals in this database. " +
+                f"Reason: {e}"
+            )
+            return
+
+        if len(game_ids_arr) > 0:
+            logging.warning(
+                "Recovered the plays charted in %s game(s) " +
+                "from their play journals.",
+                len(game_ids_arr)
+            )
+
+    def open_connection(self, read_only: bool = False) -> sqlite3.Connection:
+        """
+        Opens a new SQLite3 connection, and applies `self.pragmas` to it.
+        """
+        if exists(self.db_path) is False:
+            # `sqlite3.connect()` would otherwise create an empty database.
+            from core.database.create_db_elements import create_app_sqlite3_db
+
+            create_app_sqlite3_db(self.custom_dir)
+
+        try:
+            con = sqlite3.connect(self.db_path, check_same_thread=False)
+        except sqlite3.OperationalError as e:
+            from core.database.create_db_elements import create_app_sqlite3_db
+
+            create_app_sqlite3_db(self.custom_dir)
+            logging.warning(
+                "A SQLite3 Operational Error has been raised. " +
+                f"Reason: {e}"
+            )
+            con = sqlite3.connect(self.db_path, check_same_thread=False)
+
+        try:
+            for pragma, value in self.pragmas.items():
+                try:
+                    con.execute(f"PRAGMA {pragma} = {value};")
+                except sqlite3.OperationalError as e:
+                    logging.warning(
+                        f"Could not set `PRAGMA {pragma}`. Reason: {e}"
+                    )
+
+            if read_only is True:
+                con.execute("PRAGMA query_only = ON;")
+        except sqlite3.DatabaseError as e:
+            # Don't leave a handle open on a corrupted database file.
+            con.close()
+            raise e
+
+        return con
+
+    def get_writer(self) -> sqlite3.Connection:
+        """
+        Returns the writer connection for this application.
+        """
+        if self.is_closed is True:
+            raise sqlite3.ProgrammingError(
+                "Cannot use a closed `SqliteConnectionManager()`."
+            )
+        return self.writer_con
+
+    @contextmanager
+    def reader(self):
+        """
+        Borrows a read-only connection from the reader pool,
+        and returns it to the pool once the `with` block exits.
+        If every reader is in use, and the pool is full,
+        this waits for a reader to be returned.
+        """
+        if self.is_closed is True:
+            raise sqlite3.ProgrammingError(
+                "Cannot use a closed `SqliteConnectionManager()`."
+            )
+
+        con = None
+        try:
+            con = self.reader_pool.get_nowait()
+        except queue.Empty:
+            with self.readers_lock:
+                if self.readers_opened < self.max_readers:
+                    # Only counted once it's open, so a reader that
+                    # fails to open doesn't use up a slot for good.
+                    con = self.open_connection(read_only=True)
+                    self.readers_opened += 1
+
+        if con is None:
+            con = self.reader_pool.get()
+
+        try:
+            yield con
+        finally:
+            if self.is_closed is True:
+                con.close()
+            else:
+                self.reader_pool.put(con)
+
+    def close(self) -> None:
+        """
+        Closes every connection opened by this manager.
+        """
+        if self.is_closed is True:
+            return
+
+        self.is_closed = True
+
+        while True:
+            try:
+                self.reader_pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+        with self.writer_lock:
+            try:
+                # Schedule caches only live as long as this process,
+                # so every change recorded so far has already been seen.
+                self.writer_con.execute("DELETE FROM fb_schedule_changes;")
+                self.writer_con.commit()
+            except sqlite3.Error as e:
+                logging.warning(
+                    f"Could not clear `fb_schedule_changes`. Reason: {e}"
+                )
+            try:
+                self.writer_con.execute("PRAGMA optimize;")
+            except sqlite3.Error as e:
+                logging.warning(
+                    f"Could not optimize the database. Reason: {e}"
+                )
+            self.writer_con.close()
+
+
+# Process-wide connection managers, keyed by `custom_dir`.
+_connection_managers = {}
+_connection_managers_lock = threading.Lock()
+
+
+def get_connection_manager(
+    custom_dir: str = None
+) -> SqliteConnectionManager:
+    """
+    Returns the process-wide `SqliteConnectionManager()`
+    for a given database directory, creating it on first use.
+    """
+    with _connection_managers_lock:
+        manager = _connection_managers.get(custom_dir)
+
+        if manager is None or manager.is_closed is True:
+            manager = SqliteConnectionManager(custom_dir)
+            _connection_managers[custom_dir] = manager
+
+    return manager
+
+
+def close_sqlite3_connectors() -> None:
+    """
+    Closes every connection opened by this application.
+    """
+    with _connection_managers_lock:
+        for manager in _connection_managers.values():
+            manager.close()
+        _connection_managers.clear()
+
+
+atexit.register(close_sqlite3_connectors)
+
+
+def initialize_sqlite3_connectors(custom_dir: str = None):
+    """
+    Returns the shared writer connection for this application,
+    and a new cursor for that connection.
+    """
+    con = get_connection_manager(custom_dir).get_writer()
+    cur = con.cursor()
 
     return con, cur
@@ -0,0 +1,316 @@
+"""
+- Creation Date: 10/18/2026 08:05 PM EDT
+- Last Updated: 10/19/2026 02:40 AM EDT
+- Author: Joseph Armstrong (armstrongjoseph08@gmail.com)
+- File Name: ./core/database/stats_db_elements.py
+- Purpose: Saves the box score of every game
+-   (see `core.pbp_engine.box_score.BoxScore()`)
+-   into `fb_player_game_stats` and `fb_team_game_stats`,
+-   and keeps the season totals in `fb_player_season_stats`
+-   and `fb_team_season_stats` up to date.
+-   Every table stores one row per stat, so new stats
+-   never require a change to these tables.
+
+When a game's box score changes, only the difference between
+the old and new box score is added to the season totals,
+so saving a game takes the same amount of time
+no matter how many games are in that season.
+"""
+
+###############################################################################
+
+import sqlite3
+from contextlib import nullcontext
+
+from core.database.query_db_elements import build_where_clause
+
+# Added to every player and team in a game's box score,
+# so season totals include the number of games played.
+GAMES_PLAYED_STAT = ("games", "games_played")
+
+
+def get_game_stat_rows(stats_dict: dict, team_ids: dict = None) -> tuple:
+    """
+    Flattens the `"stats"` section of a game file
+    into one value per stat.
+
+    Parameters
+    ----------
+    `stats_dict` (dict, mandatory):
+        The `"stats"` section of a game file,
+        or `None` if the game has no stats.
+
+    `team_ids` (dict, optional):
+        Maps `"home"` and `"away"` to the `team_id` of each team,
+        for plays charted without team abbreviations.
+
+    Returns
+    ----------
+    A tuple of two dictionaries. The first is keyed by
+    `(team_id, player_id, stat_category, stat_name)`, and the second
+    is keyed by `(team_id, stat_category, stat_name)`.
+    Players without a `player_id` are only counted in their team's totals.
+    """
+    if team_ids is None:
+        team_ids = {}
+
+    player_rows_dict = {}
+    team_rows_dict = {}
+    if stats_dict is None:
+        return player_rows_dict, team_rows_dict
+
+    for stat_category, lines_arr in stats_dict.items():
+        for line_dict in lines_arr:
+            team_id = team_ids.get(line_dict["team"], line_dict["team"])
+            if team_id is None:
+                continue
+
+            if line_dict["is_team_total"] is True:
+                rows_dict = team_rows_dict
+                key = (team_id,)
+            elif line_dict["player_id"] is not None:
+                rows_dict = player_rows_dict
+                key = (team_id, line_dict["player_id"])
+            else:
+                continue
+
+            rows_dict[key + GAMES_PLAYED_STAT] = 1
+            for stat_name, value in line_dict.items():
+                if stat_name in (
+                    "team", "is_team_total", "player_id", "team_id",
+                    "player_num", "player_full_name", "player_football_name"
+                ) or value == 0:
+                    continue
+                rows_dict[key + (stat_category, stat_name)] = value
+
+    return player_rows_dict, team_rows_dict
+
+
+def load_game_stat_rows(
+    con: sqlite3.Connection,
+    table_name: str,
+    game_id: int
+) -> dict:
+    """
+    Returns the rows stored for a game in `fb_player_game_stats`
+    or `fb_team_game_stats`, in the format `get_game_stat_rows()` returns.
+    """
+    rows_dict = {}
+    for row in con.execute(
+        f"SELECT * FROM {table_name} WHERE game_id = ?", (game_id,)
+    ):
+        rows_dict[row[1:-1]] = row[-1]
+    return rows_dict
+
+
+def get_stat_changes(old_rows_dict: dict, new_rows_dict: dict) -> list:
+    """
+    Returns every stat that changed between two box scores,
+    as a list of `(*key, change)` tuples.
+    """
+    changes_arr = []
+    for key in old_rows_dict.keys() | new_rows_dict.keys():
+        # Shared sacks are fractions, which shouldn't leave behind
+        # tiny rounding errors in the season totals.
+        change = round(
+            new_rows_dict.get(key, 0) - old_rows_dict.get(key, 0), 6
+        )
+        if change != 0:
+            changes_arr.append(key + (change,))
+    return changes_arr
+
+
+def save_game_stats(
+    con: sqlite3.Connection,
+    game_id: int,
+    stats_dict: dict
+) -> None:
+    """
+    Replaces the box score stored for a game,
+    and adds the difference between the old and new box score
+    to that game's season totals.
+    This does not commit, so that it can be part of a larger transaction.
+
+    Parameters
+    ----------
+    `con` (sqlite3.Connection, mandatory):
+        A connection to the database for this application.
+
+    `game_id` (int, mandatory):
+        The game this box score is for.
+
+    `stats_dict` (dict, mandatory):
+        The `"stats"` section of a game file
+        (see `core.pbp_engine.box_score.BoxScore.get_stats()`),
+        or `None` to remove this game's box score.
+    """
+    schedule_row = con.execute(
+        "SELECT league_id, season, home_team_abv, away_team_abv " +
+        "FROM fb_schedule WHERE game_id = ?",
+        (game_id,)
+    ).fetchone()
+
+    team_ids = {}
+    if schedule_row is not None:
+        team_ids = {"home": schedule_row[2], "away": schedule_row[3]}
+
+    player_rows_dict, team_rows_dict = get_game_stat_rows(
+        stats_dict, team_ids
+    )
+
+    for table_name, rows_dict in (
+        ("fb_player", player_rows_dict),
+        ("fb_team", team_rows_dict),
+    ):
+        old_rows_dict = load_game_stat_rows(
+            con, f"{table_name}_game_stats", game_id
+        )
+        changes_arr = get_stat_changes(old_rows_dict, rows_dict)
+        if len(changes_arr) == 0:
+            continue
+
+        key_len = len(changes_arr[0]) - 1
+        con.execute(
+            f"DELETE FROM {table_name}_game_stats WHERE game_id = ?",
+            (game_id,)
+        )
+        con.executemany(
+            f"INSERT INTO {table_name}_game_stats VALUES " +
+            f"(?, {','.join(['?'] * (key_len + 1))})",
+            [(game_id,) + key + (value,) for key, value in rows_dict.items()]
+        )
+
+        # Games that aren't in `fb_schedule` don't belong to a season.
+        if schedule_row is None:
+            continue
+
+        key_columns = ["team_id", "stat_category", "stat_name"]
+        if table_name == "fb_player":
+            key_columns.insert(1, "player_id")
+
+        con.executemany(
+            f"INSERT INTO {table_name}_season_stats" +
+            f"(league_id, season, {','.join(key_columns)}, stat_value) " +
+            f"VALUES (?, ?, {','.join(['?'] * (key_len + 1))}) " +
+            f"ON CONFLICT(league_id, season, {','.join(key_columns)}) " +
+            "DO UPDATE SET " +
+            "stat_value = stat_value + excluded.stat_value",
+            [schedule_row[:2] + x for x in changes_arr]
+        )
+        con.executemany(
+            f"DELETE FROM {table_name}_season_stats " +
+            "WHERE league_id = ? AND season = ? AND " +
+            " AND ".join([f"{x} = ?" for x in key_columns]) +
+            " AND stat_value = 0",
+            [schedule_row[:2] + x[:-1] for x in changes_arr]
+        )
+
+
+def rebuild_season_stats(
+    con: sqlite3.Connection,
+    league_id: str = None,
+    season: int = None
+) -> dict:
+    """
+    Rebuilds `fb_player_season_stats` and `fb_team_season_stats`
+    for a league/season (or every season, if no filters are set)
+    from the box score of every game in that season,
+    with one `polars` `group_by()` per table, in a single transaction.
+
+    Returns
+    ----------
+    A dictionary where each key is a table name,
+    and each value is the number of rows saved in that table.
+    """
+    # Imported here, so that saving a game doesn't require `polars`.
+    import polars as pl
+
+    where_clause, params = build_where_clause(
+        {"league_id": league_id, "season": season}
+    )
+    rows_dict = {}
+
+    with con:
+        for table_name, key_columns in (
+            ("fb_player", ["team_id", "player_id"]),
+            ("fb_team", ["team_id"]),
+        ):
+            group_columns = ["league_id", "season"] + key_columns + [
+                "stat_category", "stat_name"
+            ]
+            season_df = pl.read_database(
+                query=(
+                    f"SELECT {','.join(group_columns)}, stat_value " +
+                    f"FROM {table_name}_game_stats " +
+                    f"INNER JOIN fb_schedule USING (game_id) {where_clause}"
+                ),
+                connection=con.cursor(),
+                execute_options={"parameters": params},
+                schema_overrides={"stat_value": pl.Float64},
+            ).group_by(group_columns).agg(
+                pl.col("stat_value").sum()
+            ).filter(pl.col("stat_value") != 0)
+
+            con.execute(
+                f"DELETE FROM {table_name}_season_stats {where_clause}",
+                params
+            )
+            con.executemany(
+                f"INSERT INTO {table_name}_season_stats" +
+                f"({','.join(group_columns)}, stat_value) VALUES " +
+                f"({','.join(['?'] * (len(group_columns) + 1))})",
+                season_df.rows()
+            )
+            rows_dict[f"{table_name}_season_stats"] = season_df.height
+
+    return rows_dict
+
+
+def rebuild_game_stats(
+    con: sqlite3.Connection,
+    game_ids: list = None,
+    commit: bool = True
+) -> int:
+    """
+    Rebuilds the box score of one or more games from their plays,
+    and updates the season totals of every game that changed,
+    in a single transaction.
+
+    Parameters
+    ----------
+    `con` (sqlite3.Connection, mandatory):
+        A connection to the database for this application.
+
+    `game_ids` (list, optional):
+        The games to rebuild.
+        If not set, every game with plays in `fb_pbp_plays` is rebuilt.
+
+    `commit` (bool, optional):
+        If set to `False`, the box scores are saved without committing,
+        so that they can be part of a larger transaction.
+
+    Returns
+    ----------
+    The number of games that were rebuilt.
+    """
+    # Imported here, since `core.database.pbp_db_elements`
+    # saves box scores with this module.
+    from core.database.pbp_db_elements import load_game_plays
+    from core.pbp_engine.box_score import BoxScore
+
+    if game_ids is None:
+        game_ids = [
+            x[0] for x in con.execute(
+                "SELECT DISTINCT game_id FROM fb_pbp_plays"
+            )
+        ]
+
+    with con if commit is True else nullcontext():
+        for game_id in game_ids:
+            save_game_stats(
+                con,
+                game_id,
+                BoxScore.from_plays(load_game_plays(con, game_id)).get_stats()
+            )
+
+    return len(game_ids)
@@ -0,0 +1,247 @@
+"""
+- Creation Date: 10/18/2026 11:35 PM EDT
+- Last Updated: 10/18/2026 11:35 PM EDT
+- Author: Joseph Armstrong (armstrongjoseph08@gmail.com)
+- File Name: ./core/database/worker_db_elements.py
+- Purpose: Runs database loads and writes on a background thread,
+-   so the event loop of a window never waits on SQLite3.
+
+Every request is a function that takes a SQLite3 connection.
+Loads borrow a read-only connection from the reader pool,
+and writes use the writer connection
+(see `core.database.sqlite3_connectors.SqliteConnectionManager()`).
+When a request finishes, its result is sent back to the window
+that made it with `window.write_event_value()`,
+so it arrives as a normal event in that window's event loop.
+
+Requests are coalesced by their event key. If a window makes several
+requests with the same event key before the first one runs
+(for example, when the user scrolls through a combo box),
+only the latest request is run, and only its result is sent back.
+"""
+
+###############################################################################
+
+import logging
+import queue
+import threading
+from dataclasses import dataclass
+
+from core.database.sqlite3_connectors import get_connection_manager
+
+
+@dataclass(slots=True)
+class DataResult:
+    """
+    The result of a request to `DataService()`,
+    sent back to the window as the value of that request's event.
+    """
+    request_id: int
+    value: object = None
+    # Set if the request raised an exception.
+    error: Exception = None
+
+
+class DataService:
+    """
+    Runs database loads and writes for a window on a background thread.
+
+    Requests are run one at a time, in the order they were made,
+    so a load made after a write always sees that write.
+    """
+
+    def __init__(self, window, custom_dir: str = None) -> None:
+        """
+        Parameters
+        ----------
+        `window` (sg.Window, mandatory):
+            The window results are sent back to.
+
+        `custom_dir` (str, optional):
+            The folder the database for this application is in.
+        """
+        self.window = window
+        self.manager = get_connection_manager(custom_dir)
+
+        self.requests_queue = queue.Queue()
+        self.lock = threading.Lock()
+        # `{event_key: request_id}` of the latest coalesced request
+        # made for each event key.
+        self.latest_ids_dict = {}
+        self.last_request_id = 0
+        self.pending_count = 0
+        self.is_closed = False
+
+        self.thread = threading.Thread(
+            target=self.run, name="DataService", daemon=True
+        )
+        self.thread.start()
+
+    def submit(
+        self,
+        event_key: str,
+        func,
+        *args,
+        is_write: bool = False,
+        coalesce: bool = True,
+        **kwargs
+    ) -> int:
+        """
+        Queues a request.
+
+        Parameters
+        ----------
+        `event_key` (str, mandatory):
+            The event the result of this request is sent back as.
+            `values[event_key]` is a `DataResult()`.
+
+        `func` (callable, mandatory):
+            Called on the background thread as
+            `func(con, *args, **kwargs)`, where `con` is
+            a SQLite3 connection. Must not touch the window.
+
+        `is_write` (bool, optional):
+            If set to `True`, `func` is given the writer connection,
+            and the transaction is committed once `func` returns
+            (or rolled back if `func` raises an exception).
+            Otherwise, `func` is given a read-only connection.
+
+        `coalesce` (bool, optional):
+            If set to `True`, this request is skipped (or its result
+            is dropped) if another request with the same `event_key`
+            is made before this request's result is sent back.
+            Writes should never be coalesced.
+
+        Returns
+        ----------
+        The ID of this request (see `DataResult.request_id`).
+        """
+        with self.lock:
+            if self.is_closed is True:
+                raise RuntimeError("Cannot use a closed `DataService()`.")
+
+            self.last_request_id += 1
+            request_id = self.last_request_id
+            if coalesce is True:
+                self.latest_ids_dict[event_key] = request_id
+            self.pending_count += 1
+
+        self.requests_queue.put(
+            (request_id, event_key, func, args, kwargs, is_write, coalesce)
+        )
+        return request_id
+
+    def load(self, event_key: str, func, *args, **kwargs) -> int:
+        """
+        Queues a coalesced, read-only request (see `submit()`).
+        """
+        return self.submit(event_key, func, *args, **kwargs)
+
+    def write(self, event_key: str, func, *args, **kwargs) -> int:
+        """
+        Queues a write that's never coalesced (see `submit()`).
+        """
+        return self.submit(
+            event_key, func, *args, is_write=True, coalesce=False, **kwargs
+        )
+
+    def cancel(self, event_key: str) -> None:
+        """
+        Drops the result of every pending request for `event_key`.
+        """
+        with self.lock:
+            if event_key in self.latest_ids_dict:
+                self.latest_ids_dict[event_key] = None
+
+    def is_latest(self, event_key: str, request_id: int) -> bool:
+        """
+        Returns `True` if `request_id` is the latest coalesced request
+        made for `event_key`.
+        """
+        with self.lock:
+            return self.latest_ids_dict.get(event_key) == request_id
+
+    def is_pending(self) -> bool:
+        """
+        Returns `True` if any request hasn't been sent back yet.
+        """
+        with self.lock:
+            return self.pending_count > 0
+
+    def run_request(self, func, args, kwargs, is_write: bool) -> object:
+        """
+        Runs a request on a connection from `self.manager`.
+        """
+        if is_write is False:
+            with self.manager.reader() as con:
+                return func(con, *args, **kwargs)
+
+        with self.manager.writer_lock:
+            con = self.manager.get_writer()
+            try:
+                value = func(con, *args, **kwargs)
+                con.commit()
+            except Exception as e:
+                con.rollback()
+                raise e
+        return value
+
+    def run(self) -> None:
+        """
+        Runs every request, one at a time, until `close()` is called.
+        """
+        while True:
+            request = self.requests_queue.get()
+            if request is None:
+                break
+
+            request_id, event_key, func, args, kwargs, is_write, coalesce = \
+                request
+
+            try:
+                # A newer request has already been made for this event.
+                if coalesce is True and \
+                        self.is_latest(event_key, request_id) is False:
+                    continue
+
+                result = DataResult(request_id)
+                try:
+                    result.value = self.run_request(
+                        func, args, kwargs, is_write
+                    )
+                except Exception as e:
+                    logging.exception(
+                        f"Request `{event_key}` failed. Reason: {e}"
+                    )
+                    result.error = e
+
+                if coalesce is True and \
+                        self.is_latest(event_key, request_id) is False:
+                    continue
+
+                try:
+                    self.window.write_event_value(event_key, result)
+                except Exception as e:
+                    # The window was closed before this request finished.
+                    logging.info(
+                        f"Could not send back `{event_key}`. Reason: {e}"
+                    )
+            finally:
+                with self.lock:
+                    self.pending_count -= 1
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Stops the background thread, once every queued write has run.
+        Loads that haven't run yet are skipped.
+        Must be called before the window is closed.
+        """
+        with self.lock:
+            if self.is_closed is True:
+                return
+            self.is_closed = True
+            for event_key in self.latest_ids_dict:
+                self.latest_ids_dict[event_key] = None
+
+        self.requests_queue.put(None)
+        self.thread.join(timeout)
@@ -0,0 +1,69 @@
+"""
+- Creation Date: 10/18/2026 09:50 PM EDT
+- Last Updated: 10/18/2026 10:25 PM EDT
+- Authors: Joseph Armstrong (armstrongjoseph08@gmail.com)
+- file: `./core/export/export_as_json.py`
+- Purpose: Exports games as `sdv_football_pbp` game files
+    (see `core.pbp_engine.game.get_initial_game_file()`).
+"""
+###############################################################################
+import sqlite3
+from os import makedirs
+from os.path import join
+
+from core.database.pbp_db_elements import load_game_pbp
+from core.database.query_db_elements import build_where_clause
+from core.pbp_engine.game_codec import encode_game_file
+
+
+def export_as_json(
+    con: sqlite3.Connection,
+    output_dir: str,
+    game_id: int = None,
+    league_id: str = None,
+    season: int = None
+) -> list:
+    """
+    Exports one game, or every game in a league/season,
+    as game files named `{game_id}.json`.
+    Games without PBP data are skipped.
+
+    Parameters
+    ----------
+    `con` (sqlite3.Connection, mandatory):
+        A connection to the database for this application.
+
+    `output_dir` (str, mandatory):
+        The folder these files are written to.
+        This folder is created if it doesn't exist.
+
+    `game_id`, `league_id`, `season` (optional):
+        The game (or list of games), or league/season, to export.
+        If none are set, every game is exported.
+
+    Returns
+    ----------
+    A list of every file that was written, sorted by `game_id`.
+    """
+    where_clause, params = build_where_clause(
+        {"game_id": game_id, "league_id": league_id, "season": season}
+    )
+    game_ids = [
+        x[0] for x in con.execute(
+            "SELECT game_id FROM fb_pbp " +
+            f"INNER JOIN fb_schedule USING (game_id) {where_clause} " +
+            "ORDER BY game_id",
+            params
+        )
+    ]
+
+    makedirs(output_dir, exist_ok=True)
+    files_arr = []
+
+    for x in game_ids:
+        file_path = join(output_dir, f"{x}.json")
+        with open(file_path, "wb") as f:
+            f.write(encode_game_file(load_game_pbp(con, x), indent=True))
+        files_arr.append(file_path)
+
+    return files_arr
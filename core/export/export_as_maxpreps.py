@@ -1,82 +1,571 @@
 """
 - Creation Date: 01/21/2024 7:50 PM EDT
-# Last Updated: 04/15/2024 10:25 AM EDT
+- Last Updated: 10/18/2026 08:40 PM EDT
 - Authors: Joseph Armstrong (armstrongjoseph08@gmail.com)
 - file: `./core/export/export_as_maxpreps.py`
-- Purpose: Tentative code for exporting a game in a format that works with
-    MaxPreps.
+- Purpose: Exports the stats of every player in a game
+    in a format that works with MaxPreps.
+
+Stats come from `fb_player_game_stats`
+(see `core.database.stats_db_elements`).
+The stats that can't be stored there ("long" stats, kickoffs,
+and jersey numbers) come from `fb_pbp_plays` and `fb_pbp_play_players`.
+Every game that's exported is turned into MaxPreps columns with
+one set of `polars` expressions, instead of one game at a time.
 """
 ###############################################################################
+import random
+import sqlite3
+import tempfile
+import time
+from os import makedirs
+from os.path import join
+
+import polars as pl
+
+from core.database.query_db_elements import build_where_clause
+
+# Every column in a MaxPreps stats file, in order.
+MAXPREPS_COLUMNS = [
+    "Jersey",
+    "RushingNum",
+    "RushingYards",
+    "RushingLong",
+    "ReceivingNum",
+    "ReceivingYards",
+    "ReceivingLong",
+    "PassingComp",
+    "PassingAtt",
+    "PassingInt",
+    "PassingYards",
+    "PassingTD",
+    "PassingLong",
+    "OffensiveFumbles",
+    "OffensiveFumblesLost",
+    "Tackles",
+    "Assists",
+    "TotalTackles",
+    "TacklesForLoss",
+    "Sacks",
+    "SacksYardsLost",
+    "QBHurries",
+    "INTs",
+    "INTYards",
+    "PassesDefensed",
+    "BlockedPunts",
+    "BlockedFG",
+    "FumbleRecoveries",
+    "FumbleRecoveryYards",
+    "CausedFumbles",
+    "PuntReturnNum",
+    "PuntReturnYards",
+    "PuntReturnLong",
+    "PuntReturnFairCatches",
+    "KickoffReturnNum",
+    "KickoffReturnYards",
+    "KickoffReturnLong",
+    "TotalReturnYards",
+    "PuntNum",
+    "PuntYards",
+    "PuntLong",
+    "PuntInside20",
+    "KickoffNum",
+    "KickoffYards",
+    "KickoffLong",
+    "KickoffTouchbacks",
+    "RushingTDNum",
+    "ReceivingTDNum",
+    "MiscTDNum",
+    "TotalTDNum",
+    "PATKickingMade",
+    "PATKickingAtt",
+    "PATKickingPoints",
+    "PATRushingNum",
+    "PATReceivingNum",
+    "PATDefReturnNum",
+    "TotalConversionPoints",
+    "FGMade",
+    "FGAttempted",
+    "FGLong",
+    "Safeties",
+    "TotalPoints",
+]
+
+# MaxPreps columns that are a single stat in `fb_player_game_stats`,
+# as `(stat_category, stat_name)`.
+MAXPREPS_STATS = {
+    "RushingNum": ("rushing", "carries"),
+    "RushingYards": ("rushing", "yards"),
+    "ReceivingNum": ("receiving", "receptions"),
+    "ReceivingYards": ("receiving", "yards"),
+    "PassingComp": ("passing", "completions"),
+    "PassingAtt": ("passing", "attempts"),
+    "PassingInt": ("passing", "interceptions"),
+    "PassingYards": ("passing", "yards"),
+    "PassingTD": ("passing", "touchdowns"),
+    "OffensiveFumbles": ("fumbles", "fumbles"),
+    "OffensiveFumblesLost": ("fumbles", "fumbles_lost"),
+    "Tackles": ("defense", "solo_tackles"),
+    "Assists": ("defense", "assisted_tackles"),
+    "TacklesForLoss": ("defense", "tackles_for_loss"),
+    "Sacks": ("defense", "sacks"),
+    "BlockedPunts": ("blocks", "blocked_punts"),
+    "BlockedFG": ("blocks", "blocked_field_goals"),
+    "FumbleRecoveries": ("fumbles", "fumble_recoveries"),
+    "FumbleRecoveryYards": ("fumbles", "fumble_return_yards"),
+    "CausedFumbles": ("fumbles", "forced_fumbles"),
+    "PuntReturnNum": ("punt_return", "returns"),
+    "PuntReturnYards": ("punt_return", "yards"),
+    "KickoffReturnNum": ("kick_return", "returns"),
+    "KickoffReturnYards": ("kick_return", "yards"),
+    "PuntNum": ("punting", "punts"),
+    # Gross punt yards aren't charted, so this is net punt yards.
+    "PuntYards": ("punting", "net_yards"),
+    "PuntInside20": ("punting", "inside_20"),
+    "RushingTDNum": ("rushing", "touchdowns"),
+    "ReceivingTDNum": ("receiving", "touchdowns"),
+    "PATKickingMade": ("field_goals", "xp_made"),
+    "PATKickingAtt": ("field_goals", "xp_attempts"),
+    "FGMade": ("field_goals", "fg_made"),
+    "FGAttempted": ("field_goals", "fg_attempts"),
+}
+
+# Touchdowns that are neither rushing nor receiving touchdowns.
+MAXPREPS_MISC_TDS = (
+    ("fumbles", "fumble_return_touchdowns"),
+    ("kick_return", "touchdowns"),
+    ("punt_return", "touchdowns"),
+    ("missed_fg", "touchdowns"),
+)
+
+# MaxPreps columns that are built from the plays in a game
+# (see `get_maxpreps_play_stats()`).
+MAXPREPS_PLAY_STATS = (
+    "Jersey",
+    "RushingLong",
+    "ReceivingLong",
+    "PassingLong",
+    "FGLong",
+    "KickoffNum",
+    "KickoffTouchbacks",
+)
+
+# Every other column (QB hurries, passes defensed, individual
+# interceptions, return/punt/kickoff "long" stats, kickoff yards,
+# two point conversions, and safeties) isn't charted yet,
+# and is always exported as `0`.
 
 
-def export_as_maxpreps():
-    """ """
-    columns = [
-        "Jersey",
-        "RushingNum",
-        "RushingYards",
-        "RushingLong",
-        "ReceivingNum",
-        "ReceivingYards",
-        "ReceivingLong",
-        "PassingComp",
-        "PassingAtt",
-        "PassingInt",
-        "PassingYards",
-        "PassingTD",
-        "PassingLong",
-        "OffensiveFumbles",
-        "OffensiveFumblesLost",
-        "Tackles",
-        "Assists",
-        "TotalTackles",
-        "TacklesForLoss",
-        "Sacks",
-        "SacksYardsLost",
-        "QBHurries",
-        "INTs",
-        "INTYards",
-        "PassesDefensed",
-        "BlockedPunts",
-        "BlockedFG",
-        "FumbleRecoveries",
-        "FumbleRecoveryYards",
-        "CausedFumbles",
-        "PuntReturnNum",
-        "PuntReturnYards",
-        "PuntReturnLong",
-        "PuntReturnFairCatches",
-        "KickoffReturnNum",
-        "KickoffReturnYards",
-        "KickoffReturnLong",
-        "TotalReturnYards",
-        "PuntNum",
-        "PuntYards",
-        "PuntLong",
-        "PuntInside20",
-        "KickoffNum",
-        "KickoffYards",
-        "KickoffLong",
-        "KickoffTouchbacks",
-        "RushingTDNum",
-        "ReceivingTDNum",
-        "MiscTDNum",
-        "TotalTDNum",
-        "PATKickingMade",
-        "PATKickingAtt",
-        "PATKickingPoints",
-        "PATRushingNum",
-        "PATReceivingNum",
-        "PATDefReturnNum",
-        "TotalConversionPoints",
-        "FGMade",
-        "FGAttempted",
-        "FGLong",
-        "Safeties",
-        "TotalPoints",
-    ]
-
-    print(columns[0])
-    raise NotImplementedError(
-        "This function has yet to be implemented in this version"
+def load_maxpreps_stats(
+    con: sqlite3.Connection,
+    game_id: int = None,
+    league_id: str = None,
+    season: int = None
+) -> pl.DataFrame:
+    """
+    Loads every stat in `fb_player_game_stats` for one game,
+    or for every game in a league/season, with one row per stat.
+    """
+    where_clause, params = build_where_clause(
+        {"game_id": game_id, "league_id": league_id, "season": season}
     )
+    return pl.read_database(
+        query=(
+            "SELECT game_id, team_id, player_id, " +
+            "stat_category, stat_name, stat_value " +
+            "FROM fb_player_game_stats " +
+            f"INNER JOIN fb_schedule USING (game_id) {where_clause}"
+        ),
+        connection=con.cursor(),
+        execute_options={"parameters": params},
+        schema_overrides={
+            "game_id": pl.Int64,
+            "team_id": pl.String,
+            "player_id": pl.Int64,
+            "stat_category": pl.String,
+            "stat_name": pl.String,
+            "stat_value": pl.Float64,
+        },
+    )
+
+
+def load_maxpreps_plays(
+    con: sqlite3.Connection,
+    game_id: int = None,
+    league_id: str = None,
+    season: int = None
+) -> pl.DataFrame:
+    """
+    Loads every player in every play of one game,
+    or of every game in a league/season,
+    with one row per player per play,
+    along with the columns `get_maxpreps_play_stats()` needs.
+    Tacklers have a `player_role` of `"tackler"`.
+    """
+    where_clause, params = build_where_clause(
+        {"game_id": game_id, "league_id": league_id, "season": season}
+    )
+    return pl.read_database(
+        query=(
+            "SELECT game_id, player_id, player_num, player_role, " +
+            "play_type, is_no_play, is_completed_pass, is_sack_play, " +
+            "is_touchback, is_fg_made, fg_attempt_distance, " +
+            "yardline_start - MAX(yardline_end, 0) AS gain " +
+            "FROM (" +
+            "SELECT game_id, play_num, player_id, player_num, player_role " +
+            "FROM fb_pbp_play_players UNION ALL " +
+            "SELECT game_id, play_num, player_id, player_num, 'tackler' " +
+            "FROM fb_pbp_play_tacklers" +
+            ") INNER JOIN fb_pbp_plays USING (game_id, play_num) " +
+            f"INNER JOIN fb_schedule USING (game_id) {where_clause}"
+        ),
+        connection=con.cursor(),
+        execute_options={"parameters": params},
+        schema_overrides={
+            "game_id": pl.Int64,
+            "player_id": pl.Int64,
+            "player_num": pl.Int64,
+            "player_role": pl.String,
+            "play_type": pl.String,
+            "is_no_play": pl.Int64,
+            "is_completed_pass": pl.Int64,
+            "is_sack_play": pl.Int64,
+            "is_touchback": pl.Int64,
+            "is_fg_made": pl.Int64,
+            "fg_attempt_distance": pl.Int64,
+            "gain": pl.Int64,
+        },
+    )
+
+
+def get_maxpreps_play_stats(plays_df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Returns the MaxPreps columns in `MAXPREPS_PLAY_STATS`
+    for every player in `plays_df` (see `load_maxpreps_plays()`),
+    with one row per player per game.
+    """
+    role = pl.col("player_role")
+    play_type = pl.col("play_type")
+    gain = pl.col("gain").fill_null(0)
+    # Stats don't count on a play wiped out by a penalty,
+    # or on a try after a touchdown.
+    is_play = (pl.col("is_no_play").fill_null(0) == 0) & \
+        (play_type != "conversion_attempt")
+    is_completion = is_play & (play_type == "pass") & \
+        (pl.col("is_completed_pass") == 1) & \
+        (pl.col("is_sack_play").fill_null(0) == 0)
+    is_kickoff = is_play & (role == "kicker") & \
+        play_type.is_in(["kickoff", "safety_kickoff"])
+
+    return plays_df.filter(
+        pl.col("player_id").is_not_null()
+    ).group_by(["game_id", "player_id"]).agg(
+        pl.col("player_num").drop_nulls().max().alias("Jersey"),
+        gain.filter(is_play & (role == "rusher") & (play_type == "rush"))
+        .max().alias("RushingLong"),
+        gain.filter(is_completion & (role == "receiver"))
+        .max().alias("ReceivingLong"),
+        gain.filter(is_completion & (role == "passer"))
+        .max().alias("PassingLong"),
+        pl.col("fg_attempt_distance").filter(
+            is_play & (role == "kicker") &
+            play_type.is_in(["field_goal", "fair_catch_kick"]) &
+            (pl.col("is_fg_made") == 1)
+        ).max().alias("FGLong"),
+        is_kickoff.sum().alias("KickoffNum"),
+        (is_kickoff & (pl.col("is_touchback") == 1))
+        .sum().alias("KickoffTouchbacks"),
+    )
+
+
+def get_maxpreps_df(
+    stats_df: pl.DataFrame,
+    plays_df: pl.DataFrame
+) -> pl.DataFrame:
+    """
+    Turns the stats of every player in one or more games
+    into MaxPreps columns.
+
+    Parameters
+    ----------
+    `stats_df` (pl.DataFrame, mandatory):
+        Every stat in these games, in the format
+        `load_maxpreps_stats()` returns.
+
+    `plays_df` (pl.DataFrame, mandatory):
+        Every player in every play of these games, in the format
+        `load_maxpreps_plays()` returns.
+
+    Returns
+    ----------
+    A `polars` DataFrame with a `game_id` and `team_id` column,
+    followed by every column in `MAXPREPS_COLUMNS`,
+    with one row per player per game.
+    Players without any stat MaxPreps keeps track of aren't included.
+    """
+    # Maps each stat to the MaxPreps column it's added to.
+    columns_df = pl.DataFrame(
+        [x + (column,) for column, x in MAXPREPS_STATS.items()] +
+        [x + ("MiscTDNum",) for x in MAXPREPS_MISC_TDS],
+        schema=["stat_category", "stat_name", "column"],
+        orient="row",
+    )
+    stat_columns = list(MAXPREPS_STATS) + ["MiscTDNum"]
+
+    maxpreps_df = stats_df.join(
+        columns_df, on=["stat_category", "stat_name"]
+    ).pivot(
+        on="column",
+        index=["game_id", "team_id", "player_id"],
+        values="stat_value",
+        aggregate_function="sum",
+    )
+    # A column is only created if at least one player has that stat.
+    maxpreps_df = maxpreps_df.with_columns(
+        [
+            pl.lit(0.0).alias(x) for x in stat_columns
+            if x not in maxpreps_df.columns
+        ]
+    ).with_columns(
+        pl.col(stat_columns).fill_null(0)
+    ).join(
+        get_maxpreps_play_stats(plays_df),
+        on=["game_id", "player_id"],
+        how="left",
+    ).with_columns(
+        pl.col(MAXPREPS_PLAY_STATS[1:]).fill_null(0),
+        (pl.col("Tackles") + pl.col("Assists")).alias("TotalTackles"),
+        (pl.col("PuntReturnYards") + pl.col("KickoffReturnYards"))
+        .alias("TotalReturnYards"),
+        (
+            pl.col("RushingTDNum") + pl.col("ReceivingTDNum") +
+            pl.col("MiscTDNum")
+        ).alias("TotalTDNum"),
+        pl.col("PATKickingMade").alias("PATKickingPoints"),
+        pl.col("PATKickingMade").alias("TotalConversionPoints"),
+    ).with_columns(
+        (
+            pl.col("TotalTDNum") * 6 + pl.col("TotalConversionPoints") +
+            pl.col("FGMade") * 3
+        ).alias("TotalPoints"),
+    )
+
+    columns_arr = []
+    for column in MAXPREPS_COLUMNS:
+        if column == "Jersey":
+            columns_arr.append(pl.col(column))
+        elif column == "Sacks":
+            # A sack shared by two players is half a sack for each player.
+            columns_arr.append(pl.col(column).cast(pl.Float64))
+        elif column in maxpreps_df.columns:
+            columns_arr.append(pl.col(column).cast(pl.Int64))
+        else:
+            columns_arr.append(pl.lit(0, dtype=pl.Int64).alias(column))
+
+    return maxpreps_df.select(
+        [pl.col("game_id"), pl.col("team_id")] + columns_arr
+    ).sort(["game_id", "team_id", "Jersey"], nulls_last=True)
+
+
+def write_maxpreps_files(
+    maxpreps_df: pl.DataFrame,
+    output_dir: str
+) -> list:
+    """
+    Writes one MaxPreps file for each team in each game in `maxpreps_df`
+    (see `get_maxpreps_df()`), named `{game_id}_{team_id}_maxpreps.txt`.
+
+    Returns
+    ----------
+    A list of every file that was written.
+    """
+    makedirs(output_dir, exist_ok=True)
+    files_arr = []
+
+    # Every line in every file is built in one pass,
+    # so each file only has to be written to disk.
+    # MaxPreps stat files are pipe delimited.
+    header = "|".join(MAXPREPS_COLUMNS)
+    files_df = maxpreps_df.group_by(
+        ["game_id", "team_id"], maintain_order=True
+    ).agg(
+        pl.concat_str(
+            [
+                pl.col(x).cast(pl.String).fill_null("")
+                for x in MAXPREPS_COLUMNS
+            ],
+            separator="|",
+        ).str.join("\n")
+    )
+
+    for game_id, team_id, lines_str in files_df.iter_rows():
+        file_path = join(output_dir, f"{game_id}_{team_id}_maxpreps.txt")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(f"{header}\n{lines_str}\n")
+        files_arr.append(file_path)
+
+    return files_arr
+
+
+def export_as_maxpreps(
+    con: sqlite3.Connection,
+    output_dir: str,
+    game_id: int = None,
+    league_id: str = None,
+    season: int = None
+) -> list:
+    """
+    Exports the stats of every player in one game,
+    or in every game in a league/season,
+    as MaxPreps files (one file per team per game).
+
+    Parameters
+    ----------
+    `con` (sqlite3.Connection, mandatory):
+        A connection to the database for this application.
+
+    `output_dir` (str, mandatory):
+        The folder these files are written to.
+        This folder is created if it doesn't exist.
+
+    `game_id`, `league_id`, `season` (optional):
+        The game (or list of games), or league/season, to export.
+        If none are set, every game is exported.
+
+    Returns
+    ----------
+    A list of every file that was written.
+    """
+    maxpreps_df = get_maxpreps_df(
+        load_maxpreps_stats(con, game_id, league_id, season),
+        load_maxpreps_plays(con, game_id, league_id, season),
+    )
+    return write_maxpreps_files(maxpreps_df, output_dir)
+
+
+def build_synthetic_maxpreps_data(
+    game_count: int = 5000,
+    simulated_games: int = 100,
+    seed: int = 0
+) -> tuple:
+    """
+    Builds `game_count` games in the formats `load_maxpreps_stats()`
+    and `load_maxpreps_plays()` return, by copying `simulated_games`
+    games charted with `simulate_game()`, with a random player
+    from a 40 man roster in every role.
+    Only used to create test data.
+    """
+    # Imported here, since exporting a game doesn't need either module.
+    from core.database.rebuild_db_elements import simulate_game
+    from core.database.stats_db_elements import get_game_stat_rows
+    from core.pbp_engine.box_score import BoxScore
+
+    rng = random.Random(seed)
+    stat_rows_arr = []
+    play_rows_arr = []
+
+    for game_num in range(simulated_games):
+        plays_arr = simulate_game(rng)
+        for play_dict in plays_arr:
+            team_num = 1000 if play_dict.get("pos_team") == "HOM" else 2000
+            for role in ("passer", "receiver", "rusher", "kicker", "punter"):
+                player_num = rng.randrange(40)
+                play_dict[role] = {
+                    "player_id": team_num + player_num,
+                    "player_num": player_num,
+                }
+                play_rows_arr.append(
+                    [
+                        game_num, team_num + player_num, player_num, role,
+                        play_dict["play_type"],
+                        int(play_dict.get("is_no_play") is True),
+                        int(play_dict.get("is_completed_pass") is True),
+                        int(play_dict.get("is_sack_play") is True),
+                        int(play_dict.get("is_touchback") is True),
+                        int(play_dict.get("is_fg_made") is True),
+                        play_dict.get("fg_attempt_distance"),
+                        (play_dict.get("yardline_start") or 0) -
+                        max(play_dict.get("yardline_end") or 0, 0),
+                    ]
+                )
+
+        player_rows_dict, _ = get_game_stat_rows(
+            BoxScore.from_plays(plays_arr).get_stats()
+        )
+        for key, stat_value in player_rows_dict.items():
+            stat_rows_arr.append((game_num,) + key + (stat_value,))
+
+    stats_df = pl.DataFrame(
+        stat_rows_arr,
+        schema={
+            "game_id": pl.Int64,
+            "team_id": pl.String,
+            "player_id": pl.Int64,
+            "stat_category": pl.String,
+            "stat_name": pl.String,
+            "stat_value": pl.Float64,
+        },
+        orient="row",
+    )
+    plays_df = pl.DataFrame(
+        play_rows_arr,
+        schema={
+            "game_id": pl.Int64,
+            "player_id": pl.Int64,
+            "player_num": pl.Int64,
+            "player_role": pl.String,
+            "play_type": pl.String,
+            "is_no_play": pl.Int64,
+            "is_completed_pass": pl.Int64,
+            "is_sack_play": pl.Int64,
+            "is_touchback": pl.Int64,
+            "is_fg_made": pl.Int64,
+            "fg_attempt_distance": pl.Int64,
+            "gain": pl.Int64,
+        },
+        orient="row",
+    )
+
+    copies_df = pl.DataFrame(
+        {"copy_num": range(-(-game_count // simulated_games))}
+    )
+
+    def copy_games(df: pl.DataFrame) -> pl.DataFrame:
+        return df.join(copies_df, how="cross").with_columns(
+            (pl.col("copy_num") * simulated_games + pl.col("game_id"))
+            .alias("game_id")
+        ).filter(pl.col("game_id") < game_count).drop("copy_num")
+
+    return copy_games(stats_df), copy_games(plays_df)
+
+
+def benchmark_maxpreps_export(game_count: int = 5000) -> dict:
+    """
+    Times `get_maxpreps_df()` and `write_maxpreps_files()`
+    on `game_count` synthetic games
+    (about the number of games in a high school season,
+    in a state with 1,000 teams).
+    """
+    stats_df, plays_df = build_synthetic_maxpreps_data(game_count)
+
+    start_time = time.perf_counter()
+    maxpreps_df = get_maxpreps_df(stats_df, plays_df)
+    build_seconds = time.perf_counter() - start_time
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        start_time = time.perf_counter()
+        files_arr = write_maxpreps_files(maxpreps_df, output_dir)
+        write_seconds = time.perf_counter() - start_time
+
+    return {
+        "games": game_count,
+        "stats": stats_df.height,
+        "players": maxpreps_df.height,
+        "files": len(files_arr),
+        "build_seconds": round(build_seconds, 3),
+        "write_seconds": round(write_seconds, 3),
+    }
+
+
+if __name__ == "__main__":
+    print(benchmark_maxpreps_export())
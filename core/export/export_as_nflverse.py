@@ -1,17 +1,611 @@
 """
 - Creation Date: 01/29/2024 9:55 PM EDT
-- Last Updated: 04/15/2024 10:25 AM EDT
+- Last Updated: 10/19/2026 04:15 AM EDT
 - Authors: Joseph Armstrong (armstrongjoseph08@gmail.com)
 - file: `./core/export/export_as_nflverse.py`
-- Purpose: Tenative code for exporting a game in a format that works with
+- Purpose: Exports the play-by-play data, schedules, weekly rosters,
+    and depth charts of a league in a format that works with
     the nflverse project.
+
+Every dataset is exported one season at a time, so the memory used by
+an export depends on the size of a season, not the number of seasons.
+The four datasets of a season are built as `polars` LazyFrames,
+and are written to disk at the same time with `pl.collect_all()`.
 """
 ###############################################################################
+import sqlite3
+from os.path import join
+
+import polars as pl
+
+from core.database.load_db_elements import SqliteLoadData
+from core.database.query_db_elements import SqliteQueryData
+from core.pbp_engine.expected_points import get_ep_model
+
+# Every dataset `export_as_nflverse()` can export,
+# and the name nflverse uses for the files of that dataset.
+NFLVERSE_DATASETS = {
+    "pbp": "play_by_play",
+    "schedules": "games",
+    "rosters_weekly": "roster_weekly",
+    "depth_charts": "depth_charts",
+}
+
+# Maps the play types in this application to nflverse play types.
+NFLVERSE_PLAY_TYPES = {
+    "rush": "run",
+    "xp": "extra_point",
+    "safety_kickoff": "kickoff",
+}
+
+# Player roles in `fb_pbp_play_players`,
+# and the nflverse columns they're exported as.
+NFLVERSE_PLAYER_ROLES = {
+    "passer": "passer",
+    "receiver": "receiver",
+    "rusher": "rusher",
+    "kicker": "kicker",
+    "punter": "punter",
+    "blocker": "blocked",
+}
+
+# The columns exported from `fb_weekly_rosters` and `fb_depth_charts`,
+# and their names in nflverse.
+NFLVERSE_ROSTER_COLUMNS = {
+    "season": "season",
+    "team_abv": "team",
+    "position": "position",
+    "depth_chart_position": "depth_chart_position",
+    "jersey_number": "jersey_number",
+    "status": "status",
+    "player_full_name": "full_name",
+    "player_first_name": "first_name",
+    "player_last_name": "last_name",
+    "player_bday": "birth_date",
+    "height": "height",
+    "weight": "weight",
+    "college": "college",
+    "gsis_id": "gsis_id",
+    "espn_id": "espn_id",
+    "sportradar_id": "sportradar_id",
+    "yahoo_id": "yahoo_id",
+    "rotowire_id": "rotowire_id",
+    "pff_id": "pff_id",
+    "pfr_id": "pfr_id",
+    "fantasy_data_id": "fantasy_data_id",
+    "sleeper_id": "sleeper_id",
+    "years_exp": "years_exp",
+    "headshot_url": "headshot_url",
+    "ngs_position": "ngs_position",
+    "week": "week",
+    "game_type": "game_type",
+    "status_description_abbr": "status_description_abbr",
+    "player_football_name": "football_name",
+    "esb_id": "esb_id",
+    "smart_id": "smart_id",
+    "entry_year": "entry_year",
+    "rookie_year": "rookie_year",
+}
+NFLVERSE_DEPTH_CHART_COLUMNS = {
+    "season": "season",
+    "team_abv": "club_code",
+    "week": "week",
+    "game_type": "game_type",
+    "depth_team": "depth_team",
+    "player_last_name": "last_name",
+    "player_first_name": "first_name",
+    "player_football_name": "football_name",
+    "formation": "formation",
+    "gsis_id": "gsis_id",
+    "player_jersey_number": "jersey_number",
+    "player_position": "position",
+    "esb_id": "elias_id",
+    "player_depth_position": "depth_position",
+    "player_full_name": "full_name",
+}
+
+# nflverse columns that are whole numbers.
+NFLVERSE_INT_COLUMNS = (
+    "season",
+    "week",
+    "depth_team",
+    "height",
+    "weight",
+    "espn_id",
+    "yahoo_id",
+    "rotowire_id",
+    "pff_id",
+    "fantasy_data_id",
+    "sleeper_id",
+    "years_exp",
+    "entry_year",
+    "rookie_year",
+)
+
+
+def get_season_type() -> pl.Expr:
+    """
+    Returns the nflverse `season_type` of a game (`"PRE"`, `"REG"`,
+    or `"POST"`) from its `game_type`.
+    """
+    return pl.when(pl.col("game_type").is_in(["PRE", "REG"])).then(
+        pl.col("game_type")
+    ).otherwise(pl.lit("POST"))
+
+
+def load_nflverse_games(
+    con: sqlite3.Connection,
+    league_id: str,
+    season: int
+) -> pl.DataFrame:
+    """
+    Loads every game in a league/season from `fb_schedule`,
+    with nflverse column names.
+    The `game_id` of each game is kept in `fb_game_id`,
+    since nflverse uses `nflverse_game_id` as the `game_id` of a game.
+    """
+    return pl.read_database(
+        query=(
+            "SELECT fb_schedule.game_id AS fb_game_id, " +
+            "nflverse_game_id AS game_id, season, game_type, week, " +
+            "game_day AS gameday, game_day_of_week AS weekday, " +
+            "game_time AS gametime, " +
+            "away_team_abv AS away_team, away_team_score AS away_score, " +
+            "home_team_abv AS home_team, home_team_score AS home_score, " +
+            "game_is_finished, is_neutral_site_game, " +
+            "is_overtime_game AS overtime, " +
+            "nflverse_old_game_id AS old_game_id, gsis_id AS gsis, " +
+            "pfr_game_id AS pfr, pff_game_id AS pff, " +
+            "espn_game_id AS espn, ftn_game_id AS ftn, " +
+            "away_days_rest AS away_rest, home_days_rest AS home_rest, " +
+            "is_divisional_game AS div_game, game_roof AS roof, surface, " +
+            "temp_f AS temp, wind, fb_schedule.stadium_id, " +
+            "stadium_name AS stadium " +
+            "FROM fb_schedule " +
+            "LEFT JOIN fb_stadiums USING (stadium_id) " +
+            "WHERE league_id = ? AND season = ? " +
+            "ORDER BY nflverse_game_id"
+        ),
+        connection=con.cursor(),
+        execute_options={"parameters": [league_id, season]},
+        schema_overrides={
+            "fb_game_id": pl.UInt64,
+            "game_id": pl.String,
+            "season": pl.Int32,
+            "game_type": pl.String,
+            "week": pl.Int32,
+            "gameday": pl.String,
+            "weekday": pl.String,
+            "gametime": pl.String,
+            "away_team": pl.String,
+            "away_score": pl.Int32,
+            "home_team": pl.String,
+            "home_score": pl.Int32,
+            "game_is_finished": pl.Boolean,
+            "is_neutral_site_game": pl.Boolean,
+            "overtime": pl.Int32,
+            "old_game_id": pl.String,
+            "gsis": pl.Int64,
+            "pfr": pl.String,
+            "pff": pl.String,
+            "espn": pl.Int64,
+            "ftn": pl.Int64,
+            "away_rest": pl.Int32,
+            "home_rest": pl.Int32,
+            "div_game": pl.Int32,
+            "roof": pl.String,
+            "surface": pl.String,
+            "temp": pl.Float64,
+            "wind": pl.Int32,
+            "stadium_id": pl.Int64,
+            "stadium": pl.String,
+        },
+    )
+
+
+def get_nflverse_schedules(games_df: pl.DataFrame) -> pl.LazyFrame:
+    """
+    Returns the nflverse `schedules` dataset of a season,
+    from the output of `load_nflverse_games()`.
+    """
+    # Scores aren't final until a game is finished.
+    finished = pl.col("game_is_finished")
+    away_score = pl.when(finished).then(pl.col("away_score"))
+    home_score = pl.when(finished).then(pl.col("home_score"))
+
+    return games_df.lazy().with_columns(
+        away_score.alias("away_score"),
+        home_score.alias("home_score"),
+        pl.when(pl.col("is_neutral_site_game")).then(pl.lit("Neutral"))
+        .otherwise(pl.lit("Home")).alias("location"),
+        (home_score - away_score).alias("result"),
+        (home_score + away_score).alias("total"),
+        pl.col("gametime").str.slice(0, 5),
+    ).select(
+        "game_id", "season", "game_type", "week", "gameday", "weekday",
+        "gametime", "away_team", "away_score", "home_team", "home_score",
+        "location", "result", "total", "overtime", "old_game_id", "gsis",
+        "pfr", "pff", "espn", "ftn", "away_rest", "home_rest", "div_game",
+        "roof", "surface", "temp", "wind", "stadium_id", "stadium",
+    )
 
 
-def export_as_nflverse():
+def get_nflverse_pbp(
+    con: sqlite3.Connection,
+    games_df: pl.DataFrame,
+    league_id: str,
+    season: int
+) -> pl.LazyFrame:
     """
+    Returns the nflverse `pbp` dataset of a league/season,
+    with one row per play.
+
+    Parameters
+    ----------
+    `con` (sqlite3.Connection, mandatory):
+        A connection to the database for this application.
+
+    `games_df` (pl.DataFrame, mandatory):
+        Every game in this season (see `load_nflverse_games()`).
+
+    `league_id`, `season` (mandatory):
+        The league/season to export.
     """
-    raise NotImplementedError(
-        "This function has yet to be implemented in this version"
+    cur = con.cursor()
+    plays_lf = SqliteLoadData.load_fb_pbp_plays(
+        con, cur, league_id=league_id, season=season
+    ).lazy()
+    players_lf = SqliteLoadData.load_fb_pbp_play_players(
+        con, cur, league_id=league_id, season=season
+    ).lazy().filter(
+        pl.col("player_role") != "participating_players"
+    ).select(
+        "game_id", "play_num", "player_role", "player_id",
+        pl.coalesce("player_football_name", "player_full_name")
+        .alias("player_name"),
+    )
+
+    # EP and WP use the rules of this league.
+    plays_lf = get_ep_model(
+        SqliteQueryData.query_league_settings(cur, league_id)
+    ).add_ep_wp(plays_lf)
+
+    plays_lf = plays_lf.join(
+        games_df.lazy().select(
+            pl.col("fb_game_id").alias("game_id"),
+            pl.col("game_id").alias("nflverse_game_id"),
+            "old_game_id", "home_team", "away_team", "game_type",
+            "gameday",
+        ),
+        on="game_id",
+        how="left",
+    )
+
+    # Plays can be charted with `"home"` and `"away"`
+    # instead of team abbreviations.
+    def get_team(column: str) -> pl.Expr:
+        return pl.when(pl.col(column) == "home").then(pl.col("home_team")) \
+            .when(pl.col(column) == "away").then(pl.col("away_team")) \
+            .otherwise(pl.col(column))
+
+    is_no_play = pl.col("is_no_play").fill_null(False)
+    play_type = pl.col("play_type")
+    gain = pl.col("yardline_start") - pl.max_horizontal(
+        pl.col("yardline_end"), pl.lit(0)
+    )
+
+    pbp_lf = plays_lf.with_columns(
+        get_team("pos_team").alias("posteam"),
+        get_team("def_team").alias("defteam"),
+    ).select(
+        pl.col("play_num").cast(pl.Int32).alias("play_id"),
+        pl.col("nflverse_game_id").alias("game_id"),
+        "old_game_id",
+        "home_team",
+        "away_team",
+        get_season_type().alias("season_type"),
+        pl.col("week").cast(pl.Int32),
+        "posteam",
+        pl.when(pl.col("posteam") == pl.col("home_team"))
+        .then(pl.lit("home"))
+        .when(pl.col("posteam") == pl.col("away_team"))
+        .then(pl.lit("away")).alias("posteam_type"),
+        "defteam",
+        pl.col("yardline_start").cast(pl.Int32).alias("yardline_100"),
+        pl.col("gameday").alias("game_date"),
+        pl.col("quarter_time_left").cast(pl.Int32)
+        .alias("quarter_seconds_remaining"),
+        pl.col("half_time_left").cast(pl.Int32)
+        .alias("half_seconds_remaining"),
+        pl.col("game_time_left").cast(pl.Int32)
+        .alias("game_seconds_remaining"),
+        pl.when(pl.col("half_num") == 1).then(pl.lit("Half1"))
+        .when(pl.col("half_num") == 2).then(pl.lit("Half2"))
+        .when(pl.col("half_num") > 2).then(pl.lit("Overtime"))
+        .alias("game_half"),
+        pl.col("drive_num").cast(pl.Int32).alias("drive"),
+        pl.col("quarter_num").cast(pl.Int32).alias("qtr"),
+        pl.col("down").cast(pl.Int32),
+        pl.col("is_goal_to_go").cast(pl.Int32).alias("goal_to_go"),
+        pl.col("quarter_time_left_str").alias("time"),
+        pl.col("distance").cast(pl.Int32).alias("ydstogo"),
+        pl.when(is_no_play).then(pl.lit(0))
+        .otherwise(gain).cast(pl.Int32).alias("yards_gained"),
+        pl.col("play_desc").alias("desc"),
+        pl.when(is_no_play).then(pl.lit("no_play")).otherwise(
+            play_type.replace(NFLVERSE_PLAY_TYPES)
+        ).alias("play_type"),
+        pl.col("home_score_post").cast(pl.Int32).alias("total_home_score"),
+        pl.col("away_score_post").cast(pl.Int32).alias("total_away_score"),
+        pl.col("posteam_score").cast(pl.Int32),
+        pl.col("defteam_score").cast(pl.Int32),
+        (pl.col("posteam_score") - pl.col("defteam_score")).cast(pl.Int32)
+        .alias("score_differential"),
+        pl.col("posteam_post").cast(pl.Int32).alias("posteam_score_post"),
+        pl.col("defteam_post").cast(pl.Int32).alias("defteam_score_post"),
+        (pl.col("posteam_post") - pl.col("defteam_post")).cast(pl.Int32)
+        .alias("score_differential_post"),
+        "ep",
+        "epa",
+        "wp",
+        "wpa",
+        pl.when(play_type.is_in(["field_goal", "fair_catch_kick"]))
+        .then(
+            pl.when(pl.col("is_fg_made")).then(pl.lit("made"))
+            .otherwise(pl.lit("missed"))
+        ).alias("field_goal_result"),
+        pl.when(play_type == "xp").then(
+            pl.when(pl.col("is_fg_made")).then(pl.lit("good"))
+            .otherwise(pl.lit("failed"))
+        ).alias("extra_point_result"),
+        pl.col("fg_attempt_distance").cast(pl.Int32).alias("kick_distance"),
+        (play_type == "conversion_attempt").cast(pl.Int32)
+        .alias("two_point_attempt"),
+        pl.col("is_first_down").cast(pl.Int32).alias("first_down"),
+        pl.col("is_completed_pass").cast(pl.Int32).alias("complete_pass"),
+        pl.col("is_intercepted").cast(pl.Int32).alias("interception"),
+        pl.col("is_sack_play").cast(pl.Int32).alias("sack"),
+        pl.col("is_fumble").cast(pl.Int32).alias("fumble"),
+        pl.col("is_touchback").cast(pl.Int32).alias("touchback"),
+        pl.col("is_touchdown").cast(pl.Int32).alias("touchdown"),
+        pl.col("is_safety").cast(pl.Int32).alias("safety"),
+        pl.col("season").cast(pl.Int32),
+        # Kept until returners are added, then dropped.
+        pl.col("game_id").alias("fb_game_id"),
+        pl.col("play_num").alias("fb_play_num"),
+        play_type.alias("fb_play_type"),
+    )
+
+    keys = [pl.col("fb_game_id"), pl.col("fb_play_num")]
+
+    for role, prefix in NFLVERSE_PLAYER_ROLES.items():
+        pbp_lf = pbp_lf.join(
+            players_lf.filter(pl.col("player_role") == role).select(
+                "game_id",
+                "play_num",
+                pl.col("player_id").cast(pl.String)
+                .alias(f"{prefix}_player_id"),
+                pl.col("player_name").alias(f"{prefix}_player_name"),
+            ),
+            left_on=keys,
+            right_on=["game_id", "play_num"],
+            how="left",
+        )
+
+    # nflverse keeps punt and kickoff returners in different columns.
+    returners_lf = players_lf.filter(pl.col("player_role") == "returner")
+    pbp_lf = pbp_lf.join(
+        returners_lf.select(
+            "game_id",
+            "play_num",
+            pl.col("player_id").cast(pl.String).alias("returner_id"),
+            pl.col("player_name").alias("returner_name"),
+        ),
+        left_on=keys,
+        right_on=["game_id", "play_num"],
+        how="left",
+    )
+    is_kickoff = pl.col("fb_play_type").is_in(["kickoff", "safety_kickoff"])
+    is_punt = pl.col("fb_play_type") == "punt"
+
+    return pbp_lf.with_columns(
+        pl.when(is_punt).then(pl.col("returner_id"))
+        .alias("punt_returner_player_id"),
+        pl.when(is_punt).then(pl.col("returner_name"))
+        .alias("punt_returner_player_name"),
+        pl.when(is_kickoff).then(pl.col("returner_id"))
+        .alias("kickoff_returner_player_id"),
+        pl.when(is_kickoff).then(pl.col("returner_name"))
+        .alias("kickoff_returner_player_name"),
+    ).sort(keys).drop(
+        "returner_id", "returner_name",
+        "fb_game_id", "fb_play_num", "fb_play_type",
     )
+
+
+def load_nflverse_table(
+    con: sqlite3.Connection,
+    table_name: str,
+    columns_dict: dict,
+    league_id: str,
+    season: int
+) -> pl.LazyFrame:
+    """
+    Loads the rows of a league/season from `fb_weekly_rosters`
+    or `fb_depth_charts`, with the columns in `columns_dict`
+    renamed to their nflverse names.
+    Every other column is loaded as text, as nflverse stores it.
+    """
+    columns_str = ", ".join(
+        [f"\"{k}\" AS \"{v}\"" for k, v in columns_dict.items()]
+    )
+    schema_overrides = {
+        x: pl.String for x in columns_dict.values()
+        if x not in NFLVERSE_INT_COLUMNS
+    }
+    schema_overrides.update(
+        {
+            x: pl.Int32 for x in columns_dict.values()
+            if x in NFLVERSE_INT_COLUMNS
+        }
+    )
+    return pl.read_database(
+        query=(
+            f"SELECT {columns_str} FROM {table_name} " +
+            "WHERE league_id = ? AND season = ?"
+        ),
+        connection=con.cursor(),
+        execute_options={"parameters": [league_id, season]},
+        schema_overrides=schema_overrides,
+    ).lazy()
+
+
+def get_nflverse_rosters_weekly(
+    con: sqlite3.Connection,
+    league_id: str,
+    season: int
+) -> pl.LazyFrame:
+    """
+    Returns the nflverse `rosters_weekly` dataset of a league/season.
+    """
+    return load_nflverse_table(
+        con,
+        "fb_weekly_rosters",
+        NFLVERSE_ROSTER_COLUMNS,
+        league_id,
+        season
+    ).sort(["week", "team", "jersey_number"])
+
+
+def get_nflverse_depth_charts(
+    con: sqlite3.Connection,
+    league_id: str,
+    season: int
+) -> pl.LazyFrame:
+    """
+    Returns the nflverse `depth_charts` dataset of a league/season.
+    """
+    return load_nflverse_table(
+        con,
+        "fb_depth_charts",
+        NFLVERSE_DEPTH_CHART_COLUMNS,
+        league_id,
+        season
+    ).sort(["week", "club_code", "formation", "depth_team"])
+
+
+def get_nflverse_file_path(
+    output_dir: str,
+    league_id: str,
+    dataset: str,
+    season: int,
+    file_format: str = "parquet"
+) -> str:
+    """
+    Returns the path a dataset of a league/season is exported to
+    (for example, `{output_dir}/NFL/pbp/play_by_play_2024.parquet`).
+    Every league has its own folder, so leagues with the same seasons
+    can be exported to the same `output_dir`.
+    """
+    return join(
+        output_dir,
+        league_id,
+        dataset,
+        f"{NFLVERSE_DATASETS[dataset]}_{season}.{file_format}"
+    )
+
+
+def export_as_nflverse(
+    con: sqlite3.Connection,
+    output_dir: str,
+    league_id: str,
+    seasons: list = None,
+    datasets: list = None,
+    file_format: str = "parquet"
+) -> list:
+    """
+    Exports the play-by-play data, schedules, weekly rosters,
+    and depth charts of a league as nflverse datasets,
+    with one file per dataset per season, in a folder for this league
+    (for example, `{output_dir}/NFL/pbp/play_by_play_2024.parquet`,
+    see `get_nflverse_file_path()`).
+
+    Parameters
+    ----------
+    `con` (sqlite3.Connection, mandatory):
+        A connection to the database for this application.
+
+    `output_dir` (str, mandatory):
+        The folder these files are written to.
+        This folder is created if it doesn't exist.
+
+    `league_id` (str, mandatory):
+        The league to export.
+
+    `seasons` (list, optional):
+        The seasons to export. Defaults to every season in this league.
+
+    `datasets` (list, optional):
+        The datasets to export (see `NFLVERSE_DATASETS`).
+        Defaults to every dataset.
+
+    `file_format` (str, optional):
+        Can be `"parquet"` or `"csv"`.
+
+    Returns
+    ----------
+    A list of every file that was written.
+    """
+    if seasons is None:
+        seasons = SqliteQueryData.query_seasons(con.cursor(), league_id)
+
+    if datasets is None:
+        datasets = list(NFLVERSE_DATASETS)
+
+    for dataset in datasets:
+        if dataset not in NFLVERSE_DATASETS:
+            raise ValueError(f"Unhandled nflverse dataset: `{dataset}`")
+
+    if file_format not in ("parquet", "csv"):
+        raise ValueError(f"Unhandled file format: `{file_format}`")
+
+    files_arr = []
+
+    for season in seasons:
+        games_df = load_nflverse_games(con, league_id, season)
+        sinks_arr = []
+
+        for dataset in datasets:
+            match dataset:
+                case "pbp":
+                    dataset_lf = get_nflverse_pbp(
+                        con, games_df, league_id, season
+                    )
+                case "schedules":
+                    dataset_lf = get_nflverse_schedules(games_df)
+                case "rosters_weekly":
+                    dataset_lf = get_nflverse_rosters_weekly(
+                        con, league_id, season
+                    )
+                case "depth_charts":
+                    dataset_lf = get_nflverse_depth_charts(
+                        con, league_id, season
+                    )
+
+            file_path = get_nflverse_file_path(
+                output_dir, league_id, dataset, season, file_format
+            )
+            if file_format == "parquet":
+                sinks_arr.append(
+                    dataset_lf.sink_parquet(file_path, mkdir=True, lazy=True)
+                )
+            else:
+                sinks_arr.append(
+                    dataset_lf.sink_csv(file_path, mkdir=True, lazy=True)
+                )
+            files_arr.append(file_path)
+
+        # Every dataset in this season is written at the same time.
+        pl.collect_all(sinks_arr)
+
+    return files_arr
@@ -0,0 +1,249 @@
+"""
+- Creation Date: 10/18/2026 09:50 PM EDT
+- Last Updated: 10/19/2026 04:25 AM EDT
+- Authors: Joseph Armstrong (armstrongjoseph08@gmail.com)
+- file: `./core/export/export_games.py`
+- Purpose: Exports many games at once (as MaxPreps files,
+    nflverse datasets, or `sdv_football_pbp` game files),
+    by splitting the games into tasks,
+    and running those tasks in a pool of worker processes.
+
+Every worker opens its own read-only connection to the database
+(see `core.database.sqlite3_connectors.open_read_only_connection()`),
+since SQLite3 connections can't be shared between processes.
+Files are always returned in the same order,
+no matter which worker finishes first.
+"""
+###############################################################################
+import multiprocessing
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from core.database.query_db_elements import build_where_clause
+from core.database.sqlite3_connectors import (
+    get_sqlite3_db_path,
+    open_read_only_connection,
+)
+
+# Every format `export_games()` can export.
+EXPORT_FORMATS = ("maxpreps", "nflverse", "json")
+
+# The read-only connection used by this worker process.
+_worker_con = None
+
+
+def get_export_tasks(
+    con: sqlite3.Connection,
+    export_format: str,
+    game_ids: list = None,
+    league_id: str = None,
+    season: int = None,
+    games_per_task: int = 25
+) -> list:
+    """
+    Splits the games selected by `game_ids`, or by `league_id`/`season`,
+    into tasks for `run_export_task()`.
+
+    MaxPreps and `json` exports are split into tasks of up to
+    `games_per_task` games. nflverse datasets are exported
+    one league/season at a time, so every league/season with
+    at least one selected game is its own task.
+
+    Raises a `ValueError` if two nflverse tasks would write
+    the same files (see
+    `core.export.export_as_nflverse.get_nflverse_file_path()`).
+
+    Returns
+    ----------
+    A list of `(league_id, season, game_ids)` tuples, sorted by
+    league, season, and game. `game_ids` is `None`
+    for nflverse tasks.
+    """
+    where_clause, params = build_where_clause(
+        {"game_id": game_ids, "league_id": league_id, "season": season}
+    )
+    games_arr = con.execute(
+        "SELECT league_id, season, game_id FROM fb_schedule " +
+        f"{where_clause} ORDER BY league_id, season, game_id",
+        params
+    ).fetchall()
+
+    tasks_arr = []
+    # `{(league folder, season): league_id}` of every nflverse task.
+    # Folder names are compared without case, since two leagues
+    # that only differ by case share a folder on Windows and macOS.
+    task_paths_dict = {}
+    for game_league_id, game_season, game_id in games_arr:
+        if export_format == "nflverse":
+            task = (game_league_id, game_season, None)
+            if len(tasks_arr) > 0 and tasks_arr[-1] == task:
+                continue
+
+            path_key = (str(game_league_id).casefold(), game_season)
+            if path_key in task_paths_dict:
+                raise ValueError(
+                    f"`{task_paths_dict[path_key]}` and " +
+                    f"`{game_league_id}` would both be exported to " +
+                    f"the same files for the {game_season} season."
+                )
+            task_paths_dict[path_key] = game_league_id
+            tasks_arr.append(task)
+        elif len(tasks_arr) == 0 or \
+                tasks_arr[-1][:2] != (game_league_id, game_season) or \
+                len(tasks_arr[-1][2]) >= games_per_task:
+            tasks_arr.append((game_league_id, game_season, [game_id]))
+        else:
+            tasks_arr[-1][2].append(game_id)
+
+    return tasks_arr
+
+
+def init_export_worker(db_path: str, polars_threads: int) -> None:
+    """
+    Sets up a worker process for `export_games()`.
+    """
+    global _worker_con
+
+    # Every worker has its own `polars` thread pool,
+    # so the workers shouldn't use every core each.
+    # This has to be set before `polars` is imported.
+    os.environ["POLARS_MAX_THREADS"] = str(polars_threads)
+    _worker_con = open_read_only_connection(db_path)
+
+
+def run_export_task(
+    export_format: str,
+    output_dir: str,
+    task: tuple,
+    con: sqlite3.Connection = None
+) -> list:
+    """
+    Runs one task from `get_export_tasks()`.
+
+    Returns
+    ----------
+    A list of every file that was written.
+    """
+    if con is None:
+        con = _worker_con
+
+    task_league_id, task_season, task_game_ids = task
+
+    match export_format:
+        case "maxpreps":
+            from core.export.export_as_maxpreps import export_as_maxpreps
+
+            return export_as_maxpreps(con, output_dir, game_id=task_game_ids)
+        case "nflverse":
+            from core.export.export_as_nflverse import export_as_nflverse
+
+            return export_as_nflverse(
+                con, output_dir, task_league_id, seasons=[task_season]
+            )
+        case "json":
+            from core.export.export_as_json import export_as_json
+
+            return export_as_json(con, output_dir, game_id=task_game_ids)
+
+
+def export_games(
+    output_dir: str,
+    export_format: str,
+    game_ids: list = None,
+    league_id: str = None,
+    season: int = None,
+    max_workers: int = None,
+    games_per_task: int = 25,
+    progress_callback=None,
+    custom_dir: str = None
+) -> list:
+    """
+    Exports a list of games, or every game in a league/season,
+    with a pool of worker processes.
+
+    Parameters
+    ----------
+    `output_dir` (str, mandatory):
+        The folder these files are written to.
+
+    `export_format` (str, mandatory):
+        Can be `"maxpreps"`, `"nflverse"`, or `"json"`.
+        nflverse datasets are always exported for a whole season,
+        so every season with at least one selected game is exported,
+        into a folder for each league.
+
+    `game_ids`, `league_id`, `season` (optional):
+        The games to export. If none are set, every game is exported.
+
+    `max_workers` (int, optional):
+        The number of worker processes.
+        Defaults to the number of CPU cores.
+        If set to `1`, every task is run in this process.
+        Workers are started with `spawn`, so a script that calls this
+        needs an `if __name__ == "__main__":` guard.
+
+    `games_per_task` (int, optional):
+        The number of games each MaxPreps or `json` task exports.
+
+    `progress_callback` (callable, optional):
+        Called in this process with `(tasks_done, tasks_total)`
+        every time a task finishes.
+
+    `custom_dir` (str, optional):
+        The folder the database for this application is in.
+
+    Returns
+    ----------
+    A list of every file that was written, in the order of
+    `get_export_tasks()`, no matter which task finished first.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unhandled export format: `{export_format}`")
+
+    db_path = get_sqlite3_db_path(custom_dir)
+    con = open_read_only_connection(db_path)
+    try:
+        tasks_arr = get_export_tasks(
+            con, export_format, game_ids, league_id, season, games_per_task
+        )
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = max(min(max_workers, len(tasks_arr)), 1)
+
+        if max_workers == 1:
+            files_arr = []
+            for i, task in enumerate(tasks_arr, start=1):
+                files_arr += run_export_task(
+                    export_format, output_dir, task, con
+                )
+                if progress_callback is not None:
+                    progress_callback(i, len(tasks_arr))
+            return files_arr
+    finally:
+        con.close()
+
+    results_arr = [None] * len(tasks_arr)
+    tasks_done = 0
+
+    # `fork` isn't safe once `polars` has started its thread pool.
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_export_worker,
+        initargs=(db_path, max((os.cpu_count() or 1) // max_workers, 1)),
+    ) as executor:
+        futures_dict = {
+            executor.submit(
+                run_export_task, export_format, output_dir, task
+            ): i
+            for i, task in enumerate(tasks_arr)
+        }
+        for future in as_completed(futures_dict):
+            results_arr[futures_dict[future]] = future.result()
+            tasks_done += 1
+            if progress_callback is not None:
+                progress_callback(tasks_done, len(tasks_arr))
+
+    return [x for files_arr in results_arr for x in files_arr]
@@ -0,0 +1,158 @@
+"""
+- Creation Date: 10/19/2026 12:45 AM EDT
+- Last Updated: 10/19/2026 12:45 AM EDT
+- Authors: Joseph Armstrong (armstrongjoseph08@gmail.com)
+- file: `./core/other/event_dispatcher.py`
+- Purpose: Reads and routes the events of a window,
+    without waking up when nothing has happened.
+
+`EventDispatcher().read()` blocks until the user does something,
+or until a background request sends back its result
+(see `core.database.worker_db_elements.DataService()`).
+A timeout is only used while a background request is pending.
+
+Run `python main.py --debug-events`
+(or set the `SDV_PBP_DEBUG_EVENTS` environment variable)
+to log every event, and the values of the window when it happened.
+"""
+###############################################################################
+import logging
+
+import FreeSimpleGUI as sg
+
+# How often (in milliseconds) a window checks for events
+# while a background request is pending.
+# Results are sent back as events, so this is only a fallback.
+PENDING_TIMEOUT_MS = 250
+
+# Every event is logged here, if `enable_event_debug()` has been called.
+event_logger = logging.getLogger("sdv_pbp.events")
+
+_debug_enabled = False
+
+
+def enable_event_debug() -> None:
+    """
+    Logs every event read by an `EventDispatcher()`.
+    """
+    global _debug_enabled
+    _debug_enabled = True
+
+    event_logger.setLevel(logging.DEBUG)
+    if len(event_logger.handlers) == 0:
+        event_logger.addHandler(logging.StreamHandler())
+
+
+def is_event_debug_enabled() -> bool:
+    """
+    Returns `True` if `enable_event_debug()` has been called.
+    """
+    return _debug_enabled
+
+
+def get_event_key(event) -> object:
+    """
+    Returns the key of the element that sent `event`.
+    Some events (like clicking on a table) are tuples,
+    where the first item is the key of that element.
+    """
+    if isinstance(event, tuple) and len(event) > 0:
+        return event[0]
+    return event
+
+
+class EventDispatcher:
+    """
+    Reads the events of a window, and routes each one to its handler.
+
+    A handler is called as `handler(event, values)`,
+    and is registered with one or more event keys
+    (see `add_handler()`).
+    """
+
+    def __init__(
+        self,
+        window: sg.Window,
+        data_service=None,
+        handlers_dict: dict = None
+    ) -> None:
+        """
+        Parameters
+        ----------
+        `window` (sg.Window, mandatory):
+            The window to read events from.
+
+        `data_service` (DataService, optional):
+            The `DataService()` of this window, if it has one.
+            While a request to it is pending,
+            this window wakes up every `PENDING_TIMEOUT_MS` milliseconds.
+
+        `handlers_dict` (dict, optional):
+            `{event_key: handler}` of the handlers for this window.
+        """
+        self.window = window
+        self.data_service = data_service
+        self.handlers_dict = {}
+
+        if handlers_dict is not None:
+            self.add_handlers(handlers_dict)
+
+    def add_handler(self, keys, handler) -> None:
+        """
+        Registers `handler` for an event key,
+        or a list (or tuple) of event keys.
+        """
+        if isinstance(keys, (list, tuple, set, frozenset)):
+            for key in keys:
+                self.handlers_dict[key] = handler
+        else:
+            self.handlers_dict[keys] = handler
+
+    def add_handlers(self, handlers_dict: dict) -> None:
+        """
+        Registers every handler in `{event_key: handler}`.
+        """
+        for key, handler in handlers_dict.items():
+            self.add_handler(key, handler)
+
+    def get_timeout(self) -> int | None:
+        """
+        Returns the timeout used by `read()`,
+        or `None` if `read()` should wait for the next event.
+        """
+        if self.data_service is not None and \
+                self.data_service.is_pending() is True:
+            return PENDING_TIMEOUT_MS
+        return None
+
+    def read(self) -> tuple:
+        """
+        Waits for the next event in this window.
+
+        Returns
+        ----------
+        A tuple of `(event, values)`, like `sg.Window.read()`.
+        """
+        event, values = self.window.read(timeout=self.get_timeout())
+
+        if _debug_enabled is True and event != sg.TIMEOUT_EVENT:
+            event_logger.debug(
+                f"[{self.window.Title}] event: `{event}`, " +
+                f"values: {values}"
+            )
+        return event, values
+
+    def dispatch(self, event, values: dict) -> bool:
+        """
+        Calls the handler registered for `event`, if there is one.
+
+        Returns
+        ----------
+        `True` if `event` had a handler, and `False` otherwise.
+        """
+        handler = self.handlers_dict.get(get_event_key(event))
+        if handler is None:
+            return False
+
+        handler(event, values)
+        return True
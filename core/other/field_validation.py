@@ -0,0 +1,303 @@
+"""
+- Creation Date: 10/19/2026 01:20 AM EDT
+- Last Updated: 10/19/2026 04:05 AM EDT
+- Authors: Joseph Armstrong (armstrongjoseph08@gmail.com)
+- file: `./core/other/field_validation.py`
+- Purpose: Declarative rules for the values a field can hold,
+    checked as the user types, and when data is imported.
+
+Every field has a `FieldRule()`, which sets the characters allowed
+in that field, its max length, and (optionally) a regex it must match,
+and the range its value must be within.
+
+A window registers its fields with a `FieldValidator()` once,
+and passes every event to `FieldValidator().handle_event()`.
+The same rules can be checked without a window
+(for example, when importing a roster) with `validate_fields()`.
+"""
+###############################################################################
+import re
+from dataclasses import dataclass
+
+from core.other.embedded import LettersAndNumbers
+
+LETTERS_ALL = frozenset(LettersAndNumbers.letters_all(include_space=True))
+NUMBERS_ALL = frozenset(LettersAndNumbers.numbers_all())
+NUMBERS_WITH_DASHES = frozenset(
+    LettersAndNumbers.numbers_all(include_dash_and_underscore=True)
+)
+LETTERS_AND_NUMBERS = frozenset(
+    LettersAndNumbers.letters_and_numbers(
+        include_space=True,
+        include_dash_and_underscore=True
+    )
+)
+
+
+@dataclass(frozen=True, slots=True)
+class FieldRule:
+    """
+    The values a field can hold.
+    Any check set to `None` is skipped.
+    """
+    # Every character that can be typed into this field.
+    allowed_chars: frozenset = None
+    max_length: int = None
+    # A regex the whole value must match.
+    # Not checked while the user is typing,
+    # since a partial value rarely matches.
+    pattern: str = None
+    # The range a number must be within.
+    # Only `max_value` is checked while the user is typing.
+    min_value: int = None
+    max_value: int = None
+
+    def get_keystroke_error(self, value: str) -> str | None:
+        """
+        Returns why `value` can't be typed into this field,
+        or `None` if it can.
+        """
+        if self.max_length is not None and len(value) > self.max_length:
+            return f"must be at most {self.max_length} characters long"
+
+        if self.allowed_chars is not None:
+            for char in value:
+                if char not in self.allowed_chars:
+                    return f"can't contain `{char}`"
+
+        if self.max_value is not None and value != "":
+            try:
+                if float(value) > self.max_value:
+                    return f"must be at most {self.max_value}"
+            except ValueError:
+                return "must be a number"
+        return None
+
+    def get_error(self, value) -> str | None:
+        """
+        Returns why `value` isn't a valid value for this field,
+        or `None` if it is. Empty values (`None` or `""`) are valid.
+        """
+        if value is None or value == "":
+            return None
+        value = str(value)
+
+        error = self.get_keystroke_error(value)
+        if error is not None:
+            return error
+
+        if self.pattern is not None and \
+                re.fullmatch(self.pattern, value) is None:
+            return f"must match `{self.pattern}`"
+
+        if self.min_value is not None:
+            try:
+                if float(value) < self.min_value:
+                    return f"must be at least {self.min_value}"
+            except ValueError:
+                return "must be a number"
+        return None
+
+
+# The rules for every column in `fb_rosters` that a user can type into.
+ROSTER_FIELD_RULES = {
+    "weight": FieldRule(NUMBERS_ALL, max_length=3),
+    "years_exp": FieldRule(NUMBERS_ALL, max_length=2),
+    "gsis_id": FieldRule(
+        NUMBERS_WITH_DASHES, max_length=10, pattern=r"\d{2}-\d{7}"
+    ),
+    "sportradar_id": FieldRule(
+        LETTERS_AND_NUMBERS,
+        max_length=36,
+        pattern=r"[0-9a-fA-F]{8}(-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}"
+    ),
+    "sr_player_id": FieldRule(LETTERS_AND_NUMBERS, max_length=8),
+    "footballdb_player_id": FieldRule(LETTERS_AND_NUMBERS),
+    "stats_crew_player_id": FieldRule(LETTERS_AND_NUMBERS, max_length=13),
+    "arenafan_player_id": FieldRule(LETTERS_AND_NUMBERS),
+    "pfr_id": FieldRule(LETTERS_AND_NUMBERS, max_length=8),
+    "espn_id": FieldRule(NUMBERS_ALL, max_length=7),
+    "ncaa_player_id": FieldRule(NUMBERS_ALL, max_length=7),
+    "yahoo_id": FieldRule(NUMBERS_ALL, max_length=5),
+    "rotowire_id": FieldRule(NUMBERS_ALL, max_length=5),
+    "pff_id": FieldRule(NUMBERS_ALL, max_length=6),
+    "sleeper_id": FieldRule(NUMBERS_ALL, max_length=6),
+}
+
+
+def validate_fields(rules_dict: dict, values_dict: dict) -> dict:
+    """
+    Checks every value in `values_dict` that has a rule in `rules_dict`.
+
+    Parameters
+    ----------
+    `rules_dict` (dict, mandatory):
+        `{field: FieldRule()}` (for example, `ROSTER_FIELD_RULES`).
+
+    `values_dict` (dict, mandatory):
+        `{field: value}` (for example, a row being imported).
+
+    Returns
+    ----------
+    `{field: error}` of every value that isn't valid.
+    If every value is valid, this is an empty dict.
+    """
+    errors_dict = {}
+    for field, value in values_dict.items():
+        rule = rules_dict.get(field)
+        if rule is None:
+            continue
+
+        error = rule.get_error(value)
+        if error is not None:
+            errors_dict[field] = error
+    return errors_dict
+
+
+class FieldValidator:
+    """
+    Checks what the user types into the fields of a window.
+
+    If a keystroke would make a field invalid, that keystroke is undone.
+    When a new character is typed at the end of a field,
+    only that character is checked.
+    """
+
+    def __init__(self, target: object = None) -> None:
+        """
+        Parameters
+        ----------
+        `target` (object, optional):
+            If set, every valid value is also set as an attribute of
+            `target` (see `add_field()`).
+            Usually, this is the view that owns the window.
+        """
+        self.target = target
+        # `{key: (FieldRule(), attr_name)}`
+        self.fields_dict = {}
+        # `{key: value}` of the last valid value in each field.
+        self.last_values_dict = {}
+
+    def add_field(
+        self,
+        key: str,
+        rule: FieldRule,
+        attr_name: str = None
+    ) -> None:
+        """
+        Registers a field.
+
+        Parameters
+        ----------
+        `key` (str, mandatory):
+            The key of the `sg.Input()` for this field.
+            It must have `enable_events=True`.
+
+        `rule` (FieldRule, mandatory):
+            The values this field can hold.
+
+        `attr_name` (str, optional):
+            If set, every valid value in this field
+            is set as `target.attr_name`.
+        """
+        self.fields_dict[key] = (rule, attr_name)
+
+    def add_fields(self, rules_dict: dict, keys_dict: dict) -> None:
+        """
+        Registers a field for every `{key: field}` in `keys_dict`,
+        with the rule for that field in `rules_dict`.
+        The value of each field is set as `target.field`.
+        """
+        for key, field in keys_dict.items():
+            self.add_field(key, rules_dict[field], field)
+
+    def set_value(self, key: str, value) -> None:
+        """
+        Records the value of a field that was filled in without an event
+        (for example, with `window[key].update()`),
+        so the next keystroke in that field is checked against it.
+        """
+        if value is None:
+            value = ""
+        self.last_values_dict[key] = str(value)
+
+    def reset(self) -> None:
+        """
+        Forgets the last value of every field.
+        If this validator has a `target`, the last value of each field
+        is taken from that field's attribute on `target` instead.
+        Call this after filling in the fields of a window
+        without events (for example, when a different player is selected).
+        """
+        self.last_values_dict = {}
+        if self.target is None:
+            return
+
+        for key, (_, attr_name) in self.fields_dict.items():
+            if attr_name is not None:
+                self.set_value(key, getattr(self.target, attr_name, None))
+
+    def get_keys(self) -> list:
+        """
+        Returns the key of every registered field.
+        """
+        return list(self.fields_dict)
+
+    def clean_value(self, key: str, value: str) -> str:
+        """
+        Returns `value` if it's a valid value for this field,
+        and otherwise, what this field should be changed to.
+        """
+        rule = self.fields_dict[key][0]
+        last_value = self.last_values_dict.get(key, "")
+
+        # Typing one more character at the end is the common case,
+        # so only that character (and the length) needs to be checked.
+        if len(value) == len(last_value) + 1 and \
+                value.startswith(last_value) and rule.max_value is None:
+            if rule.max_length is not None and len(value) > rule.max_length:
+                return last_value
+            if rule.allowed_chars is not None and \
+                    value[-1] not in rule.allowed_chars:
+                return last_value
+            return value
+
+        if rule.get_keystroke_error(value) is None:
+            return value
+
+        # Keeps the longest part of `value` that is valid,
+        # rather than going back to `last_value`,
+        # which is stale if the field was filled in without an event.
+        for end in range(len(value) - 1, 0, -1):
+            if rule.get_keystroke_error(value[:end]) is None:
+                return value[:end]
+        return ""
+
+    def handle_event(self, window, event, values: dict) -> bool:
+        """
+        Checks the value of a field, if `event` is for that field,
+        and undoes the last keystroke if it made that field invalid.
+
+        Returns
+        ----------
+        `True` if `event` was for a registered field,
+        and `False` otherwise.
+        """
+        if event not in self.fields_dict:
+            return False
+
+        value = values[event]
+        if value is None:
+            value = ""
+        value = str(value)
+
+        clean_value = self.clean_value(event, value)
+        if clean_value != value:
+            window[event].update(clean_value)
+            values[event] = clean_value
+        self.last_values_dict[event] = clean_value
+
+        attr_name = self.fields_dict[event][1]
+        if self.target is not None and attr_name is not None:
+            setattr(self.target, attr_name, clean_value)
+        return True
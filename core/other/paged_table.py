@@ -0,0 +1,451 @@
+"""
+- Creation Date: 10/19/2026 12:10 AM EDT
+- Last Updated: 10/19/2026 12:10 AM EDT
+- Authors: Joseph Armstrong (armstrongjoseph08@gmail.com)
+- file: `./core/other/paged_table.py`
+- Purpose: Shows large tables one page at a time,
+    so a `sg.Table()` never has to render every row at once.
+
+A `PagedTable()` only converts (and renders) the rows on the current page.
+The rows themselves come from a source, which stays the source of truth:
+
+- `RowsSource()`: a list of rows (tuples or lists).
+- `DataFrameSource()`: a `polars` DataFrame.
+- `SqlSource()`: a table in the database. Sorting, searching,
+    and paging are done by SQLite3, so only one page of rows
+    is ever read from the database.
+"""
+###############################################################################
+import sqlite3
+
+import FreeSimpleGUI as sg
+
+from core.database.query_db_elements import build_where_clause
+
+# The number of rows on each page, unless a table sets its own.
+DEFAULT_PAGE_SIZE = 100
+
+
+class RowsSource:
+    """
+    A source for `PagedTable()` that holds a list of rows.
+    """
+
+    def __init__(self, rows_arr: list) -> None:
+        self.rows_arr = rows_arr
+        # The rows that match the current search, in the current order.
+        self.shown_rows_arr = rows_arr
+
+    def query(
+        self,
+        sort_col: int = None,
+        descending: bool = False,
+        search_text: str = None
+    ) -> None:
+        """
+        Sorts and searches the rows in this source.
+        Only called when the sort order or search changes,
+        not every time the page changes.
+        """
+        rows_arr = self.rows_arr
+        if search_text:
+            search_text = search_text.lower()
+            rows_arr = [
+                row for row in rows_arr
+                if any(
+                    search_text in str(x).lower()
+                    for x in row if x is not None
+                )
+            ]
+
+        if sort_col is not None:
+            # Empty values are always shown last.
+            null_rows_arr = [x for x in rows_arr if x[sort_col] is None]
+            rows_arr = [x for x in rows_arr if x[sort_col] is not None]
+            try:
+                rows_arr.sort(key=lambda x: x[sort_col], reverse=descending)
+            except TypeError:
+                # This column has more than one type of value.
+                rows_arr.sort(
+                    key=lambda x: str(x[sort_col]), reverse=descending
+                )
+            rows_arr += null_rows_arr
+
+        self.shown_rows_arr = rows_arr
+
+    def count(self) -> int:
+        """
+        Returns the number of rows that match the current search.
+        """
+        return len(self.shown_rows_arr)
+
+    def get_rows(self, offset: int, limit: int) -> list:
+        """
+        Returns up to `limit` rows, starting at row `offset`.
+        """
+        return self.shown_rows_arr[offset:offset + limit]
+
+
+class DataFrameSource:
+    """
+    A source for `PagedTable()` that holds a `polars` DataFrame.
+    Only the rows on the current page are converted into Python objects.
+    """
+
+    def __init__(self, df) -> None:
+        self.df = df
+        self.shown_df = df
+
+    def query(
+        self,
+        sort_col: int = None,
+        descending: bool = False,
+        search_text: str = None
+    ) -> None:
+        """
+        Sorts and searches the rows in this source.
+        """
+        # Imported here, so the main window doesn't require `polars`.
+        import polars as pl
+
+        df = self.df
+        if search_text and len(df.columns) > 0:
+            df = df.filter(
+                pl.any_horizontal(
+                    pl.col(x).cast(pl.String).str.to_lowercase()
+                    .str.contains(search_text.lower(), literal=True)
+                    for x in df.columns
+                )
+            )
+
+        if sort_col is not None:
+            df = df.sort(
+                df.columns[sort_col],
+                descending=descending,
+                nulls_last=True
+            )
+
+        self.shown_df = df
+
+    def count(self) -> int:
+        """
+        Returns the number of rows that match the current search.
+        """
+        return self.shown_df.height
+
+    def get_rows(self, offset: int, limit: int) -> list:
+        """
+        Returns up to `limit` rows, starting at row `offset`.
+        """
+        return self.shown_df.slice(offset, limit).rows()
+
+
+class SqlSource:
+    """
+    A source for `PagedTable()` that reads from a table in the database.
+    Every page is its own `SELECT ... LIMIT ? OFFSET ?`.
+    """
+
+    def __init__(
+        self,
+        con: sqlite3.Connection,
+        table_name: str,
+        columns: list,
+        filters: dict = None,
+        order_by: list = None
+    ) -> None:
+        """
+        Parameters
+        ----------
+        `con` (sqlite3.Connection, mandatory):
+            A connection to the database for this application.
+
+        `table_name` (str, mandatory):
+            The table (or view) to read from.
+
+        `columns` (list, mandatory):
+            The columns shown in the table, in order.
+
+        `filters` (dict, optional):
+            Filters applied to every query
+            (see `core.database.query_db_elements.build_where_clause()`).
+
+        `order_by` (list, optional):
+            The columns rows are sorted by,
+            when the user hasn't sorted by a column.
+        """
+        self.con = con
+        self.table_name = table_name
+        self.columns = columns
+        self.order_by = order_by or []
+
+        if filters is None:
+            filters = {}
+        self.filters = filters
+
+        self.where_clause, self.params = build_where_clause(filters)
+        self.order_clause = self.get_order_clause(None, False)
+        self.row_count = None
+
+    def get_order_clause(self, sort_col: int, descending: bool) -> str:
+        """
+        Returns the `ORDER BY` clause for a sort order.
+        """
+        order_arr = [f"\"{x}\"" for x in self.order_by]
+        if sort_col is not None:
+            direction = "DESC" if descending is True else "ASC"
+            order_arr.insert(
+                0,
+                f"\"{self.columns[sort_col]}\" IS NULL, " +
+                f"\"{self.columns[sort_col]}\" {direction}"
+            )
+
+        if len(order_arr) == 0:
+            return ""
+        return "ORDER BY " + ", ".join(order_arr)
+
+    def query(
+        self,
+        sort_col: int = None,
+        descending: bool = False,
+        search_text: str = None
+    ) -> None:
+        """
+        Sets the sort order and search used by every page.
+        """
+        self.where_clause, self.params = build_where_clause(self.filters)
+
+        if search_text:
+            search_sql = "(" + " OR ".join(
+                f"CAST(\"{x}\" AS TEXT) LIKE ? ESCAPE '\\'"
+                for x in self.columns
+            ) + ")"
+            search_text = search_text.replace("\\", "\\\\") \
+                .replace("%", "\\%").replace("_", "\\_")
+
+            if self.where_clause == "":
+                self.where_clause = f"WHERE {search_sql}"
+            else:
+                self.where_clause += f" AND {search_sql}"
+            self.params = self.params + (
+                [f"%{search_text}%"] * len(self.columns)
+            )
+
+        self.order_clause = self.get_order_clause(sort_col, descending)
+        self.row_count = None
+
+    def count(self) -> int:
+        """
+        Returns the number of rows that match the current search.
+        """
+        if self.row_count is None:
+            self.row_count = self.con.execute(
+                f"SELECT COUNT(*) FROM \"{self.table_name}\" " +
+                self.where_clause,
+                self.params
+            ).fetchone()[0]
+        return self.row_count
+
+    def get_rows(self, offset: int, limit: int) -> list:
+        """
+        Returns up to `limit` rows, starting at row `offset`.
+        """
+        columns_str = ",".join(f"\"{x}\"" for x in self.columns)
+        return self.con.execute(
+            f"SELECT {columns_str} " +
+            f"FROM \"{self.table_name}\" {self.where_clause} " +
+            f"{self.order_clause} LIMIT ? OFFSET ?",
+            self.params + [limit, offset]
+        ).fetchall()
+
+
+class PagedTable:
+    """
+    Shows the rows of a source one page at a time in a `sg.Table()`,
+    with buttons to change pages, a search box,
+    and sorting by clicking on a column heading.
+
+    Every element of this table has a key that starts with `key`:
+    - `key`: The `sg.Table()` itself.
+    - `f"{key}PREV-"` and `f"{key}NEXT-"`: The buttons that change pages.
+    - `f"{key}PAGE-"`: The text that shows the current page.
+    - `f"{key}SEARCH-"`, `f"{key}SEARCH_BUTTON-"`,
+        and `f"{key}CLEAR_BUTTON-"`: The search box, and its buttons.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        source=None,
+        page_size: int = DEFAULT_PAGE_SIZE
+    ) -> None:
+        self.key = key
+        self.page_size = page_size
+        self.page_num = 0
+        self.sort_col = None
+        self.descending = False
+        self.search_text = None
+
+        # The rows on the current page.
+        self.page_rows_arr = []
+        self.source = None
+        self.set_source(RowsSource([]) if source is None else source)
+
+    def get_layout(
+        self,
+        headings: list,
+        search: bool = True,
+        **table_kwargs
+    ) -> list:
+        """
+        Returns the layout of this table, as a list of rows.
+
+        Parameters
+        ----------
+        `headings` (list, mandatory):
+            The heading of each column.
+
+        `search` (bool, optional):
+            If set to `True`, a search box is shown above this table.
+
+        `**table_kwargs`:
+            Passed into `sg.Table()`.
+        """
+        layout = []
+        if search is True:
+            layout.append([
+                sg.Input(key=f"{self.key}SEARCH-", size=(30, 1)),
+                sg.Button("Search", key=f"{self.key}SEARCH_BUTTON-"),
+                sg.Button("Clear", key=f"{self.key}CLEAR_BUTTON-"),
+                sg.Push(),
+            ])
+
+        layout.append([
+            sg.Table(
+                values=self.page_rows_arr,
+                headings=headings,
+                key=self.key,
+                enable_click_events=True,
+                num_rows=min(self.page_size, 25),
+                **table_kwargs
+            )
+        ])
+        layout.append([
+            sg.Push(),
+            sg.Button("< Prev", key=f"{self.key}PREV-"),
+            sg.Text(
+                self.get_page_text(), key=f"{self.key}PAGE-", size=(30, 1),
+                justification="center"
+            ),
+            sg.Button("Next >", key=f"{self.key}NEXT-"),
+            sg.Push(),
+        ])
+        return layout
+
+    def set_source(self, source) -> None:
+        """
+        Replaces the rows in this table,
+        keeping the current sort order and search.
+        """
+        self.source = source
+        self.source.query(self.sort_col, self.descending, self.search_text)
+        self.load_page(self.page_num)
+
+    def get_page_count(self) -> int:
+        """
+        Returns the number of pages in this table (at least 1).
+        """
+        return max((self.source.count() - 1) // self.page_size + 1, 1)
+
+    def get_page_text(self) -> str:
+        """
+        Returns the text shown between the page buttons.
+        """
+        return (
+            f"Page {self.page_num + 1} of {self.get_page_count()} " +
+            f"({self.source.count()} rows)"
+        )
+
+    def load_page(self, page_num: int) -> None:
+        """
+        Converts the rows on a page, and makes that the current page.
+        """
+        self.page_num = min(max(page_num, 0), self.get_page_count() - 1)
+        self.page_rows_arr = [
+            list(x) for x in self.source.get_rows(
+                self.page_num * self.page_size, self.page_size
+            )
+        ]
+
+    def get_row(self, table_idx: int) -> list:
+        """
+        Returns a row on the current page, where `table_idx`
+        is the index of that row in the `sg.Table()`
+        (for example, from `values[key]`).
+        """
+        return self.page_rows_arr[table_idx]
+
+    def sort_by(self, sort_col: int) -> None:
+        """
+        Sorts this table by a column.
+        Sorting by the same column twice reverses the order.
+        """
+        if self.sort_col == sort_col:
+            self.descending = not self.descending
+        else:
+            self.sort_col = sort_col
+            self.descending = False
+
+        self.source.query(self.sort_col, self.descending, self.search_text)
+        self.load_page(0)
+
+    def search(self, search_text: str) -> None:
+        """
+        Only shows rows that contain `search_text` in any column.
+        An empty `search_text` shows every row.
+        """
+        self.search_text = search_text or None
+        self.source.query(self.sort_col, self.descending, self.search_text)
+        self.load_page(0)
+
+    def update(self, window: sg.Window) -> None:
+        """
+        Shows the current page in `window`.
+        """
+        window[self.key].update(values=self.page_rows_arr)
+        window[f"{self.key}PAGE-"].update(self.get_page_text())
+        window[f"{self.key}PREV-"].update(disabled=self.page_num == 0)
+        window[f"{self.key}NEXT-"].update(
+            disabled=self.page_num >= self.get_page_count() - 1
+        )
+
+    def handle_event(self, window: sg.Window, event, values: dict) -> bool:
+        """
+        Handles the events of this table
+        (changing pages, searching, and sorting).
+
+        Returns
+        ----------
+        `True` if `event` was an event of this table,
+        and `False` otherwise.
+        """
+        # Clicking on a heading sends `(key, "+CLICKED+", (-1, column))`.
+        if isinstance(event, tuple) and event[0] == self.key:
+            row, col = event[2]
+            if row != -1 or col is None or col < 0:
+                return True
+            self.sort_by(col)
+        elif event == f"{self.key}PREV-":
+            self.load_page(self.page_num - 1)
+        elif event == f"{self.key}NEXT-":
+            self.load_page(self.page_num + 1)
+        elif event == f"{self.key}SEARCH_BUTTON-":
+            self.search(values[f"{self.key}SEARCH-"])
+        elif event == f"{self.key}CLEAR_BUTTON-":
+            window[f"{self.key}SEARCH-"].update("")
+            self.search(None)
+        else:
+            return False
+
+        self.update(window)
+        return True
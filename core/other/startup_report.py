@@ -0,0 +1,165 @@
+"""
+- Creation Date: 10/18/2026 12:10 PM EDT
+- Last Updated: 10/18/2026 12:10 PM EDT
+- Authors: Joseph Armstrong (armstrongjoseph08@gmail.com)
+- file: `./core/other/startup_report.py`
+- Purpose: Measures how long this application takes to start up,
+    in a similar fashion to `python -X importtime`.
+"""
+###############################################################################
+import builtins
+import sys
+from time import perf_counter
+
+
+class StartupReport:
+    """
+    Records how long each module takes to import,
+    and how long each step of starting up the app takes.
+
+    Nothing is recorded until `StartupReport().enable()` is called,
+    so this costs nothing when the report isn't wanted.
+    """
+
+    def __init__(self) -> None:
+        self.is_enabled = False
+        self.start_time = perf_counter()
+        # Each import is stored as
+        # `[module_name, depth, self_microseconds, cumulative_microseconds]`.
+        self.imports_arr = []
+        # Each milestone is stored as `[milestone_name, seconds_since_start]`.
+        self.milestones_arr = []
+        self.import_stack = []
+        self.original_import = None
+
+    def enable(self, start_time: float = None) -> None:
+        """
+        Starts recording imports and milestones.
+
+        Parameters
+        ----------
+        `start_time` (float, optional):
+            A `time.perf_counter()` value for when the app started.
+            If not set, the time this function was called is used.
+        """
+        if self.is_enabled is True:
+            return
+
+        self.is_enabled = True
+        if start_time is not None:
+            self.start_time = start_time
+        else:
+            self.start_time = perf_counter()
+
+        self.original_import = builtins.__import__
+        builtins.__import__ = self.timed_import
+
+    def disable(self) -> None:
+        """
+        Stops recording imports.
+        """
+        if self.is_enabled is False:
+            return
+
+        self.is_enabled = False
+        builtins.__import__ = self.original_import
+
+    def timed_import(
+        self,
+        name: str,
+        globals: dict = None,
+        locals: dict = None,
+        fromlist: tuple = (),
+        level: int = 0
+    ):
+        """
+        Drop-in replacement for `builtins.__import__()`
+        that records how long new (not yet imported) modules take to import.
+        """
+        if level == 0 and name in sys.modules:
+            return self.original_import(name, globals, locals, fromlist, level)
+
+        modules_before = len(sys.modules)
+        # `[self_microseconds, children_microseconds]`
+        timer = [0, 0]
+        self.import_stack.append(timer)
+        start = perf_counter()
+
+        try:
+            return self.original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = int((perf_counter() - start) * 1_000_000)
+            self.import_stack.pop()
+
+            if len(self.import_stack) > 0:
+                self.import_stack[-1][1] += elapsed
+
+            # Only record imports that actually loaded something.
+            if len(sys.modules) > modules_before:
+                if level > 0 and globals is not None:
+                    name = f"{globals.get('__package__', '')}.{name}"
+                self.imports_arr.append(
+                    [
+                        name,
+                        len(self.import_stack),
+                        elapsed - timer[1],
+                        elapsed
+                    ]
+                )
+
+    def mark(self, milestone_name: str) -> None:
+        """
+        Records how long it took for the app to reach a given milestone.
+        """
+        if self.is_enabled is False:
+            return
+
+        self.milestones_arr.append(
+            [milestone_name, perf_counter() - self.start_time]
+        )
+
+    def get_report(self, min_cumulative_us: int = 1000) -> str:
+        """
+        Returns this startup report as a string.
+
+        Parameters
+        ----------
+        `min_cumulative_us` (int, optional):
+            Imports that took less than this many microseconds
+            (including the modules they imported)
+            are left out of the report.
+        """
+        report = "Startup report\n"
+        report += "=" * 79 + "\n"
+        report += "import time: self [us] | cumulative | imported package\n"
+
+        # `self.imports_arr` is in the order imports finished,
+        # which (like `-X importtime`) lists children before their parent.
+        for name, depth, self_us, cumulative_us in self.imports_arr:
+            if cumulative_us < min_cumulative_us:
+                continue
+            report += (
+                f"import time: {self_us:>9} | {cumulative_us:>10} | " +
+                f"{'  ' * depth}{name}\n"
+            )
+
+        report += "-" * 79 + "\n"
+        for milestone_name, seconds in self.milestones_arr:
+            report += f"{seconds:>8.3f}s | {milestone_name}\n"
+
+        return report
+
+    def print_report(self, min_cumulative_us: int = 1000) -> None:
+        """
+        Prints this startup report to `sys.stderr`,
+        and stops recording imports.
+        """
+        if self.is_enabled is False:
+            return
+
+        self.disable()
+        print(self.get_report(min_cumulative_us), file=sys.stderr)
+
+
+# Shared by every part of the app that wants to mark a startup milestone.
+startup_report = StartupReport()
@@ -0,0 +1,483 @@
+"""
+- Creation Date: 10/18/2026 07:30 PM EDT
+- Last Updated: 10/18/2026 07:30 PM EDT
+- Authors: Joseph Armstrong (armstrongjoseph08@gmail.com)
+- file: `./core/pbp_engine/box_score.py`
+- Purpose: Keeps the `"stats"` section of a game file
+    (see `core.pbp_engine.game.get_initial_game_file()`) up to date,
+    one play at a time.
+
+Every play is turned into a set of stat changes (see `get_play_stats()`).
+Adding, replacing, or removing a play only adds or subtracts
+that play's changes, so the box score never has to be rebuilt
+from the start of the game.
+Because of this, every stat is a count or a total
+(no "longest play" stats, which can't be subtracted).
+
+Yardlines follow the same convention as
+`core.pbp_engine.game_state`, and the `"return_start_yardline"`
+and `"return_end_yardline"` of a returner are from the point of view
+of the returning team.
+###############################################################################
+"""
+from core.pbp_engine.game import get_initial_game_file
+
+# The stats kept in each section of `"stats"`.
+STAT_FIELDS = {
+    "passing": (
+        "completions",
+        "attempts",
+        "yards",
+        "touchdowns",
+        "interceptions",
+        "sacks",
+        "sack_yards",
+        "first_downs",
+    ),
+    "rushing": (
+        "carries",
+        "yards",
+        "touchdowns",
+        "first_downs",
+    ),
+    "receiving": (
+        "targets",
+        "receptions",
+        "yards",
+        "touchdowns",
+        "first_downs",
+    ),
+    "fumbles": (
+        "fumbles",
+        "fumbles_lost",
+        "forced_fumbles",
+        "fumble_recoveries",
+        "fumble_return_yards",
+        "fumble_return_touchdowns",
+    ),
+    "defense": (
+        "solo_tackles",
+        "assisted_tackles",
+        "tackles_for_loss",
+        # A sack shared by two players is half a sack for each player.
+        "sacks",
+        "sack_fumbles",
+    ),
+    # Interceptions are only kept for each team,
+    # since a pass play doesn't record who caught the interception.
+    "interceptions": (
+        "interceptions",
+        "touchdowns",
+    ),
+    "blocks": (
+        "blocked_punts",
+        "blocked_field_goals",
+        "blocked_extra_points",
+    ),
+    "field_goals": (
+        "fg_made",
+        "fg_attempts",
+        "fg_blocked",
+        # The total distance of every made field goal.
+        "fg_made_distance",
+        "xp_made",
+        "xp_attempts",
+    ),
+    "punting": (
+        "punts",
+        # From the line of scrimmage to where the ball ended up,
+        # after any return.
+        "net_yards",
+        "touchbacks",
+        "inside_20",
+        "blocked",
+    ),
+    # Returns of a missed field goal.
+    "missed_fg": (
+        "returns",
+        "yards",
+        "touchdowns",
+    ),
+    "kick_return": (
+        "returns",
+        "yards",
+        "touchdowns",
+    ),
+    "punt_return": (
+        "returns",
+        "yards",
+        "touchdowns",
+    ),
+}
+
+# The fields that identify a player in a stat line.
+PLAYER_FIELDS = (
+    "player_id",
+    "team_id",
+    "player_num",
+    "player_full_name",
+    "player_football_name",
+)
+
+# Play types where the kicking team is `"pos_team"`,
+# and the tacklers are on the kicking team.
+KICKING_PLAY_TYPES = ("punt", "field_goal", "fair_catch_kick", "xp")
+
+
+def get_stat_line(category: str, team: str, player_dict: dict) -> dict:
+    """
+    Returns an empty stat line for a player,
+    or for a team if `player_dict` is `None`.
+    """
+    line_dict = {"team": team, "is_team_total": player_dict is None}
+    for key in PLAYER_FIELDS:
+        line_dict[key] = None
+        if player_dict is not None:
+            line_dict[key] = player_dict.get(key)
+
+    for key in STAT_FIELDS[category]:
+        line_dict[key] = 0
+    return line_dict
+
+
+def get_player(play_dict: dict, role: str) -> dict:
+    """
+    Returns the player in `role` (such as `"passer"`),
+    or `None` if no player has been entered for that role.
+    """
+    player_dict = play_dict.get(role)
+    if not player_dict:
+        return None
+    elif player_dict.get("player_id") is None and \
+            player_dict.get("player_num") is None and \
+            player_dict.get("player_full_name") is None:
+        return None
+    return player_dict
+
+
+def get_return_yards(returner_dict: dict) -> int:
+    """
+    Returns the yards gained by a returner.
+    """
+    start = returner_dict.get("return_start_yardline")
+    end = returner_dict.get("return_end_yardline")
+    if start is None or end is None:
+        return 0
+    return start - end
+
+
+def get_play_stats(play_dict: dict) -> list:
+    """
+    Returns the stats added to a game by a play.
+
+    Returns
+    ----------
+    A list of `(category, team, player_dict, stats_dict)` tuples,
+    where `player_dict` is `None` for stats that only count
+    towards a team's totals.
+    """
+    stats_arr = []
+    play_type = play_dict.get("play_type")
+    pos_team = play_dict.get("pos_team")
+    def_team = play_dict.get("def_team")
+
+    # Stats don't count on a play wiped out by a penalty,
+    # or on a try after a touchdown (other than the kick itself).
+    if play_dict.get("is_no_play") is True or \
+            play_type == "conversion_attempt":
+        return stats_arr
+
+    is_touchdown = play_dict.get("is_touchdown") is True
+    is_turnover = play_dict.get("is_turnover") is True
+    is_first_down = int(play_dict.get("is_first_down") is True)
+    offense_td = int(is_touchdown and not is_turnover)
+
+    yardline_start = play_dict.get("yardline_start")
+    yardline_end = play_dict.get("yardline_end")
+    gain = 0
+    if yardline_start is not None and yardline_end is not None:
+        gain = yardline_start - max(yardline_end, 0)
+
+    def add(category, team, player_dict, **stats):
+        stats_arr.append((category, team, player_dict, stats))
+
+    if play_type == "pass":
+        passer = get_player(play_dict, "passer")
+        receiver = get_player(play_dict, "receiver")
+
+        if play_dict.get("is_sack_play") is True:
+            add("passing", pos_team, passer, sacks=1, sack_yards=-gain)
+        elif play_dict.get("is_completed_pass") is True:
+            add(
+                "passing", pos_team, passer,
+                completions=1, attempts=1, yards=gain,
+                touchdowns=offense_td, first_downs=is_first_down
+            )
+            add(
+                "receiving", pos_team, receiver,
+                targets=1, receptions=1, yards=gain,
+                touchdowns=offense_td, first_downs=is_first_down
+            )
+        elif play_dict.get("is_intercepted") is True:
+            add("passing", pos_team, passer, attempts=1, interceptions=1)
+            add(
+                "interceptions", def_team, None,
+                interceptions=1, touchdowns=int(is_touchdown)
+            )
+        else:
+            add("passing", pos_team, passer, attempts=1)
+            if receiver is not None:
+                add("receiving", pos_team, receiver, targets=1)
+
+        lost = int(is_turnover and play_dict.get("is_intercepted") is not True)
+        if play_dict.get("is_qb_fumble") is True:
+            add("fumbles", pos_team, passer, fumbles=1, fumbles_lost=lost)
+        if play_dict.get("is_receiver_fumble") is True:
+            add("fumbles", pos_team, receiver, fumbles=1, fumbles_lost=lost)
+
+    elif play_type == "rush":
+        rusher = get_player(play_dict, "rusher")
+        add(
+            "rushing", pos_team, rusher,
+            carries=1, yards=gain,
+            touchdowns=offense_td, first_downs=is_first_down
+        )
+        if play_dict.get("is_fumble") is True:
+            add(
+                "fumbles", pos_team, rusher,
+                fumbles=1, fumbles_lost=int(is_turnover)
+            )
+
+    elif play_type in ("field_goal", "fair_catch_kick", "xp"):
+        kicker = get_player(play_dict, "kicker")
+        is_made = int(play_dict.get("is_fg_made") is True)
+        is_blocked = play_dict.get("is_blocked") is True
+
+        if play_type == "xp":
+            add(
+                "field_goals", pos_team, kicker,
+                xp_made=is_made, xp_attempts=1
+            )
+            block_stat = "blocked_extra_points"
+        else:
+            distance = play_dict.get("fg_attempt_distance") or 0
+            add(
+                "field_goals", pos_team, kicker,
+                fg_made=is_made, fg_attempts=1, fg_blocked=int(is_blocked),
+                fg_made_distance=distance * is_made
+            )
+            block_stat = "blocked_field_goals"
+
+        if is_blocked:
+            add(
+                "blocks", def_team, get_player(play_dict, "blocker"),
+                **{block_stat: 1}
+            )
+
+        returner = get_player(play_dict, "returner")
+        if play_type != "xp" and play_dict.get("is_returned") is True:
+            add(
+                "missed_fg", def_team, returner,
+                returns=1,
+                yards=get_return_yards(returner or {}),
+                touchdowns=int(is_touchdown and not is_turnover)
+            )
+
+    elif play_type == "punt":
+        punter = get_player(play_dict, "punter")
+        is_blocked = play_dict.get("is_blocked") is True
+        is_touchback = play_dict.get("is_touchback") is True
+        inside_20 = int(
+            not is_touchback and not is_blocked and
+            yardline_end is not None and 0 < yardline_end <= 20
+        )
+        add(
+            "punting", pos_team, punter,
+            punts=1, net_yards=gain, touchbacks=int(is_touchback),
+            inside_20=inside_20, blocked=int(is_blocked)
+        )
+        if is_blocked:
+            add(
+                "blocks", def_team, get_player(play_dict, "blocker"),
+                blocked_punts=1
+            )
+
+        returner = get_player(play_dict, "returner")
+        if play_dict.get("is_returned") is True:
+            add(
+                "punt_return", def_team, returner,
+                returns=1,
+                yards=get_return_yards(returner or {}),
+                touchdowns=int(is_touchdown and not is_turnover)
+            )
+
+    elif play_type in ("kickoff", "safety_kickoff"):
+        # On a kickoff, `"pos_team"` is the receiving team.
+        returner = get_player(play_dict, "returner")
+        if play_dict.get("is_returned") is True:
+            add(
+                "kick_return", pos_team, returner,
+                returns=1,
+                yards=get_return_yards(returner or {}),
+                touchdowns=int(
+                    is_touchdown and not is_turnover and
+                    play_dict.get("is_own_kickoff_recovery") is not True
+                )
+            )
+
+    # The team making the tackles is the defense,
+    # unless the play is a kick from scrimmage.
+    tackling_team = def_team
+    recovering_team = pos_team
+    if play_type in KICKING_PLAY_TYPES:
+        tackling_team = pos_team
+        recovering_team = def_team
+
+    tacklers_arr = play_dict.get("tacklers") or []
+    sackers = sum(1 for x in tacklers_arr if x.get("is_sack") is True)
+    is_solo = len(tacklers_arr) == 1 and \
+        play_dict.get("is_assisted_tackle") is not True
+    for tackler_dict in tacklers_arr:
+        is_sack = tackler_dict.get("is_sack") is True
+        add(
+            "defense", tackling_team, tackler_dict,
+            solo_tackles=int(is_solo),
+            assisted_tackles=int(not is_solo),
+            tackles_for_loss=int(tackler_dict.get("is_tfl") is True),
+            sacks=1 / sackers if is_sack else 0,
+            sack_fumbles=int(tackler_dict.get("is_sack_fumble") is True)
+        )
+
+    for fumble_dict in play_dict.get("forced_fumbles") or []:
+        add("fumbles", tackling_team, fumble_dict, forced_fumbles=1)
+
+    for recovery_dict in play_dict.get("fumble_recoveries") or []:
+        team = recovering_team
+        if recovery_dict.get("is_defensive_fumble_recovery") is True:
+            team = tackling_team
+        add(
+            "fumbles", team, recovery_dict,
+            fumble_recoveries=1,
+            fumble_return_yards=recovery_dict.get("return_yards") or 0,
+            fumble_return_touchdowns=int(
+                recovery_dict.get("scored_touchdown") is True
+            )
+        )
+
+    return stats_arr
+
+
+def get_line_key(category: str, team: str, player_dict: dict) -> tuple:
+    """
+    Returns the key of a stat line in `BoxScore.lines`.
+    Players without a `"player_id"` are told apart by their number and name.
+    """
+    if player_dict is None:
+        return (category, team, None)
+    elif player_dict.get("player_id") is not None:
+        return (category, team, player_dict["player_id"])
+    return (
+        category,
+        team,
+        (player_dict.get("player_num"), player_dict.get("player_full_name"))
+    )
+
+
+class BoxScore:
+    """
+    The stat lines for every player and team in a game,
+    kept up to date one play at a time.
+
+    The stats added by each play are kept, so a play can be replaced
+    or removed by subtracting what it added, instead of going back over
+    every other play in the game.
+    """
+
+    def __init__(self) -> None:
+        # Every stat line, keyed by `get_line_key()`.
+        self.lines = {}
+        # The number of plays that have added to each stat line.
+        # A line is removed once no play adds to it.
+        self.line_plays = {}
+        # The stats added by each play, in play order.
+        self.play_stats = []
+
+    @staticmethod
+    def from_plays(plays_arr: list) -> "BoxScore":
+        """
+        Creates a `BoxScore()` from every play in a game.
+        """
+        box_score = BoxScore()
+        for play_dict in plays_arr:
+            box_score.append_play(play_dict)
+        return box_score
+
+    def append_play(self, play_dict: dict) -> None:
+        """
+        Adds the next play in this game.
+        """
+        stats_arr = get_play_stats(play_dict)
+        self.add_stats(stats_arr, 1)
+        self.play_stats.append(stats_arr)
+
+    def replace_play(self, play_num: int, play_dict: dict) -> None:
+        """
+        Replaces play #`play_num` (starting at 1) in this game.
+        """
+        self.add_stats(self.play_stats[play_num - 1], -1)
+        stats_arr = get_play_stats(play_dict)
+        self.add_stats(stats_arr, 1)
+        self.play_stats[play_num - 1] = stats_arr
+
+    def delete_play(self, play_num: int) -> None:
+        """
+        Removes play #`play_num` (starting at 1) from this game.
+        Every play after it moves up by one.
+        """
+        self.add_stats(self.play_stats.pop(play_num - 1), -1)
+
+    def add_stats(self, stats_arr: list, sign: int) -> None:
+        """
+        Adds (or, if `sign` is `-1`, subtracts) the stats from a play
+        to each player's line, and to each team's totals.
+        """
+        lines = self.lines
+        line_plays = self.line_plays
+
+        for category, team, player_dict, stats_dict in stats_arr:
+            keys_arr = [get_line_key(category, team, None)]
+            if player_dict is not None:
+                keys_arr.append(get_line_key(category, team, player_dict))
+
+            for key in keys_arr:
+                line_dict = lines.get(key)
+                if line_dict is None:
+                    line_dict = get_stat_line(
+                        category,
+                        team,
+                        None if key[2] is None else player_dict
+                    )
+                    lines[key] = line_dict
+                    line_plays[key] = 0
+
+                for stat, value in stats_dict.items():
+                    line_dict[stat] += sign * value
+
+                line_plays[key] += sign
+                if line_plays[key] == 0:
+                    del lines[key]
+                    del line_plays[key]
+
+    def get_stats(self) -> dict:
+        """
+        Returns the `"stats"` section of a game file.
+        In each section, team totals come first,
+        followed by every player on that team.
+        """
+        stats_dict = get_initial_game_file()["stats"]
+        for key in sorted(
+            self.lines,
+            key=lambda x: (str(x[1]), x[2] is not None, str(x[2]))
+        ):
+            stats_dict[key[0]].append(dict(self.lines[key]))
+        return stats_dict
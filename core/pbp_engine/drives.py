@@ -0,0 +1,402 @@
+"""
+- Creation Date: 10/18/2026 06:55 PM EDT
+- Last Updated: 10/18/2026 06:55 PM EDT
+- Authors: Joseph Armstrong (armstrongjoseph08@gmail.com)
+- file: `./core/pbp_engine/drives.py`
+- Purpose: Groups the plays in a game into drives,
+    for the `"drives"` section of a game file.
+    Plays are grouped by `"drive_num"`
+    (see `core.pbp_engine.game_state.GameStateEngine()`),
+    and each play is only looked at once.
+###############################################################################
+"""
+from core.pbp_engine.game_state import (
+    CONVERSION_PLAY_TYPES,
+    KICKOFF_PLAY_TYPES,
+)
+
+# Every value `"drive_result"` can have.
+# An unfinished drive has a `"drive_result"` of `None`.
+DRIVE_RESULTS = (
+    "TOUCHDOWN",
+    "OPP_TOUCHDOWN",
+    "FIELD_GOAL",
+    "MISSED_FG",
+    "PUNT",
+    "INTERCEPTION",
+    "FUMBLE",
+    "DOWNS",
+    "SAFETY",
+    "END_OF_HALF",
+    "END_OF_GAME",
+    # Any other change of possession.
+    "TURNOVER",
+)
+
+# Drive results that give the ball to the other team,
+# and are used as the `"start_transition"` of the next drive.
+CHANGE_OF_POSSESSION_RESULTS = (
+    "PUNT",
+    "INTERCEPTION",
+    "FUMBLE",
+    "DOWNS",
+    "MISSED_FG",
+    "TURNOVER",
+)
+
+
+def get_drive_template() -> dict:
+    """
+    Returns an empty drive, for the `"drives"` section of a game file.
+    """
+    return {
+        "drive_num": 0,
+        "pos_team": None,
+        "def_team": None,
+        "first_play_num": None,
+        "last_play_num": None,
+        "start_quarter_num": None,
+        "end_quarter_num": None,
+        "start_half_num": None,
+        "start_quarter_time_left": None,
+        "end_quarter_time_left": None,
+        "start_game_time_left": None,
+        "end_game_time_left": None,
+        # In seconds. For an unfinished drive (or the last drive in a game),
+        # this is the time between the first and last snap of the drive.
+        "time_of_possession": 0,
+        # Uses the same convention as `"yardline_start"` in a play.
+        # Kickoffs are not included, so a drive starts
+        # where the offense first snapped the ball.
+        # A drive that ends in a kick or turnover ends
+        # where the offense last snapped the ball.
+        "start_yardline": None,
+        "end_yardline": None,
+        "yards": 0,
+        # The number of plays in this drive,
+        # not counting kickoffs, tries after a touchdown, or no-plays.
+        "play_count": 0,
+        "first_downs": 0,
+        # `True` if the offense snapped the ball at,
+        # or inside of the opponent's 20 yard line.
+        "is_red_zone": False,
+        # How the offense got the ball.
+        # Can be "KICKOFF", "START_OF_PERIOD",
+        # or anything in `CHANGE_OF_POSSESSION_RESULTS`.
+        "start_transition": None,
+        # Any value in `DRIVE_RESULTS`.
+        "drive_result": None,
+        # Points scored by the offense in this drive,
+        # including the try after a touchdown.
+        "points": 0,
+        "is_finished": False,
+    }
+
+
+def get_play_result(play_dict: dict, pos_points: int) -> str:
+    """
+    Returns the drive result that a play would end a drive with,
+    or `None` if this play doesn't end a drive by itself.
+    `pos_points` is the number of points the offense of the drive
+    scored in this play.
+    """
+    play_type = play_dict.get("play_type")
+
+    if play_dict.get("is_touchdown") is True:
+        return "TOUCHDOWN" if pos_points > 0 else "OPP_TOUCHDOWN"
+    elif play_dict.get("is_safety") is True:
+        return "SAFETY"
+    elif play_type in ("field_goal", "fair_catch_kick"):
+        return "FIELD_GOAL" if play_dict.get("is_fg_made") else "MISSED_FG"
+    elif play_type == "punt":
+        return "PUNT"
+    elif play_dict.get("is_turnover") is True:
+        if play_dict.get("is_intercepted") is True:
+            return "INTERCEPTION"
+        return "FUMBLE"
+    return None
+
+
+class DriveBuilder:
+    """
+    Groups plays into drives, one play at a time.
+
+    `add_play()` only updates the current drive,
+    so it can be called every time a play is charted,
+    and `build_drives()` groups every play in a game in a single pass.
+    """
+
+    def __init__(self, downs: int = 4) -> None:
+        self.downs = downs
+        self.drives_arr = []
+        self.current = None
+        # The `"drive_num"` of the plays in the current drive.
+        self.drive_num = None
+        # The last play in the current drive
+        # that wasn't a kickoff, or a try after a touchdown.
+        self.end_play = None
+        # The result the current drive would have if it ended right now.
+        self.result = None
+        # Used to work out the time of possession
+        # if the current drive lasts until the end of the half.
+        self.start_half_time_left = None
+
+    @staticmethod
+    def build_drives(
+        plays_arr: list,
+        is_finished: bool = False,
+        downs: int = 4
+    ) -> list:
+        """
+        Groups every play in a game into drives.
+
+        Parameters
+        ----------
+        `plays_arr` (list, mandatory):
+            Every play in the game, in order.
+
+        `is_finished` (bool, optional):
+            If `True`, the last drive is closed with `finish()`.
+            Otherwise, the last drive is left unfinished.
+
+        Returns
+        ----------
+        A list of drives (see `get_drive_template()`).
+        """
+        builder = DriveBuilder(downs)
+        for play_num, play_dict in enumerate(plays_arr, start=1):
+            builder.add_play(play_num, play_dict)
+
+        if is_finished is True:
+            builder.finish()
+        return builder.get_drives()
+
+    def get_drives(self) -> list:
+        """
+        Returns every drive so far, including the current drive.
+        """
+        if self.current is None:
+            return list(self.drives_arr)
+        return self.drives_arr + [self.current]
+
+    def add_play(self, play_num: int, play_dict: dict) -> list:
+        """
+        Adds the next play in a game.
+
+        Returns
+        ----------
+        A list of the drives changed by this play:
+        the drive this play ended (if any), and the current drive.
+        """
+        changed_arr = []
+        current = self.current
+
+        drive_num = play_dict.get("drive_num")
+        if current is None or drive_num != self.drive_num or \
+                drive_num is None and \
+                play_dict.get("pos_team") != current["pos_team"]:
+            if current is not None:
+                self.close_drive(play_dict)
+                changed_arr.append(current)
+            self.open_drive(play_num, play_dict)
+
+        self.update_drive(play_num, play_dict)
+        changed_arr.append(self.current)
+        return changed_arr
+
+    def finish(self) -> list:
+        """
+        Closes the last drive in a game, once that game is over.
+
+        Returns
+        ----------
+        Every drive in the game.
+        """
+        if self.current is not None:
+            self.close_drive(None)
+        return self.get_drives()
+
+    def open_drive(self, play_num: int, play_dict: dict) -> None:
+        """
+        Starts a new drive with `play_dict`.
+        """
+        drive_dict = get_drive_template()
+        # Plays that haven't been through a `GameStateEngine()`
+        # are numbered here, on every change of possession.
+        self.drive_num = play_dict.get("drive_num")
+        drive_dict["drive_num"] = self.drive_num
+        if self.drive_num is None:
+            drive_dict["drive_num"] = len(self.drives_arr) + 1
+        drive_dict["pos_team"] = play_dict.get("pos_team")
+        drive_dict["def_team"] = play_dict.get("def_team")
+        drive_dict["first_play_num"] = play_num
+        drive_dict["start_quarter_num"] = play_dict.get("quarter_num")
+        drive_dict["start_half_num"] = play_dict.get("half_num")
+        drive_dict["start_quarter_time_left"] = \
+            play_dict.get("quarter_time_left")
+        drive_dict["start_game_time_left"] = play_dict.get("game_time_left")
+
+        previous_dict = None
+        if len(self.drives_arr) > 0:
+            previous_dict = self.drives_arr[-1]
+
+        if play_dict.get("play_type") in KICKOFF_PLAY_TYPES:
+            drive_dict["start_transition"] = "KICKOFF"
+        elif previous_dict is not None and \
+                previous_dict["drive_result"] in \
+                CHANGE_OF_POSSESSION_RESULTS:
+            drive_dict["start_transition"] = previous_dict["drive_result"]
+        else:
+            drive_dict["start_transition"] = "START_OF_PERIOD"
+
+        self.current = drive_dict
+        self.end_play = None
+        self.result = None
+        self.start_half_time_left = play_dict.get("half_time_left")
+
+    def update_drive(self, play_num: int, play_dict: dict) -> None:
+        """
+        Adds `play_dict` to the current drive.
+        """
+        drive_dict = self.current
+        play_type = play_dict.get("play_type")
+
+        drive_dict["last_play_num"] = play_num
+        drive_dict["end_quarter_num"] = play_dict.get("quarter_num")
+        drive_dict["end_quarter_time_left"] = \
+            play_dict.get("quarter_time_left")
+        drive_dict["end_game_time_left"] = play_dict.get("game_time_left")
+        drive_dict["time_of_possession"] = self.get_elapsed_time(play_dict)
+
+        # Points are counted for the offense of this drive,
+        # even on plays where the other team has the ball
+        # (such as a try after a defensive touchdown).
+        pos_points = get_points(play_dict, "posteam")
+        def_points = get_points(play_dict, "defteam")
+        if play_dict.get("pos_team") != drive_dict["pos_team"]:
+            pos_points, def_points = def_points, pos_points
+        drive_dict["points"] += pos_points
+
+        if play_type in CONVERSION_PLAY_TYPES:
+            return
+
+        self.result = get_play_result(play_dict, pos_points)
+        if play_type in KICKOFF_PLAY_TYPES:
+            return
+
+        yardline_start = play_dict.get("yardline_start")
+        yardline_end = play_dict.get("yardline_end")
+        if yardline_end is None or self.result in (
+            "FIELD_GOAL", "MISSED_FG", "PUNT", "INTERCEPTION", "FUMBLE"
+        ):
+            # A drive that ends in a kick or turnover
+            # ends where the offense last snapped the ball.
+            yardline_end = yardline_start
+        elif yardline_end < 0:
+            yardline_end = 0
+
+        if drive_dict["start_yardline"] is None:
+            drive_dict["start_yardline"] = yardline_start
+        drive_dict["end_yardline"] = yardline_end
+        if drive_dict["start_yardline"] is not None and \
+                yardline_end is not None:
+            drive_dict["yards"] = drive_dict["start_yardline"] - yardline_end
+
+        if play_dict.get("is_no_play") is not True:
+            drive_dict["play_count"] += 1
+        if play_dict.get("is_first_down") is True:
+            drive_dict["first_downs"] += 1
+        if yardline_start is not None and yardline_start <= 20:
+            drive_dict["is_red_zone"] = True
+
+        self.end_play = play_dict
+
+    def close_drive(self, next_play_dict: dict) -> None:
+        """
+        Ends the current drive.
+
+        Parameters
+        ----------
+        `next_play_dict` (dict, mandatory):
+            The first play of the next drive,
+            or `None` if the game is over.
+        """
+        drive_dict = self.current
+        end_play = self.end_play
+
+        if self.result is not None:
+            result = self.result
+        elif end_play is not None and \
+                end_play.get("down") == self.downs and \
+                end_play.get("is_first_down") is not True and \
+                next_play_dict is not None and \
+                next_play_dict.get("pos_team") != drive_dict["pos_team"] and \
+                next_play_dict.get("half_num") == drive_dict["start_half_num"]:
+            result = "DOWNS"
+        elif next_play_dict is None:
+            result = "END_OF_GAME"
+        elif next_play_dict.get("half_num") != drive_dict["start_half_num"] \
+                or drive_dict["start_half_num"] == 3 and \
+                next_play_dict.get("quarter_num") != \
+                drive_dict["end_quarter_num"]:
+            result = "END_OF_HALF"
+        else:
+            result = "TURNOVER"
+
+        if next_play_dict is not None:
+            drive_dict["time_of_possession"] = self.get_elapsed_time(
+                next_play_dict, is_next_drive=True
+            )
+
+        drive_dict["drive_result"] = result
+        drive_dict["is_finished"] = True
+        self.drives_arr.append(drive_dict)
+        self.current = None
+
+    def get_elapsed_time(
+        self,
+        play_dict: dict,
+        is_next_drive: bool = False
+    ) -> int:
+        """
+        Returns the seconds between the start of the current drive,
+        and the snap of `play_dict`.
+        If `play_dict` is the first play of the next drive,
+        and it's in a different half (or OT period), the drive is assumed
+        to have lasted until the end of its half.
+        """
+        drive_dict = self.current
+        if drive_dict["start_half_num"] == 3:
+            start = drive_dict["start_quarter_time_left"]
+            end = play_dict.get("quarter_time_left")
+            same_period = (
+                play_dict.get("quarter_num") ==
+                drive_dict["start_quarter_num"]
+            )
+        else:
+            start = drive_dict["start_game_time_left"]
+            end = play_dict.get("game_time_left")
+            same_period = (
+                play_dict.get("half_num") == drive_dict["start_half_num"]
+            )
+
+        if is_next_drive is True and same_period is False:
+            if drive_dict["start_half_num"] == 3:
+                start = drive_dict["start_quarter_time_left"]
+            else:
+                start = self.start_half_time_left
+            return max(start or 0, 0)
+        elif start is None or end is None:
+            return drive_dict["time_of_possession"]
+        return max(start - end, 0)
+
+
+def get_points(play_dict: dict, team: str) -> int:
+    """
+    Returns the points scored by `"posteam"` or `"defteam"` in a play.
+    """
+    before = play_dict.get(f"{team}_score")
+    after = play_dict.get(f"{team}_post")
+    if before is None or after is None:
+        return 0
+    return after - before
@@ -0,0 +1,673 @@
+"""
+- Creation Date: 10/18/2026 11:00 PM EDT
+- Last Updated: 10/18/2026 11:00 PM EDT
+- Authors: Joseph Armstrong (armstrongjoseph08@gmail.com)
+- file: `./core/pbp_engine/expected_points.py`
+- Purpose: Expected points (EP) and win probability (WP)
+    for every play in a game, or in a season,
+    and for the current state of a game that's being charted.
+
+EP is looked up in a table keyed on
+down × distance bucket × yardline × time bucket
+(see `get_ep_key()`). By default, that table is filled in by a simple
+fallback model (see `get_fallback_ep()`), but it can also be fit to the
+plays stored in the database (see `ExpectedPointsModel.from_plays()`),
+with the fallback model used for states that rarely happen.
+
+EP is the net number of points the team with the ball can expect
+to score before the end of the half, where a touchdown is worth 6 points,
+and the try after it is its own play. EPA is the change in EP
+(plus any points scored) from one play to the next,
+so the EPA of every play in a half adds up to the net points scored,
+minus the EP of the first play in that half.
+
+WP is the chance the team with the ball wins this game,
+based on the score, the EP of the current play, and the time left
+(see `get_fallback_wp()`).
+
+Every play can be scored in pure Python
+(see `ExpectedPointsModel.score_plays()`), which takes a few microseconds
+per play, or every play in a `polars` DataFrame can be scored at once
+(see `ExpectedPointsModel.add_ep_wp()`).
+###############################################################################
+"""
+import math
+from bisect import bisect_right
+
+from core.pbp_engine.game import get_initial_game_file
+
+# The first distance in each distance bucket,
+# and the distance used to fill in each bucket with the fallback model.
+DISTANCE_BUCKET_EDGES = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 15, 20)
+DISTANCE_BUCKET_VALUES = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 12, 17, 22)
+
+# The first second (of the time left in the half) in each time bucket,
+# and the time used to fill in each bucket with the fallback model.
+TIME_BUCKET_EDGES = (0, 30, 60, 120, 240, 480)
+TIME_BUCKET_VALUES = (15, 45, 90, 180, 360, 900)
+
+# Every down in the EP table.
+# Leagues with fewer downs never use the rows for the later downs.
+EP_DOWNS = (1, 2, 3, 4)
+
+# How many EP points each down costs, compared to 1st down.
+DOWN_EP_COST = {1: 0.0, 2: 0.45, 3: 1.1, 4: 1.9}
+
+# The lowest and highest EP a play from scrimmage can have.
+MIN_EP = -2.5
+MAX_EP = 5.9
+
+# The EP of each type of try after a touchdown.
+CONVERSION_EP = {"xp": 0.94, "conversion_attempt": 0.96}
+
+KICKOFF_PLAY_TYPES = ("kickoff", "safety_kickoff")
+
+# The standard deviation of the final score margin of a game,
+# from the start of a game.
+WP_SCORE_SD = 13.45
+
+# The standard deviation of the final score margin of a game
+# when there's no time left. Keeps WP from being exactly 0 or 1
+# in a game that's tied up, or within an EP of being tied up.
+WP_MIN_SD = 0.5
+
+# How many points each timeout is worth, in WP.
+TIMEOUT_POINTS = 0.4
+
+# The settings in a game file `"settings"` that change EP or WP.
+EP_SETTINGS = (
+    "first_down_yards",
+    "kickoff_touchback_yardline",
+    "quarters",
+    "quarter_seconds",
+    "timeouts_per_half",
+)
+
+_models = {}
+
+
+def get_distance_bucket(distance: int) -> int:
+    """
+    Returns the distance bucket that `distance` is in.
+    """
+    return max(bisect_right(DISTANCE_BUCKET_EDGES, distance) - 1, 0)
+
+
+def get_time_bucket(half_time_left: int) -> int:
+    """
+    Returns the time bucket that `half_time_left` (in seconds) is in.
+    """
+    return max(bisect_right(TIME_BUCKET_EDGES, half_time_left) - 1, 0)
+
+
+def get_ep_key(
+    down: int,
+    distance: int,
+    yardline: int,
+    half_time_left: int
+) -> tuple:
+    """
+    Returns the key of a play in the EP table, as a tuple of
+    `(down, distance_bucket, yardline, time_bucket)`.
+    """
+    return (
+        min(max(down, EP_DOWNS[0]), EP_DOWNS[-1]),
+        get_distance_bucket(distance),
+        min(max(yardline, 1), 99),
+        get_time_bucket(half_time_left),
+    )
+
+
+def get_fallback_ep(
+    down: int,
+    distance: int,
+    yardline: int,
+    half_time_left: int,
+    first_down_yards: int = 10
+) -> float:
+    """
+    A simple EP model, used when there isn't enough data
+    to fill in a state in the EP table.
+
+    EP goes up by 0.07 points for every yard closer to the end zone,
+    goes down with every down, and goes down on longer distances
+    (more so on later downs). With less than 2 minutes left in a half,
+    EP shrinks, since there isn't enough time to finish a drive.
+    """
+    ep = 6.0 - 0.07 * yardline - DOWN_EP_COST.get(down, DOWN_EP_COST[4])
+    ep -= 0.04 * down * (min(distance, 25) - first_down_yards)
+    ep = min(max(ep, MIN_EP), MAX_EP)
+    return ep * min(1.0, 0.25 + max(half_time_left, 0) / 160)
+
+
+def get_fallback_wp(
+    score_diff: float,
+    ep: float,
+    game_time_left: int,
+    game_seconds: int = 3600,
+    timeout_diff: int = 0
+) -> float:
+    """
+    Returns the chance the team with the ball wins this game.
+
+    The final score margin of a game is treated as a normal distribution,
+    centered on the current score margin plus the EP of this play,
+    with a standard deviation that shrinks as the game goes on.
+    A logistic curve is used in place of the normal CDF.
+
+    Parameters
+    ----------
+    `score_diff` (float, mandatory):
+        The score of the team with the ball,
+        minus the score of the other team.
+
+    `ep` (float, mandatory):
+        The EP of this play.
+
+    `game_time_left` (int, mandatory):
+        The time left in this game (in seconds).
+
+    `game_seconds` (int, optional):
+        The length of a game (in seconds).
+
+    `timeout_diff` (int, optional):
+        The number of timeouts the team with the ball has,
+        minus the number of timeouts the other team has.
+    """
+    game_fraction = max(game_time_left, 0) / game_seconds
+    lead = score_diff + ep + TIMEOUT_POINTS * timeout_diff
+    z = lead / (WP_SCORE_SD * math.sqrt(game_fraction) + WP_MIN_SD)
+    z = min(max(z, -30.0), 30.0)
+    return 1 / (1 + math.exp(-1.7 * z))
+
+
+def get_final_wp(posteam_post: int, defteam_post: int) -> float:
+    """
+    Returns `1` if the team with the ball won this game,
+    `0` if that team lost, and `0.5` if this game ended in a tie.
+    """
+    if posteam_post > defteam_post:
+        return 1.0
+    elif posteam_post < defteam_post:
+        return 0.0
+    return 0.5
+
+
+class ExpectedPointsModel:
+    """
+    Scores the EP, EPA, WP, and WPA of plays.
+
+    Use `get_ep_model()` to get the model for a league's settings,
+    instead of creating a new model every time.
+    """
+
+    def __init__(self, settings: dict = None, ep_table: dict = None) -> None:
+        self.settings = get_initial_game_file()["settings"]
+        if settings is not None:
+            self.settings.update(settings)
+
+        self.first_down_yards = self.settings["first_down_yards"]
+        self.touchback_yardline = self.settings["kickoff_touchback_yardline"]
+        self.game_seconds = (
+            self.settings["quarters"] * self.settings["quarter_seconds"]
+        )
+
+        self.ep_table = self.get_fallback_ep_table()
+        if ep_table is not None:
+            self.ep_table.update(ep_table)
+
+        # Built the first time `add_ep_wp()` is called.
+        self.ep_table_df = None
+
+    def get_fallback_ep_table(self) -> dict:
+        """
+        Returns an EP table filled in by `get_fallback_ep()`.
+        """
+        ep_table = {}
+        for down in EP_DOWNS:
+            for distance_bucket, distance in enumerate(
+                DISTANCE_BUCKET_VALUES
+            ):
+                for yardline in range(1, 100):
+                    for time_bucket, half_time_left in enumerate(
+                        TIME_BUCKET_VALUES
+                    ):
+                        ep_table[
+                            (down, distance_bucket, yardline, time_bucket)
+                        ] = get_fallback_ep(
+                            down,
+                            min(distance, yardline),
+                            yardline,
+                            half_time_left,
+                            self.first_down_yards
+                        )
+        return ep_table
+
+    @staticmethod
+    def from_plays(
+        plays_df,
+        settings: dict = None,
+        prior_plays: int = 20
+    ) -> "ExpectedPointsModel":
+        """
+        Fits an EP table to the plays stored in the database.
+
+        The value of a play is the net number of points
+        the team with the ball scored on the next scoring play
+        in the same half (or 0, if nobody scored before the end of the half).
+        The EP of each state is the average value of every play in that
+        state, blended with the fallback model as if it were
+        `prior_plays` extra plays, so states that rarely happen
+        stay close to the fallback model.
+
+        Parameters
+        ----------
+        `plays_df` (pl.DataFrame, mandatory):
+            The plays to fit this table to
+            (see `core.database.load_db_elements.SqliteLoadData`
+            `.load_fb_pbp_plays()`).
+
+        `settings` (dict, optional):
+            The `"settings"` of the league these plays are from.
+
+        `prior_plays` (int, optional):
+            How many plays the fallback model counts as.
+        """
+        # Imported here, so that scoring a play doesn't require `polars`.
+        import polars as pl
+
+        model = ExpectedPointsModel(settings)
+        points = (pl.col("posteam_post") - pl.col("posteam_score")) - (
+            pl.col("defteam_post") - pl.col("defteam_score")
+        )
+        game_half = ["game_id", "half_num"]
+
+        # The next scoring play (and which team had the ball on it)
+        # is found by filling the scoring plays in a half backward.
+        values_df = plays_df.lazy().sort("game_id", "play_num").with_columns(
+            pl.when(points != 0).then(points).alias("_next_points"),
+            pl.when(points != 0).then(pl.col("pos_team"))
+            .alias("_next_team"),
+        ).with_columns(
+            pl.col("_next_points", "_next_team")
+            .backward_fill().over(game_half),
+        ).filter(
+            pl.col("play_type").is_in(KICKOFF_PLAY_TYPES).not_() &
+            pl.col("play_type").is_in(list(CONVERSION_EP)).not_() &
+            pl.col("down").is_between(EP_DOWNS[0], EP_DOWNS[-1]) &
+            pl.col("distance").is_not_null() &
+            pl.col("yardline_start").is_not_null() &
+            pl.col("half_time_left").is_not_null()
+        ).select(
+            *model.get_ep_key_exprs(
+                pl.col("down"),
+                pl.col("distance"),
+                pl.col("yardline_start"),
+            ),
+            pl.when(pl.col("_next_team") == pl.col("pos_team"))
+            .then(pl.col("_next_points"))
+            .otherwise(-pl.col("_next_points"))
+            .fill_null(0)
+            .alias("_value"),
+        ).group_by(
+            "_down", "_distance_bucket", "_yardline", "_time_bucket"
+        ).agg(
+            pl.col("_value").sum().alias("_value_sum"),
+            pl.len().alias("_plays"),
+        ).collect()
+
+        for down, distance_bucket, yardline, time_bucket, value_sum, n in \
+                values_df.iter_rows():
+            key = (down, distance_bucket, yardline, time_bucket)
+            model.ep_table[key] = (
+                value_sum + prior_plays * model.ep_table[key]
+            ) / (n + prior_plays)
+
+        return model
+
+    def get_ep(
+        self,
+        play_type: str,
+        down: int,
+        distance: int,
+        yardline: int,
+        half_time_left: int
+    ) -> float:
+        """
+        Returns the EP of a play, or `None` if this play
+        doesn't have a down, distance, yardline, or clock.
+
+        The EP of a kickoff is the EP of a touchback
+        for the receiving team, and the EP of a try
+        is a constant (see `CONVERSION_EP`).
+        """
+        if play_type in CONVERSION_EP:
+            return CONVERSION_EP[play_type]
+        elif play_type in KICKOFF_PLAY_TYPES:
+            down = 1
+            distance = self.first_down_yards
+            yardline = self.touchback_yardline
+        elif down is None or distance is None or yardline is None:
+            return None
+
+        if half_time_left is None:
+            return None
+        return self.ep_table[
+            get_ep_key(down, distance, yardline, half_time_left)
+        ]
+
+    def get_wp(
+        self,
+        score_diff: float,
+        ep: float,
+        game_time_left: int,
+        timeout_diff: int = 0
+    ) -> float:
+        """
+        Returns the WP of a play (see `get_fallback_wp()`),
+        or `None` if this play doesn't have a score or clock.
+        """
+        if score_diff is None or game_time_left is None:
+            return None
+        return get_fallback_wp(
+            score_diff,
+            ep or 0.0,
+            game_time_left,
+            self.game_seconds,
+            timeout_diff
+        )
+
+    def get_state_ep_wp(self, engine) -> dict:
+        """
+        Returns the EP and WP of the next play in a game being charted.
+        Fast enough to call every time a play is added.
+
+        Parameters
+        ----------
+        `engine` (GameStateEngine, mandatory):
+            The `core.pbp_engine.game_state.GameStateEngine()`
+            of the game being charted.
+
+        Returns
+        ----------
+        A dictionary with the team that has the ball (`"pos_team"`),
+        the `"ep"` and `"wp"` of that team, and the `"home_wp"`.
+        """
+        # Imported here, to avoid a circular import.
+        from core.pbp_engine.game_state import (
+            NEXT_CONVERSION,
+            NEXT_KICKOFF,
+            NEXT_SAFETY_KICKOFF,
+            other_team,
+        )
+
+        state = engine.state
+        pos_team = state.pos_team
+        def_team = other_team(pos_team)
+        score_diff = engine.get_score(pos_team) - engine.get_score(def_team)
+
+        if state.is_game_over is True:
+            ep = 0.0
+            wp = get_final_wp(score_diff, 0)
+        else:
+            play_type = None
+            if state.next_play == NEXT_KICKOFF:
+                play_type = "kickoff"
+            elif state.next_play == NEXT_SAFETY_KICKOFF:
+                play_type = "safety_kickoff"
+            elif state.next_play == NEXT_CONVERSION:
+                play_type = "xp"
+
+            _, half_time_left, game_time_left = engine.get_clock()
+            ep = self.get_ep(
+                play_type,
+                state.down,
+                state.distance,
+                state.yardline,
+                half_time_left
+            )
+            if pos_team == "home":
+                timeout_diff = state.home_timeouts - state.away_timeouts
+            else:
+                timeout_diff = state.away_timeouts - state.home_timeouts
+            wp = self.get_wp(score_diff, ep, game_time_left, timeout_diff)
+
+        return {
+            "pos_team": pos_team,
+            "ep": ep,
+            "wp": wp,
+            "home_wp": wp if pos_team == "home" else 1 - wp,
+        }
+
+    def score_plays(self, plays_arr: list) -> list:
+        """
+        Adds `"ep"`, `"epa"`, `"wp"`, and `"wpa"` to every play in a game,
+        in pure Python.
+
+        Parameters
+        ----------
+        `plays_arr` (list, mandatory):
+            Every play in a game, in order, after they've been through a
+            `core.pbp_engine.game_state.GameStateEngine()`.
+            These dictionaries are changed in place.
+
+        Returns
+        ----------
+        `plays_arr`.
+        """
+        for play_dict in plays_arr:
+            play_dict["ep"] = self.get_ep(
+                play_dict.get("play_type"),
+                play_dict.get("down"),
+                play_dict.get("distance"),
+                play_dict.get("yardline_start"),
+                play_dict.get("half_time_left"),
+            )
+            posteam_score = play_dict.get("posteam_score")
+            defteam_score = play_dict.get("defteam_score")
+            score_diff = None
+            if posteam_score is not None and defteam_score is not None:
+                score_diff = posteam_score - defteam_score
+            play_dict["wp"] = self.get_wp(
+                score_diff, play_dict["ep"], play_dict.get("game_time_left")
+            )
+
+        for i, play_dict in enumerate(plays_arr):
+            next_dict = None
+            if i + 1 < len(plays_arr):
+                next_dict = plays_arr[i + 1]
+
+            try:
+                points = (
+                    play_dict["posteam_post"] - play_dict["posteam_score"]
+                ) - (play_dict["defteam_post"] - play_dict["defteam_score"])
+            except (KeyError, TypeError):
+                points = None
+
+            ep_after = 0.0
+            wp_after = None
+            if next_dict is not None:
+                is_same_team = next_dict.get("pos_team") == \
+                    play_dict.get("pos_team")
+                if next_dict.get("half_num") == play_dict.get("half_num"):
+                    ep_after = next_dict["ep"]
+                    if ep_after is not None and is_same_team is False:
+                        ep_after = -ep_after
+                wp_after = next_dict["wp"]
+                if wp_after is not None and is_same_team is False:
+                    wp_after = 1 - wp_after
+            elif points is not None:
+                wp_after = get_final_wp(
+                    play_dict["posteam_post"], play_dict["defteam_post"]
+                )
+
+            play_dict["epa"] = None
+            if None not in (points, ep_after, play_dict["ep"]):
+                play_dict["epa"] = points + ep_after - play_dict["ep"]
+
+            play_dict["wpa"] = None
+            if None not in (wp_after, play_dict["wp"]):
+                play_dict["wpa"] = wp_after - play_dict["wp"]
+
+        return plays_arr
+
+    def get_ep_key_exprs(self, down, distance, yardline) -> list:
+        """
+        Returns the `polars` expressions for the key of a play
+        in the EP table (see `get_ep_key()`), as the columns
+        `_down`, `_distance_bucket`, `_yardline`, and `_time_bucket`.
+        """
+        import polars as pl
+
+        half_time_left = pl.col("half_time_left")
+
+        # `sum_horizontal()` skips nulls,
+        # so a missing distance or clock has to stay missing.
+        return [
+            down.clip(EP_DOWNS[0], EP_DOWNS[-1]).cast(pl.Int64)
+            .alias("_down"),
+            pl.when(distance.is_not_null()).then(
+                pl.sum_horizontal(
+                    [(distance >= x).cast(pl.Int64)
+                     for x in DISTANCE_BUCKET_EDGES]
+                ) - 1
+            ).clip(0, None).alias("_distance_bucket"),
+            yardline.clip(1, 99).cast(pl.Int64).alias("_yardline"),
+            pl.when(half_time_left.is_not_null()).then(
+                pl.sum_horizontal(
+                    [(half_time_left >= x).cast(pl.Int64)
+                     for x in TIME_BUCKET_EDGES]
+                ) - 1
+            ).clip(0, None).alias("_time_bucket"),
+        ]
+
+    def get_ep_table_df(self):
+        """
+        Returns the EP table as a `polars` DataFrame,
+        with one row per key.
+        """
+        import polars as pl
+
+        if self.ep_table_df is None:
+            keys_arr = list(self.ep_table.keys())
+            self.ep_table_df = pl.DataFrame(
+                {
+                    "_down": [x[0] for x in keys_arr],
+                    "_distance_bucket": [x[1] for x in keys_arr],
+                    "_yardline": [x[2] for x in keys_arr],
+                    "_time_bucket": [x[3] for x in keys_arr],
+                    "ep": list(self.ep_table.values()),
+                },
+                schema_overrides={"ep": pl.Float64},
+            )
+        return self.ep_table_df
+
+    def add_ep_wp(self, plays_lf):
+        """
+        Adds the `ep`, `epa`, `wp`, and `wpa` columns to every play
+        in a game or season, with one join against the EP table,
+        and a few window functions. Gives the same result as
+        `score_plays()`, without a Python loop over every play.
+
+        Parameters
+        ----------
+        `plays_lf` (pl.LazyFrame, mandatory):
+            A LazyFrame of plays, with the columns of `fb_pbp_plays`
+            (see `core.database.load_db_elements.SqliteLoadData`
+            `.load_fb_pbp_plays()`).
+
+        Returns
+        ----------
+        `plays_lf`, sorted by `game_id` and `play_num`,
+        with the `ep`, `epa`, `wp`, and `wpa` columns added.
+        """
+        import polars as pl
+
+        play_type = pl.col("play_type")
+        is_kickoff = play_type.is_in(KICKOFF_PLAY_TYPES)
+        conversion_ep = pl.col("ep")
+        for conversion_type, ep in CONVERSION_EP.items():
+            conversion_ep = pl.when(play_type == conversion_type) \
+                .then(pl.lit(ep)).otherwise(conversion_ep)
+
+        def get_next(column: str) -> pl.Expr:
+            return pl.col(column).shift(-1).over("game_id")
+
+        points = (pl.col("posteam_post") - pl.col("posteam_score")) - (
+            pl.col("defteam_post") - pl.col("defteam_score")
+        )
+        is_same_team = get_next("pos_team") == pl.col("pos_team")
+
+        game_fraction = pl.col("game_time_left").clip(0, None) / \
+            self.game_seconds
+        z = (
+            (pl.col("posteam_score") - pl.col("defteam_score")) +
+            pl.col("ep").fill_null(0.0)
+        ) / (WP_SCORE_SD * game_fraction.sqrt() + WP_MIN_SD)
+
+        final_wp = pl.when(
+            pl.col("posteam_post").is_null() |
+            pl.col("defteam_post").is_null()
+        ).then(None) \
+            .when(pl.col("posteam_post") > pl.col("defteam_post")) \
+            .then(pl.lit(1.0)) \
+            .when(pl.col("posteam_post") < pl.col("defteam_post")) \
+            .then(pl.lit(0.0)) \
+            .otherwise(pl.lit(0.5))
+
+        return plays_lf.with_columns(
+            self.get_ep_key_exprs(
+                pl.when(is_kickoff).then(pl.lit(1))
+                .otherwise(pl.col("down")),
+                pl.when(is_kickoff).then(pl.lit(self.first_down_yards))
+                .otherwise(pl.col("distance")),
+                pl.when(is_kickoff).then(pl.lit(self.touchback_yardline))
+                .otherwise(pl.col("yardline_start")),
+            )
+        ).join(
+            self.get_ep_table_df().lazy(),
+            on=["_down", "_distance_bucket", "_yardline", "_time_bucket"],
+            how="left",
+        ).sort("game_id", "play_num").with_columns(
+            conversion_ep.alias("ep")
+        ).with_columns(
+            pl.when(
+                pl.col("posteam_score").is_null() |
+                pl.col("defteam_score").is_null() |
+                pl.col("game_time_left").is_null()
+            ).then(None)
+            .otherwise(1 / (1 + (-1.7 * z.clip(-30.0, 30.0)).exp()))
+            .alias("wp"),
+        ).with_columns(
+            (
+                points +
+                pl.when(get_next("half_num").is_null() |
+                        (get_next("half_num") != pl.col("half_num")))
+                .then(pl.lit(0.0))
+                .when(is_same_team).then(get_next("ep"))
+                .otherwise(-get_next("ep")) -
+                pl.col("ep")
+            ).alias("epa"),
+            (
+                pl.when(get_next("play_num").is_null()).then(final_wp)
+                .when(is_same_team).then(get_next("wp"))
+                .otherwise(1 - get_next("wp")) -
+                pl.col("wp")
+            ).alias("wpa"),
+        ).drop("_down", "_distance_bucket", "_yardline", "_time_bucket")
+
+
+def get_ep_model(settings: dict = None) -> ExpectedPointsModel:
+    """
+    Returns the `ExpectedPointsModel()` for a league's `"settings"`,
+    using the fallback EP table.
+    Models are cached, so the EP table of each set of rules
+    is only built once.
+    """
+    if settings is None:
+        settings = {}
+
+    key = tuple(settings.get(x) for x in EP_SETTINGS)
+    if key not in _models:
+        _models[key] = ExpectedPointsModel(settings)
+    return _models[key]
@@ -0,0 +1,446 @@
+"""
+- Creation Date: 10/18/2026 10:25 PM EDT
+- Last Updated: 10/18/2026 10:25 PM EDT
+- Authors: Joseph Armstrong (armstrongjoseph08@gmail.com)
+- file: `./core/pbp_engine/game_codec.py`
+- Purpose: Encodes and decodes `sdv_football_pbp` game files
+    (see `core.pbp_engine.game.get_initial_game_file()`),
+    and the plays within them.
+
+If `orjson` is installed, it's used to encode and decode JSON.
+Otherwise, the `json` module from the standard library is used.
+Both give the same output (UTF-8, with 2 space indents if indented),
+so a game file doesn't change depending on which one is installed.
+The only exception is numbers written with an exponent
+(`1e-7` instead of `1e-07`), which are never used in a game file.
+
+Game files can also be written and read one play at a time
+(see `write_game_file()` and `GameFileReader()`),
+so a game never has to be held in memory as one large string.
+####
+"""
+import json
+import random
+import time
+from os import remove
+from os.path import getsize
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# The `"format_name"` of every game file.
+GAME_FORMAT_NAME = "sdv_football_pbp"
+
+# Every `"version"` of the game file format that can be read.
+SUPPORTED_FORMAT_VERSIONS = ("0.1",)
+
+# The number of characters read from a game file at a time.
+READ_CHUNK_SIZE = 65536
+
+_decoder = json.JSONDecoder()
+
+
+def get_json_backend() -> str:
+    """
+    Returns the name of the module used to encode and decode JSON.
+    """
+    if orjson is not None:
+        return "orjson"
+    return "json"
+
+
+def to_json_bytes(obj: object, indent: bool = False) -> bytes:
+    """
+    Encodes `obj` as UTF-8 JSON.
+
+    Parameters
+    ----------
+    `obj` (object, mandatory):
+        The object to encode.
+
+    `indent` (bool, optional):
+        If set to `True`, the JSON is indented with 2 spaces.
+        Otherwise, the JSON is as compact as possible.
+
+    Returns
+    ----------
+    `obj`, as JSON.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent is True:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    if indent is True:
+        json_str = json.dumps(obj, indent=2, ensure_ascii=False)
+    else:
+        json_str = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+    return json_str.encode("utf-8")
+
+
+def to_json(obj: object, indent: bool = False) -> str:
+    """
+    Encodes `obj` as JSON (see `to_json_bytes()`).
+    """
+    return to_json_bytes(obj, indent).decode("utf-8")
+
+
+def from_json(data: str | bytes) -> object:
+    """
+    Decodes a JSON string.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def validate_format_standard(format_dict: dict) -> None:
+    """
+    Raises a `ValueError` if `format_dict` (the `"format_standard"`
+    section of a game file) isn't a version of the game file format
+    this application can read.
+    """
+    if not isinstance(format_dict, dict):
+        raise ValueError("This game file has no `format_standard`.")
+    elif format_dict.get("format_name") != GAME_FORMAT_NAME:
+        raise ValueError(
+            "This is not a game file. " +
+            f"Expected a `format_name` of `{GAME_FORMAT_NAME}`, " +
+            f"but got `{format_dict.get('format_name')}`."
+        )
+    elif format_dict.get("version") not in SUPPORTED_FORMAT_VERSIONS:
+        raise ValueError(
+            "Unsupported game file version: " +
+            f"`{format_dict.get('version')}`."
+        )
+
+
+def validate_game_file(game_dict: dict) -> None:
+    """
+    Raises a `ValueError` if `game_dict` isn't a game file
+    this application can read.
+    """
+    if not isinstance(game_dict, dict):
+        raise ValueError("A game file must be a JSON object.")
+
+    validate_format_standard(game_dict.get("format_standard"))
+
+    if not isinstance(game_dict.get("plays", []), list):
+        raise ValueError("The `plays` in a game file must be a list.")
+
+
+def encode_game_file(
+    game_dict: dict,
+    indent: bool = False,
+    validate: bool = True
+) -> bytes:
+    """
+    Encodes a game file as UTF-8 JSON.
+
+    Parameters
+    ----------
+    `game_dict` (dict, mandatory):
+        The game file to encode.
+
+    `indent` (bool, optional):
+        If set to `True`, the JSON is indented with 2 spaces.
+
+    `validate` (bool, optional):
+        If set to `True`, a `ValueError` is raised if `game_dict`
+        isn't a game file (see `validate_game_file()`).
+    """
+    if validate is True:
+        validate_game_file(game_dict)
+    return to_json_bytes(game_dict, indent)
+
+
+def decode_game_file(data: str | bytes, validate: bool = True) -> dict:
+    """
+    Decodes a game file.
+    If `validate` is set to `True`, a `ValueError` is raised
+    if `data` isn't a game file (see `validate_game_file()`).
+    """
+    game_dict = from_json(data)
+    if validate is True:
+        validate_game_file(game_dict)
+    return game_dict
+
+
+def write_game_file(
+    game_dict: dict,
+    file_path: str,
+    plays=None,
+    validate: bool = True
+) -> int:
+    """
+    Writes a game file, one play at a time,
+    with every play on its own line.
+
+    Parameters
+    ----------
+    `game_dict` (dict, mandatory):
+        The game file to write.
+
+    `file_path` (str, mandatory):
+        The file to write to.
+
+    `plays` (iterable, optional):
+        The plays in this game. Can be any iterable
+        (including a generator), so the plays of a game
+        don't all have to be in memory at once.
+        Defaults to `game_dict["plays"]`.
+
+    `validate` (bool, optional):
+        If set to `True`, a `ValueError` is raised if `game_dict`
+        isn't a game file (see `validate_game_file()`).
+
+    Returns
+    ----------
+    The number of plays that were written.
+    """
+    if validate is True:
+        validate_game_file(game_dict)
+
+    if plays is None:
+        plays = game_dict.get("plays", [])
+
+    header_dict = {k: v for k, v in game_dict.items() if k != "plays"}
+    # Drops the closing `}`, so the plays can be added after every
+    # other section in this game.
+    header_bytes = to_json_bytes(header_dict)[:-1]
+    if len(header_dict) > 0:
+        header_bytes += b","
+
+    play_count = 0
+    with open(file_path, "wb") as f:
+        f.write(header_bytes + b'"plays":[')
+        for play_dict in plays:
+            if play_count > 0:
+                f.write(b",")
+            f.write(b"\n" + to_json_bytes(play_dict))
+            play_count += 1
+        f.write(b"\n]}\n")
+
+    return play_count
+
+
+class GameFileReader:
+    """
+    Reads a game file one play at a time,
+    so a game never has to be held in memory as one large string.
+
+    Every section of the game file other than `"plays"` is stored in
+    `self.header`. Sections before `"plays"` are in `self.header` as
+    soon as the first play is read, and every section is in
+    `self.header` once `self.iter_plays()` has finished.
+    """
+
+    def __init__(self, file_path: str, validate: bool = True) -> None:
+        self.file = open(file_path, "r", encoding="utf-8")
+        self.validate = validate
+        self.header = {}
+        self.buffer = ""
+        self.pos = 0
+        self.is_eof = False
+
+    def __enter__(self) -> "GameFileReader":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes this game file.
+        """
+        self.file.close()
+
+    def read_more(self) -> None:
+        """
+        Reads the next chunk of this game file into `self.buffer`,
+        and drops everything in `self.buffer` that's already been read.
+        """
+        chunk = self.file.read(READ_CHUNK_SIZE)
+        if chunk == "":
+            self.is_eof = True
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+
+    def next_char(self) -> str:
+        """
+        Skips any whitespace, and returns the next character
+        in this game file (without reading past it),
+        or an empty string at the end of this game file.
+        """
+        while True:
+            while self.pos < len(self.buffer) and \
+                    self.buffer[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buffer) or self.is_eof:
+                return self.buffer[self.pos:self.pos + 1]
+            self.read_more()
+
+    def expect(self, chars: str) -> str:
+        """
+        Reads the next character in this game file,
+        and raises a `ValueError` if it isn't in `chars`.
+        """
+        char = self.next_char()
+        if char == "" or char not in chars:
+            raise ValueError(
+                f"Expected one of `{chars}` in this game file, " +
+                f"but got `{char}`."
+            )
+        self.pos += 1
+        return char
+
+    def read_value(self) -> object:
+        """
+        Reads the next JSON value in this game file.
+        """
+        self.next_char()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                if self.is_eof:
+                    raise ValueError(f"Invalid game file. Reason: {e}")
+                self.read_more()
+                continue
+
+            # A number at the end of `self.buffer` may continue
+            # in the next chunk of this game file.
+            if end == len(self.buffer) and not self.is_eof:
+                self.read_more()
+                continue
+
+            self.pos = end
+            return value
+
+    def iter_plays(self):
+        """
+        Yields every play in this game file, in order.
+        """
+        self.expect("{")
+        if self.next_char() == "}":
+            self.pos += 1
+            return
+
+        while True:
+            key = self.read_value()
+            self.expect(":")
+
+            if key == "plays":
+                self.expect("[")
+                if self.next_char() == "]":
+                    self.pos += 1
+                else:
+                    while True:
+                        yield self.read_value()
+                        if self.expect(",]") == "]":
+                            break
+            else:
+                self.header[key] = self.read_value()
+                if key == "format_standard" and self.validate is True:
+                    validate_format_standard(self.header[key])
+
+            if self.expect(",}") == "}":
+                break
+
+        if self.validate is True and "format_standard" not in self.header:
+            validate_format_standard(None)
+
+
+def read_game_file(file_path: str, validate: bool = True) -> dict:
+    """
+    Reads a game file written by `write_game_file()`,
+    or by any other JSON encoder.
+    """
+    with GameFileReader(file_path, validate) as reader:
+        plays_arr = list(reader.iter_plays())
+
+    game_dict = reader.header
+    game_dict["plays"] = plays_arr
+    return game_dict
+
+
+def benchmark_game_codec(
+    play_count: int = 200,
+    game_count: int = 300,
+    file_path: str = "benchmark_game_codec.json"
+) -> dict:
+    """
+    Times encoding and decoding a game with `play_count` plays,
+    and a season of `game_count` games,
+    with `orjson` (if it's installed) and with the `json` module,
+    compact and indented.
+    Only used to compare the speed and size of each backend.
+    """
+    # Imported here, since only this benchmark needs test data.
+    from core.database.rebuild_db_elements import simulate_game
+    from core.pbp_engine.game import get_initial_game_file
+
+    global orjson
+    installed_orjson = orjson
+
+    rng = random.Random(0)
+    plays_arr = []
+    while len(plays_arr) < play_count:
+        plays_arr += simulate_game(rng)
+
+    game_dict = get_initial_game_file()
+    game_dict["plays"] = plays_arr[:play_count]
+
+    results_dict = {}
+    backends = [("json", None)]
+    if installed_orjson is not None:
+        backends.insert(0, ("orjson", installed_orjson))
+
+    try:
+        for backend, module in backends:
+            orjson = module
+            for indent in (False, True):
+                start_time = time.perf_counter()
+                for _ in range(game_count):
+                    data = encode_game_file(game_dict, indent)
+                encode_seconds = time.perf_counter() - start_time
+
+                start_time = time.perf_counter()
+                for _ in range(game_count):
+                    decode_game_file(data)
+                decode_seconds = time.perf_counter() - start_time
+
+                style = "indented" if indent is True else "compact"
+                results_dict[f"{backend}_{style}"] = {
+                    "game_bytes": len(data),
+                    "game_encode_ms": round(
+                        encode_seconds / game_count * 1e3, 3
+                    ),
+                    "game_decode_ms": round(
+                        decode_seconds / game_count * 1e3, 3
+                    ),
+                    "season_encode_seconds": round(encode_seconds, 3),
+                    "season_decode_seconds": round(decode_seconds, 3),
+                }
+
+            start_time = time.perf_counter()
+            write_game_file(game_dict, file_path)
+            read_game_file(file_path)
+            results_dict[f"{backend}_streamed"] = {
+                "game_bytes": getsize(file_path),
+                "game_write_read_ms": round(
+                    (time.perf_counter() - start_time) * 1e3, 3
+                ),
+            }
+            remove(file_path)
+    finally:
+        orjson = installed_orjson
+
+    return results_dict
+
+
+if __name__ == "__main__":
+    print(json.dumps(benchmark_game_codec(), indent=4))
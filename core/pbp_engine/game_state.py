@@ -0,0 +1,904 @@
+"""
+- Creation Date: 10/18/2026 05:45 PM EDT
+- Last Updated: 10/18/2026 06:55 PM EDT
+- Authors: Joseph Armstrong (armstrongjoseph08@gmail.com)
+- file: `./core/pbp_engine/game_state.py`
+- Purpose: Derives the down, distance, clock, score, and drive
+    of a game one play at a time, using the rules in
+    `core.pbp_engine.game.get_initial_game_file()["settings"]`.
+
+Yardlines follow the same convention as the nflverse `yardline_100` column,
+and the touchback/kickoff yardlines in `"settings"`:
+the number of yards between the team with the ball,
+and the end zone that team is trying to score in.
+
+- `"yardline_start"` is where the ball was snapped (or kicked from).
+- `"yardline_end"` is where the ball ended up, from the point of view
+    of the team that had the ball when the play started.
+- On a kickoff, the team with the ball (`"pos_team"`)
+    is the receiving team, like in nflverse.
+###############################################################################
+"""
+import copy
+from dataclasses import dataclass
+
+from core.pbp_engine.game import get_initial_game_file
+
+# What the next play in a game has to be.
+NEXT_KICKOFF = "kickoff"
+NEXT_SAFETY_KICKOFF = "safety_kickoff"
+NEXT_SCRIMMAGE = "scrimmage"
+NEXT_CONVERSION = "conversion"
+
+KICKOFF_PLAY_TYPES = ("kickoff", "safety_kickoff")
+CONVERSION_PLAY_TYPES = ("xp", "conversion_attempt")
+SCRIMMAGE_PLAY_TYPES = (
+    "pass", "rush", "punt", "field_goal", "fair_catch_kick"
+)
+
+
+def other_team(team: str) -> str:
+    """
+    Returns `"away"` if `team` is `"home"`, and `"home"` otherwise.
+    """
+    return "away" if team == "home" else "home"
+
+
+def team_score(team: str, home_score: int, away_score: int) -> int:
+    """
+    Returns `home_score` if `team` is `"home"`, and `away_score` otherwise.
+    """
+    if team == "home":
+        return home_score
+    return away_score
+
+
+def get_ot_rule(settings: dict) -> str:
+    """
+    Returns the name of the OT rule set enabled in `settings`,
+    or `None` if OT is disabled.
+    """
+    if settings.get("overtime_enabled", True) is False:
+        return None
+
+    # "modified_sudden_death_ot" is `True` by default,
+    # so it's only used if none of the other OT rules are enabled.
+    for ot_rule in (
+        "sudden_death_ot",
+        "super_modified_sudden_death_ot",
+        "kansas_ot",
+        "ncaa_ot",
+        "xfl_ot_rule",
+        "full_period_ot",
+        "modified_sudden_death_ot",
+    ):
+        if settings.get(ot_rule) is True:
+            return ot_rule
+
+    return "sudden_death_ot"
+
+
+@dataclass(slots=True)
+class GameState:
+    """
+    The state of a game before the next play.
+    """
+    quarter_num: int = 1
+    # In seconds.
+    quarter_time_left: int = 900
+    # `"home"` or `"away"`.
+    pos_team: str = "home"
+    down: int = 0
+    distance: int = 0
+    # Yards between `pos_team` and the end zone it is trying to score in.
+    yardline: int = 35
+    drive_num: int = 0
+    home_score: int = 0
+    away_score: int = 0
+    home_timeouts: int = 3
+    away_timeouts: int = 3
+    next_play: str = NEXT_KICKOFF
+    # The team that received the opening kickoff.
+    opening_receiver: str = "home"
+    # The team that had the ball in the last play.
+    last_pos_team: str = None
+    ot_period: int = 0
+    # The number of possessions that have ended in the current OT period.
+    ot_possessions: int = 0
+    # The team that had the first possession in the current OT period.
+    ot_first_team: str = None
+    is_game_over: bool = False
+
+
+class GameStateEngine:
+    """
+    Derives the down, distance, clock, score, and drive of a game
+    one play at a time.
+
+    `apply_play()` only looks at the play it is given
+    and the current `GameState()`, so adding a play to a game
+    never requires going back over the plays before it.
+    """
+
+    def __init__(
+        self,
+        settings: dict = None,
+        coin_flip: dict = None,
+        home_team_abv: str = None,
+        away_team_abv: str = None,
+    ) -> None:
+        game_dict = get_initial_game_file()
+        self.settings = game_dict["settings"]
+        if settings is not None:
+            self.settings.update(settings)
+
+        if coin_flip is None:
+            coin_flip = game_dict["coin_flip"]
+        self.coin_flip = coin_flip
+        self.team_abvs = {"home": home_team_abv, "away": away_team_abv}
+        self.ot_rule = get_ot_rule(self.settings)
+
+        self.quarters = self.settings["quarters"]
+        self.quarter_seconds = self.settings["quarter_seconds"]
+        self.half_quarters = max(self.quarters // 2, 1)
+
+        # The team that wins the coin toss, and defers or kicks,
+        # kicks off to start the game.
+        winner = coin_flip.get("winning_team", "home")
+        if coin_flip.get("decision") == "receive":
+            opening_receiver = winner
+        else:
+            opening_receiver = other_team(winner)
+
+        self.state = GameState(
+            quarter_time_left=self.quarter_seconds,
+            pos_team=opening_receiver,
+            yardline=self.settings["kickoff_yardline"],
+            home_timeouts=self.settings["timeouts_per_half"],
+            away_timeouts=self.settings["timeouts_per_half"],
+            opening_receiver=opening_receiver,
+        )
+        if self.settings.get("kickoffs_enabled", True) is False:
+            self.start_possession(
+                opening_receiver,
+                self.settings["kickoff_touchback_yardline"]
+            )
+
+    @staticmethod
+    def from_game_file(game_dict: dict) -> "GameStateEngine":
+        """
+        Creates a `GameStateEngine()` for a game file
+        (see `core.pbp_engine.game.get_initial_game_file()`).
+        """
+        return GameStateEngine(
+            settings=game_dict["settings"],
+            coin_flip=game_dict["coin_flip"],
+            home_team_abv=game_dict["home_team"]["team_abv"],
+            away_team_abv=game_dict["away_team"]["team_abv"],
+        )
+
+    @staticmethod
+    def replay(
+        plays_arr: list,
+        seconds_arr: list = None,
+        **kwargs
+    ) -> "GameStateEngine":
+        """
+        Creates a `GameStateEngine()`, and applies every play in a game.
+        Only needed when a play before the last play changes.
+
+        Parameters
+        ----------
+        `plays_arr` (list, mandatory):
+            Every play in the game, in order.
+
+        `seconds_arr` (list, optional):
+            How many seconds ran off the clock during each play.
+
+        `**kwargs`:
+            Passed into `GameStateEngine()`.
+        """
+        engine = GameStateEngine(**kwargs)
+        for i, play_dict in enumerate(plays_arr):
+            seconds = 0
+            if seconds_arr is not None:
+                seconds = seconds_arr[i]
+            engine.apply_play(play_dict, seconds)
+        return engine
+
+    def snapshot(self) -> GameState:
+        """
+        Returns a copy of the current state of this game.
+        """
+        return copy.copy(self.state)
+
+    def get_team_name(self, team: str) -> str:
+        """
+        Returns the abbreviation for `"home"`/`"away"`, if it is known.
+        """
+        return self.team_abvs.get(team) or team
+
+    def get_half_num(self) -> int:
+        """
+        Returns `1` for the first half, `2` for the second half,
+        and `3` for OT.
+        """
+        if self.state.ot_period > 0:
+            return 3
+        elif self.state.quarter_num <= self.half_quarters:
+            return 1
+        return 2
+
+    def get_clock(self) -> tuple:
+        """
+        Returns the time left in this quarter, half, and game (in seconds).
+        """
+        state = self.state
+        quarter_time_left = max(state.quarter_time_left, 0)
+
+        if state.ot_period > 0:
+            return quarter_time_left, quarter_time_left, quarter_time_left
+
+        quarters_left = self.quarters - state.quarter_num
+        if state.quarter_num <= self.half_quarters:
+            half_quarters_left = self.half_quarters - state.quarter_num
+        else:
+            half_quarters_left = quarters_left
+
+        return (
+            quarter_time_left,
+            quarter_time_left + half_quarters_left * self.quarter_seconds,
+            quarter_time_left + quarters_left * self.quarter_seconds,
+        )
+
+    def get_clock_str(self) -> str:
+        """
+        Returns the game clock, formatted like `"Q1 15:00"`, or `"OT 10:00"`.
+        """
+        state = self.state
+        quarter_time_left = max(state.quarter_time_left, 0)
+        if state.ot_period == 1:
+            period = "OT"
+        elif state.ot_period > 1:
+            period = f"{state.ot_period} OT"
+        else:
+            period = f"Q{state.quarter_num}"
+        return (
+            f"{period} {quarter_time_left // 60:02d}:" +
+            f"{quarter_time_left % 60:02d}"
+        )
+
+    def get_score(self, team: str) -> int:
+        """
+        Returns the score for `"home"`/`"away"`.
+        """
+        if team == "home":
+            return self.state.home_score
+        return self.state.away_score
+
+    def add_points(self, team: str, points: int) -> None:
+        """
+        Adds points to the score for `"home"`/`"away"`.
+        """
+        if team == "home":
+            self.state.home_score += points
+        else:
+            self.state.away_score += points
+
+    def use_timeout(self, team: str) -> int:
+        """
+        Charges a timeout to `"home"`/`"away"`.
+
+        Returns
+        ----------
+        The number of timeouts that team has left.
+        """
+        if team == "home":
+            self.state.home_timeouts = max(self.state.home_timeouts - 1, 0)
+            return self.state.home_timeouts
+        self.state.away_timeouts = max(self.state.away_timeouts - 1, 0)
+        return self.state.away_timeouts
+
+    def start_possession(self, team: str, yardline: int) -> None:
+        """
+        Gives `team` a 1st down at `yardline`.
+        """
+        state = self.state
+        state.pos_team = team
+        state.yardline = yardline
+        state.down = 1
+        state.distance = min(self.settings["first_down_yards"], yardline)
+        state.next_play = NEXT_SCRIMMAGE
+
+    def set_kickoff(self, receiving_team: str, is_safety: bool = False):
+        """
+        Sets up a kickoff (or safety kick) to `receiving_team`.
+        """
+        state = self.state
+        if self.settings.get("kickoffs_enabled", True) is False:
+            self.start_possession(
+                receiving_team, self.settings["kickoff_touchback_yardline"]
+            )
+            return
+
+        state.pos_team = receiving_team
+        state.down = 0
+        state.distance = 0
+        if is_safety is True:
+            state.yardline = self.settings["safety_kick_yardline"]
+            state.next_play = NEXT_SAFETY_KICKOFF
+        else:
+            state.yardline = self.settings["kickoff_yardline"]
+            state.next_play = NEXT_KICKOFF
+
+    def set_conversion(self, team: str) -> None:
+        """
+        Sets up a conversion attempt after a touchdown by `team`.
+        """
+        state = self.state
+        state.pos_team = team
+        state.yardline = self.settings["pat_yardline"]
+        state.down = 0
+        state.distance = state.yardline
+        state.next_play = NEXT_CONVERSION
+
+    def apply_play(self, play_dict: dict, seconds_elapsed: int = 0) -> dict:
+        """
+        Fills in the fields of a play that can be derived from the state
+        of the game (down, distance, clock, score, drive, etc.),
+        and then updates the state of the game with the result of that play.
+
+        Parameters
+        ----------
+        `play_dict` (dict, mandatory):
+            A play from `core.pbp_engine.plays.Plays()`.
+            If `"yardline_start"` or `"quarter_time_left"` are already set,
+            they are used instead of the current state of the game,
+            so that a statistician can correct the spot or the clock.
+            This dictionary is changed in place.
+
+        `seconds_elapsed` (int, optional):
+            How many seconds ran off the clock during this play.
+
+        Returns
+        ----------
+        `play_dict`, with every derived field filled in.
+        """
+        state = self.state
+        settings = self.settings
+        play_type = play_dict.get("play_type")
+
+        if play_dict.get("quarter_time_left") is not None:
+            state.quarter_time_left = play_dict["quarter_time_left"]
+        if play_dict.get("yardline_start") is not None:
+            state.yardline = play_dict["yardline_start"]
+            if state.next_play == NEXT_SCRIMMAGE:
+                state.distance = min(state.distance, state.yardline)
+
+        # A new drive starts on every kickoff,
+        # every change of possession, and at the start of every half.
+        # The try after a touchdown is part of the drive that scored it,
+        # even if the defense scored that touchdown.
+        is_try = (
+            play_type in CONVERSION_PLAY_TYPES and
+            state.next_play == NEXT_CONVERSION and
+            state.last_pos_team is not None and
+            self.is_shootout() is False
+        )
+        if play_type in KICKOFF_PLAY_TYPES or \
+                state.pos_team != state.last_pos_team and is_try is False:
+            state.drive_num += 1
+        state.last_pos_team = state.pos_team
+
+        pos_team = state.pos_team
+        def_team = other_team(pos_team)
+        quarter_time_left, half_time_left, game_time_left = self.get_clock()
+        down = state.down
+        distance = state.distance
+        yardline_start = state.yardline
+
+        set_fields(
+            play_dict,
+            quarter_num=state.quarter_num,
+            half_num=self.get_half_num(),
+            quarter_time_left=quarter_time_left,
+            half_time_left=half_time_left,
+            game_time_left=game_time_left,
+            quarter_time_left_str=self.get_clock_str(),
+            pos_team=self.get_team_name(pos_team),
+            def_team=self.get_team_name(def_team),
+            down=down,
+            distance=distance,
+            is_goal_to_go=(
+                play_type in SCRIMMAGE_PLAY_TYPES and
+                yardline_start <= distance
+            ),
+            yardline_start=yardline_start,
+            drive_num=state.drive_num,
+            home_score=state.home_score,
+            away_score=state.away_score,
+            posteam_score=self.get_score(pos_team),
+            defteam_score=self.get_score(def_team),
+        )
+
+        home_before = state.home_score
+        away_before = state.away_score
+
+        if play_type in KICKOFF_PLAY_TYPES:
+            self.apply_kickoff(play_dict)
+        elif play_type in CONVERSION_PLAY_TYPES:
+            self.apply_conversion(play_dict)
+        elif play_type == "punt":
+            self.apply_punt(play_dict)
+        elif play_type in ("field_goal", "fair_catch_kick"):
+            self.apply_field_goal(play_dict)
+        else:
+            self.apply_scrimmage(play_dict)
+
+        if play_type in SCRIMMAGE_PLAY_TYPES:
+            converted = (
+                play_type in ("pass", "rush") and
+                state.pos_team == pos_team and
+                (state.down == 1 or state.next_play == NEXT_CONVERSION)
+            )
+            set_fields(
+                play_dict,
+                is_third_down=down == settings["downs"] - 1,
+                is_third_down_converted=(
+                    down == settings["downs"] - 1 and converted
+                ),
+                is_fourth_down=down == settings["downs"],
+                is_fourth_down_converted=(
+                    down == settings["downs"] and converted
+                ),
+            )
+
+        scoring_play = (
+            state.home_score != home_before or
+            state.away_score != away_before
+        )
+        set_fields(
+            play_dict,
+            is_scoring_play=scoring_play,
+            home_score_post=state.home_score,
+            away_score_post=state.away_score,
+            posteam_post=self.get_score(pos_team),
+            defteam_post=self.get_score(def_team),
+        )
+
+        if state.ot_period > 0 and state.is_game_over is False:
+            self.check_ot(
+                play_dict,
+                pos_team,
+                self.get_score(pos_team) - team_score(
+                    pos_team, home_before, away_before
+                ),
+                self.get_score(def_team) - team_score(
+                    def_team, home_before, away_before
+                ),
+            )
+
+        self.run_clock(seconds_elapsed)
+        return play_dict
+
+    def apply_kickoff(self, play_dict: dict) -> None:
+        """
+        Applies the result of a kickoff, where `pos_team`
+        is the receiving team.
+        """
+        state = self.state
+        field_length = self.settings["field_length"]
+        receiving_team = state.pos_team
+        kicking_team = other_team(receiving_team)
+        yardline_end = play_dict.get("yardline_end")
+
+        if play_dict.get("is_touchdown") is True:
+            if play_dict.get("is_turnover") is True or \
+                    play_dict.get("is_own_kickoff_recovery") is True:
+                self.score_touchdown(kicking_team)
+            else:
+                self.score_touchdown(receiving_team)
+        elif play_dict.get("is_safety") is True:
+            self.score_safety(kicking_team)
+        elif play_dict.get("is_touchback") is True or yardline_end is None:
+            self.start_possession(
+                receiving_team, self.settings["kickoff_touchback_yardline"]
+            )
+        elif play_dict.get("is_own_kickoff_recovery") is True or \
+                play_dict.get("is_turnover") is True:
+            self.start_possession(kicking_team, field_length - yardline_end)
+        else:
+            self.start_possession(receiving_team, yardline_end)
+
+    def apply_punt(self, play_dict: dict) -> None:
+        """
+        Applies the result of a punt.
+        """
+        state = self.state
+        field_length = self.settings["field_length"]
+        punting_team = state.pos_team
+        receiving_team = other_team(punting_team)
+        yardline_end = play_dict.get("yardline_end")
+
+        if play_dict.get("is_touchdown") is True:
+            if play_dict.get("is_turnover") is True or \
+                    play_dict.get("is_blocked") is False and \
+                    play_dict.get("is_returned") is not True:
+                self.score_touchdown(punting_team)
+            else:
+                self.score_touchdown(receiving_team)
+        elif play_dict.get("is_safety") is True:
+            self.score_safety(receiving_team)
+        elif play_dict.get("is_rouge") is True:
+            self.add_points(punting_team, 1)
+            self.start_possession(
+                receiving_team, self.settings["normal_touchback_yardline"]
+            )
+        elif play_dict.get("is_turnover") is True and \
+                yardline_end is not None:
+            # The receiving team muffed/fumbled the punt,
+            # and the punting team recovered it.
+            self.start_possession(punting_team, yardline_end)
+        elif play_dict.get("is_touchback") is True or yardline_end is None:
+            self.start_possession(
+                receiving_team, self.settings["punt_touchback_yardline"]
+            )
+        else:
+            self.start_possession(receiving_team, field_length - yardline_end)
+
+    def apply_field_goal(self, play_dict: dict) -> None:
+        """
+        Applies the result of a field goal, or a fair catch kick.
+        """
+        state = self.state
+        field_length = self.settings["field_length"]
+        kicking_team = state.pos_team
+        defending_team = other_team(kicking_team)
+
+        if play_dict.get("is_fg_made") is True:
+            points = self.settings["field_goal_points"]
+            if self.settings.get("long_fg_bonus_point") is True and \
+                    (play_dict.get("fg_attempt_distance") or 0) >= 50:
+                points += 1
+            self.add_points(kicking_team, points)
+            self.set_kickoff(defending_team)
+        elif play_dict.get("is_touchdown") is True:
+            if play_dict.get("is_blocked") is True or \
+                    play_dict.get("is_returned") is True or \
+                    play_dict.get("is_turnover") is True:
+                self.score_touchdown(defending_team)
+            else:
+                self.score_touchdown(kicking_team)
+        else:
+            # A missed field goal goes back to the spot of the kick,
+            # or to the touchback line, whichever is further
+            # from the kicking team's end zone.
+            spot = play_dict.get("yardline_end")
+            if spot is None:
+                spot = state.yardline
+            self.start_possession(
+                defending_team,
+                min(
+                    field_length - spot,
+                    self.settings["normal_touchback_yardline"]
+                )
+            )
+
+    def apply_conversion(self, play_dict: dict) -> None:
+        """
+        Applies the result of an extra point, or conversion attempt.
+        """
+        state = self.state
+        settings = self.settings
+        scoring_team = state.pos_team
+        defending_team = other_team(scoring_team)
+
+        if play_dict.get("play_type") == "xp" and \
+                play_dict.get("is_fg_made") is True:
+            self.add_points(scoring_team, settings["pat_points"])
+        elif play_dict.get("is_1pt_successful_conversion") is True:
+            self.add_points(scoring_team, 1)
+        elif play_dict.get("is_2pt_successful_conversion") is True:
+            self.add_points(scoring_team, 2)
+        elif play_dict.get("is_3pt_successful_conversion") is True:
+            self.add_points(scoring_team, 3)
+        elif play_dict.get("is_defensive_2pc") is True:
+            self.add_points(defending_team, settings["pat_defense"])
+        elif play_dict.get("is_safety") is True:
+            # A safety on a conversion attempt
+            # is worth `pat_safety` points to the team that scored.
+            self.add_points(scoring_team, settings["pat_safety"])
+
+        if self.state.ot_period > 0 and self.ot_rule in (
+            "kansas_ot", "ncaa_ot", "xfl_ot_rule"
+        ):
+            # These OT rules don't have kickoffs.
+            state.next_play = NEXT_SCRIMMAGE
+            return
+
+        self.set_kickoff(defending_team)
+
+    def apply_scrimmage(self, play_dict: dict) -> None:
+        """
+        Applies the result of a pass or rush.
+        """
+        state = self.state
+        settings = self.settings
+        field_length = settings["field_length"]
+        pos_team = state.pos_team
+        def_team = other_team(pos_team)
+
+        yardline_end = play_dict.get("yardline_end")
+        if yardline_end is None:
+            yardline_end = state.yardline
+
+        if play_dict.get("is_turnover") is True:
+            if play_dict.get("is_touchdown") is True or \
+                    yardline_end >= field_length:
+                set_fields(play_dict, is_touchdown=True)
+                self.score_touchdown(def_team)
+            elif yardline_end <= 0:
+                # The defense was downed in its own end zone.
+                self.start_possession(
+                    def_team, settings["normal_touchback_yardline"]
+                )
+            else:
+                self.start_possession(def_team, field_length - yardline_end)
+            return
+
+        if play_dict.get("is_touchdown") is True or yardline_end <= 0:
+            set_fields(play_dict, is_touchdown=True)
+            self.score_touchdown(pos_team)
+            return
+        elif play_dict.get("is_safety") is True or \
+                yardline_end >= field_length:
+            set_fields(play_dict, is_safety=True)
+            self.score_safety(def_team)
+            return
+
+        yards_gained = state.yardline - yardline_end
+        state.yardline = yardline_end
+
+        if yards_gained >= state.distance or \
+                play_dict.get("is_first_down_penalty") is True:
+            set_fields(play_dict, is_first_down=True)
+            self.start_possession(pos_team, yardline_end)
+        elif play_dict.get("is_no_play") is True:
+            # The down is replayed from wherever the penalty moved the ball.
+            state.distance -= yards_gained
+        elif state.down >= settings["downs"]:
+            # Turnover on downs.
+            self.start_possession(def_team, field_length - yardline_end)
+        else:
+            state.down += 1
+            state.distance -= yards_gained
+
+    def score_touchdown(self, team: str) -> None:
+        """
+        Scores a touchdown for `team`.
+        """
+        self.add_points(team, self.settings["touchdown_points"])
+        self.set_conversion(team)
+
+    def score_safety(self, team: str) -> None:
+        """
+        Scores a safety for `team`.
+        """
+        # The team that gave up the safety kicks to the team that scored.
+        self.add_points(team, self.settings["safety_points"])
+        self.set_kickoff(team, is_safety=True)
+
+    def run_clock(self, seconds_elapsed: int) -> None:
+        """
+        Runs `seconds_elapsed` off the clock,
+        and moves on to the next quarter if this quarter is over.
+        """
+        state = self.state
+        if state.is_game_over is True:
+            return
+
+        # Kansas, NCAA, and XFL OT periods are never timed.
+        untimed_ot = state.ot_period > 0 and (
+            self.settings["ot_period_seconds"] == 0 or
+            self.ot_rule in ("kansas_ot", "ncaa_ot", "xfl_ot_rule")
+        )
+        if untimed_ot is False:
+            state.quarter_time_left -= seconds_elapsed
+
+        # A try after a touchdown is always played,
+        # even if there is no time left.
+        if state.quarter_time_left > 0 or untimed_ot is True or \
+                state.next_play == NEXT_CONVERSION:
+            return
+
+        self.end_quarter()
+
+    def end_quarter(self) -> None:
+        """
+        Moves on to the next quarter (or half, or OT period),
+        or ends the game.
+        """
+        state = self.state
+        settings = self.settings
+
+        if state.ot_period > 0:
+            if self.ot_rule == "full_period_ot" and \
+                    state.home_score != state.away_score:
+                state.is_game_over = True
+                return
+            self.start_ot_period()
+            return
+
+        state.quarter_num += 1
+        state.quarter_time_left = self.quarter_seconds
+
+        if state.quarter_num == self.half_quarters + 1:
+            # Halftime. The team that kicked off to start the game
+            # receives to start the second half.
+            state.home_timeouts = settings["timeouts_per_half"]
+            state.away_timeouts = settings["timeouts_per_half"]
+            state.last_pos_team = None
+            self.set_kickoff(other_team(state.opening_receiver))
+        elif state.quarter_num > self.quarters:
+            if state.home_score != state.away_score or self.ot_rule is None:
+                state.quarter_num = self.quarters
+                state.quarter_time_left = 0
+                state.is_game_over = True
+                return
+            self.start_ot_period()
+
+    def start_ot_period(self) -> None:
+        """
+        Starts the next OT period, or ends the game in a tie
+        if every OT period allowed by `"ot_periods"` has been played.
+        """
+        state = self.state
+        settings = self.settings
+        ot_periods = settings["ot_periods"]
+
+        if ot_periods != -1 and state.ot_period >= ot_periods and \
+                self.ot_rule not in ("kansas_ot", "ncaa_ot", "xfl_ot_rule"):
+            state.is_game_over = True
+            return
+
+        state.ot_period += 1
+        state.quarter_num = self.quarters + state.ot_period
+        state.quarter_time_left = settings["ot_period_seconds"]
+        state.ot_possessions = 0
+        state.last_pos_team = None
+
+        winner = self.coin_flip.get("ot_coin_flip_winner", "home")
+        if self.coin_flip.get("ot_decision") == "receive":
+            first_team = winner
+        else:
+            first_team = other_team(winner)
+        if state.ot_period % 2 == 0:
+            # Teams alternate who goes first in each OT period.
+            first_team = other_team(first_team)
+        state.ot_first_team = first_team
+
+        if self.is_shootout() is True:
+            self.set_shootout_attempt(first_team)
+        elif self.ot_rule in ("kansas_ot", "ncaa_ot"):
+            self.start_possession(first_team, settings["kansas_ot_yardline"])
+        else:
+            self.set_kickoff(first_team)
+
+    def set_shootout_attempt(self, team: str) -> None:
+        """
+        Sets up a two point conversion attempt for `team`,
+        in an OT period that is a two point conversion contest.
+        """
+        self.set_conversion(team)
+        self.state.yardline = self.settings["2PC_yardline"]
+        self.state.distance = self.state.yardline
+
+    def is_shootout(self) -> bool:
+        """
+        Returns `True` if the current OT period is a
+        two point conversion contest.
+        """
+        if self.ot_rule == "xfl_ot_rule":
+            return True
+        elif self.ot_rule == "ncaa_ot":
+            until = self.settings["ot_periods_until_shootout"]
+            return until != -1 and self.state.ot_period > until
+        return False
+
+    def check_ot(
+        self,
+        play_dict: dict,
+        pos_team: str,
+        pos_points: int,
+        def_points: int
+    ) -> None:
+        """
+        Ends the game, or sets up the next OT possession,
+        based on the OT rule set for this game.
+
+        Parameters
+        ----------
+        `play_dict` (dict, mandatory):
+            The play that was just applied.
+
+        `pos_team` (str, mandatory):
+            The team that had the ball when the play started.
+
+        `pos_points` (int, mandatory):
+            Points scored by `pos_team` in this play.
+
+        `def_points` (int, mandatory):
+            Points scored by the other team in this play.
+        """
+        state = self.state
+        settings = self.settings
+        ot_rule = self.ot_rule
+        is_conversion = play_dict.get("play_type") in CONVERSION_PLAY_TYPES
+        tied = state.home_score == state.away_score
+        is_shootout = self.is_shootout()
+
+        # A possession ends when the other team gets the ball,
+        # or when the try after a touchdown is over.
+        possessions_before = state.ot_possessions
+        if is_conversion is True or \
+                state.next_play != NEXT_CONVERSION and \
+                state.pos_team != pos_team:
+            state.ot_possessions += 1
+        possession_ended = state.ot_possessions > possessions_before
+
+        if ot_rule == "full_period_ot":
+            return
+        elif def_points > 0 and is_conversion is False:
+            # A score by the defense always ends the game.
+            state.is_game_over = tied is False
+        elif ot_rule == "sudden_death_ot":
+            state.is_game_over = pos_points > 0 and tied is False
+        elif ot_rule == "modified_sudden_death_ot":
+            if possessions_before == 0 and \
+                    play_dict.get("is_touchdown") is True and pos_points > 0:
+                state.is_game_over = True
+            elif possessions_before >= 1 and pos_points > 0:
+                state.is_game_over = tied is False
+            elif possession_ended is True and state.ot_possessions >= 2:
+                state.is_game_over = tied is False
+        elif ot_rule == "super_modified_sudden_death_ot":
+            if possessions_before >= 2 and pos_points > 0:
+                state.is_game_over = tied is False
+            elif possession_ended is True and state.ot_possessions >= 2:
+                state.is_game_over = tied is False
+        elif possessions_before == 1 and is_shootout is False and \
+                pos_points > 0 and self.get_score(pos_team) > \
+                self.get_score(other_team(pos_team)):
+            # The second team in a Kansas/NCAA OT period
+            # doesn't need to finish a possession that already won the game.
+            state.is_game_over = True
+        elif possession_ended is False:
+            return
+        elif state.ot_possessions == 1:
+            second_team = other_team(state.ot_first_team)
+            if is_shootout is True:
+                self.set_shootout_attempt(second_team)
+            else:
+                self.start_possession(
+                    second_team, settings["kansas_ot_yardline"]
+                )
+            state.last_pos_team = None
+        else:
+            min_periods = 1
+            if ot_rule == "xfl_ot_rule":
+                min_periods = max(settings["min_xfl_ot_periods"], 1)
+
+            if tied is False and state.ot_period >= min_periods:
+                state.is_game_over = True
+            else:
+                self.start_ot_period()
+
+
+def set_fields(play_dict: dict, **fields) -> None:
+    """
+    Sets every field in `fields` that is already in `play_dict`,
+    so that a play never gains fields that its template doesn't have.
+    """
+    for key, value in fields.items():
+        if key in play_dict:
+            play_dict[key] = value
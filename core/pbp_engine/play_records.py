@@ -0,0 +1,692 @@
+"""
+- Creation Date: 10/18/2026 05:10 PM EDT
+- Last Updated: 10/18/2026 10:25 PM EDT
+- Authors: Joseph Armstrong (armstrongjoseph08@gmail.com)
+- file: `./core/pbp_engine/play_records.py`
+- Purpose: Compact, typed records for plays, as an alternative to the
+    dictionaries created by `core.pbp_engine.plays.Plays()`.
+    Every record can be converted back into the exact same dictionary
+    (and JSON) that it was created from.
+###############################################################################
+"""
+from dataclasses import dataclass, fields
+from enum import Enum, IntEnum
+
+from core.pbp_engine import game_codec
+from core.pbp_engine.plays import Plays
+
+
+class PlayType(str, Enum):
+    """
+    Every valid value for `"play_type"` in a play.
+    """
+    PASS = "pass"
+    RUSH = "rush"
+    PUNT = "punt"
+    FIELD_GOAL = "field_goal"
+    # Kicking an XP after a TD.
+    XP = "xp"
+    # Anything that isn't an XP after a TD.
+    CONVERSION_ATTEMPT = "conversion_attempt"
+    KICKOFF = "kickoff"
+    SAFETY_KICKOFF = "safety_kickoff"
+    FAIR_CATCH_KICK = "fair_catch_kick"
+
+
+class Hash(str, Enum):
+    """
+    Every valid value for `"starting_hash"` in a play.
+    """
+    LEFT = "L"
+    MIDDLE = "M"
+    RIGHT = "R"
+
+
+class QbLocation(str, Enum):
+    """
+    Every valid value for `"qb_location"` in a play.
+    """
+    UNDER_CENTER = "U"
+    SHOTGUN = "S"
+    PISTOL = "P"
+    HOLDER = "H"
+    KICKER = "K"
+
+
+class Half(IntEnum):
+    """
+    Every valid value for `"half_num"` in a play.
+    """
+    NOT_SET = 0
+    FIRST_HALF = 1
+    SECOND_HALF = 2
+    OT = 3
+
+
+# The function in `Plays()` that creates a new play of each type.
+PLAY_TEMPLATES = {
+    PlayType.PASS: Plays.pass_play,
+    PlayType.RUSH: Plays.rush_play,
+    PlayType.PUNT: Plays.punt_play,
+    PlayType.FIELD_GOAL: Plays.field_goal_play,
+    PlayType.XP: Plays.extra_point_play,
+    PlayType.CONVERSION_ATTEMPT: Plays.conversion_attempt_play,
+    PlayType.KICKOFF: Plays.kickoff_play,
+    PlayType.SAFETY_KICKOFF: lambda: Plays.kickoff_play(
+        is_safety_kickoff=True
+    ),
+    PlayType.FAIR_CATCH_KICK: Plays.fair_catch_kick_play,
+}
+
+# Stands in for an empty player dictionary (`{}`), such as `"receiver"`
+# in a pass play that hasn't been completed.
+EMPTY_PLAYER = None
+
+
+def to_enum(enum_class: Enum, value):
+    """
+    Converts `value` into a member of `enum_class`,
+    or returns `value` as-is if it isn't a valid value for that enum.
+    """
+    if isinstance(value, enum_class):
+        return value
+    # `True == 1`, so `Half(True)` would otherwise become `Half.FIRST_HALF`.
+    elif isinstance(value, bool) or value is None:
+        return value
+
+    try:
+        return enum_class(value)
+    except ValueError:
+        return value
+
+
+def from_enum(value):
+    """
+    Converts an enum member back into its value.
+    """
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+class RecordMixin:
+    """
+    Shared code for converting a record to, and from, a dictionary.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def field_names(cls) -> tuple:
+        """
+        Returns the name of every field in this record, in order.
+        """
+        names = cls.__dict__.get("_field_names")
+        if names is None:
+            names = tuple(x.name for x in fields(cls))
+            setattr(cls, "_field_names", names)
+        return names
+
+    @classmethod
+    def from_value(cls, value):
+        """
+        Converts a dictionary into this record,
+        if that dictionary has exactly the fields in this record.
+        Anything else is returned as-is.
+        """
+        if isinstance(value, dict) and \
+                len(value) == len(cls.field_names()) and \
+                all(x in value for x in cls.field_names()):
+            return cls(**value)
+        return value
+
+    def to_dict(self) -> dict:
+        """
+        Returns this record as a dictionary.
+        """
+        return {x: getattr(self, x) for x in self.field_names()}
+
+
+@dataclass(slots=True)
+class PlayerRecord(RecordMixin):
+    """
+    A player within a play (such as `"passer"`, or `"rusher"`).
+    """
+    player_id: int = None
+    team_id: int = None
+    player_num: int = None
+    player_full_name: str = None
+    player_football_name: str = None
+
+
+@dataclass(slots=True)
+class ParticipantRecord(RecordMixin):
+    """
+    A player in `"participating_players"`.
+    """
+    player_id: int = None
+    team_id: int = None
+    player_num: int = None
+    player_full_name: str = None
+    player_football_name: str = None
+    # Player position for this play.
+    # So if a player has a roster position of "OT",
+    # and he's playing LT, this is set to "LT".
+    player_position: str = None
+
+
+@dataclass(slots=True)
+class InjuredPlayerRecord(RecordMixin):
+    """
+    A player in `"injured_players"`.
+    """
+    player_id: int = None
+    team_id: int = None
+    player_num: int = None
+    player_full_name: str = None
+    player_football_name: str = None
+    type_of_injury: str = None
+
+
+@dataclass(slots=True)
+class TacklerRecord(RecordMixin):
+    """
+    A player in `"tacklers"`.
+    """
+    player_id: int = None
+    team_id: int = None
+    player_num: int = None
+    player_full_name: str = None
+    player_football_name: str = None
+    is_tfl: bool = False
+    is_sack: bool = False
+    is_sack_fumble: bool = False
+
+
+@dataclass(slots=True)
+class ForcedFumbleRecord(RecordMixin):
+    """
+    A player in `"forced_fumbles"`.
+    """
+    forced_fumble_num: int = 0
+    player_id: int = None
+    team_id: int = None
+    player_num: int = None
+    player_full_name: str = None
+    player_football_name: str = None
+    fumble_forced_at: int = None
+
+
+@dataclass(slots=True)
+class FumbleRecoveryRecord(RecordMixin):
+    """
+    A player in `"fumble_recoveries"`.
+    """
+    fumble_recovery_num: int = 0
+    player_id: int = None
+    team_id: int = None
+    player_num: int = None
+    player_full_name: str = None
+    player_football_name: str = None
+    is_defensive_fumble_recovery: bool = False
+    fumble_recovered_at: int = None
+    returned_to: int = None
+    return_yards: int = 0
+    player_fumbled: bool = False
+    player_lost_fumble: bool = False
+    player_lateraled: bool = False
+    scored_touchdown: bool = False
+
+
+@dataclass(slots=True)
+class PenaltyRecord(RecordMixin):
+    """
+    A penalty in `"penalties"`.
+    """
+    # Auto increments by 1 during the game.
+    penalty_num: int = 0
+    # ID for penalties will follow this guide (p 226-229)
+    # http://www.myiafoa.org/mechanics/mofo19/mofo.pdf
+    penalty_id: str = None
+    penalty_name: str = None
+    is_offensive_penalty: bool = False
+    is_penalty_accepted: bool = False
+    is_personal_foul: bool = False
+    is_player_ejected: bool = False
+    is_team_penalty: bool = False
+    player: PlayerRecord = None
+
+    @classmethod
+    def from_value(cls, value):
+        """
+        Converts a penalty dictionary into a `PenaltyRecord()`.
+        """
+        record = super(PenaltyRecord, cls).from_value(value)
+        if isinstance(record, PenaltyRecord):
+            record.player = PlayerRecord.from_value(record.player)
+        return record
+
+    def to_dict(self) -> dict:
+        """
+        Returns this penalty as a dictionary.
+        """
+        penalty_dict = {x: getattr(self, x) for x in self.field_names()}
+        if isinstance(self.player, PlayerRecord):
+            penalty_dict["player"] = self.player.to_dict()
+        return penalty_dict
+
+
+# Keys in a play that hold a single player.
+PLAYER_FIELDS = (
+    "passer",
+    "receiver",
+    "rusher",
+    "punter",
+    "returner",
+    "blocker",
+    "kicker",
+    "own_kickoff_recovery_player",
+)
+
+# Keys in a play that hold a list, and the record used for each item.
+LIST_FIELDS = {
+    "penalties": PenaltyRecord,
+    "injured_players": InjuredPlayerRecord,
+    "tacklers": TacklerRecord,
+    "forced_fumbles": ForcedFumbleRecord,
+    "fumble_recoveries": FumbleRecoveryRecord,
+    "participating_players": ParticipantRecord,
+}
+
+# Keys in a play that are stored as an enum.
+ENUM_FIELDS = {
+    "play_type": PlayType,
+    "starting_hash": Hash,
+    "qb_location": QbLocation,
+    "half_num": Half,
+}
+
+# How each field in a `PlayRecord()` is converted to/from a play.
+FIELD_VALUE = 0
+FIELD_ENUM = 1
+FIELD_PLAYER = 2
+FIELD_LIST = 3
+
+# The keys in every play created from the same template are the same,
+# so every record shares one tuple of keys per template.
+_play_keys_cache = {}
+
+
+def get_shared_keys(keys: tuple) -> tuple:
+    """
+    Returns a shared copy of a tuple of keys.
+    """
+    return _play_keys_cache.setdefault(keys, keys)
+
+
+@dataclass(slots=True)
+class PlayRecord(RecordMixin):
+    """
+    The fields shared by every type of play.
+
+    A record only holds the fields used by its type of play,
+    so use `PlayRecord.from_dict()` or `PlayRecord.new()`,
+    which pick the right record for each play type.
+    """
+    play_desc: str = None
+    play_type: PlayType = None
+    # In seconds, the time left in this quarter/half/game.
+    quarter_time_left: int = None
+    half_time_left: int = None
+    game_time_left: int = None
+    home_score: int = None
+    away_score: int = None
+    home_score_post: int = None
+    away_score_post: int = None
+    posteam_score: int = None
+    defteam_score: int = None
+    posteam_post: int = None
+    defteam_post: int = None
+    pos_team: str = None
+    def_team: str = None
+    drive_num: int = 0
+    half_num: Half = Half.NOT_SET
+    quarter_num: int = 0
+    is_scoring_play: bool = False
+    is_safety: bool = False
+    yardline_start: int = None
+    yardline_end: int = None
+    starting_hash: Hash = Hash.MIDDLE
+    n_offense_backfield: int = 0
+    is_no_huddle: bool = False
+    is_motion: bool = False
+    is_trick_play: bool = False
+    is_touchdown: bool = False
+    is_turnover: bool = False
+    is_double_turnover: bool = False
+    is_bad_snap: bool = False
+    is_assisted_tackle: bool = False
+    penalties: tuple = ()
+    injured_players: tuple = ()
+    tacklers: tuple = ()
+    forced_fumbles: tuple = ()
+    fumble_recoveries: tuple = ()
+    participating_players: tuple = ()
+    # The keys in this play, in order.
+    play_keys: tuple = ()
+    # Any keys in this play that aren't a field in this record.
+    extra_fields: dict = None
+
+    @staticmethod
+    def new(play_type: PlayType) -> "PlayRecord":
+        """
+        Creates a new play from the template in `Plays()`
+        for a given play type.
+        """
+        return PlayRecord.from_dict(PLAY_TEMPLATES[PlayType(play_type)]())
+
+    @staticmethod
+    def from_dict(play_dict: dict) -> "PlayRecord":
+        """
+        Converts a play (see `core.pbp_engine.plays.Plays()`)
+        into the record for that type of play.
+        """
+        record_class = PLAY_RECORDS.get(
+            to_enum(PlayType, play_dict.get("play_type")), PlayRecord
+        )
+        field_kinds = record_class.field_kinds()
+        record = record_class()
+        extra_fields = None
+
+        for key, value in play_dict.items():
+            kind = field_kinds.get(key)
+            if kind is None:
+                extra_fields = extra_fields or {}
+                extra_fields[key] = value
+                continue
+            elif kind == FIELD_ENUM:
+                value = to_enum(ENUM_FIELDS[key], value)
+            elif kind == FIELD_PLAYER:
+                if isinstance(value, dict) and len(value) == 0:
+                    value = EMPTY_PLAYER
+                elif value is None:
+                    # A player that was set to `None`, rather than `{}`.
+                    extra_fields = extra_fields or {}
+                    extra_fields[key] = value
+                    continue
+                else:
+                    value = PlayerRecord.from_value(value)
+            elif kind == FIELD_LIST:
+                if isinstance(value, list) is False:
+                    extra_fields = extra_fields or {}
+                    extra_fields[key] = value
+                    continue
+                elif len(value) == 0:
+                    value = ()
+                else:
+                    value = tuple(
+                        LIST_FIELDS[key].from_value(x) for x in value
+                    )
+
+            setattr(record, key, value)
+
+        record.play_keys = get_shared_keys(tuple(play_dict))
+        record.extra_fields = extra_fields
+        return record
+
+    @staticmethod
+    def from_json(play_json: str) -> "PlayRecord":
+        """
+        Converts a play, stored as a JSON string,
+        into the record for that type of play.
+        """
+        return PlayRecord.from_dict(game_codec.from_json(play_json))
+
+    @classmethod
+    def field_kinds(cls) -> dict:
+        """
+        Returns a dictionary where each key is a field in this record
+        that holds part of a play, and each value is how that field
+        is converted (`FIELD_VALUE`, `FIELD_ENUM`, `FIELD_PLAYER`,
+        or `FIELD_LIST`).
+        """
+        kinds_dict = cls.__dict__.get("_field_kinds")
+        if kinds_dict is None:
+            kinds_dict = {}
+            for name in cls.field_names():
+                if name in ("play_keys", "extra_fields"):
+                    continue
+                elif name in ENUM_FIELDS:
+                    kinds_dict[name] = FIELD_ENUM
+                elif name in PLAYER_FIELDS:
+                    kinds_dict[name] = FIELD_PLAYER
+                elif name in LIST_FIELDS:
+                    kinds_dict[name] = FIELD_LIST
+                else:
+                    kinds_dict[name] = FIELD_VALUE
+            setattr(cls, "_field_kinds", kinds_dict)
+        return kinds_dict
+
+    def to_dict(self) -> dict:
+        """
+        Returns this play as a dictionary,
+        exactly as it was before it was converted into a record.
+        """
+        play_dict = {}
+        extra_fields = self.extra_fields or {}
+
+        field_kinds = self.field_kinds()
+
+        for key in self.play_keys or field_kinds:
+            if key in extra_fields:
+                play_dict[key] = extra_fields[key]
+                continue
+
+            value = getattr(self, key)
+            kind = field_kinds[key]
+            if kind == FIELD_ENUM:
+                value = from_enum(value)
+            elif kind == FIELD_PLAYER:
+                if value is EMPTY_PLAYER:
+                    value = {}
+                elif isinstance(value, PlayerRecord):
+                    value = value.to_dict()
+            elif kind == FIELD_LIST:
+                value = [
+                    x.to_dict() if isinstance(x, RecordMixin) else x
+                    for x in value
+                ]
+            play_dict[key] = value
+
+        return play_dict
+
+    def to_json(self) -> str:
+        """
+        Returns this play as a JSON string.
+        """
+        return game_codec.to_json(self.to_dict())
+
+
+@dataclass(slots=True)
+class ScrimmagePlayRecord(PlayRecord):
+    """
+    The fields shared by every play that starts from scrimmage
+    with a down and distance.
+    """
+    down: int = 0
+    distance: int = 0
+    is_goal_to_go: bool = False
+    is_first_down: bool = False
+    is_first_down_penalty: bool = False
+    is_third_down: bool = False
+    is_third_down_converted: bool = False
+    is_fourth_down: bool = False
+    is_fourth_down_converted: bool = False
+    is_touchback: bool = False
+    qb_location: QbLocation = None
+    is_no_play: bool = False
+
+
+@dataclass(slots=True)
+class PassPlayRecord(ScrimmagePlayRecord):
+    """
+    A passing play (see `Plays.pass_play()`).
+    """
+    # will be formatted as "Q1 15:00"
+    quarter_time_left_str: str = None
+    pass_attempted_at_yardline: int = None
+    pass_caught_at_yardline: int = None
+    first_contact_yardline: int = None
+    passer: PlayerRecord = EMPTY_PLAYER
+    is_completed_pass: bool = False
+    is_spiked_pass: bool = False
+    is_deflected_pass: bool = False
+    is_intercepted: bool = False
+    is_play_action: bool = False
+    is_screen_pass: bool = False
+    is_rpo: bool = False
+    is_qb_out_of_pocket: bool = False
+    is_interception_worthy: bool = False
+    is_throw_away: bool = False
+    is_catchable_ball: bool = False
+    is_contested_ball: bool = False
+    is_created_reception: bool = False
+    is_drop: bool = False
+    is_sack_play: bool = False
+    receiver: PlayerRecord = EMPTY_PLAYER
+    is_qb_fumble: bool = False
+    is_receiver_fumble: bool = False
+
+
+@dataclass(slots=True)
+class RushPlayRecord(ScrimmagePlayRecord):
+    """
+    A rushing play (see `Plays.rush_play()`).
+    """
+    rusher: PlayerRecord = EMPTY_PLAYER
+    first_contact_yardline: int = 0
+    run_location: str = None
+    run_gap: str = None
+    is_rpo: bool = False
+    is_read_option: bool = False
+    is_fumble: bool = False
+    is_qb_kneel: bool = False
+
+
+@dataclass(slots=True)
+class KickPlayRecord(ScrimmagePlayRecord):
+    """
+    A punt, field goal, or fair catch kick (see `Plays.punt_play()`,
+    `Plays.field_goal_play()`, and `Plays.fair_catch_kick_play()`).
+    """
+    punter: PlayerRecord = EMPTY_PLAYER
+    kicker: PlayerRecord = EMPTY_PLAYER
+    is_returned: bool = False
+    is_blocked: bool = False
+    is_rouge: bool = False
+    fg_attempt_distance: int = 0
+    is_fg_made: bool = False
+    missed_fg_reason: str = None
+    missed_xp_reason: str = None
+    is_defensive_2pc: bool = None
+    returner: PlayerRecord = EMPTY_PLAYER
+    is_fumble: bool = False
+    blocker: PlayerRecord = EMPTY_PLAYER
+
+
+@dataclass(slots=True)
+class ExtraPointPlayRecord(PlayRecord):
+    """
+    A kicked extra point (see `Plays.extra_point_play()`).
+    """
+    qb_location: QbLocation = QbLocation.HOLDER
+    is_no_play: bool = False
+    kicker: PlayerRecord = EMPTY_PLAYER
+    is_returned: bool = False
+    is_rouge: bool = False
+    is_punt_in_20: bool = False
+    fg_attempt_distance: int = 0
+    is_fg_made: bool = False
+    missed_fg_reason: str = None
+    returner: PlayerRecord = EMPTY_PLAYER
+    is_fumble: bool = False
+    blocker: PlayerRecord = EMPTY_PLAYER
+
+
+@dataclass(slots=True)
+class ConversionPlayRecord(PlayRecord):
+    """
+    Any conversion attempt that isn't a kicked extra point
+    (see `Plays.conversion_attempt_play()`).
+    """
+    quarter_time_left_str: str = None
+    down: int = 0
+    distance: int = 0
+    is_goal_to_go: bool = False
+    is_1pt_conversion: bool = False
+    is_1pt_successful_conversion: bool = False
+    is_2pt_conversion: bool = False
+    is_2pt_successful_conversion: bool = False
+    is_3pt_conversion: bool = False
+    is_3pt_successful_conversion: bool = False
+    is_touchback: bool = False
+    qb_location: QbLocation = None
+    is_no_play: bool = False
+    conversion_play_type: str = None
+    pass_attempted_at_yardline: int = None
+    pass_caught_at_yardline: int = None
+    first_contact_yardline: int = None
+    passer: PlayerRecord = EMPTY_PLAYER
+    is_completed_pass: bool = False
+    is_spiked_pass: bool = False
+    is_deflected_pass: bool = False
+    is_intercepted: bool = False
+    is_play_action: bool = False
+    is_screen_pass: bool = False
+    is_rpo: bool = False
+    is_qb_out_of_pocket: bool = False
+    is_interception_worthy: bool = False
+    is_throw_away: bool = False
+    is_catchable_ball: bool = False
+    is_contested_ball: bool = False
+    is_created_reception: bool = False
+    is_drop: bool = False
+    is_sack_play: bool = False
+    receiver: PlayerRecord = EMPTY_PLAYER
+    is_qb_fumble: bool = False
+    rusher: PlayerRecord = EMPTY_PLAYER
+    is_receiver_fumble: bool = False
+
+
+@dataclass(slots=True)
+class KickoffPlayRecord(PlayRecord):
+    """
+    A kickoff, or a safety kickoff (see `Plays.kickoff_play()`).
+    """
+    is_safety_kickoff: bool = False
+    is_touchback: bool = False
+    qb_location: QbLocation = QbLocation.KICKER
+    is_no_play: bool = False
+    kicker: PlayerRecord = EMPTY_PLAYER
+    is_returned: bool = False
+    is_rouge: bool = False
+    kickoff_yardline: int = 0
+    is_fg_made: bool = False
+    missed_fg_reason: str = None
+    returner: PlayerRecord = EMPTY_PLAYER
+    is_fumble: bool = False
+    is_own_kickoff_recovery: bool = False
+    own_kickoff_recovery_player: PlayerRecord = EMPTY_PLAYER
+
+
+# The record used for each type of play.
+PLAY_RECORDS = {
+    PlayType.PASS: PassPlayRecord,
+    PlayType.RUSH: RushPlayRecord,
+    PlayType.PUNT: KickPlayRecord,
+    PlayType.FIELD_GOAL: KickPlayRecord,
+    PlayType.XP: ExtraPointPlayRecord,
+    PlayType.CONVERSION_ATTEMPT: ConversionPlayRecord,
+    PlayType.KICKOFF: KickoffPlayRecord,
+    PlayType.SAFETY_KICKOFF: KickoffPlayRecord,
+    PlayType.FAIR_CATCH_KICK: KickPlayRecord,
+}
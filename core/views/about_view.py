@@ -1,14 +1,15 @@
 """
 - Creation Date: 03/10/2024 4:40 PM EST
-- Last Updated: 05/29/2024 01:15 AM EDT
+- Last Updated: 10/19/2026 12:45 AM EDT
 - Authors: Joseph Armstrong (armstrongjoseph08@gmail.com)
 - file: `./core/settings/about_view.py`
 - Purpose: About page for this application.
 """
 
-import PySimpleGUI as sg
+import FreeSimpleGUI as sg
 
 from core.other.embedded import EmbeddedElements
+from core.other.event_dispatcher import EventDispatcher
 
 
 def about_view():
@@ -58,11 +59,10 @@ def about_view():
     window = sg.Window(
         "About", layout=layout, size=(600, 480), resizable=False, finalize=True
     )
+    dispatcher = EventDispatcher(window)
     keep_open = True
     while keep_open:
-        event, values = window.read(timeout=1000)
-        # print(values)
-        print(event)
+        event, values = dispatcher.read()
 
         if event == sg.WIN_CLOSED or event == "Quit":
             break
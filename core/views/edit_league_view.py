@@ -1,6 +1,6 @@
 """
 - Creation Date: 03/10/2024 04:35 PM EDT
-- Last Updated: 06/04/2024 01:15 PM EDT
+- Last Updated: 10/19/2026 04:35 AM EDT
 - Authors: Joseph Armstrong (armstrongjoseph08@gmail.com)
 - file: `./core/views/edit_league_view.py`
 - Purpose: Code behind for the window
@@ -18,6 +18,7 @@ import polars as pl
 from core.database.load_db_elements import SqliteLoadData
 from core.database.sqlite3_connectors import initialize_sqlite3_connectors
 from core.other.embedded import EmbeddedElements, LettersAndNumbers
+from core.other.event_dispatcher import EventDispatcher
 
 
 class LeagueView:
@@ -298,10 +299,10 @@ class LeagueView:
 
         """
         self.lg_df = SqliteLoadData.load_leagues(
-            con=self.sqlite3_con, cur=self.sqlite3_cur
+            con=self.sqlite3_con,
+            cur=self.sqlite3_cur,
+            league_id=self.league_id
         )
-        # print(self.lg_df)
-        self.lg_df = self.lg_df.filter(pl.col("league_id") == self.league_id)
 
         # The following line is not run because we already know
         # what the `league_id` is.
@@ -1016,12 +1017,11 @@ class LeagueView:
             self.special_onside_play_enabled
         )
 
+        dispatcher = EventDispatcher(window)
         keep_open = True
         change_count = 0
         while keep_open is True:
-            event, values = window.read(timeout=1000)
-            print(values)
-            print(event)
+            event, values = dispatcher.read()
 
             if event in (sg.WIN_CLOSED, 'Exit'):
                 keep_open = False
@@ -1077,10 +1077,6 @@ class LeagueView:
                     disabled=True
                 )
 
-            if change_count == 1 and event not in (sg.WIN_CLOSED, 'Exit'):
-                window["-APPLY_BUTTON-"].update(disabled=False)
-            elif change_count == 0 and event not in (sg.WIN_CLOSED, 'Exit'):
-                window["-APPLY_BUTTON-"].update(disabled=True)
             # if event == "-LG_ID-" and len(values["-LG_ID-"]) > 5:
             #     window["-LG_ID-"].update(values["-LG_ID-"][:-1])
             # elif event == "-LG_ID-" and (
@@ -1330,6 +1326,13 @@ class LeagueView:
                 ]
                 change_count += 1
 
+            # Checked after every handler above has updated `change_count`,
+            # so that the first edit enables the "Apply" button right away.
+            if change_count == 1 and event not in (sg.WIN_CLOSED, 'Exit'):
+                window["-APPLY_BUTTON-"].update(disabled=False)
+            elif change_count == 0 and event not in (sg.WIN_CLOSED, 'Exit'):
+                window["-APPLY_BUTTON-"].update(disabled=True)
+
         window.close()
 
 
@@ -1485,12 +1488,10 @@ def new_league_view(settings_json: dict):
         keep_on_top=False
     )
 
+    dispatcher = EventDispatcher(window)
     keep_open = True
     while keep_open is True:
-        event, values = window.read(timeout=1000)
-        print(values)
-        print(event)
-        print(league_id)
+        event, values = dispatcher.read()
 
         # cur.executescript(SqliteSampleFiles.schedule_sql_file())
         # con.commit()
@@ -1,6 +1,6 @@
 """
 - Creation Date: 03/10/2024 4:35 PM EDT
-- Last Updated: 06/04/2024 01:15 AM EDT
+- Last Updated: 10/19/2026 04:05 AM EDT
 - Authors: Joseph Armstrong (armstrongjoseph08@gmail.com)
 - file: `./core/views/new_game_view.py`
 - Purpose: Code behind for the window that adds a game to a schedule.
@@ -13,7 +13,11 @@ import polars as pl
 
 from core.database.load_db_elements import SqliteLoadData
 from core.database.sqlite3_connectors import initialize_sqlite3_connectors
-from core.other.embedded import EmbeddedElements, LettersAndNumbers
+from core.database.worker_db_elements import DataService
+from core.other.embedded import EmbeddedElements
+from core.other.event_dispatcher import EventDispatcher
+from core.other.field_validation import ROSTER_FIELD_RULES, FieldValidator
+from core.other.paged_table import DataFrameSource, PagedTable
 
 
 class RosterView:
@@ -21,19 +25,6 @@ class RosterView:
     Handles logic with editing the rosters of teams.
     """
 
-    letters_all = LettersAndNumbers.letters_all(include_space=True)
-    letters_lower = LettersAndNumbers.letters_lower()
-    letters_upper = LettersAndNumbers.letters_upper()
-    numbers_all = LettersAndNumbers.numbers_all()
-    numbers_with_dashes = LettersAndNumbers.numbers_all(
-        include_dash_and_underscore=True
-    )
-    letters_and_numbers = LettersAndNumbers.letters_and_numbers(
-        include_space=True,
-        include_dash_and_underscore=True
-    )
-    upper_letters_and_numbers = LettersAndNumbers.upper_letters_and_numbers()
-
     player_jersey_numbers_arr = [x for x in range(0, 100)]
     player_positions = [
         "QB",
@@ -108,6 +99,18 @@ class RosterView:
 
     roster_df = pl.DataFrame()
     show_roster_df = pl.DataFrame()
+    # Only the rows on the current page of the roster table
+    # are converted from `show_roster_df`, and rendered
+    # (see `core.other.paged_table.PagedTable()`).
+    roster_table = None
+
+    # Checks what's typed into the weight, experience, and player ID fields
+    # (see `core.other.field_validation.FieldValidator()`).
+    field_validator = None
+
+    # Loads rosters and deletes players in the background
+    # (see `core.database.worker_db_elements.DataService()`).
+    data_service = None
 
     show_height = ""
     show_height_arr = [
@@ -227,11 +230,10 @@ class RosterView:
     def initial_data_load(self):
         """ """
         self.team_df = SqliteLoadData.load_fb_teams(
-            con=self.sqlite3_con, cur=self.sqlite3_cur
-        )
-        self.team_df = self.team_df.filter(
-            (pl.col("league_id") == self.league_id) &
-            (pl.col("season") == self.season)
+            con=self.sqlite3_con,
+            cur=self.sqlite3_cur,
+            league_id=self.league_id,
+            season=self.season
         )
 
         self.team_ids_arr = self.team_df["team_id"].to_list()
@@ -244,15 +246,24 @@ class RosterView:
 
         # print(self.season_df)
 
-    def refresh_show_roster(self, team_id: str) -> None:
-        self.roster_df = SqliteLoadData.load_fb_rosters(
-            con=self.sqlite3_con, cur=self.sqlite3_cur
-        )
-        self.show_roster_df = self.roster_df
-        self.show_roster_df = self.show_roster_df.filter(
-            (pl.col("team_id") == team_id)
+    def load_roster(self, con, team_id: str) -> tuple:
+        """
+        Loads the roster of a team, and the columns of that roster
+        shown in the roster table.
+        Can be run in the background (see `DataService()`).
+
+        Returns
+        ----------
+        A tuple of `(roster_df, show_roster_df)`.
+        """
+        roster_df = SqliteLoadData.load_fb_rosters(
+            con=con,
+            cur=con.cursor(),
+            league_id=self.league_id,
+            season=self.season,
+            team_id=team_id
         )
-        self.show_roster_df = self.show_roster_df[
+        show_roster_df = roster_df[
             [
                 "team_id",
                 "player_id",
@@ -262,11 +273,37 @@ class RosterView:
                 "player_first_name",
                 "player_last_name",
             ]
-        ]
-        self.show_roster_df = self.show_roster_df.sort(
+        ].sort(
             "team_id",
             "jersey_number",
         )
+        return roster_df, show_roster_df
+
+    def refresh_show_roster(self, team_id: str) -> None:
+        self.roster_df, self.show_roster_df = self.load_roster(
+            self.sqlite3_con, team_id
+        )
+
+    def remove_player(self, con, player_id: int) -> None:
+        """
+        Deletes a player from `fb_rosters`.
+        Can be run in the background (see `DataService()`).
+        """
+        sql_script = """
+        DELETE FROM fb_rosters
+        WHERE player_id = ?
+        """
+        con.execute(
+            sql_script,
+            (player_id,)
+        )
+
+    def store_player(self, con, sql_script: str, params_arr: list) -> None:
+        """
+        Inserts or updates a player in `fb_rosters`.
+        Can be run in the background (see `DataService()`).
+        """
+        con.executemany(sql_script, params_arr)
 
     def validate_player_input(self) -> bool:
         """ """
@@ -393,15 +430,11 @@ class RosterView:
             title="CAUTION: Player Deletion"
         )
         if check == "Yes":
-            sql_script = """
-            DELETE FROM fb_rosters
-            WHERE player_id = ?
-            """
-            self.sqlite3_cur.execute(
-                sql_script,
-                (self.player_id,)
+            # The roster is reloaded once this player has been deleted
+            # (see the `"-PLAYER_DELETED-"` event).
+            self.data_service.write(
+                "-PLAYER_DELETED-", self.remove_player, self.player_id
             )
-            self.sqlite3_con.commit()
             return True
         elif check == "No":
             return False
@@ -498,7 +531,13 @@ class RosterView:
                 ?
             )
             """
-            self.sqlite3_cur.executemany(
+            # Every write goes through the `DataService()` of this window,
+            # so the writer connection is never used by two threads at once.
+            # The roster is reloaded once this player has been saved
+            # (see the `"-PLAYER_SAVED-"` event).
+            self.data_service.write(
+                "-PLAYER_SAVED-",
+                self.store_player,
                 sql_script,
                 [(
                     self.season,
@@ -542,7 +581,6 @@ class RosterView:
                     self.status_description_abbr,
                 )]
             )
-            self.sqlite3_con.commit()
 
         elif self.player_id > 0:
             sql_script = """
@@ -586,7 +624,9 @@ class RosterView:
             WHERE
                 "player_id" = ?
             """
-            self.sqlite3_cur.executemany(
+            self.data_service.write(
+                "-PLAYER_SAVED-",
+                self.store_player,
                 sql_script,
                 [(
                     self.position,
@@ -627,7 +667,6 @@ class RosterView:
                     self.player_id
                 )]
             )
-            self.sqlite3_con.commit()
 
     def show_height_from_inches(self, ht_in: int) -> str:
         inches = ht_in % 12
@@ -647,7 +686,8 @@ class RosterView:
     def rosters_view(self) -> None:
         """ """
         def select_player(table_loc: int):
-            p_id = self.show_roster_df["player_id"][table_loc]
+            # Column 1 of the roster table is `player_id`.
+            p_id = self.roster_table.get_row(table_loc)[1]
 
             temp_df = self.roster_df.filter(
                 (pl.col("player_id") == p_id)
@@ -805,6 +845,9 @@ class RosterView:
             window["-SAVE_PLAYER-"].update(
                 disabled=False
             )
+            # These fields were filled in without an event,
+            # so the next keystroke is checked against these values.
+            self.field_validator.reset()
 
         def clear_player():
             """ """
@@ -949,6 +992,8 @@ class RosterView:
             window["-ROOKIE_YEAR-"].update(
                 value=self.rookie_year, disabled=True
             )
+            # See `select_player()`.
+            self.field_validator.reset()
 
         def new_player_refresh():
             """ """
@@ -1097,6 +1142,8 @@ class RosterView:
 
             window["-DELETE_PLAYER-"].update(disabled=True)
             window["-SAVE_PLAYER-"].update(disabled=False)
+            # See `select_player()`.
+            self.field_validator.reset()
 
         sg.theme(self.app_theme)
 
@@ -1503,6 +1550,10 @@ class RosterView:
             ]
         ]
 
+        self.roster_table = PagedTable(
+            "-ROSTER_TABLE-", DataFrameSource(self.show_roster_df)
+        )
+
         layout = [
             [
                 sg.Text(
@@ -1528,22 +1579,25 @@ class RosterView:
                     expand_x=True,
                     expand_y=True
                 ),
-                sg.Table(
-                    values=self.show_roster_df.rows(),
-                    headings=[
-                        "Team",
-                        "Player ID",
-                        "Jersey",
-                        "Position",
-                        "Full Name",
-                        "First Name",
-                        "Last Name",
-                    ],
+                sg.Column(
+                    self.roster_table.get_layout(
+                        headings=[
+                            "Team",
+                            "Player ID",
+                            "Jersey",
+                            "Position",
+                            "Full Name",
+                            "First Name",
+                            "Last Name",
+                        ],
+                        expand_x=True,
+                        expand_y=True,
+                        enable_events=True,
+                        justification="center",
+                    ),
                     expand_x=True,
                     expand_y=True,
-                    enable_events=True,
-                    justification="center",
-                    key="-ROSTER_TABLE-",
+                    pad=0,
                 ),
             ],
         ]
@@ -1556,435 +1610,66 @@ class RosterView:
             finalize=True,
             keep_on_top=False,
         )
-
+        self.data_service = DataService(window)
+
+        dispatcher = EventDispatcher(window, self.data_service)
+
+        self.field_validator = FieldValidator(target=self)
+        self.field_validator.add_fields(
+            ROSTER_FIELD_RULES,
+            {
+                "-PLAYER_WEIGHT-": "weight",
+                "-YEARS_EXP-": "years_exp",
+                "-GSIS_PLAYER_ID-": "gsis_id",
+                "-SPORTRADAR_PLAYER_ID-": "sportradar_id",
+                "-SR_PLAYER_ID-": "sr_player_id",
+                "-FOOTBALLDB_PLAYER_ID-": "footballdb_player_id",
+                "-STATS_CREW_PLAYER_ID-": "stats_crew_player_id",
+                "-ARENAFAN_PLAYER_ID-": "arenafan_player_id",
+                "-PFR_PLAYER_ID-": "pfr_id",
+                "-ESPN_PLAYER_ID-": "espn_id",
+                "-NCAA_PLAYER_ID-": "ncaa_player_id",
+                "-YAHOO_PLAYER_ID-": "yahoo_id",
+                "-ROTOWIRE_PLAYER_ID-": "rotowire_id",
+                "-PFF_PLAYER_ID-": "pff_id",
+                "-SLEEPER_PLAYER_ID-": "sleeper_id",
+            }
+        )
         keep_open = True
         while keep_open is True:
-            event, values = window.read(timeout=1000)
-            print(values)
-            print(event)
+            event, values = dispatcher.read()
             # print(self.player_bday)
 
             if event in (sg.WIN_CLOSED, "Exit"):
                 keep_open = False
 
-            # Player Weight
-            if event == "-PLAYER_WEIGHT-" \
-                    and len(values["-PLAYER_WEIGHT-"]) > 3:
-                window["-PLAYER_WEIGHT-"].update(
-                    values["-PLAYER_WEIGHT-"][:-1]
-                )
-            elif event == "-PLAYER_WEIGHT-" and (
-                values["-PLAYER_WEIGHT-"] and
-                values["-PLAYER_WEIGHT-"][-1] not in (
-                    self.numbers_all
-                )
-            ):
-                window["-PLAYER_WEIGHT-"].update(
-                    values["-PLAYER_WEIGHT-"][:-1]
-                )
-                self.weight = values["-PLAYER_WEIGHT-"]
-            elif event == "-PLAYER_WEIGHT-" and (
-                values["-PLAYER_WEIGHT-"] and
-                values["-PLAYER_WEIGHT-"][-1] in (
-                    self.numbers_all
-                )
-            ):
-                window["-PLAYER_WEIGHT-"].update(
-                    values["-PLAYER_WEIGHT-"]
-                )
-                self.weight = values["-PLAYER_WEIGHT-"]
-
-            # Player experience
-            if event == "-YEARS_EXP-" and len(values["-YEARS_EXP-"]) > 2:
-                window["-YEARS_EXP-"].update(
-                    values["-YEARS_EXP-"][:-1]
-                )
-            elif event == "-YEARS_EXP-" and (
-                values["-YEARS_EXP-"] and
-                values["-YEARS_EXP-"][-1] not in (
-                    self.numbers_all
-                )
-            ):
-                window["-YEARS_EXP-"].update(
-                    values["-YEARS_EXP-"][:-1]
-                )
-                self.years_exp = values["-YEARS_EXP-"]
-            elif event == "-YEARS_EXP-" and (
-                values["-YEARS_EXP-"] and
-                values["-YEARS_EXP-"][-1] in (
-                    self.numbers_all
-                )
-            ):
-                window["-YEARS_EXP-"].update(
-                    values["-YEARS_EXP-"]
-                )
-                self.years_exp = values["-YEARS_EXP-"]
-
-            # NFL GSIS Player ID
-            if event == "-GSIS_PLAYER_ID-" \
-                    and len(values["-GSIS_PLAYER_ID-"]) > 10:
-                window["-GSIS_PLAYER_ID-"].update(
-                    values["-GSIS_PLAYER_ID-"][:-1]
-                )
-            elif event == "-GSIS_PLAYER_ID-" and (
-                values["-GSIS_PLAYER_ID-"] and
-                values["-GSIS_PLAYER_ID-"][-1] not in (
-                    self.numbers_with_dashes
-                )
-            ):
-                window["-GSIS_PLAYER_ID-"].update(
-                    values["-GSIS_PLAYER_ID-"][:-1]
-                )
-                self.gsis_id = values["-GSIS_PLAYER_ID-"]
-            elif event == "-GSIS_PLAYER_ID-" and (
-                values["-GSIS_PLAYER_ID-"] and
-                values["-GSIS_PLAYER_ID-"][-1] in (
-                    self.numbers_with_dashes
-                )
-            ):
-                window["-GSIS_PLAYER_ID-"].update(
-                    values["-GSIS_PLAYER_ID-"]
-                )
-                self.gsis_id = values["-GSIS_PLAYER_ID-"]
+            # Checks what was typed into a field with a `FieldRule()`.
+            if self.field_validator.handle_event(window, event, values):
+                continue
 
-            # Sportradar Player ID
-            if event == "-SPORTRADAR_PLAYER_ID-" \
-                    and len(values["-SPORTRADAR_PLAYER_ID-"]) > 36:
-                window["-SPORTRADAR_PLAYER_ID-"].update(
-                    values["-SPORTRADAR_PLAYER_ID-"][:-1]
-                )
-            elif event == "-SPORTRADAR_PLAYER_ID-" and (
-                values["-SPORTRADAR_PLAYER_ID-"] and
-                values["-SPORTRADAR_PLAYER_ID-"][-1] not in (
-                    self.letters_and_numbers
-                )
-            ):
-                window["-SPORTRADAR_PLAYER_ID-"].update(
-                    values["-SPORTRADAR_PLAYER_ID-"][:-1]
-                )
-                self.sportradar_id = values["-SPORTRADAR_PLAYER_ID-"]
-            elif event == "-SPORTRADAR_PLAYER_ID-" and (
-                values["-SPORTRADAR_PLAYER_ID-"] and
-                values["-SPORTRADAR_PLAYER_ID-"][-1] in (
-                    self.letters_and_numbers
-                )
-            ):
-                window["-SPORTRADAR_PLAYER_ID-"].update(
-                    values["-SPORTRADAR_PLAYER_ID-"]
-                )
-                self.sportradar_id = values["-SPORTRADAR_PLAYER_ID-"]
-
-            # Sports Reference Player ID
-            if event == "-SR_PLAYER_ID-" \
-                    and len(values["-SR_PLAYER_ID-"]) > 8:
-                window["-SR_PLAYER_ID-"].update(
-                    values["-SR_PLAYER_ID-"][:-1]
-                )
-            elif event == "-SR_PLAYER_ID-" and (
-                values["-SR_PLAYER_ID-"] and
-                values["-SR_PLAYER_ID-"][-1] not in (
-                    self.letters_and_numbers
-                )
-            ):
-                window["-SR_PLAYER_ID-"].update(
-                    values["-SR_PLAYER_ID-"][:-1]
-                )
-                self.sr_player_id = values["-SR_PLAYER_ID-"]
-            elif event == "-SR_PLAYER_ID-" and (
-                values["-SR_PLAYER_ID-"] and
-                values["-SR_PLAYER_ID-"][-1] in (
-                    self.letters_and_numbers
-                )
-            ):
-                window["-SR_PLAYER_ID-"].update(
-                    values["-SR_PLAYER_ID-"]
-                )
-                self.sr_player_id = values["-SR_PLAYER_ID-"]
-
-            # footballdb.com Player ID
-
-            # This ID system is weird.
-            # Let's handle this when someone saves a Player ID
-            # for this ID system.
-            # if event == "-FOOTBALLDB_PLAYER_ID-" \
-            #         and len(values["-FOOTBALLDB_PLAYER_ID-"]) > 8:
-            #     window["-FOOTBALLDB_PLAYER_ID-"].update(
-            #         values["-FOOTBALLDB_PLAYER_ID-"][:-1]
-            #     )
-            # elif event == "-FOOTBALLDB_PLAYER_ID-" and (
-            if event == "-FOOTBALLDB_PLAYER_ID-" and (
-                values["-FOOTBALLDB_PLAYER_ID-"] and
-                values["-FOOTBALLDB_PLAYER_ID-"][-1] not in (
-                    self.letters_and_numbers
-                )
-            ):
-                window["-FOOTBALLDB_PLAYER_ID-"].update(
-                    values["-FOOTBALLDB_PLAYER_ID-"][:-1]
-                )
-                self.footballdb_player_id = values["-FOOTBALLDB_PLAYER_ID-"]
-            elif event == "-FOOTBALLDB_PLAYER_ID-" and (
-                values["-FOOTBALLDB_PLAYER_ID-"] and
-                values["-FOOTBALLDB_PLAYER_ID-"][-1] in (
-                    self.letters_and_numbers
-                )
-            ):
-                window["-FOOTBALLDB_PLAYER_ID-"].update(
-                    values["-FOOTBALLDB_PLAYER_ID-"]
-                )
-                self.footballdb_player_id = values["-FOOTBALLDB_PLAYER_ID-"]
-
-            # Stats Crew Player ID
-            if event == "-STATS_CREW_PLAYER_ID-" \
-                    and len(values["-STATS_CREW_PLAYER_ID-"]) > 13:
-                # NOTE: We can chop off the "p-" part of the Player ID
-                # at the insert.
-
-                # For now, make sure that a valid PID
-                # is put in for this ID system.
-                window["-STATS_CREW_PLAYER_ID-"].update(
-                    values["-STATS_CREW_PLAYER_ID-"][:-1]
-                )
-            elif event == "-STATS_CREW_PLAYER_ID-" and (
-                values["-STATS_CREW_PLAYER_ID-"] and
-                values["-STATS_CREW_PLAYER_ID-"][-1] not in (
-                    self.letters_and_numbers
-                )
-            ):
-                window["-STATS_CREW_PLAYER_ID-"].update(
-                    values["-STATS_CREW_PLAYER_ID-"][:-1]
-                )
-                self.stats_crew_player_id = values["-STATS_CREW_PLAYER_ID-"]
-            elif event == "-STATS_CREW_PLAYER_ID-" and (
-                values["-STATS_CREW_PLAYER_ID-"] and
-                values["-STATS_CREW_PLAYER_ID-"][-1] in (
-                    self.letters_and_numbers
-                )
-            ):
-                window["-STATS_CREW_PLAYER_ID-"].update(
-                    values["-STATS_CREW_PLAYER_ID-"]
-                )
-                self.stats_crew_player_id = values["-STATS_CREW_PLAYER_ID-"]
-
-            # ArenaFan Player ID
-            if event == "-ARENAFAN_PLAYER_ID-" and (
-                values["-ARENAFAN_PLAYER_ID-"] and
-                values["-ARENAFAN_PLAYER_ID-"][-1] not in (
-                    self.letters_and_numbers
-                )
-            ):
-                window["-ARENAFAN_PLAYER_ID-"].update(
-                    values["-ARENAFAN_PLAYER_ID-"][:-1]
-                )
-                self.arenafan_player_id = values["-ARENAFAN_PLAYER_ID-"]
-            elif event == "-ARENAFAN_PLAYER_ID-" and (
-                values["-ARENAFAN_PLAYER_ID-"] and
-                values["-ARENAFAN_PLAYER_ID-"][-1] in (
-                    self.letters_and_numbers
-                )
-            ):
-                window["-ARENAFAN_PLAYER_ID-"].update(
-                    values["-ARENAFAN_PLAYER_ID-"]
-                )
-                self.arenafan_player_id = values["-ARENAFAN_PLAYER_ID-"]
-
-            # Pro Football Reference Player ID
-            if event == "-PFR_PLAYER_ID-" \
-                    and len(values["-PFR_PLAYER_ID-"]) > 8:
-                window["-PFR_PLAYER_ID-"].update(
-                    values["-PFR_PLAYER_ID-"][:-1]
-                )
-            elif event == "-PFR_PLAYER_ID-" and (
-                values["-PFR_PLAYER_ID-"] and
-                values["-PFR_PLAYER_ID-"][-1] not in (
-                    self.letters_and_numbers
-                )
-            ):
-                window["-PFR_PLAYER_ID-"].update(
-                    values["-PFR_PLAYER_ID-"][:-1]
-                )
-                self.pfr_id = values["-PFR_PLAYER_ID-"]
-            elif event == "-PFR_PLAYER_ID-" and (
-                values["-PFR_PLAYER_ID-"] and
-                values["-PFR_PLAYER_ID-"][-1] in (
-                    self.letters_and_numbers
-                )
-            ):
-                window["-PFR_PLAYER_ID-"].update(
-                    values["-PFR_PLAYER_ID-"]
-                )
-                self.pfr_id = values["-PFR_PLAYER_ID-"]
-
-            # ESPN Player ID
-            if event == "-ESPN_PLAYER_ID-" \
-                    and len(values["-ESPN_PLAYER_ID-"]) > 7:
-                window["-ESPN_PLAYER_ID-"].update(
-                    values["-ESPN_PLAYER_ID-"][:-1]
-                )
-            elif event == "-ESPN_PLAYER_ID-" and (
-                values["-ESPN_PLAYER_ID-"] and
-                values["-ESPN_PLAYER_ID-"][-1] not in (
-                    self.numbers_all
-                )
-            ):
-                window["-ESPN_PLAYER_ID-"].update(
-                    values["-ESPN_PLAYER_ID-"][:-1]
-                )
-                self.espn_id = values["-ESPN_PLAYER_ID-"]
-            elif event == "-ESPN_PLAYER_ID-" and (
-                values["-ESPN_PLAYER_ID-"] and
-                values["-ESPN_PLAYER_ID-"][-1] in (
-                    self.numbers_all
-                )
-            ):
-                window["-ESPN_PLAYER_ID-"].update(
-                    values["-ESPN_PLAYER_ID-"]
-                )
-                self.espn_id = values["-ESPN_PLAYER_ID-"]
-
-            # stats.ncaa.org Player ID
-            if event == "-NCAA_PLAYER_ID-" \
-                    and len(values["-NCAA_PLAYER_ID-"]) > 7:
-                window["-NCAA_PLAYER_ID-"].update(
-                    values["-NCAA_PLAYER_ID-"][:-1]
-                )
-            elif event == "-NCAA_PLAYER_ID-" and (
-                values["-NCAA_PLAYER_ID-"] and
-                values["-NCAA_PLAYER_ID-"][-1] not in (
-                    self.numbers_all
-                )
-            ):
-                window["-NCAA_PLAYER_ID-"].update(
-                    values["-NCAA_PLAYER_ID-"][:-1]
-                )
-                self.ncaa_player_id = values["-NCAA_PLAYER_ID-"]
-            elif event == "-NCAA_PLAYER_ID-" and (
-                values["-NCAA_PLAYER_ID-"] and
-                values["-NCAA_PLAYER_ID-"][-1] in (
-                    self.numbers_all
-                )
-            ):
-                window["-NCAA_PLAYER_ID-"].update(
-                    values["-NCAA_PLAYER_ID-"]
-                )
-                self.ncaa_player_id = values["-NCAA_PLAYER_ID-"]
-
-            # Yahoo Player ID
-            if event == "-YAHOO_PLAYER_ID-" \
-                    and len(values["-YAHOO_PLAYER_ID-"]) > 5:
-                window["-YAHOO_PLAYER_ID-"].update(
-                    values["-YAHOO_PLAYER_ID-"][:-1]
-                )
-            elif event == "-YAHOO_PLAYER_ID-" and (
-                values["-YAHOO_PLAYER_ID-"] and
-                values["-YAHOO_PLAYER_ID-"][-1] not in (
-                    self.numbers_all
-                )
-            ):
-                window["-YAHOO_PLAYER_ID-"].update(
-                    values["-YAHOO_PLAYER_ID-"][:-1]
-                )
-                self.yahoo_id = values["-YAHOO_PLAYER_ID-"]
-            elif event == "-YAHOO_PLAYER_ID-" and (
-                values["-YAHOO_PLAYER_ID-"] and
-                values["-YAHOO_PLAYER_ID-"][-1] in (
-                    self.numbers_all
-                )
-            ):
-                window["-YAHOO_PLAYER_ID-"].update(
-                    values["-YAHOO_PLAYER_ID-"]
-                )
-                self.yahoo_id = values["-YAHOO_PLAYER_ID-"]
-
-            # Rotowire ID
-            if event == "-ROTOWIRE_PLAYER_ID-" \
-                    and len(values["-ROTOWIRE_PLAYER_ID-"]) > 5:
-                window["-ROTOWIRE_PLAYER_ID-"].update(
-                    values["-ROTOWIRE_PLAYER_ID-"][:-1]
-                )
-            elif event == "-ROTOWIRE_PLAYER_ID-" and (
-                values["-ROTOWIRE_PLAYER_ID-"] and
-                values["-ROTOWIRE_PLAYER_ID-"][-1] not in (
-                    self.numbers_all
-                )
-            ):
-                window["-ROTOWIRE_PLAYER_ID-"].update(
-                    values["-ROTOWIRE_PLAYER_ID-"][:-1]
-                )
-                self.rotowire_id = values["-ROTOWIRE_PLAYER_ID-"]
-            elif event == "-ROTOWIRE_PLAYER_ID-" and (
-                values["-ROTOWIRE_PLAYER_ID-"] and
-                values["-ROTOWIRE_PLAYER_ID-"][-1] in (
-                    self.numbers_all
-                )
-            ):
-                window["-ROTOWIRE_PLAYER_ID-"].update(
-                    values["-ROTOWIRE_PLAYER_ID-"]
-                )
-                self.rotowire_id = values["-ROTOWIRE_PLAYER_ID-"]
-
-            # PFF Player ID
-            if event == "-PFF_PLAYER_ID-" \
-                    and len(values["-PFF_PLAYER_ID-"]) > 6:
-                window["-PFF_PLAYER_ID-"].update(
-                    values["-PFF_PLAYER_ID-"][:-1]
-                )
-            elif event == "-PFF_PLAYER_ID-" and (
-                values["-PFF_PLAYER_ID-"] and
-                values["-PFF_PLAYER_ID-"][-1] not in (
-                    self.numbers_all
-                )
-            ):
-                window["-PFF_PLAYER_ID-"].update(
-                    values["-PFF_PLAYER_ID-"][:-1]
-                )
-                self.pff_id = values["-PFF_PLAYER_ID-"]
-            elif event == "-PFF_PLAYER_ID-" and (
-                values["-PFF_PLAYER_ID-"] and
-                values["-PFF_PLAYER_ID-"][-1] in (
-                    self.numbers_all
-                )
-            ):
-                window["-PFF_PLAYER_ID-"].update(
-                    values["-PFF_PLAYER_ID-"]
-                )
-                self.pff_id = values["-PFF_PLAYER_ID-"]
-
-            # sleeper.com Player ID
-            if event == "-SLEEPER_PLAYER_ID-" \
-                    and len(values["-SLEEPER_PLAYER_ID-"]) > 6:
-                window["-SLEEPER_PLAYER_ID-"].update(
-                    values["-SLEEPER_PLAYER_ID-"][:-1]
-                )
-            elif event == "-SLEEPER_PLAYER_ID-" and (
-                values["-SLEEPER_PLAYER_ID-"] and
-                values["-SLEEPER_PLAYER_ID-"][-1] not in (
-                    self.numbers_all
-                )
-            ):
-                window["-SLEEPER_PLAYER_ID-"].update(
-                    values["-SLEEPER_PLAYER_ID-"][:-1]
-                )
-                self.sleeper_id = values["-SLEEPER_PLAYER_ID-"]
-            elif event == "-SLEEPER_PLAYER_ID-" and (
-                values["-SLEEPER_PLAYER_ID-"] and
-                values["-SLEEPER_PLAYER_ID-"][-1] in (
-                    self.numbers_all
-                )
-            ):
-                window["-SLEEPER_PLAYER_ID-"].update(
-                    values["-SLEEPER_PLAYER_ID-"]
-                )
-                self.sleeper_id = values["-SLEEPER_PLAYER_ID-"]
+            # Changing pages, searching, or sorting the roster table.
+            if self.roster_table.handle_event(window, event, values):
+                continue
 
             match event:
                 case "-TEAM_ID-":
                     # This will switch from one team's roster
                     # to another.
                     clear_player()
-                    self.refresh_show_roster(values["-TEAM_ID-"])
-                    window["-ROSTER_TABLE-"].update(
-                        values=self.show_roster_df.rows()
+                    self.data_service.load(
+                        "-ROSTER_LOADED-",
+                        self.load_roster,
+                        values["-TEAM_ID-"]
                     )
+                case "-ROSTER_LOADED-":
+                    result = values["-ROSTER_LOADED-"]
+                    if result.error is None:
+                        self.roster_df, self.show_roster_df = result.value
+                        self.roster_table.set_source(
+                            DataFrameSource(self.show_roster_df)
+                        )
+                        self.roster_table.update(window)
+                    del result
                 case "-NEW_PLAYER-":
                     new_player_refresh()
                 case "-DELETE_PLAYER-":
@@ -1992,15 +1677,29 @@ class RosterView:
                     if check is True:
                         clear_player()
                     del check
-                    self.refresh_show_roster(self.team_id)
-                    window["-ROSTER_TABLE-"].update(
-                        values=self.show_roster_df.rows()
+                case "-PLAYER_DELETED-":
+                    self.data_service.load(
+                        "-ROSTER_LOADED-",
+                        self.load_roster,
+                        values["-TEAM_ID-"]
                     )
                 case "-SAVE_PLAYER-":
                     check = self.validate_player_input()
                     if check is True:
                         self.save_player()
-                    print()
+                case "-PLAYER_SAVED-":
+                    result = values["-PLAYER_SAVED-"]
+                    if result.error is not None:
+                        sg.popup_error(
+                            "Could not save this player.\n\n" +
+                            f"Reason: {result.error}"
+                        )
+                    self.data_service.load(
+                        "-ROSTER_LOADED-",
+                        self.load_roster,
+                        values["-TEAM_ID-"]
+                    )
+                    del result
                 case "-ROSTER_TABLE-":
                     try:
                         select_player(values["-ROSTER_TABLE-"][0])
@@ -2055,3 +1754,5 @@ class RosterView:
                     self.headshot_url = values["-PLAYER_HEADSHOT-"]
                 case _:
                     pass
+
+        self.data_service.close()
@@ -1,6 +1,6 @@
 """
 - Creation Date: 03/10/2024 04:35 PM EDT
-- Last Updated: 06/04/2024 01:15 PM EDT
+- Last Updated: 10/19/2026 04:35 AM EDT
 - Authors: Joseph Armstrong (armstrongjoseph08@gmail.com)
 - file: `./core/views/edit_season_view.py`
 - Purpose: Code behind for the window
@@ -18,6 +18,7 @@ import polars as pl
 from core.database.load_db_elements import SqliteLoadData
 from core.database.sqlite3_connectors import initialize_sqlite3_connectors
 from core.other.embedded import EmbeddedElements, LettersAndNumbers
+from core.other.event_dispatcher import EventDispatcher
 
 
 class SeasonView:
@@ -291,12 +292,10 @@ class SeasonView:
     def initial_data_load(self):
         """ """
         self.season_df = SqliteLoadData.load_seasons(
-            con=self.sqlite3_con, cur=self.sqlite3_cur
-        )
-        # print(self.season_df)
-        self.season_df = self.season_df.filter(
-            (pl.col("league_id") == self.league_id) &
-            (pl.col("season") == self.season)
+            con=self.sqlite3_con,
+            cur=self.sqlite3_cur,
+            league_id=self.league_id,
+            season=self.season
         )
 
         # The following line is not run because we already know
@@ -985,12 +984,11 @@ class SeasonView:
             self.special_onside_play_enabled
         )
 
+        dispatcher = EventDispatcher(window)
         keep_open = True
         change_count = 0
         while keep_open is True:
-            event, values = window.read(timeout=1000)
-            print(values)
-            print(event)
+            event, values = dispatcher.read()
 
             if event in (sg.WIN_CLOSED, "Exit"):
                 keep_open = False
@@ -1018,11 +1016,6 @@ class SeasonView:
                 del check_flag
                 window["-APPLY_BUTTON-"].update(disabled=True)
 
-            if change_count == 1 and event not in (sg.WIN_CLOSED, 'Exit'):
-                window["-APPLY_BUTTON-"].update(disabled=False)
-            elif change_count == 0 and event not in (sg.WIN_CLOSED, 'Exit'):
-                window["-APPLY_BUTTON-"].update(disabled=True)
-
             # if event == "-LG_ID-" and len(values["-LG_ID-"]) > 5:
             #     window["-LG_ID-"].update(values["-LG_ID-"][:-1])
             # elif event == "-LG_ID-" and (
@@ -1243,6 +1236,13 @@ class SeasonView:
                 ]
                 change_count += 1
 
+            # Checked after every handler above has updated `change_count`,
+            # so that the first edit enables the "Apply" button right away.
+            if change_count == 1 and event not in (sg.WIN_CLOSED, 'Exit'):
+                window["-APPLY_BUTTON-"].update(disabled=False)
+            elif change_count == 0 and event not in (sg.WIN_CLOSED, 'Exit'):
+                window["-APPLY_BUTTON-"].update(disabled=True)
+
         window.close()
 
 
@@ -1494,11 +1494,10 @@ def new_season_view(settings_json: dict, league_id: str):
         keep_on_top=False,
     )
 
+    dispatcher = EventDispatcher(window)
     keep_open = True
     while keep_open is True:
-        event, values = window.read(timeout=1000)
-        print(values)
-        print(event)
+        event, values = dispatcher.read()
 
         if event in (sg.WIN_CLOSED, "Exit", "-CANCEL_BUTTON-"):
             keep_open = False
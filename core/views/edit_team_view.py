@@ -1,6 +1,6 @@
 """
 - Creation Date: 03/10/2024 4:35 PM EDT
-- Last Updated: 05/31/2024 01:15 PM EDT
+- Last Updated: 10/19/2026 04:50 AM EDT
 - Authors: Joseph Armstrong (armstrongjoseph08@gmail.com)
 - file: `./core/views/new_game_view.py`
 - Purpose: Code behind for the window that allows a user
@@ -10,9 +10,11 @@
 import FreeSimpleGUI as sg
 import polars as pl
 
+from core.database.cache_db_elements import get_reference_data
 from core.database.load_db_elements import SqliteLoadData
 from core.database.sqlite3_connectors import initialize_sqlite3_connectors
 from core.other.embedded import EmbeddedElements, LettersAndNumbers
+from core.other.event_dispatcher import EventDispatcher
 
 
 class TeamView():
@@ -28,16 +30,15 @@ class TeamView():
         include_dash_and_underscore=True
     )
     # sqlite3 connectors
-    sqlite3_con, sqlite3_cur = initialize_sqlite3_connectors()
+    sqlite3_con = None
+    sqlite3_cur = None
 
     settings_dict = {}
 
     team_df = pl.DataFrame()
 
-    iso_nations_df = pl.DataFrame()
-    iso_states_df = pl.DataFrame()
-    filtered_iso_states_df = pl.DataFrame()
-    iso_timezones_df = pl.DataFrame()
+    # Shared cache of nations, states, and time zones.
+    reference_data = None
 
     iso_2_arr = []
     iso_states_arr = []
@@ -97,6 +98,9 @@ class TeamView():
         self.season = season
         self.team_id = team_id
 
+        # Get SQLite3 connections
+        self.sqlite3_con, self.sqlite3_cur = initialize_sqlite3_connectors()
+
         self.initial_data_load()
         self.team_edit_view()
 
@@ -172,12 +176,11 @@ class TeamView():
         """ """
 
         self.team_df = SqliteLoadData.load_fb_teams(
-            con=self.sqlite3_con, cur=self.sqlite3_cur
-        )
-        self.team_df = self.team_df.filter(
-            (pl.col("league_id") == self.league_id) &
-            (pl.col("season") == self.season) &
-            (pl.col("team_id") == self.team_id)
+            con=self.sqlite3_con,
+            cur=self.sqlite3_cur,
+            league_id=self.league_id,
+            season=self.season,
+            team_id=self.team_id
         )
 
         self.pfr_team_id = self.team_df["pfr_team_id"][0]
@@ -205,16 +208,11 @@ class TeamView():
         self.team_notes = self.team_df["team_notes"][0]
         self.stadium_id = self.team_df["stadium_id"][0]
 
-        # Nations
-        self.iso_nations_df = SqliteLoadData.load_iso_nations(
-            con=self.sqlite3_con, cur=self.sqlite3_cur
-        )
+        # Nations, states, and time zones
+        self.reference_data = get_reference_data(self.sqlite3_con)
         self.refresh_iso_nations()
 
         # States
-        self.iso_states_df = SqliteLoadData.load_iso_states(
-            con=self.sqlite3_con, cur=self.sqlite3_cur
-        )
         self.refresh_iso_states(
             iso_2_nation=self.team_nation,
             is_first_data_refresh=True
@@ -228,24 +226,11 @@ class TeamView():
 
     def refresh_iso_nations(self) -> None:
         """ """
-        self.iso_2_arr = self.iso_nations_df["nation_iso_alpha_2"].to_list()
-        temp_nation_names_arr = self.iso_nations_df["nation_name"].to_list()
-
-        for i in range(0, len(temp_nation_names_arr)):
-            temp_nation_name = temp_nation_names_arr[i]
-            temp_iso_2 = self.iso_2_arr[i]
-            self.show_nations_arr.append(
-                f"({temp_iso_2}) {temp_nation_name}"
-            )
-            del temp_nation_name
-            del temp_iso_2
-
-        temp_pointer = self.iso_2_arr.index(
+        self.iso_2_arr = self.reference_data.nation_codes_arr
+        self.show_nations_arr = self.reference_data.show_nations_arr
+        self.show_nation = self.reference_data.get_show_nation(
             self.team_nation
         )
-        self.show_nation = self.show_nations_arr[temp_pointer]
-        del temp_nation_names_arr
-        del temp_pointer
 
     def refresh_iso_states(
         self,
@@ -253,36 +238,17 @@ class TeamView():
         is_first_data_refresh: bool = False
     ):
         """ """
-
-        self.filtered_iso_states_df = self.iso_states_df
-
-        self.filtered_iso_states_df = self.filtered_iso_states_df.filter(
-            (pl.col("nation_iso_alpha_2") == iso_2_nation)
+        self.iso_states_arr = self.reference_data.get_state_codes(
+            iso_2_nation
+        )
+        self.show_states_arr = self.reference_data.get_show_states(
+            iso_2_nation
         )
-        self.iso_states_arr = self.filtered_iso_states_df[
-            "subdivision_iso_3166_2_code"
-        ].to_list()
-        temp_state_names_arr = self.filtered_iso_states_df[
-            "subdivision_name"
-        ].to_list()
-        self.show_states_arr = []
-
-        for i in range(0, len(temp_state_names_arr)):
-            temp_state_name = temp_state_names_arr[i]
-            temp_iso = self.iso_states_arr[i]
-            self.show_states_arr.append(f"({temp_iso}) {temp_state_name}")
-            del temp_state_name
-            del temp_iso
 
         if is_first_data_refresh is True:
-            temp_pointer = self.iso_states_arr.index(
+            self.show_state = self.reference_data.get_show_state(
                 self.team_state
             )
-
-            del temp_state_names_arr
-
-            self.show_state = self.show_states_arr[temp_pointer]
-            del temp_pointer
         else:
             self.team_state = self.iso_states_arr[0]
             self.show_state = self.show_states_arr[0]
@@ -293,34 +259,24 @@ class TeamView():
         is_first_data_refresh: bool = False
     ):
         """ """
-        # Timezones
-        self.iso_timezones_df = SqliteLoadData.load_iso_timezones(
-            con=self.sqlite3_con, cur=self.sqlite3_cur
-        )
-        temp_df = self.iso_timezones_df
-        temp_df = temp_df.filter(
-            (pl.col("nation_iso_alpha_2") == iso_2_nation)
+        self.show_timezones_arr = self.reference_data.get_timezones(
+            iso_2_nation
         )
-        self.show_timezones_arr = temp_df["timezone_name"].to_list()
 
         if is_first_data_refresh is False:
             self.team_timezone = self.show_timezones_arr[0]
 
     def search_iso_nation(self, show_nation: str) -> None:
         """ """
-        temp_pointer = self.show_nations_arr.index(
+        self.team_nation = self.reference_data.get_nation_code(
             show_nation
         )
-        self.team_nation = self.iso_2_arr[temp_pointer]
-        del temp_pointer
 
     def search_iso_state(self, show_state: str) -> None:
         """ """
-        temp_pointer = self.show_states_arr.index(
+        self.team_state = self.reference_data.get_state_code(
             show_state
         )
-        self.team_state = self.iso_states_arr[temp_pointer]
-        del temp_pointer
 
     def changed_settings_check(self) -> str:
         check = sg.popup_yes_no(
@@ -602,12 +558,11 @@ class TeamView():
             keep_on_top=False,
         )
 
+        dispatcher = EventDispatcher(window)
         keep_open = True
         change_count = 0
         while keep_open is True:
-            event, values = window.read(timeout=1000)
-            print(values)
-            print(event)
+            event, values = dispatcher.read()
             # print(self.team_timezone)
             # print(self.team_nation, self.team_state)
 
@@ -637,11 +592,6 @@ class TeamView():
                 del check_flag
                 window["-APPLY_BUTTON-"].update(disabled=True)
 
-            if change_count == 1 and event not in (sg.WIN_CLOSED, "Exit"):
-                window["-APPLY_BUTTON-"].update(disabled=False)
-            elif change_count == 0 and event not in (sg.WIN_CLOSED, "Exit"):
-                window["-APPLY_BUTTON-"].update(disabled=True)
-
             # Team abbreviation check
             if event == "-TEAM_ABV-" and len(values["-TEAM_ABV-"]) > 5:
                 window["-TEAM_ABV-"].update(
@@ -964,6 +914,13 @@ class TeamView():
                 self.team_notes = values["-TEAM_NOTES-"]
                 change_count += 1
 
+            # Checked after every handler above has updated `change_count`,
+            # so that the first edit enables the "Apply" button right away.
+            if change_count == 1 and event not in (sg.WIN_CLOSED, "Exit"):
+                window["-APPLY_BUTTON-"].update(disabled=False)
+            elif change_count == 0 and event not in (sg.WIN_CLOSED, "Exit"):
+                window["-APPLY_BUTTON-"].update(disabled=True)
+
         window.close()
 
 
@@ -976,16 +933,15 @@ class NewTeamView():
         include_dash_and_underscore=True
     )
     # sqlite3 connectors
-    sqlite3_con, sqlite3_cur = initialize_sqlite3_connectors()
+    sqlite3_con = None
+    sqlite3_cur = None
 
     settings_dict = {}
 
     team_df = pl.DataFrame()
 
-    iso_nations_df = pl.DataFrame()
-    iso_states_df = pl.DataFrame()
-    filtered_iso_states_df = pl.DataFrame()
-    iso_timezones_df = pl.DataFrame()
+    # Shared cache of nations, states, and time zones.
+    reference_data = None
 
     iso_2_arr = []
     iso_states_arr = []
@@ -1041,6 +997,9 @@ class NewTeamView():
         self.league_id = league_id
         self.season = season
 
+        # Get SQLite3 connections
+        self.sqlite3_con, self.sqlite3_cur = initialize_sqlite3_connectors()
+
         self.initial_data_load()
         self.refresh_iso_nations()
         self.refresh_iso_states(
@@ -1056,18 +1015,16 @@ class NewTeamView():
         # Existing teams (so we can validate if a team already exists
         # before doing an insert statement).
         self.team_df = SqliteLoadData.load_fb_teams(
-            con=self.sqlite3_con, cur=self.sqlite3_cur
-        )
-        # Nations
-        self.iso_nations_df = SqliteLoadData.load_iso_nations(
-            con=self.sqlite3_con, cur=self.sqlite3_cur
+            con=self.sqlite3_con,
+            cur=self.sqlite3_cur,
+            league_id=self.league_id,
+            season=self.season
         )
+        # Nations, states, and time zones
+        self.reference_data = get_reference_data(self.sqlite3_con)
         self.refresh_iso_nations()
 
         # States
-        self.iso_states_df = SqliteLoadData.load_iso_states(
-            con=self.sqlite3_con, cur=self.sqlite3_cur
-        )
         self.refresh_iso_states(
             iso_2_nation=self.team_nation,
             is_first_data_refresh=True
@@ -1081,24 +1038,11 @@ class NewTeamView():
 
     def refresh_iso_nations(self) -> None:
         """ """
-        self.iso_2_arr = self.iso_nations_df["nation_iso_alpha_2"].to_list()
-        temp_nation_names_arr = self.iso_nations_df["nation_name"].to_list()
-
-        for i in range(0, len(temp_nation_names_arr)):
-            temp_nation_name = temp_nation_names_arr[i]
-            temp_iso_2 = self.iso_2_arr[i]
-            self.show_nations_arr.append(
-                f"({temp_iso_2}) {temp_nation_name}"
-            )
-            del temp_nation_name
-            del temp_iso_2
-
-        temp_pointer = self.iso_2_arr.index(
+        self.iso_2_arr = self.reference_data.nation_codes_arr
+        self.show_nations_arr = self.reference_data.show_nations_arr
+        self.show_nation = self.reference_data.get_show_nation(
             self.team_nation
         )
-        self.show_nation = self.show_nations_arr[temp_pointer]
-        del temp_nation_names_arr
-        del temp_pointer
 
     def refresh_iso_states(
         self,
@@ -1106,38 +1050,17 @@ class NewTeamView():
         is_first_data_refresh: bool = False
     ):
         """ """
-
-        self.filtered_iso_states_df = self.iso_states_df
-
-        self.filtered_iso_states_df = self.filtered_iso_states_df.filter(
-            (pl.col("nation_iso_alpha_2") == iso_2_nation)
+        self.iso_states_arr = self.reference_data.get_state_codes(
+            iso_2_nation
+        )
+        self.show_states_arr = self.reference_data.get_show_states(
+            iso_2_nation
         )
-        self.iso_states_arr = self.filtered_iso_states_df[
-            "subdivision_iso_3166_2_code"
-        ].to_list()
-        temp_state_names_arr = self.filtered_iso_states_df[
-            "subdivision_name"
-        ].to_list()
-        self.show_states_arr = []
-
-        for i in range(0, len(temp_state_names_arr)):
-            temp_state_name = temp_state_names_arr[i]
-            temp_iso = self.iso_states_arr[i]
-            self.show_states_arr.append(
-                f"{temp_state_name} ({temp_iso})"
-            )
-            del temp_state_name
-            del temp_iso
 
         if is_first_data_refresh is True:
-            temp_pointer = self.iso_states_arr.index(
+            self.show_state = self.reference_data.get_show_state(
                 self.team_state
             )
-
-            del temp_state_names_arr
-
-            self.show_state = self.show_states_arr[temp_pointer]
-            del temp_pointer
         else:
             self.team_state = self.iso_states_arr[0]
             self.show_state = self.show_states_arr[0]
@@ -1148,34 +1071,24 @@ class NewTeamView():
         is_first_data_refresh: bool = False
     ):
         """ """
-        # Timezones
-        self.iso_timezones_df = SqliteLoadData.load_iso_timezones(
-            con=self.sqlite3_con, cur=self.sqlite3_cur
-        )
-        temp_df = self.iso_timezones_df
-        temp_df = temp_df.filter(
-            (pl.col("nation_iso_alpha_2") == iso_2_nation)
+        self.show_timezones_arr = self.reference_data.get_timezones(
+            iso_2_nation
         )
-        self.show_timezones_arr = temp_df["timezone_name"].to_list()
 
         if is_first_data_refresh is False:
             self.team_timezone = self.show_timezones_arr[0]
 
     def search_iso_nation(self, show_nation: str) -> None:
         """ """
-        temp_pointer = self.show_nations_arr.index(
+        self.team_nation = self.reference_data.get_nation_code(
             show_nation
         )
-        self.team_nation = self.iso_2_arr[temp_pointer]
-        del temp_pointer
 
     def search_iso_state(self, show_state: str) -> None:
         """ """
-        temp_pointer = self.show_states_arr.index(
+        self.team_state = self.reference_data.get_state_code(
             show_state
         )
-        self.team_state = self.iso_states_arr[temp_pointer]
-        del temp_pointer
 
     def changed_settings_check(self) -> str:
         check = sg.popup_yes_no(
@@ -1657,11 +1570,10 @@ class NewTeamView():
             keep_on_top=False,
         )
 
+        dispatcher = EventDispatcher(window)
         keep_open = True
         while keep_open is True:
-            event, values = window.read(timeout=1000)
-            print(values)
-            print(event)
+            event, values = dispatcher.read()
             # print(self.team_timezone)
             # print(self.team_nation, self.team_state)
 
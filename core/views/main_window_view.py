@@ -1,28 +1,29 @@
 """
 - Creation Date: 01/27/2024 12:00 PM EST
-- Last Updated: 06/04/2024 03:23 PM EDT
+- Last Updated: 10/19/2026 02:55 AM EDT
 - Authors: Joseph Armstrong (armstrongjoseph08@gmail.com)
 - file: `./core/views/main_window_view.py`
 - Purpose: Main startup window for this application.
 """
 
+import logging
 from os.path import expanduser
 
 import FreeSimpleGUI as sg
-import polars as pl
 
-from core.database.load_db_elements import SqliteLoadData
+from core.database.cache_db_elements import ScheduleCache
+from core.database.query_db_elements import SqliteQueryData
 from core.database.sqlite3_connectors import initialize_sqlite3_connectors
+from core.database.worker_db_elements import DataService
 from core.other.embedded import EmbeddedElements
+from core.other.event_dispatcher import EventDispatcher
+from core.other.paged_table import PagedTable, RowsSource
+from core.other.startup_report import startup_report
 from core.settings.settings_core import AppSettings
-from core.views.about_view import about_view
-from core.views.edit_game_view import EditGameView
-from core.views.edit_league_view import LeagueView, new_league_view
-from core.views.edit_roster_view import RosterView
-from core.views.edit_season_view import SeasonView, new_season_view
-from core.views.edit_team_view import NewTeamView, TeamView
-from core.views.new_game_view import NewGameView
-from core.views.settings_view import SettingsWindow
+
+# NOTE: Every other view (and `polars`, which those views rely on)
+# is imported when that view is first opened,
+# so that the main window can open as fast as possible.
 
 
 class MainWindow:
@@ -39,18 +40,18 @@ class MainWindow:
     home_dir = expanduser("~")
     default_data_directory = f"{home_dir}/.sdv_pbp_fb/"
 
-    # polars dataframes
-    iso_nations_df = None
-    iso_states_df = None
-    iso_timezones_df = None
-    fb_leagues_df = None
-    fb_seasons_df = None
-    fb_teams_df = None
-    fb_stadiums_df = None
-    fb_schedule_df = None
-    fb_game_refs = None
+    # Rows shown in the schedule table.
+    # The columns in each row are listed in
+    # `SqliteQueryData.schedule_table_columns`.
+    shown_schedule_rows = []
+    schedule_cache = None
+    # Only the rows on the current page of the schedule table
+    # are rendered (see `core.other.paged_table.PagedTable()`).
+    schedule_table = None
 
-    shown_schedule_df = None
+    # Loads the schedule table and combo boxes in the background
+    # (see `core.database.worker_db_elements.DataService()`).
+    data_service = None
 
     # Settings
     app_settings = AppSettings()
@@ -81,47 +82,25 @@ class MainWindow:
         # Set app defaults
         self.load_settings()
         self.set_settings()
+        startup_report.mark("Settings loaded")
         # Get SQLite3 connections
         self.sqlite3_con, self.sqlite3_cur = initialize_sqlite3_connectors()
-
-        # Load dataframes
-        self.iso_nations_df = SqliteLoadData.load_iso_nations(
-            con=self.sqlite3_con, cur=self.sqlite3_cur
-        )
-        self.iso_states_df = SqliteLoadData.load_iso_states(
-            self.sqlite3_con, self.sqlite3_cur
-        )
-        self.iso_timezones_df = SqliteLoadData.load_iso_timezones(
-            self.sqlite3_con, self.sqlite3_cur
-        )
-        self.fb_leagues_df = SqliteLoadData.load_leagues(
-            self.sqlite3_con, self.sqlite3_cur
-        )
-        self.fb_seasons_df = SqliteLoadData.load_seasons(
-            self.sqlite3_con, self.sqlite3_cur
-        )
-        self.fb_seasons_df = self.fb_seasons_df.sort(
-            ["league_id", "season"],
-        )
-        self.fb_stadiums_df = SqliteLoadData.load_fb_stadiums(
-            self.sqlite3_con, self.sqlite3_cur
-        )
-        self.fb_game_refs = SqliteLoadData.load_fb_game_refs(
-            self.sqlite3_con, self.sqlite3_cur
-        )
+        self.schedule_cache = ScheduleCache(self.sqlite3_con)
+        startup_report.mark("SQLite3 database opened")
 
         self.refresh_leagues()
-        self.refresh_league_weeks()
+        self.refresh_league_weeks(
+            lg_abv=self.default_league, lg_season=self.default_season
+        )
         self.refresh_league_seasons(league=self.default_league)
 
-        self.shown_schedule_df = self.fb_schedule_df.filter(
-            (pl.col("league_id") == self.default_league)
-            & (pl.col("season") == self.default_season)
+        self.filter_shown_schedule(
+            lg_abv=self.default_league, lg_season=self.default_season
         )
-        self.clean_shown_schedule_df()
         self.refresh_league_teams(
             lg_abv=self.default_league, lg_season=self.default_season
         )
+        startup_report.mark("Main window data loaded")
         self.main()
 
     def load_settings(self) -> None:
@@ -139,23 +118,42 @@ class MainWindow:
         self.default_team = self.settings_dict["defaults"]["default_team"]
         self.app_theme = self.settings_dict["app_theme"]
 
-    def clean_shown_schedule_df(self) -> None:
-        """ """
-        self.shown_schedule_df = self.shown_schedule_df[
-            [
-                "nflverse_game_id",
-                "game_type",
-                "week",
-                "game_day",
-                "away_team_abv",
-                "home_team_abv",
-                "away_team_score",
-                "home_team_score",
-                "game_is_finished",
-            ]
-        ]
+    def get_schedule_rows(
+        self,
+        lg_abv: str,
+        lg_season: int,
+        team_abv: str = None,
+        week: int = None,
+        con=None
+    ) -> list:
+        """
+        Returns the rows shown in the schedule table
+        for a league/season, and optionally a team and/or week.
+        If `con` is set, any games that aren't cached
+        are read with `con`.
+        """
+        if lg_season == "-ALL-" or lg_season is None:
+            lg_season = None
+        elif lg_season > 1800:
+            pass
+        else:
+            lg_season = None
 
-    def filter_shown_schedule_df(
+        if team_abv == "-ALL-":
+            team_abv = None
+
+        if week == 0:
+            week = None
+
+        return self.schedule_cache.get_rows(
+            league_id=lg_abv,
+            season=lg_season,
+            team_abv=team_abv,
+            week=week,
+            con=con
+        )
+
+    def filter_shown_schedule(
         self,
         lg_abv: str,
         lg_season: int,
@@ -163,93 +161,126 @@ class MainWindow:
         week: int = None
     ) -> None:
         """ """
-        self.shown_schedule_df = self.fb_schedule_df.filter(
-            (pl.col("league_id") == lg_abv)
+        self.shown_schedule_rows = self.get_schedule_rows(
+            lg_abv=lg_abv,
+            lg_season=lg_season,
+            team_abv=team_abv,
+            week=week
         )
 
-        if lg_season == "-ALL-":
-            pass
-        elif lg_season > 1800:
-            self.shown_schedule_df = self.fb_schedule_df.filter(
-                (pl.col("season") == lg_season)
-            )
-
-        if team_abv == "-ALL-":
-            pass
-        elif (team_abv is not None):
-            self.shown_schedule_df = self.shown_schedule_df.filter(
-                (pl.col("away_team_abv") == team_abv) |
-                (pl.col("home_team_abv") == team_abv)
-            )
-        if week is None:
-            pass
-        elif week == 0:
-            pass
-        elif week > 0 or week < 0:
-            self.shown_schedule_df = self.shown_schedule_df.filter(
-                (pl.col("week") == week)
-            )
-
-        self.shown_schedule_df = self.shown_schedule_df.sort(
-            "nflverse_game_id"
-        )
-        self.clean_shown_schedule_df()
+    def show_schedule(self, window: sg.Window) -> None:
+        """
+        Shows `self.shown_schedule_rows` in the schedule table.
+        """
+        self.schedule_table.set_source(RowsSource(self.shown_schedule_rows))
+        self.schedule_table.update(window)
 
-    def refresh_league_weeks(self):
+    def get_league_weeks(
+        self,
+        lg_abv: str,
+        lg_season: int,
+        con=None
+    ) -> list:
         """ """
-        self.fb_schedule_df = SqliteLoadData.load_fb_schedule(
-            self.sqlite3_con, self.sqlite3_cur
+        league_weeks = self.schedule_cache.get_weeks(
+            league_id=lg_abv,
+            season=lg_season,
+            con=con
         )
-        self.league_weeks = self.fb_schedule_df["week"].to_list()
 
         # In the case there's no games in this league,
         # add a "Week 1" to the weeks list.
         # If there is a week 1, this move gets negated by the
         # `set()` function.
-        self.league_weeks.append(1)
+        league_weeks.append(1)
 
-        self.league_weeks.append(0)
+        league_weeks.append(0)
 
-        self.league_weeks = list(set(self.league_weeks))
-        self.league_weeks.sort()
+        league_weeks = list(set(league_weeks))
+        league_weeks.sort()
+        return league_weeks
 
-    def refresh_league_teams(self, lg_abv: str, lg_season: int):
+    def refresh_league_weeks(self, lg_abv: str, lg_season: int):
+        """ """
+        self.league_weeks = self.get_league_weeks(lg_abv, lg_season)
+
+    def get_league_teams(self, cur, lg_abv: str, lg_season: int) -> list:
         """ """
-        self.fb_teams_df = SqliteLoadData.load_fb_teams(
-            self.sqlite3_con, self.sqlite3_cur
+        league_teams = SqliteQueryData.query_teams(
+            cur,
+            league_id=lg_abv,
+            season=lg_season
         )
-        temp_league_teams = self.fb_teams_df.filter(
-            (pl.col("season") == lg_season) & (pl.col("league_id") == lg_abv)
+        league_teams.append("-ALL-")
+        league_teams.sort()
+        return league_teams
+
+    def refresh_league_teams(self, lg_abv: str, lg_season: int):
+        """ """
+        self.league_teams = self.get_league_teams(
+            self.sqlite3_cur, lg_abv, lg_season
         )
-        self.league_teams = temp_league_teams["team_id"].to_list()
-        self.league_teams.append("-ALL-")
-        set(self.league_teams)
-        self.league_teams.sort()
 
     def refresh_leagues(self):
         """
         """
-        self.fb_leagues_df = SqliteLoadData.load_leagues(
-            self.sqlite3_con, self.sqlite3_cur
-        )
-        self.leagues_list = self.fb_leagues_df["league_id"].to_list()
+        self.leagues_list = SqliteQueryData.query_leagues(self.sqlite3_cur)
 
         set(self.leagues_list)
         self.leagues_list.sort()
 
+    def get_league_seasons(self, cur, league: str) -> list:
+        """ """
+        league_seasons = SqliteQueryData.query_seasons(cur, league_id=league)
+        league_seasons.sort()
+        return league_seasons
+
     def refresh_league_seasons(self, league: str):
         """ """
-        self.fb_seasons_df = SqliteLoadData.load_seasons(
-            self.sqlite3_con, self.sqlite3_cur
+        self.league_seasons = self.get_league_seasons(
+            self.sqlite3_cur, league
         )
-        self.league_seasons = self.fb_seasons_df.filter(
-            pl.col("league_id") == league
-        )["season"].to_list()
-        self.league_seasons.sort()
-
-    def refresh_schedules(self):
-        self.fb_schedule_df = SqliteLoadData.load_fb_schedule(
-            self.sqlite3_con, self.sqlite3_cur
+
+    # Background loads (see `DataService()`).
+    # These run on a background thread,
+    # so they only return data, never touch the window,
+    # and only read with the connection they are given.
+    def load_league_data(self, con, league: str) -> dict:
+        """
+        Loads the seasons, weeks, teams, and games of a league,
+        starting with the first season in that league.
+        """
+        cur = con.cursor()
+        league_seasons = self.get_league_seasons(cur, league)
+        lg_season = None
+        if len(league_seasons) > 0:
+            lg_season = league_seasons[0]
+
+        return {
+            "seasons": league_seasons,
+            "weeks": self.get_league_weeks(league, lg_season, con),
+            "teams": self.get_league_teams(cur, league, lg_season),
+            "rows": self.get_schedule_rows(league, lg_season, con=con),
+        }
+
+    def load_schedule_rows(
+        self,
+        con,
+        lg_abv: str,
+        lg_season: int,
+        team_abv: str = None,
+        week: int = None
+    ) -> list:
+        """
+        Loads the rows shown in the schedule table
+        (see `get_schedule_rows()`).
+        """
+        return self.get_schedule_rows(
+            lg_abv=lg_abv,
+            lg_season=lg_season,
+            team_abv=team_abv,
+            week=week,
+            con=con
         )
 
     def main(self):
@@ -420,6 +451,10 @@ class MainWindow:
             ],
         ]
 
+        self.schedule_table = PagedTable(
+            "-SCHEDULE_TABLE-", RowsSource(self.shown_schedule_rows)
+        )
+
         layout = [
             [sg.MenuBar(menu_bar, visible=True, key="-WINDOW_MENU-")],
             [],
@@ -434,22 +469,28 @@ class MainWindow:
                     pad=0,
                     element_justification="top",
                 ),
-                sg.Table(
-                    values=self.shown_schedule_df.rows(),
-                    headings=[
-                        "Game ID",
-                        "Game Type",
-                        "Week",
-                        "Date",
-                        "Away Team",
-                        "Home Team",
-                        "Away Score",
-                        "Home Score",
-                        "Finished?",
-                    ],
+                sg.Column(
+                    self.schedule_table.get_layout(
+                        headings=[
+                            "Game ID",
+                            "Game Type",
+                            "Week",
+                            "Date",
+                            "Away Team",
+                            "Home Team",
+                            "Away Score",
+                            "Home Score",
+                            "Finished?",
+                        ],
+                        expand_x=True,
+                        expand_y=True,
+                        # So the game buttons are enabled
+                        # as soon as a game is selected.
+                        enable_events=True,
+                    ),
                     expand_x=True,
                     expand_y=True,
-                    key="-SCHEDULE_TABLE-",
+                    pad=0,
                 ),
 
             ],
@@ -466,13 +507,286 @@ class MainWindow:
         window.set_min_size(
             size=(1280, 720)
         )
+        startup_report.mark("Main window opened")
+        startup_report.print_report()
+        self.data_service = DataService(window)
 
         # window.TKroot.minsize(1024,600)
         keep_open = True
+
+        def close_window(event, values):
+            nonlocal keep_open
+            keep_open = False
+
+        def not_implemented(event, values):
+            logging.info(f"`{event}` has not been implemented yet.")
+
+        def open_about(event, values):
+            # print(EmbeddedElements.app_version())
+            from core.views.about_view import about_view
+
+            about_view()
+
+        def new_league(event, values):
+            check = values["-LEAGUE_ABV_COMBO-"]
+            from core.views.edit_league_view import new_league_view
+
+            new_league_view(settings_json=self.settings_dict)
+            self.refresh_leagues()
+            window["-LEAGUE_ABV_COMBO-"].update(
+                values=self.leagues_list,
+                value=check
+            )
+            del check
+
+        def new_season(event, values):
+            check = values["-LEAGUE_SEASON_COMBO-"]
+            check2 = values["-LEAGUE_ABV_COMBO-"]
+            from core.views.edit_season_view import new_season_view
+
+            new_season_view(
+                settings_json=self.settings_dict,
+                league_id=values["-LEAGUE_ABV_COMBO-"]
+            )
+            self.refresh_league_seasons(league=check2)
+            window["-LEAGUE_SEASON_COMBO-"].update(
+                values=self.league_seasons,
+                value=check
+            )
+            del check, check2
+
+        def new_team(event, values):
+            # print(event)
+            check = values["-LEAGUE_ABV_COMBO-"]
+            check2 = values["-LEAGUE_SEASON_COMBO-"]
+            check3 = values["-TEAM_SEASON_COMBO-"]
+            from core.views.edit_team_view import NewTeamView
+
+            NewTeamView(
+                settings_json=self.settings_dict,
+                league_id=values["-LEAGUE_ABV_COMBO-"],
+                season=check2
+            )
+            self.refresh_league_teams(
+                lg_abv=check,
+                lg_season=check2
+            )
+            window["-TEAM_SEASON_COMBO-"].update(
+                values=self.league_teams,
+                value=check3
+            )
+            del check, check2, check3
+
+        def new_game(event, values):
+            check = values["-LEAGUE_ABV_COMBO-"]
+            check2 = values["-LEAGUE_SEASON_COMBO-"]
+            from core.views.new_game_view import NewGameView
+
+            NewGameView(
+                settings_json=self.settings_dict,
+                season=check2,
+                league_id=check
+            )
+            self.filter_shown_schedule(
+                lg_abv=values["-LEAGUE_ABV_COMBO-"],
+                lg_season=self.league_seasons[0]
+            )
+            self.show_schedule(window)
+            del check, check2
+
+        def open_app_settings(event, values):
+            from core.views.settings_view import SettingsWindow
+
+            SettingsWindow()
+
+        def change_league(event, values):
+            # Any schedule that's still loading
+            # is for the last league.
+            self.data_service.cancel("-SCHEDULE_LOADED-")
+            self.data_service.load(
+                "-LEAGUE_LOADED-",
+                self.load_league_data,
+                values["-LEAGUE_ABV_COMBO-"]
+            )
+
+        def league_loaded(event, values):
+            result = values["-LEAGUE_LOADED-"]
+            if result.error is None:
+                self.league_seasons = result.value["seasons"]
+                self.league_weeks = result.value["weeks"]
+                self.league_teams = result.value["teams"]
+                self.shown_schedule_rows = result.value["rows"]
+
+                window["-LEAGUE_SEASON_COMBO-"].update(
+                    values=self.league_seasons,
+                    value=(
+                        self.league_seasons[0]
+                        if len(self.league_seasons) > 0 else None
+                    ),
+                )
+                window["-WEEK_SEASON_COMBO-"].update(
+                    values=self.league_weeks,
+                    value=self.league_weeks[0],
+                )
+                window["-TEAM_SEASON_COMBO-"].update(
+                    values=self.league_teams,
+                    value=self.league_teams[0]
+                )
+                self.show_schedule(window)
+            del result
+
+        def schedule_loaded(event, values):
+            result = values["-SCHEDULE_LOADED-"]
+            if result.error is None:
+                self.shown_schedule_rows = result.value
+                self.show_schedule(window)
+            del result
+
+        def edit_rosters(event, values):
+            from core.views.edit_roster_view import RosterView
+
+            RosterView(
+                settings_json=self.settings_dict,
+                league_id=values["-LEAGUE_ABV_COMBO-"],
+                season=values["-LEAGUE_SEASON_COMBO-"]
+
+            )
+
+        def change_season(event, values):
+            self.data_service.load(
+                "-SCHEDULE_LOADED-",
+                self.load_schedule_rows,
+                values["-LEAGUE_ABV_COMBO-"],
+                values["-LEAGUE_SEASON_COMBO-"]
+            )
+
+        def edit_season(event, values):
+            from core.views.edit_season_view import SeasonView
+
+            SeasonView(
+                settings_json=self.settings_dict,
+                league_id=values["-LEAGUE_ABV_COMBO-"],
+                season=values["-LEAGUE_SEASON_COMBO-"]
+            )
+            self.filter_shown_schedule(
+                values["-LEAGUE_ABV_COMBO-"],
+                values["-LEAGUE_SEASON_COMBO-"]
+            )
+            self.show_schedule(window)
+
+        def edit_league(event, values):
+            # print(event)
+            check = values["-LEAGUE_ABV_COMBO-"]
+            from core.views.edit_league_view import LeagueView
+
+            LeagueView(
+                settings_json=self.settings_dict,
+                league_id=values["-LEAGUE_ABV_COMBO-"],
+
+            )
+
+            self.refresh_leagues()
+            # self.refresh_league_teams(values["-LEAGUE_ABV_COMBO-"])
+            window["-LEAGUE_ABV_COMBO-"].update(
+                values=self.leagues_list,
+                value=values["-LEAGUE_ABV_COMBO-"]
+            )
+            del check
+
+        def edit_team(event, values):
+
+            check = values["-LEAGUE_ABV_COMBO-"]
+            check2 = values["-LEAGUE_SEASON_COMBO-"]
+            check3 = values["-TEAM_SEASON_COMBO-"]
+            from core.views.edit_team_view import TeamView
+
+            TeamView(
+                settings_json=self.settings_dict,
+                league_id=values["-LEAGUE_ABV_COMBO-"],
+                season=check2,
+                team_id=check3
+            )
+            self.refresh_league_teams(
+                lg_abv=check,
+                lg_season=check2
+            )
+            window["-TEAM_SEASON_COMBO-"].update(
+                values=self.league_teams,
+                value=check3
+            )
+            del check, check2, check3
+
+        def change_team(event, values):
+            self.data_service.load(
+                "-SCHEDULE_LOADED-",
+                self.load_schedule_rows,
+                lg_abv=values["-LEAGUE_ABV_COMBO-"],
+                lg_season=values["-LEAGUE_SEASON_COMBO-"],
+                team_abv=values["-TEAM_SEASON_COMBO-"],
+            )
+
+        def edit_game(event, values):
+            check = values["-SCHEDULE_TABLE-"][0]
+            check2 = self.schedule_table.get_row(check)[0]
+            from core.views.edit_game_view import EditGameView
+
+            EditGameView(
+                settings_json=self.settings_dict,
+                game_id=check2
+            )
+            self.filter_shown_schedule(
+                lg_abv=values["-LEAGUE_ABV_COMBO-"],
+                lg_season=self.league_seasons[0]
+            )
+            self.show_schedule(window)
+            window["-EDIT_GAME_BUTTON-"].update(
+                disabled=True
+            )
+            del check, check2
+
+        def change_week(event, values):
+            self.data_service.load(
+                "-SCHEDULE_LOADED-",
+                self.load_schedule_rows,
+                lg_abv=values["-LEAGUE_ABV_COMBO-"],
+                lg_season=values["-LEAGUE_SEASON_COMBO-"],
+                week=values["-WEEK_SEASON_COMBO-"]
+            )
+
+        dispatcher = EventDispatcher(window, self.data_service)
+        dispatcher.add_handlers({
+            # File
+            "Exit": close_window,
+            ("Import Game", "Print Game", "Print Season", "Export Game",
+             "Export Team", "Export Season", "Export League",
+             "New Player", "Documentation (Local)",
+             "Documentation (Web)"): not_implemented,
+            # New
+            "New League": new_league,
+            "New Season": new_season,
+            "New Team": new_team,
+            ("-NEW_GAME_BUTTON-", "New Game"): new_game,
+            # Settings
+            "App Settings": open_app_settings,
+            # Help
+            "About": open_about,
+            # Sidebar
+            "-LEAGUE_ABV_COMBO-": change_league,
+            "-LEAGUE_SEASON_COMBO-": change_season,
+            "-TEAM_SEASON_COMBO-": change_team,
+            "-WEEK_SEASON_COMBO-": change_week,
+            "-LG_SETTINGS-": edit_league,
+            "-SEA_SETTINGS-": edit_season,
+            "-TEAM_SETTINGS-": edit_team,
+            "-EDIT_ROSTERS-": edit_rosters,
+            "-EDIT_GAME_BUTTON-": edit_game,
+            # Sent back by `self.data_service`
+            "-LEAGUE_LOADED-": league_loaded,
+            "-SCHEDULE_LOADED-": schedule_loaded,
+        })
+
         while keep_open:
-            event, values = window.read(timeout=1000)
-            print(values)
-            print(event)
+            event, values = dispatcher.read()
 
             if event == sg.WIN_CLOSED or event == "Quit":
                 break
@@ -480,246 +794,19 @@ class MainWindow:
             if values["-SCHEDULE_TABLE-"] != []:
                 window["-START_GAME_BUTTON-"].update(disabled=False)
                 window["-EDIT_GAME_BUTTON-"].update(disabled=False)
-                # print(values["-SCHEDULE_TABLE-"][0])
 
             if values["-TEAM_SEASON_COMBO-"] == "-ALL-":
                 window["-TEAM_SETTINGS-"].update(disabled=True)
             elif values["-TEAM_SEASON_COMBO-"] != "-ALL-":
                 window["-TEAM_SETTINGS-"].update(disabled=False)
 
-            match event:
-                # File Menu
-                case "About":
-                    # print(EmbeddedElements.app_version())
-                    about_view()
-                case "Exit":
-                    keep_open = False
-                # File
-                # case "New Game":
-                #     print(event)
-                # case "Load Game":
-                #     print(event)
-                case "Import Game":
-                    print(event)
-                case "Print Game":
-                    print(event)
-                case "Print Season":
-                    print(event)
-                case "Export Game":
-                    print(event)
-                case "Export Team":
-                    print(event)
-                case "Export Season":
-                    print(event)
-                case "Export League":
-                    print(event)
-                # New
-                case "New League":
-                    check = values["-LEAGUE_ABV_COMBO-"]
-                    new_league_view(settings_json=self.settings_dict)
-                    self.refresh_leagues()
-                    window["-LEAGUE_ABV_COMBO-"].update(
-                        values=self.leagues_list,
-                        value=check
-                    )
-                    del check
-                case "New Season":
-                    check = values["-LEAGUE_SEASON_COMBO-"]
-                    check2 = values["-LEAGUE_ABV_COMBO-"]
-                    new_season_view(
-                        settings_json=self.settings_dict,
-                        league_id=values["-LEAGUE_ABV_COMBO-"]
-                    )
-                    self.refresh_league_seasons(league=check2)
-                    window["-LEAGUE_SEASON_COMBO-"].update(
-                        values=self.league_seasons,
-                        value=check
-                    )
-                    del check, check2
-                case "New Team":
-                    # print(event)
-                    check = values["-LEAGUE_ABV_COMBO-"]
-                    check2 = values["-LEAGUE_SEASON_COMBO-"]
-                    check3 = values["-TEAM_SEASON_COMBO-"]
-                    NewTeamView(
-                        settings_json=self.settings_dict,
-                        league_id=values["-LEAGUE_ABV_COMBO-"],
-                        season=check2
-                    )
-                    self.refresh_league_teams(
-                        lg_abv=check,
-                        lg_season=check2
-                    )
-                    window["-TEAM_SEASON_COMBO-"].update(
-                        values=self.league_teams,
-                        value=check3
-                    )
-                    del check, check2, check3
-                case "-NEW_GAME_BUTTON-" | "New Game":
-                    check = values["-LEAGUE_ABV_COMBO-"]
-                    check2 = values["-LEAGUE_SEASON_COMBO-"]
-                    NewGameView(
-                        settings_json=self.settings_dict,
-                        season=check2,
-                        league_id=check
-                    )
-                    self.refresh_schedules()
-                    self.filter_shown_schedule_df(
-                        lg_abv=values["-LEAGUE_ABV_COMBO-"],
-                        lg_season=self.league_seasons[0]
-                    )
-                    window["-SCHEDULE_TABLE-"].update(
-                        values=self.shown_schedule_df.rows()
-                    )
-                    del check, check2
-                case "New Player":
-                    print(event)
-                # Settings
-                case "App Settings":
-                    SettingsWindow()
-                # Help
-                case "Documentation (Local)":
-                    print(event)
-                case "Documentation (Web)":
-                    print(event)
-
-                # Window Button events
-                case "-LEAGUE_ABV_COMBO-":
-                    self.refresh_league_seasons(
-                        values["-LEAGUE_ABV_COMBO-"]
-                    )
-                    self.refresh_league_weeks()
-                    self.refresh_league_teams(
-                        lg_abv=values["-LEAGUE_ABV_COMBO-"],
-                        lg_season=self.league_seasons[0]
-                    )
-
-                    window["-LEAGUE_SEASON_COMBO-"].update(
-                        values=self.league_seasons,
-                        value=self.league_seasons[0],
-                    )
-                    window["-WEEK_SEASON_COMBO-"].update(
-                        values=self.league_weeks,
-                        value=self.league_weeks[0],
-                    )
-                    window["-TEAM_SEASON_COMBO-"].update(
-                        values=self.league_teams,
-                        value=self.league_teams[0]
-                    )
-                    self.filter_shown_schedule_df(
-                        lg_abv=values["-LEAGUE_ABV_COMBO-"],
-                        lg_season=self.league_seasons[0]
-                    )
-                    window["-SCHEDULE_TABLE-"].update(
-                        values=self.shown_schedule_df.rows()
-                    )
-
-                case "-EDIT_ROSTERS-":
-                    RosterView(
-                        settings_json=self.settings_dict,
-                        league_id=values["-LEAGUE_ABV_COMBO-"],
-                        season=values["-LEAGUE_SEASON_COMBO-"]
-
-                    )
-                case "-LEAGUE_SEASON_COMBO-":
-                    self.filter_shown_schedule_df(
-                        values["-LEAGUE_ABV_COMBO-"],
-                        values["-LEAGUE_SEASON_COMBO-"]
-                    )
-                    window["-SCHEDULE_TABLE-"].update(
-                        values=self.shown_schedule_df.rows()
-                    )
-                case "-SEA_SETTINGS-":
-                    SeasonView(
-                        settings_json=self.settings_dict,
-                        league_id=values["-LEAGUE_ABV_COMBO-"],
-                        season=values["-LEAGUE_SEASON_COMBO-"]
-                    )
-                    self.filter_shown_schedule_df(
-                        values["-LEAGUE_ABV_COMBO-"],
-                        values["-LEAGUE_SEASON_COMBO-"]
-                    )
-                    window["-SCHEDULE_TABLE-"].update(
-                        values=self.shown_schedule_df.rows()
-                    )
-                case "-LG_SETTINGS-":
-                    # print(event)
-                    check = values["-LEAGUE_ABV_COMBO-"]
-                    LeagueView(
-                        settings_json=self.settings_dict,
-                        league_id=values["-LEAGUE_ABV_COMBO-"],
-
-                    )
-
-                    self.refresh_leagues()
-                    # self.refresh_league_teams(values["-LEAGUE_ABV_COMBO-"])
-                    window["-LEAGUE_ABV_COMBO-"].update(
-                        values=self.leagues_list,
-                        value=values["-LEAGUE_ABV_COMBO-"]
-                    )
-                    del check
-                case "-TEAM_SETTINGS-":
-
-                    check = values["-LEAGUE_ABV_COMBO-"]
-                    check2 = values["-LEAGUE_SEASON_COMBO-"]
-                    check3 = values["-TEAM_SEASON_COMBO-"]
-                    TeamView(
-                        settings_json=self.settings_dict,
-                        league_id=values["-LEAGUE_ABV_COMBO-"],
-                        season=check2,
-                        team_id=check3
-                    )
-                    self.refresh_league_teams(
-                        lg_abv=check,
-                        lg_season=check2
-                    )
-                    window["-TEAM_SEASON_COMBO-"].update(
-                        values=self.league_teams,
-                        value=check3
-                    )
-                    del check, check2, check3
-                case "-TEAM_SEASON_COMBO-":
-
-                    self.filter_shown_schedule_df(
-                        lg_abv=values["-LEAGUE_ABV_COMBO-"],
-                        lg_season=values["-LEAGUE_SEASON_COMBO-"],
-                        team_abv=values["-TEAM_SEASON_COMBO-"],
-                    )
-                    window["-SCHEDULE_TABLE-"].update(
-                        values=self.shown_schedule_df.rows()
-                    )
-                case "-EDIT_GAME_BUTTON-":
-                    check = values["-SCHEDULE_TABLE-"][0]
-                    check2 = self.shown_schedule_df["nflverse_game_id"][check]
-                    EditGameView(
-                        settings_json=self.settings_dict,
-                        game_id=check2
-                    )
-                    self.refresh_schedules()
-                    self.filter_shown_schedule_df(
-                        lg_abv=values["-LEAGUE_ABV_COMBO-"],
-                        lg_season=self.league_seasons[0]
-                    )
-                    window["-SCHEDULE_TABLE-"].update(
-                        values=self.shown_schedule_df.rows()
-                    )
-                    window["-EDIT_GAME_BUTTON-"].update(
-                        disabled=True
-                    )
-                    del check, check2
-                case "-WEEK_SEASON_COMBO-":
-                    self.filter_shown_schedule_df(
-                        lg_abv=values["-LEAGUE_ABV_COMBO-"],
-                        lg_season=values["-LEAGUE_SEASON_COMBO-"],
-                        week=values["-WEEK_SEASON_COMBO-"]
-                    )
-                    window["-SCHEDULE_TABLE-"].update(
-                        values=self.shown_schedule_df.rows()
-                    )
-
-                case _:
-                    pass
+            # Changing pages, searching, or sorting the schedule table.
+            if self.schedule_table.handle_event(window, event, values):
+                continue
+
+            dispatcher.dispatch(event, values)
 
+        self.data_service.close()
         window.close()
 
 
@@ -1,6 +1,6 @@
 """
 - Creation Date: 03/10/2024 4:35 PM EDT
-- Last Updated: 06/04/2024 03:23 PM EDT
+- Last Updated: 10/19/2026 12:45 AM EDT
 - Authors: Joseph Armstrong (armstrongjoseph08@gmail.com)
 - file: `./core/views/new_game_view.py`
 - Purpose: Code behind for the window that adds a game to a schedule.
@@ -9,9 +9,11 @@
 import FreeSimpleGUI as sg
 import polars as pl
 
+from core.database.cache_db_elements import get_reference_data
 from core.database.load_db_elements import SqliteLoadData
 from core.database.sqlite3_connectors import initialize_sqlite3_connectors
 from core.other.embedded import EmbeddedElements, LettersAndNumbers
+from core.other.event_dispatcher import EventDispatcher
 from core.time import convert_datetime_into_utc_time
 
 
@@ -28,17 +30,16 @@ class NewGameView:
     )
 
     # sqlite3 connectors
-    sqlite3_con, sqlite3_cur = initialize_sqlite3_connectors()
+    sqlite3_con = None
+    sqlite3_cur = None
 
     settings_dict = {}
 
     app_theme = ""
     teams_arr = []
     team_df = pl.DataFrame()
-    iso_nations_df = pl.DataFrame()
-    iso_states_df = pl.DataFrame()
-    filtered_iso_states_df = pl.DataFrame()
-    iso_timezones_df = pl.DataFrame()
+    # Shared cache of nations, states, and time zones.
+    reference_data = None
 
     iso_2_arr = []
     iso_states_arr = []
@@ -155,31 +156,28 @@ class NewGameView:
         self.season = season
         self.league_id = league_id
 
+        # Get SQLite3 connections
+        self.sqlite3_con, self.sqlite3_cur = initialize_sqlite3_connectors()
+
         self.initial_data_load()
         self.new_game_view()
 
     def initial_data_load(self):
         """ """
         self.team_df = SqliteLoadData.load_fb_teams(
-            con=self.sqlite3_con, cur=self.sqlite3_cur
-        )
-        self.team_df = self.team_df.filter(
-            (pl.col("league_id") == self.league_id) &
-            (pl.col("season") == self.season)
+            con=self.sqlite3_con,
+            cur=self.sqlite3_cur,
+            league_id=self.league_id,
+            season=self.season
         )
         self.teams_arr = self.team_df["team_id"].to_list()
         self.teams_arr.append("-TBD-")
 
-        # Nations
-        self.iso_nations_df = SqliteLoadData.load_iso_nations(
-            con=self.sqlite3_con, cur=self.sqlite3_cur
-        )
+        # Nations, states, and time zones
+        self.reference_data = get_reference_data(self.sqlite3_con)
         self.refresh_iso_nations()
 
         # States
-        self.iso_states_df = SqliteLoadData.load_iso_states(
-            con=self.sqlite3_con, cur=self.sqlite3_cur
-        )
         self.refresh_iso_states(
             iso_2_nation="US",
             is_first_data_refresh=True
@@ -193,20 +191,11 @@ class NewGameView:
 
     def refresh_iso_nations(self) -> None:
         """ """
-        self.iso_2_arr = self.iso_nations_df["nation_iso_alpha_2"].to_list()
-        temp_nation_names_arr = self.iso_nations_df["nation_name"].to_list()
-
-        for i in range(0, len(temp_nation_names_arr)):
-            temp_nation_name = temp_nation_names_arr[i]
-            temp_iso_2 = self.iso_2_arr[i]
-            self.show_nations_arr.append(f"({temp_iso_2}) {temp_nation_name}")
-            del temp_nation_name
-            del temp_iso_2
-
-        temp_pointer = self.iso_2_arr.index(self.game_nation)
-        self.show_nation = self.show_nations_arr[temp_pointer]
-        del temp_nation_names_arr
-        del temp_pointer
+        self.iso_2_arr = self.reference_data.nation_codes_arr
+        self.show_nations_arr = self.reference_data.show_nations_arr
+        self.show_nation = self.reference_data.get_show_nation(
+            self.game_nation
+        )
 
     def refresh_iso_states(
         self,
@@ -214,34 +203,17 @@ class NewGameView:
         is_first_data_refresh: bool = False
     ):
         """ """
-
-        self.filtered_iso_states_df = self.iso_states_df
-
-        self.filtered_iso_states_df = self.filtered_iso_states_df.filter(
-            (pl.col("nation_iso_alpha_2") == iso_2_nation)
+        self.iso_states_arr = self.reference_data.get_state_codes(
+            iso_2_nation
+        )
+        self.show_states_arr = self.reference_data.get_show_states(
+            iso_2_nation
         )
-        self.iso_states_arr = self.filtered_iso_states_df[
-            "subdivision_iso_3166_2_code"
-        ].to_list()
-        temp_state_names_arr = self.filtered_iso_states_df[
-            "subdivision_name"
-        ].to_list()
-        self.show_states_arr = []
-
-        for i in range(0, len(temp_state_names_arr)):
-            temp_state_name = temp_state_names_arr[i]
-            temp_iso = self.iso_states_arr[i]
-            self.show_states_arr.append(f"({temp_iso}) {temp_state_name}")
-            del temp_state_name
-            del temp_iso
 
         if is_first_data_refresh is True:
-            temp_pointer = self.iso_states_arr.index(self.game_state)
-
-            del temp_state_names_arr
-
-            self.show_state = self.show_states_arr[temp_pointer]
-            del temp_pointer
+            self.show_state = self.reference_data.get_show_state(
+                self.game_state
+            )
         else:
             self.game_state = self.iso_states_arr[0]
             self.show_state = self.show_states_arr[0]
@@ -252,30 +224,22 @@ class NewGameView:
         is_first_data_refresh: bool = False
     ):
         """ """
-        # Timezones
-        self.iso_timezones_df = SqliteLoadData.load_iso_timezones(
-            con=self.sqlite3_con, cur=self.sqlite3_cur
-        )
-        temp_df = self.iso_timezones_df
-        # temp_df = temp_df.filter(
-        #     (pl.col("nation_iso_alpha_2") == iso_2_nation)
-        # )
-        self.show_timezones_arr = temp_df["timezone_name"].to_list()
+        self.show_timezones_arr = self.reference_data.get_timezones()
 
         if is_first_data_refresh is False:
             self.game_timezone = self.show_timezones_arr[0]
 
     def search_iso_nation(self) -> None:
         """ """
-        temp_pointer = self.show_nations_arr.index(self.show_nation)
-        self.game_nation = self.iso_2_arr[temp_pointer]
-        del temp_pointer
+        self.game_nation = self.reference_data.get_nation_code(
+            self.show_nation
+        )
 
     def search_iso_state(self) -> None:
         """ """
-        temp_pointer = self.show_states_arr.index(self.show_state)
-        self.game_state = self.iso_states_arr[temp_pointer]
-        del temp_pointer
+        self.game_state = self.reference_data.get_state_code(
+            self.show_state
+        )
 
     def game_validation_check(self) -> bool:
         """ """
@@ -862,26 +826,18 @@ class NewGameView:
             keep_on_top=False,
         )
 
+        dispatcher = EventDispatcher(window)
         keep_open = True
         while keep_open is True:
-            event, values = window.read(timeout=1000)
-            print(values)
-            print(event)
-            print(self.surface)
+            event, values = dispatcher.read()
             # print(self.game_day, self.game_time)
             # print(self.game_nation, self.show_nation)
             # print(self.game_state, self.show_state)
             # print(self.is_24_hour_time)
-            print(self.is_divisional_game, self.is_neutral_site_game)
             if event in (sg.WIN_CLOSED, "Exit"):
                 keep_open = False
 
             match event:
-                case "__TIMEOUT__":
-                    # "__TIMEOUT__" = Nothing happened
-                    # If we're doing nothing,
-                    # pass and move on
-                    pass
                 case "-SAVE_GAME_BUTTON-":
                     check_flag = self.game_validation_check()
                     # print(check_flag)
@@ -1,6 +1,6 @@
 """
 - Creation Date: 01/27/2024 12:01 PM EST
-- Last Updated: 05/29/2024 01:15 AM EDT
+- Last Updated: 10/19/2026 12:45 AM EDT
 - Authors: Joseph Armstrong (armstrongjoseph08@gmail.com)
 - file: `./core/views/settings_view.py`
 - Purpose: Settings window for this application.
@@ -8,6 +8,7 @@
 
 import FreeSimpleGUI as sg
 
+from core.other.event_dispatcher import EventDispatcher
 from core.settings.settings_core import AppSettings
 
 
@@ -342,10 +343,9 @@ class SettingsWindow:
         )
         window.set_min_size(size=(640, 600))
 
+        dispatcher = EventDispatcher(window)
         while True:
-            event, values = window.read(timeout=1000)
-            print(event)
-            print(values)
+            event, values = dispatcher.read()
             if event == sg.WIN_CLOSED or event == "Quit":
                 break
             elif event == "-APP_THEME_COMBO-":
@@ -437,8 +437,6 @@ class SettingsWindow:
                 window["-APPLY_BUTTON-"].update(
                     disabled=True
                 )
-
-            print(self.changed_settings)
         window.close()
 
 
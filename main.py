@@ -1,12 +1,40 @@
 """
 - Creation Date: 01/14/2024 4:11 PM EST
-- Last Updated: 05/18/2024 02:05 PM EDT
+- Last Updated: 10/19/2026 12:45 AM EDT
 - Authors: Joseph Armstrong (armstrongjoseph08@gmail.com)
 - file: `./main.py`
 - Purpose: Startup file for "The Football PBP App"
+
+Run `python main.py --startup-report`
+(or set the `SDV_PBP_STARTUP_REPORT` environment variable)
+to print how long each module, and each startup step, took.
+
+Run `python main.py --debug-events`
+(or set the `SDV_PBP_DEBUG_EVENTS` environment variable)
+to log every event read by every window.
 """
 ###############################################################################
-from core.views.main_window_view import MainWindow
+from time import perf_counter
+
+APP_START_TIME = perf_counter()
+
+import os  # noqa: E402
+import sys  # noqa: E402
+
+from core.other.startup_report import startup_report  # noqa: E402
 
 if __name__ == "__main__":
+    if "--startup-report" in sys.argv or \
+            os.environ.get("SDV_PBP_STARTUP_REPORT"):
+        startup_report.enable(start_time=APP_START_TIME)
+
+    if "--debug-events" in sys.argv or \
+            os.environ.get("SDV_PBP_DEBUG_EVENTS"):
+        from core.other.event_dispatcher import enable_event_debug
+
+        enable_event_debug()
+
+    from core.views.main_window_view import MainWindow
+
+    startup_report.mark("Main window imported")
     MainWindow()